@@ -43,7 +43,8 @@ Original modular structure moved to obsolete folder for backup.
 # │  ├─ is_valid_email() - Check email format (Line 520)
 # │  ├─ extract_emails_from_text() - Find emails in text (Line 540)
 # │  ├─ parse_email_forwarding_message() - Smart email extraction (Line 590)
-# │  └─ smart_email_verification() - Comprehensive email analysis (Line 660)
+# │  ├─ smart_email_verification() - Comprehensive email analysis (Line 660)
+# │  └─ make_tracking_token() / extract_tracking_token() - Reply tracking tokens
 #
 # ┌─ SECTION 4: CONFIG MANAGER (Lines 830-1105)
 # │  👉 Handles app settings, review periods, deadlines
@@ -61,6 +62,11 @@ Original modular structure moved to obsolete folder for backup.
 #
 # ┌─ SECTION 5: AUDIT LOGGER (Lines 1110-1495)
 # │  👉 Tracks email sending and responses
+# │  ├─ BackupService class - Deduplicated backups with retention policy
+# │  ├─ merge_audit_row / AuditConflict - Field-level merge of concurrent audit saves
+# │  ├─ AuditStore / ExcelAuditStore / SQLiteAuditStore - Audit persistence backends
+# │  ├─ AuditJournal class - Append-only event history with checkpointed replay
+# │  ├─ AuditCounters class - Incremental status/overdue counts with change events
 # │  ├─ AuditLogger class (Line 1110)
 # [SECTION: AuditLogger]
 # │  ├─ initialize_log() - Create audit spreadsheet (Line 1178)
@@ -70,7 +76,10 @@ Original modular structure moved to obsolete folder for backup.
 # │  ├─ get_agencies_by_status() - Filter by status (Line 1299)
 # │  ├─ get_metrics() - Dashboard statistics (Line 1321)
 # │  ├─ export_to_csv() - Save as CSV format (Line 1339)
-# │  └─ get_summary_stats() - Count summaries (Line 1360)
+# │  ├─ get_summary_stats() - Count summaries (Line 1360)
+# │  ├─ AuditWriteBehind class - Coalesced background saves with retry
+# │  ├─ AuditAggregator class - Cached, concurrent multi-folder audit loading
+# │  └─ AuditArchive class - SQLite archive of all periods (repeat offenders, latency, reviewers)
 #
 # ┌─ SECTION 6: REGION MANAGER (Lines 1500-1840)
 # │  👉 Handle multiple regions (North America, EMEA, APAC, etc.)
@@ -110,17 +119,34 @@ Original modular structure moved to obsolete folder for backup.
 #
 # ┌─ SECTION 9: EMAIL HANDLER (Lines 2750-3885)
 # │  👉 Send emails through Outlook
+# │  ├─ AgencyMatcher class - Aho-Corasick agency attribution for subjects
+# │  ├─ SendRateLimiter class - Token-bucket send throttling
+# │  ├─ LazyEmailBatch class - On-demand rendered preview batch with prefetch
+# │  ├─ AttachmentGuard class - Attachment size pre-flight, compression, splitting
+# │  ├─ ReplyAttachmentHarvester class - Save returned workbooks from reply attachments
+# │  ├─ ReviewDecisionIngestor class - Consolidate returned Review Action decisions
 # │  ├─ EmailHandler class (Line 2750)
 # [SECTION: EmailHandler]
 # │  ├─ test_connection() - Verify Outlook works (Line 2831)
 # │  ├─ load_email_manifest() - Get recipient list (Line 2872)
+# │  ├─ create_guarded_emails() - Build email(s) within the attachment size limit
 # │  ├─ create_email() - Build email message (Line 2925)
 # │  ├─ send_emails() - Send/Preview/Schedule emails (Line 2990)
-# │  ├─ scan_inbox() - Check for replies (Line 3138)
+# │  ├─ send_email_batch() - Rate-limited send of prepared emails
+# │  ├─ render_email_body() - Template + workbook context for one file
+# │  ├─ plan_digest_messages() - Group files by recipients for digest sends
+# │  ├─ build_subject() - Subject line with tracking token
+# │  ├─ SentMessageIndex class - Subject/token -> EntryID index for follow-ups
+# │  ├─ remind_overdue() - Bulk reply-to-thread reminders
+# │  ├─ scan_inbox() - Check for replies, incremental per folder (Line 3138)
+# │  ├─ classify_message() - Reply / auto-reply / bounce classification
+# │  ├─ get_body_preview() - Fetch a reply body on demand
 # │  ├─ create_folder() - Make Outlook folder (Line 3197)
+# │  ├─ _get_folder() - Cached folder-handle lookup by path
 # │  ├─ setup_compliance_folders() - Create standard folders (Line 3250)
 # │  ├─ move_email_to_folder() - Organize emails (Line 3270)
 # │  ├─ copy_sent_email_to_folder() - Copy to compliance folder (Line 3300)
+# │  ├─ file_sent_emails() - Batch-file a send run into compliance folder
 # │  ├─ organize_compliance_replies() - Auto-organize replies (Line 3330)
 # │  └─ scan_sent_items_for_agencies() - Find old sent emails (Line 3363)
 #
@@ -191,6 +217,9 @@ Original modular structure moved to obsolete folder for backup.
 # │  ├─ FixEmailDialog (Lines 7370-7450)
 # │  │  └─ Edit invalid email addresses
 # │  │
+# │  ├─ BatchSendDialog
+# │  │  └─ Background, cancellable batch send with retry-failed
+# │  │
 # │  └─ RegionManagementDialog (Lines 7460-7700)
 # │     ├─ Add new regions
 # │     ├─ Edit existing regions
@@ -297,16 +326,27 @@ import threading
 import tkinter as tk
 import json
 import logging
-from typing import Optional, Tuple, List, Dict, Set, Callable, TypedDict
+from typing import Optional, Tuple, List, Dict, Set, Callable, Iterator, TypedDict
 from enum import Enum
 from dataclasses import dataclass, field, asdict
 import shutil
+import sqlite3
+import atexit
+import tempfile
+import zipfile
+import mailbox
+from email.utils import parsedate_to_datetime, parseaddr
 import tkinter.ttk as ttk
 from tkcalendar import DateEntry  # pip install tkcalendar
 import pytz
 import pickle
 import hashlib
-from collections import deque
+import platform
+import time
+import heapq
+from collections import deque, OrderedDict, Counter
+from contextlib import closing, contextmanager
+from concurrent.futures import ThreadPoolExecutor
 
 # ============================================================================
 # 🎨 COLOR SCHEME SYSTEM - Professional Blue/Teal Enterprise Design
@@ -537,6 +577,10 @@ class ColumnNames:
     COMMENTS = "Comments"
     TO = "To"
     CC = "CC"
+    FOLLOWUP_COUNT = "Follow-up Count"
+    LAST_REMINDER_DATE = "Last Reminder Date"
+    RETURNED_FILE = "Returned File"
+    REVIEW_COMPLETENESS = "Review Completeness"
     
     # Generated File Columns
     REVIEW_ACTION = "Review Action"
@@ -556,11 +600,18 @@ class FileNames:
     UNASSIGNED_FILE = "Unassigned.xlsx"
     AUDIT_LOG_TEMPLATE = "Audit_CognosAccessReview_{period}.xlsx"
     BACKUP_DIR = "backups"
+    BACKUP_CATALOG = "backup_catalog.json"
     LOG_FILE = "cognos_review.log"
     CONFIG_FILE = "config.json"
     EMAIL_TEMPLATE = "email_template.txt"
     CONFIG_SCHEMA = "config.schema.json"
     REGION_PROFILES = "region_profiles.json"
+    SCAN_STATE = "scan_state.json"
+    TRACKING_INDEX = "tracking_tokens.json"
+    SENT_INDEX = "sent_index.json"
+    HARVEST_STATE = "harvest_state.json"
+    RETURNS_DIR = "Returned Reviews"
+    CONSOLIDATED_DECISIONS = "Consolidated Review Decisions"
 
 
 # Tab to Country Mapping - Maps regional tabs to Country column values in master file
@@ -614,6 +665,38 @@ class AuditStatus(Enum):
     SENT = "Sent"
     RESPONDED = "Responded"
     OVERDUE = "Overdue"
+    UNDELIVERABLE = "Undeliverable"
+
+
+class AuditEventType(Enum):
+    """State transitions recorded in the audit event journal."""
+    ADDED = "added"
+    SENT = "sent"
+    PREVIEWED = "previewed"
+    SCHEDULED = "scheduled"
+    DRAFTED = "drafted"
+    RESPONDED = "responded"
+    REMINDED = "reminded"
+    BOUNCED = "bounced"
+    SEND_FAILED = "send_failed"
+    FILE_RETURNED = "file_returned"
+    REVIEW_CONSOLIDATED = "review_consolidated"
+
+
+class MessageKind(Enum):
+    """Classification of a scanned inbox message."""
+    REPLY = "reply"
+    AUTO_REPLY = "auto_reply"
+    BOUNCE = "bounce"
+
+
+class ReviewDecision(Enum):
+    """Normalized reviewer decision from a returned workbook's Review Action."""
+    KEEP = "Keep"
+    REVOKE = "Revoke"
+    MODIFY = "Modify"
+    UNCLEAR = "Unclear"
+    PENDING = "Pending"
 
 
 class ValidationSeverity(Enum):
@@ -636,6 +719,22 @@ class AppConfig(TypedDict, total=False):
     auto_scan: bool
     default_email_mode: str
     current_region: Optional[str]
+    send_messages_per_minute: int
+    send_recipients_per_minute: int
+    send_burst: int
+    send_backoff_seconds: float
+    send_max_retries: int
+    digest_max_attachment_mb: float
+    digest_zip_attachments: bool
+    attachment_limit_mb: float
+    audit_backend: str
+    audit_xlsx_export_seconds: float
+    audit_write_interval_seconds: float
+    backup_keep_last: int
+    backup_keep_daily: int
+    backup_keep_per_period: bool
+    audit_archive_path: str
+    repeat_offender_periods: int
 
 
 class RegionProfileDict(TypedDict):
@@ -861,51 +960,210 @@ class DashboardMetrics:
             total_agencies: Total number of agencies
             
         Returns:
-            DashboardMetrics instance with calculated values
+            DashboardMetrics instance with calculated values (see compute_audit_metrics)
         """
-        
-        # Count statuses
-        if audit_df.empty:
-            sent = responded = 0
-        else:
-            sent = (audit_df[ColumnNames.STATUS] == AuditStatus.SENT.value).sum()
-            responded = (audit_df[ColumnNames.STATUS] == AuditStatus.RESPONDED.value).sum()
-        
-        not_sent = total_agencies - sent - responded
-        
-        # Calculate completion percentage
-        completion = (responded / total_agencies * 100) if total_agencies > 0 else 0.0
-        
-        # Calculate days left
-        try:
-            deadline = datetime.strptime(deadline_str, "%B %d, %Y")
-            days_left = (deadline - datetime.now()).days
-        except (ValueError, TypeError):
-            days_left = -1
-        
-        # Calculate overdue (sent more than 7 days ago without response)
-        overdue = 0
-        if not audit_df.empty and ColumnNames.SENT_DATE in audit_df.columns:
-            for _, row in audit_df.iterrows():
-                if row[ColumnNames.STATUS] == AuditStatus.SENT.value:
-                    sent_date_str = row.get(ColumnNames.SENT_DATE, "")
-                    if sent_date_str:
-                        try:
-                            sent_date = datetime.strptime(sent_date_str, "%Y-%m-%d %H:%M")
-                            if (datetime.now() - sent_date).days > 7:
-                                overdue += 1
-                        except (ValueError, TypeError):
-                            pass
-        
-        return cls(
-            total_agencies=total_agencies,
-            sent_count=sent,
-            responded_count=responded,
-            not_sent_count=not_sent,
-            overdue_count=overdue,
-            completion_percentage=completion,
-            days_left=days_left
+        return compute_audit_metrics(audit_df, deadline_str, total_agencies=total_agencies)
+
+
+# Days after sending without a response before an agency counts as overdue
+OVERDUE_AFTER_DAYS = 7
+
+# Audit log columns holding "%Y-%m-%d %H:%M" timestamps
+AUDIT_DATE_COLUMNS = [
+    ColumnNames.SENT_DATE,
+    ColumnNames.RESPONSE_DATE,
+    ColumnNames.LAST_REMINDER_DATE
+]
+
+
+def type_audit_frame(audit_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Typed copy of an audit log for vectorized queries.
+    
+    Date columns become datetime64 (blank or unparseable values are NaT)
+    and Status becomes categorical over the AuditStatus values plus any
+    other values present. The persisted log keeps its text columns; this
+    is the view metrics are computed from. Frames already typed are
+    returned as they are.
+    
+    Args:
+        audit_df: Audit log as loaded
+    
+    Returns:
+        DataFrame with typed date and status columns
+    """
+    date_columns = [col for col in AUDIT_DATE_COLUMNS if col in audit_df.columns]
+    if (all(pd.api.types.is_datetime64_any_dtype(audit_df[col]) for col in date_columns)
+            and (ColumnNames.STATUS not in audit_df.columns
+                 or isinstance(audit_df[ColumnNames.STATUS].dtype, pd.CategoricalDtype))):
+        return audit_df
+    
+    typed = audit_df.copy()
+    for col in date_columns:
+        if pd.api.types.is_datetime64_any_dtype(typed[col]):
+            continue
+        text = typed[col].astype("string").str.strip()
+        parsed = pd.to_datetime(text, format="%Y-%m-%d %H:%M", errors="coerce")
+        # Dates edited in Excel come back with seconds or as datetimes
+        retry = parsed.isna() & text.fillna("").ne("")
+        if retry.any():
+            parsed[retry] = pd.to_datetime(text[retry], format="mixed", errors="coerce")
+        typed[col] = parsed
+    
+    if ColumnNames.STATUS in typed.columns:
+        status = typed[ColumnNames.STATUS].fillna("").astype(str)
+        known = [s.value for s in AuditStatus]
+        typed[ColumnNames.STATUS] = pd.Categorical(
+            status, categories=known + sorted(set(status.unique()) - set(known))
         )
+    return typed
+
+
+def audit_overdue_mask(
+    audit_df: pd.DataFrame,
+    now: Optional[datetime] = None,
+    overdue_after_days: int = OVERDUE_AFTER_DAYS
+) -> pd.Series:
+    """
+    Rows that are overdue: marked Overdue, or Sent more than overdue_after_days ago.
+    
+    Args:
+        audit_df: Audit log (typed or as loaded)
+        now: Reference time (defaults to now)
+        overdue_after_days: Days without a response before a send is overdue
+    
+    Returns:
+        Boolean Series aligned with audit_df
+    """
+    typed = type_audit_frame(audit_df)
+    if typed.empty or ColumnNames.STATUS not in typed.columns:
+        return pd.Series(False, index=typed.index)
+    status = typed[ColumnNames.STATUS]
+    overdue = status == AuditStatus.OVERDUE.value
+    if ColumnNames.SENT_DATE in typed.columns:
+        cutoff = pd.Timestamp(now or datetime.now()) - pd.Timedelta(days=overdue_after_days)
+        overdue |= (status == AuditStatus.SENT.value) & (typed[ColumnNames.SENT_DATE] < cutoff)
+    return overdue
+
+
+def effective_audit_status(
+    audit_df: pd.DataFrame,
+    now: Optional[datetime] = None,
+    overdue_after_days: int = OVERDUE_AFTER_DAYS
+) -> pd.Series:
+    """
+    Status per row as displayed: overdue sends show as Overdue.
+    
+    Args:
+        audit_df: Audit log (typed or as loaded)
+        now: Reference time (defaults to now)
+        overdue_after_days: Days without a response before a send is overdue
+    
+    Returns:
+        Series of status strings aligned with audit_df
+    """
+    typed = type_audit_frame(audit_df)
+    if ColumnNames.STATUS not in typed.columns:
+        return pd.Series(AuditStatus.NOT_SENT.value, index=typed.index)
+    status = typed[ColumnNames.STATUS].astype(str)
+    return status.mask(audit_overdue_mask(typed, now, overdue_after_days), AuditStatus.OVERDUE.value)
+
+
+def compute_audit_metrics(
+    audit_df: pd.DataFrame,
+    deadline: Optional[str],
+    agencies: Optional[List[str]] = None,
+    total_agencies: Optional[int] = None,
+    now: Optional[datetime] = None,
+    overdue_after_days: int = OVERDUE_AFTER_DAYS
+) -> 'DashboardMetrics':
+    """
+    Compute dashboard metrics from an audit log without iterating rows.
+    
+    Shared by the live status panel, the audit dashboard, AuditLogger and
+    ReportGenerator so they all count the same way. Sent counts agencies
+    awaiting a response (Sent or Overdue); overdue counts those sent more
+    than overdue_after_days ago.
+    
+    Args:
+        audit_df: Audit log (typed or as loaded)
+        deadline: Deadline such as "June 30, 2025"
+        agencies: Only count these agencies (case-insensitive); the total
+            is then their number
+        total_agencies: Total to report (defaults to the agencies counted)
+        now: Reference time (defaults to now)
+        overdue_after_days: Days without a response before a send is overdue
+    
+    Returns:
+        DashboardMetrics instance
+    """
+    now = now or datetime.now()
+    typed = type_audit_frame(audit_df)
+    if agencies is not None and not typed.empty:
+        wanted = {a.upper() for a in agencies}
+        typed = typed[typed[ColumnNames.AGENCY].astype(str).str.upper().isin(wanted)]
+        # One row per agency when the log holds duplicates
+        typed = typed.loc[~typed[ColumnNames.AGENCY].astype(str).str.upper().duplicated(keep="last")]
+    if total_agencies is None:
+        total_agencies = len(agencies) if agencies is not None else len(typed)
+    
+    counts: Counter = Counter()
+    if not typed.empty and ColumnNames.STATUS in typed.columns:
+        counts.update(typed[ColumnNames.STATUS].astype(str).value_counts().to_dict())
+        overdue = int(audit_overdue_mask(typed, now, overdue_after_days).sum())
+        # Overdue sends move from Sent to Overdue, as in AuditCounters.counts
+        counts[AuditStatus.OVERDUE.value] = overdue
+        counts[AuditStatus.SENT.value] = int(
+            typed[ColumnNames.STATUS].isin([AuditStatus.SENT.value, AuditStatus.OVERDUE.value]).sum()
+        ) - overdue
+    return metrics_from_status_counts(counts, deadline, total_agencies, now)
+
+
+def days_until_deadline(deadline: Optional[str], now: Optional[datetime] = None) -> int:
+    """
+    Whole days from now until a deadline such as "June 30, 2025".
+    
+    Returns:
+        Days left (negative once passed), or -1 if the deadline cannot be parsed
+    """
+    try:
+        deadline_date = datetime.strptime(str(deadline), "%B %d, %Y")
+    except (ValueError, TypeError):
+        deadline_date = pd.to_datetime(deadline, errors="coerce")
+    return (deadline_date - (now or datetime.now())).days if pd.notna(deadline_date) else -1
+
+
+def metrics_from_status_counts(
+    counts: Dict[str, int],
+    deadline: Optional[str],
+    total_agencies: int,
+    now: Optional[datetime] = None
+) -> 'DashboardMetrics':
+    """
+    Build dashboard metrics from status counts.
+    
+    Args:
+        counts: Agencies per status, with overdue sends counted under
+            Overdue rather than Sent (see AuditCounters.counts)
+        deadline: Deadline such as "June 30, 2025"
+        total_agencies: Total number of agencies
+        now: Reference time (defaults to now)
+        
+    Returns:
+        DashboardMetrics instance
+    """
+    responded = int(counts.get(AuditStatus.RESPONDED.value, 0))
+    overdue = int(counts.get(AuditStatus.OVERDUE.value, 0))
+    sent = int(counts.get(AuditStatus.SENT.value, 0)) + overdue
+    return DashboardMetrics(
+        total_agencies=total_agencies,
+        sent_count=sent,
+        responded_count=responded,
+        not_sent_count=max(0, total_agencies - sent - responded),
+        overdue_count=overdue,
+        completion_percentage=(responded / total_agencies * 100) if total_agencies > 0 else 0.0,
+        days_left=days_until_deadline(deadline, now)
+    )
 
 
 @dataclass
@@ -1234,6 +1492,151 @@ def smart_email_verification(text: str) -> Dict[str, any]:
     return result
 
 
+# 8 hex digits (32 bits) keep accidental collisions negligible; tokens in
+# subjects sent before the change carry 6
+TRACKING_TOKEN_DIGEST_LENGTH = 8
+LEGACY_TRACKING_TOKEN_DIGEST_LENGTH = 6
+TRACKING_TOKEN_PATTERN = re.compile(r'\[?(CAR-[A-Z0-9]{1,8}-[0-9A-F]{6}(?:[0-9A-F]{2})?)\]?', re.IGNORECASE)
+
+
+def make_tracking_token(review_period: str, file_name: str) -> str:
+    """
+    Build the deterministic tracking token embedded in outbound subjects.
+    
+    The token combines a short period code with a hash of the period and the
+    source file name, so the same file always gets the same token within a
+    review period.
+    
+    Args:
+        review_period: Review period (e.g., "Q3 2025")
+        file_name: Source file name the email is sent for
+        
+    Returns:
+        Tracking token without brackets
+        
+    Examples:
+        >>> make_tracking_token("Q3 2025", "BBDO Toronto")
+        'CAR-Q3-450B5F6D'
+    """
+    quarter = re.search(r'Q[1-4]', str(review_period).upper())
+    if quarter:
+        period_code = quarter.group(0)
+    else:
+        period_code = re.sub(r'[^A-Z0-9]', '', str(review_period).upper())[:8] or "NA"
+    digest = hashlib.sha1(f"{review_period}|{file_name}".upper().encode('utf-8')).hexdigest()
+    return f"CAR-{period_code}-{digest[:TRACKING_TOKEN_DIGEST_LENGTH].upper()}"
+
+
+def extract_tracking_token(text: str) -> Optional[str]:
+    """
+    Extract a tracking token from an email subject or body.
+    
+    Args:
+        text: Text to search
+        
+    Returns:
+        Upper-cased token without brackets, or None if not present
+        
+    Examples:
+        >>> extract_tracking_token("RE: Access Review [car-q3-450b5f6d]")
+        'CAR-Q3-450B5F6D'
+    """
+    match = TRACKING_TOKEN_PATTERN.search(str(text or ""))
+    return match.group(1).upper() if match else None
+
+
+def tracking_token_conflict(
+    index: Dict[str, "str | List[str]"],
+    token: str,
+    file_names: "str | List[str]"
+) -> Optional["str | List[str]"]:
+    """
+    Check whether a tracking token is already held by other files.
+    
+    Args:
+        index: Token -> file name (or list of names) index, as persisted by AuditLogger
+        token: Token about to be used
+        file_names: File name (or digest file names) the token is meant for
+        
+    Returns:
+        The files already registered under the token if they differ, else None
+    """
+    def normalized(names) -> List[str]:
+        return sorted(str(name).upper() for name in ([names] if isinstance(names, str) else names))
+    
+    existing = index.get(token)
+    if existing is None or normalized(existing) == normalized(file_names):
+        return None
+    return existing
+
+
+AUTO_REPLY_SUBJECT_PATTERN = re.compile(
+    r'^\s*(automatic reply|auto[- ]?reply|autoreply|out of (the )?office|ooo)\b', re.IGNORECASE
+)
+BOUNCE_SUBJECT_PATTERN = re.compile(
+    r'^\s*(undeliverable|undelivered mail|delivery status notification \(failure\)|'
+    r'mail delivery (failed|failure)|delivery has failed|returned mail)\b', re.IGNORECASE
+)
+
+
+def classify_message(
+    message_class: str,
+    subject: str = "",
+    headers: Optional[Dict[str, str]] = None,
+    recipients: str = ""
+) -> Tuple[MessageKind, Optional[str]]:
+    """
+    Classify a scanned message as a reply, an auto-reply or a bounce.
+    
+    Works only on properties already fetched with the message (message class,
+    promoted internet headers, display-to), so no further Outlook calls are
+    needed. Checked in order: NDR report items and X-Failed-Recipients,
+    Exchange out-of-office/reply-rule templates, auto-response headers, then
+    well-known subject prefixes for stores that do not promote headers.
+    
+    Args:
+        message_class: Outlook MessageClass (e.g. "REPORT.IPM.Note.NDR")
+        subject: Message subject
+        headers: Lower-case internet header name -> value
+        recipients: Display-to of the message (an NDR's failed recipients)
+        
+    Returns:
+        Tuple of (MessageKind, failing address for bounces or None)
+        
+    Examples:
+        >>> classify_message("REPORT.IPM.Note.NDR", "Undeliverable: Review", {}, "jane@x.com")
+        (<MessageKind.BOUNCE: 'bounce'>, 'jane@x.com')
+        >>> classify_message("IPM.Note", "RE: Review", {"auto-submitted": "auto-replied"})
+        (<MessageKind.AUTO_REPLY: 'auto_reply'>, None)
+    """
+    message_class = (message_class or "").upper()
+    headers = {k: str(v).strip() for k, v in (headers or {}).items() if v}
+    
+    failed = headers.get("x-failed-recipients", "")
+    if message_class.startswith("REPORT.") and message_class.endswith(".NDR") or failed:
+        address = failed or recipients
+        address = re.split(r'[;,]', address)[0].strip() if address else None
+        return MessageKind.BOUNCE, address or None
+    
+    # Delivery/read receipts and Exchange auto-reply templates
+    if message_class.startswith("REPORT.") or message_class.startswith("IPM.NOTE.RULES."):
+        return MessageKind.AUTO_REPLY, None
+    
+    auto_submitted = headers.get("auto-submitted", "").lower()
+    if (auto_submitted and auto_submitted != "no") or headers.get("x-autoreply") or headers.get("x-autorespond"):
+        return MessageKind.AUTO_REPLY, None
+    if headers.get("precedence", "").lower() in ("auto_reply", "bulk", "junk"):
+        return MessageKind.AUTO_REPLY, None
+    
+    if BOUNCE_SUBJECT_PATTERN.match(subject or ""):
+        address = re.split(r'[;,]', recipients)[0].strip() if recipients else None
+        return MessageKind.BOUNCE, address or None
+    if AUTO_REPLY_SUBJECT_PATTERN.match(subject or ""):
+        return MessageKind.AUTO_REPLY, None
+    
+    return MessageKind.REPLY, None
+
+
 # ============ MODULE: config_manager ============
 
 
@@ -1265,7 +1668,28 @@ class ConfigManager:
         "email_subject_prefix": "[ACTION REQUIRED] Cognos Access Review",
         "auto_scan": True,
         "default_email_mode": EmailMode.PREVIEW.value,
-        "current_region": None
+        "current_region": None,
+        # Outlook/Exchange submission throttling (see SendRateLimiter)
+        "send_messages_per_minute": 30,
+        "send_recipients_per_minute": 300,
+        "send_burst": 5,
+        "send_backoff_seconds": 15.0,
+        "send_max_retries": 3,
+        "digest_max_attachment_mb": 20.0,
+        "digest_zip_attachments": False,
+        "attachment_limit_mb": 20.0,
+        # Audit log storage: "sqlite" (xlsx exported when idle) or "xlsx"
+        "audit_backend": "sqlite",
+        "audit_xlsx_export_seconds": 30.0,
+        # GUI changes are saved at most once per this many seconds
+        "audit_write_interval_seconds": 5.0,
+        # Backup retention (see BackupService)
+        "backup_keep_last": 20,
+        "backup_keep_daily": 14,
+        "backup_keep_per_period": True,
+        # Cross-period archive of every review period's audit log (see AuditArchive)
+        "audit_archive_path": "audit_archive.db",
+        "repeat_offender_periods": 4
     }
     
     REQUIRED_FIELDS = [
@@ -1372,12 +1796,36 @@ class ConfigManager:
                 errors.append(f"Invalid email mode '{mode}'. Must be one of: {valid_modes}")
         
         # Validate boolean fields
-        for field in ["auto_scan"]:
+        for field in ["auto_scan", "digest_zip_attachments", "backup_keep_per_period"]:
             if field in self._config:
                 value = self._config[field]
                 if not isinstance(value, bool):
                     errors.append(f"Field '{field}' must be boolean, got {type(value).__name__}")
         
+        # Validate send throttling fields
+        for field in ["send_messages_per_minute", "send_recipients_per_minute", "send_burst", "backup_keep_last", "repeat_offender_periods"]:
+            if field in self._config:
+                value = self._config[field]
+                if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+                    errors.append(f"Field '{field}' must be a positive integer, got {value!r}")
+        
+        if "backup_keep_daily" in self._config:
+            value = self._config["backup_keep_daily"]
+            if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+                errors.append(f"Field 'backup_keep_daily' must be a non-negative integer, got {value!r}")
+        
+        if "audit_backend" in self._config and self._config["audit_backend"] not in ["sqlite", "xlsx"]:
+            errors.append(f"Invalid audit backend '{self._config['audit_backend']}'. Must be 'sqlite' or 'xlsx'")
+        
+        if "audit_archive_path" in self._config and not str(self._config["audit_archive_path"]).strip():
+            errors.append("Field 'audit_archive_path' must not be empty")
+        
+        for field in ["send_backoff_seconds", "send_max_retries", "digest_max_attachment_mb", "attachment_limit_mb", "audit_xlsx_export_seconds", "audit_write_interval_seconds"]:
+            if field in self._config:
+                value = self._config[field]
+                if isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0:
+                    errors.append(f"Field '{field}' must be a non-negative number, got {value!r}")
+        
         if errors:
             error_msg = "Configuration validation failed:\n" + "\n".join(f"  - {e}" for e in errors)
             raise ConfigurationError(error_msg)
@@ -1593,2181 +2041,5599 @@ def get_config_manager() -> ConfigManager:
     return _global_config_manager
 
 
-# ============ MODULE: audit_logger ============
-
-
+# ============ MODULE: backup_service ============
 
-
-
-
-class AuditLogger:
+class BackupService:
     """
-    Manages audit log for tracking email status and responses.
+    Content-addressed, retention-managed backups for a backup directory.
     
-    This class provides functionality for creating, updating, and querying
-    the Excel-based audit log with automatic backups.
+    Each backup is fingerprinted (for xlsx workbooks, the sheet contents
+    without the document timestamps that change on every save). A file whose
+    content matches its latest backup is not copied again, and content seen
+    before under any name reuses the stored copy. A catalog in the backup
+    directory lists the versions of each file, and a retention policy prunes
+    them: the last N versions, the newest version per day for the last D
+    days, and the newest version per review period.
     
     Examples:
-        >>> audit_logger = AuditLogger(output_dir=Path("output"))
-        >>> audit_logger.initialize_log(agencies=["Agency1", "Agency2"])
-        >>> audit_logger.mark_sent(
-        ...     agency="Agency1",
-        ...     to="test@example.com",
-        ...     cc="manager@example.com"
-        ... )
-        >>> metrics = audit_logger.get_metrics(deadline="June 30, 2025")
-        >>> print(f"Completion: {metrics.completion_percentage:.1f}%")
+        >>> service = BackupService.from_config(Path("output/backups"))
+        >>> service.backup_file(Path("output/Audit_CognosAccessReview.xlsx"))
+        WindowsPath('output/backups/20250901_101500_Audit_CognosAccessReview.xlsx')
     """
     
+    # Serializes catalog updates between services sharing a directory in this process
+    _lock = threading.Lock()
+    
     def __init__(
         self,
-        output_dir: Optional[Path] = None,
-        audit_file_name: Optional[str] = None
+        backup_dir: Path,
+        keep_last: int = 20,
+        keep_daily: int = 14,
+        keep_per_period: bool = True,
+        period: Optional[str] = None
     ):
         """
-        Initialize audit logger.
+        Initialize backup service.
         
         Args:
-            output_dir: Directory for audit log file (optional, can be set later)
-            audit_file_name: Optional custom audit file name
+            backup_dir: Directory holding backups and the catalog
+            keep_last: Versions of each file always kept
+            keep_daily: Days for which the newest version of each day is kept
+            keep_per_period: Keep the newest version of each review period
+            period: Review period recorded with new backups
         """
-        self.output_dir = Path(output_dir) if output_dir else None
-        self.audit_file_name = audit_file_name or "Audit_CognosAccessReview.xlsx"
-        self.audit_file_path = (self.output_dir / self.audit_file_name) if self.output_dir else None
+        self.backup_dir = Path(backup_dir)
+        self.catalog_path = self.backup_dir / FileNames.BACKUP_CATALOG
+        self.keep_last = max(1, keep_last)
+        self.keep_daily = max(0, keep_daily)
+        self.keep_per_period = keep_per_period
+        self.period = period
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
-        self._df: Optional[pd.DataFrame] = None
     
-    def _get_columns(self) -> List[str]:
-        """Get standard audit log column names."""
-        return [
-            ColumnNames.AGENCY,
-            ColumnNames.SENT_DATE,
-            ColumnNames.RESPONSE_DATE,
-            ColumnNames.TO,
-            ColumnNames.CC,
-            ColumnNames.STATUS,
-            ColumnNames.COMMENTS
-        ]
+    @classmethod
+    def from_config(cls, backup_dir: Path) -> 'BackupService':
+        """Create a service using the backup_keep_* settings and the current review period."""
+        defaults = ConfigManager.DEFAULT_CONFIG
+        return cls(
+            backup_dir,
+            keep_last=int(config_manager.get("backup_keep_last", defaults["backup_keep_last"])),
+            keep_daily=int(config_manager.get("backup_keep_daily", defaults["backup_keep_daily"])),
+            keep_per_period=bool(config_manager.get("backup_keep_per_period", defaults["backup_keep_per_period"])),
+            period=config_manager.get("review_period")
+        )
     
-    def load(self) -> pd.DataFrame:
-        """
-        Load audit log from file or create empty DataFrame.
-        
-        Returns:
-            Audit log DataFrame
+    @staticmethod
+    def fingerprint(path: Path) -> str:
         """
-        if self._df is not None:
-            return self._df
+        Content hash of a file.
         
-        if self.audit_file_path.exists():
-            try:
-                self._df = pd.read_excel(self.audit_file_path)
-                # Ensure all required columns exist
-                for col in self._get_columns():
-                    if col not in self._df.columns:
-                        self._df[col] = ""
-                self.logger.info(f"Loaded audit log: {self.audit_file_path}")
-            except Exception as e:
-                self.logger.error(f"Failed to load audit log: {e}")
-                self._df = pd.DataFrame(columns=self._get_columns())
-        else:
-            self._df = pd.DataFrame(columns=self._get_columns())
-            self.logger.info("Created new audit log DataFrame")
+        Workbooks are hashed over their parts except docProps, which holds
+        the created/modified timestamps rewritten on every save.
         
-        return self._df
-    
-    def save(self) -> bool:
-        """
-        Save audit log to Excel file with backup.
+        Args:
+            path: File to hash
         
         Returns:
-            True if successful
+            SHA-256 hex digest
         """
-        if self._df is None:
-            self.logger.warning("No audit data to save")
-            return False
-        
-        try:
-            # Create backup if file exists
-            if self.audit_file_path.exists():
-                self.create_backup()
-            
-            # Ensure output directory exists
-            self.output_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Save to Excel
-            self._df.to_excel(self.audit_file_path, index=False)
-            self.logger.info(f"Saved audit log: {self.audit_file_path}")
-            return True
+        path = Path(path)
+        if path.suffix.lower() in (".xlsx", ".xlsm"):
+            try:
+                digest = hashlib.sha256()
+                with zipfile.ZipFile(path) as archive:
+                    for info in sorted(archive.infolist(), key=lambda i: i.filename):
+                        if info.filename.startswith("docProps/"):
+                            continue
+                        digest.update(info.filename.encode("utf-8"))
+                        digest.update(archive.read(info))
+                return digest.hexdigest()
+            except zipfile.BadZipFile:
+                pass
+        
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    @staticmethod
+    def frame_fingerprint(df: pd.DataFrame) -> str:
+        """Content hash of a DataFrame (columns and values)."""
+        digest = hashlib.sha256("\x1f".join(str(c) for c in df.columns).encode("utf-8"))
+        digest.update(pd.util.hash_pandas_object(df.astype(str), index=False).values.tobytes())
+        return digest.hexdigest()
+    
+    def _load_catalog(self) -> Dict[str, List[dict]]:
+        if self.catalog_path.exists():
+            try:
+                with open(self.catalog_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except Exception as e:
+                self.logger.warning(f"Could not read backup catalog, starting a new one: {e}")
+        return {}
+    
+    def _save_catalog(self, catalog: Dict[str, List[dict]]) -> None:
+        temp_path = self.catalog_path.with_name(self.catalog_path.name + ".tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(catalog, f, indent=2, ensure_ascii=False)
+        os.replace(temp_path, self.catalog_path)
+    
+    def _store(self, name: str, fingerprint: str, write: Callable[[Path], None]) -> Path:
+        """Record a version of name, writing its content only if it is new."""
+        with self._lock:
+            self.backup_dir.mkdir(parents=True, exist_ok=True)
+            catalog = self._load_catalog()
+            versions = catalog.setdefault(name, [])
+            
+            if versions and versions[-1]["hash"] == fingerprint and (self.backup_dir / versions[-1]["file"]).exists():
+                self.logger.debug(f"Backup of {name} unchanged, skipped")
+                return self.backup_dir / versions[-1]["file"]
+            
+            # Same content stored before (under any name) is referenced, not copied
+            stored = next(
+                (v["file"] for entries in catalog.values() for v in entries
+                 if v["hash"] == fingerprint and (self.backup_dir / v["file"]).exists()),
+                None
+            )
+            now = datetime.now()
+            if stored is None:
+                stored = f"{now:%Y%m%d_%H%M%S}_{name}"
+                counter = 1
+                while (self.backup_dir / stored).exists():
+                    stored = f"{now:%Y%m%d_%H%M%S}_{counter}_{name}"
+                    counter += 1
+                write(self.backup_dir / stored)
+                self.logger.info(f"Created backup: {self.backup_dir / stored}")
+            else:
+                self.logger.info(f"Backup of {name} matches stored version {stored}")
             
-        except Exception as e:
-            self.logger.error(f"Failed to save audit log: {e}")
-            return False
+            versions.append({
+                "ts": now.strftime("%Y-%m-%d %H:%M:%S"),
+                "hash": fingerprint,
+                "file": stored,
+                "period": self.period
+            })
+            self._apply_retention(catalog)
+            self._save_catalog(catalog)
+            return self.backup_dir / stored
     
-    def create_backup(self) -> Optional[Path]:
+    def backup_file(self, path: Path) -> Optional[Path]:
         """
-        Create timestamped backup of audit log.
+        Back up a file unless its content is already the latest backup.
+        
+        Args:
+            path: File to back up
         
         Returns:
-            Path to backup file or None if failed
+            Path of the backup holding this content, or None if the file is missing
         """
-        if not self.audit_file_path.exists():
-            return None
-        
-        try:
-            # Create backup directory
-            backup_dir = self.output_dir / FileNames.BACKUP_DIR
-            backup_dir.mkdir(exist_ok=True)
-            
-            # Create timestamped backup filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_name = f"{timestamp}_{self.audit_file_name}"
-            backup_path = backup_dir / backup_name
-            
-            # Copy file
-            shutil.copy2(self.audit_file_path, backup_path)
-            self.logger.info(f"Created backup: {backup_path}")
-            return backup_path
-            
-        except Exception as e:
-            self.logger.error(f"Failed to create backup: {e}")
+        path = Path(path)
+        if not path.exists():
             return None
+        return self._store(path.name, self.fingerprint(path), lambda target: shutil.copy2(path, target))
     
-    def initialize_log(
-        self,
-        agencies: List[str],
-        preserve_existing: bool = True
-    ) -> None:
+    def backup_frame(self, df: pd.DataFrame, name: str) -> Path:
         """
-        Initialize audit log with agency list.
+        Back up a DataFrame as an xlsx workbook unless its data is unchanged.
         
         Args:
-            agencies: List of agency names
-            preserve_existing: If True, preserve existing entries
-        """
-        df = self.load()
+            df: Data to back up
+            name: Backup file name (e.g. the workbook it is saved to)
         
-        if preserve_existing and not df.empty:
-            # Get existing agencies
-            existing_agencies = set(df[ColumnNames.AGENCY].str.upper())
-            
-            # Add only new agencies
-            new_agencies = [
-                agency for agency in agencies
-                if agency.upper() not in existing_agencies
-            ]
-            
-            if new_agencies:
-                new_entries = pd.DataFrame({
-                    ColumnNames.AGENCY: new_agencies,
-                    ColumnNames.SENT_DATE: "",
-                    ColumnNames.RESPONSE_DATE: "",
-                    ColumnNames.TO: "",
-                    ColumnNames.CC: "",
-                    ColumnNames.STATUS: AuditStatus.NOT_SENT.value,
-                    ColumnNames.COMMENTS: ""
-                })
-                self._df = pd.concat([df, new_entries], ignore_index=True)
-                self.logger.info(f"Added {len(new_agencies)} new agencies to audit log")
-        else:
-            # Create fresh log
-            self._df = pd.DataFrame({
-                ColumnNames.AGENCY: agencies,
-                ColumnNames.SENT_DATE: "",
-                ColumnNames.RESPONSE_DATE: "",
-                ColumnNames.TO: "",
-                ColumnNames.CC: "",
-                ColumnNames.STATUS: AuditStatus.NOT_SENT.value,
-                ColumnNames.COMMENTS: ""
-            })
-            self.logger.info(f"Initialized audit log with {len(agencies)} agencies")
-    
-    def mark_sent(
-        self,
-        agency: str,
-        to: str = "",
-        cc: str = "",
-        comments: str = ""
-    ) -> bool:
+        Returns:
+            Path of the backup holding this data
         """
-        Mark an agency as having email sent.
+        return self._store(name, self.frame_fingerprint(df), lambda target: df.to_excel(target, index=False))
+    
+    def _apply_retention(self, catalog: Dict[str, List[dict]]) -> None:
+        """Drop versions outside the retention policy and delete unreferenced files."""
+        dropped = set()
+        for name, versions in catalog.items():
+            keep = set(range(max(0, len(versions) - self.keep_last), len(versions)))
+            newest_by_day, newest_by_period = {}, {}
+            for i, version in enumerate(versions):
+                newest_by_day[version["ts"][:10]] = i
+                if version.get("period"):
+                    newest_by_period[version["period"]] = i
+            if self.keep_daily:
+                keep.update(newest_by_day[day] for day in sorted(newest_by_day)[-self.keep_daily:])
+            if self.keep_per_period:
+                keep.update(newest_by_period.values())
+            
+            dropped.update(v["file"] for i, v in enumerate(versions) if i not in keep)
+            catalog[name] = [v for i, v in enumerate(versions) if i in keep]
+        
+        referenced = {v["file"] for versions in catalog.values() for v in versions}
+        for file in dropped - referenced:
+            try:
+                (self.backup_dir / file).unlink(missing_ok=True)
+                self.logger.debug(f"Pruned backup {file}")
+            except OSError as e:
+                self.logger.warning(f"Could not delete old backup {file}: {e}")
+
+
+# ============ MODULE: audit_logger ============
+
+
+
+
+
+
+def audit_values_equal(a, b) -> bool:
+    """
+    Compare two audit cell values the way they round-trip through storage.
+    
+    Blank values (None, NaN, "") are equal, numbers compare by value (so 2
+    read back as 2.0 is unchanged) and everything else compares as text.
+    """
+    def blank(value) -> bool:
+        return value is None or value == "" or (isinstance(value, float) and pd.isna(value))
+    
+    if blank(a) or blank(b):
+        return blank(a) and blank(b)
+    try:
+        return float(a) == float(b)
+    except (TypeError, ValueError):
+        return str(a) == str(b)
+
+
+@dataclass
+class AuditConflict:
+    """A field two operators changed to different values since one of them loaded it."""
+    agency: str
+    column: str
+    base: object    # Value when this operator loaded the row
+    mine: object    # Value this operator tried to save (not applied)
+    theirs: object  # Value saved by the other operator (kept)
+    
+    def __str__(self) -> str:
+        return f"{self.agency} - {self.column}: kept '{self.theirs}' (yours: '{self.mine}')"
+
+
+@dataclass
+class AuditSaveResult:
+    """
+    Outcome of AuditStore.save().
+    
+    Attributes:
+        merged: Upper-cased agency -> stored row, for rows where the store
+            holds values this log does not have yet (other operators' changes)
+        conflicts: Fields both operators changed; the stored value was kept
+    """
+    merged: Dict[str, dict] = field(default_factory=dict)
+    conflicts: List[AuditConflict] = field(default_factory=list)
+
+
+def merge_audit_row(
+    agency: str,
+    base: Optional[dict],
+    mine: dict,
+    theirs: dict
+) -> Tuple[dict, List[AuditConflict]]:
+    """
+    Three-way merge of an audit row changed by two operators.
+    
+    Fields only one side changed (relative to base) take that side's value.
+    Fields both sides changed to different values keep the stored value and
+    are reported as conflicts, so neither operator's update is silently lost.
+    
+    Args:
+        agency: Agency the row belongs to
+        base: Row as this operator loaded it (None if it was not in the log)
+        mine: Row this operator is saving
+        theirs: Row currently stored
+    
+    Returns:
+        Tuple of (merged row, conflicts)
+    """
+    base = base or {}
+    merged = dict(theirs)
+    conflicts = []
+    for col in dict.fromkeys([*theirs, *mine]):
+        m, t, b = mine.get(col), theirs.get(col), base.get(col)
+        if audit_values_equal(m, t) or audit_values_equal(m, b):
+            continue
+        if audit_values_equal(t, b):
+            merged[col] = m
+        else:
+            conflicts.append(AuditConflict(agency, col, b, m, t))
+    return merged, conflicts
+
+
+@contextmanager
+def exclusive_file_lock(
+    lock_path: Path,
+    timeout: float = 30.0,
+    stale_age: float = 120.0,
+    busy_message: Optional[str] = None
+) -> Iterator[None]:
+    """
+    Hold an advisory lock file (created exclusively) shared by every process.
+    
+    Works between operators on different hosts sharing a folder, where
+    in-process locks do not help.
+    
+    Args:
+        lock_path: Lock file to create
+        timeout: Seconds to wait for another holder
+        stale_age: Locks older than this are left over from a crash and removed
+        busy_message: TimeoutError message when the lock cannot be taken
+    
+    Raises:
+        TimeoutError: If another holder keeps the lock longer than timeout
+    """
+    lock_path = Path(lock_path)
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            try:
+                if time.time() - lock_path.stat().st_mtime > stale_age:
+                    logger.warning(f"Removing stale lock {lock_path.name}")
+                    lock_path.unlink(missing_ok=True)
+                    continue
+            except OSError:
+                continue
+            if time.monotonic() > deadline:
+                raise TimeoutError(busy_message or f"{lock_path.name} is held by another user")
+            time.sleep(0.2)
+    try:
+        os.write(fd, f"{os.environ.get('USERNAME', '')} {os.getpid()}".encode("utf-8"))
+        os.close(fd)
+        yield
+    finally:
+        lock_path.unlink(missing_ok=True)
+
+
+class AuditStore:
+    """
+    Persistence backend for AuditLogger.
+    
+    AuditLogger keeps the log in a DataFrame and tells the store which
+    agencies changed since the last save. A store may write only those rows
+    (changed_keys) or the whole frame (changed_keys is None).
+    
+    Several operators may save the same log (e.g. on a shared drive). A
+    store remembers each row as it was loaded or last saved (the base), so a
+    save merges with rows other operators changed meanwhile instead of
+    overwriting them; see merge_audit_row().
+    """
+    
+    def load(self) -> Optional[pd.DataFrame]:
+        """
+        Load the stored audit log.
         
-        Args:
-            agency: Agency name
-            to: To email addresses
-            cc: CC email addresses
-            comments: Optional comments
-            
         Returns:
-            True if updated successfully
+            Audit log DataFrame, or None if nothing is stored yet
         """
-        df = self.load()
-        
-        # Find agency (case-insensitive)
-        mask = df[ColumnNames.AGENCY].str.upper() == agency.upper()
-        
-        if not mask.any():
-            self.logger.warning(f"Agency not found in audit log: {agency}")
-            return False
+        raise NotImplementedError
+    
+    def save(self, df: pd.DataFrame, changed_keys: Optional[Set[str]] = None) -> AuditSaveResult:
+        """
+        Persist the audit log.
         
-        # Update row
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M")
-        df.loc[mask, ColumnNames.SENT_DATE] = current_time
-        df.loc[mask, ColumnNames.TO] = to
-        df.loc[mask, ColumnNames.CC] = cc
-        df.loc[mask, ColumnNames.STATUS] = AuditStatus.SENT.value
-        if comments:
-            df.loc[mask, ColumnNames.COMMENTS] = comments
+        Args:
+            df: Current audit log
+            changed_keys: Upper-cased agency names changed since the last save,
+                or None to write everything
         
-        self._df = df
-        self.logger.info(f"Marked as sent: {agency}")
-        return True
+        Returns:
+            Rows merged from other operators' saves and any conflicts
+        """
+        raise NotImplementedError
     
-    def mark_responded(
+    def export(self, df: pd.DataFrame) -> None:
+        """Write the xlsx copy of the audit log now."""
+        raise NotImplementedError
+    
+    def flush(self) -> None:
+        """Complete any deferred work (e.g. a scheduled xlsx export)."""
+    
+    @staticmethod
+    def _rows(df: pd.DataFrame) -> Dict[str, dict]:
+        """Upper-cased agency -> row dict (blank cells as None)."""
+        frame = df.astype(object).where(df.notna(), None)
+        return {
+            str(row.get(ColumnNames.AGENCY) or "").upper(): row
+            for row in frame.to_dict(orient="records")
+        }
+    
+    @staticmethod
+    def _changed(row: dict, base: Optional[dict]) -> bool:
+        """Whether a row differs from its base."""
+        if base is None:
+            return True
+        return any(not audit_values_equal(row.get(col), base.get(col)) for col in dict.fromkeys([*row, *base]))
+
+
+class ExcelAuditStore(AuditStore):
+    """
+    Audit log stored directly as the xlsx workbook, rewritten on every save.
+    
+    Saves hold an advisory lock file next to the workbook. If another
+    operator saved the workbook since this one was loaded, it is read back
+    and merged with this log before it is rewritten.
+    """
+    
+    LOCK_TIMEOUT = 30.0   # Seconds to wait for another operator's save
+    STALE_LOCK_AGE = 120.0  # Locks older than this are left over from a crash
+    
+    def __init__(
         self,
-        agency: str,
-        comments: str = ""
-    ) -> bool:
+        audit_file_path: Path,
+        backup: Callable[[], Optional[Path]],
+        normalize: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None
+    ):
         """
-        Mark an agency as having responded.
+        Initialize Excel store.
         
         Args:
-            agency: Agency name
-            comments: Optional response comments
-            
-        Returns:
-            True if updated successfully
+            audit_file_path: Audit workbook path
+            backup: Called before the workbook is overwritten
+            normalize: Applied to the workbook as read (e.g. to add missing columns)
         """
-        df = self.load()
-        
-        # Find agency (case-insensitive)
-        mask = df[ColumnNames.AGENCY].str.upper() == agency.upper()
-        
-        if not mask.any():
-            self.logger.warning(f"Agency not found in audit log: {agency}")
-            return False
-        
-        # Update row
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M")
-        df.loc[mask, ColumnNames.RESPONSE_DATE] = current_time
-        df.loc[mask, ColumnNames.STATUS] = AuditStatus.RESPONDED.value
-        if comments:
-            current_comments = df.loc[mask, ColumnNames.COMMENTS].iloc[0]
-            if current_comments:
-                df.loc[mask, ColumnNames.COMMENTS] = f"{current_comments}; {comments}"
-            else:
-                df.loc[mask, ColumnNames.COMMENTS] = comments
+        self.audit_file_path = Path(audit_file_path)
+        self.lock_path = self.audit_file_path.with_name(self.audit_file_path.name + ".lock")
+        self.backup = backup
+        self.normalize = normalize
+        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self._base: Dict[str, dict] = {}
+        self._stamp: Optional[Tuple[int, int]] = None
+    
+    def _file_stamp(self) -> Optional[Tuple[int, int]]:
+        """(mtime_ns, size) of the workbook, None if it does not exist."""
+        try:
+            stat = self.audit_file_path.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+    
+    def _read(self) -> pd.DataFrame:
+        df = pd.read_excel(self.audit_file_path)
+        return self.normalize(df) if self.normalize else df
+    
+    def _locked(self):
+        """Hold the workbook's lock file (see exclusive_file_lock()) while saving."""
+        return exclusive_file_lock(
+            self.lock_path, self.LOCK_TIMEOUT, self.STALE_LOCK_AGE,
+            busy_message=f"{self.audit_file_path.name} is being saved by another user (lock {self.lock_path.name})"
+        )
+    
+    def load(self) -> Optional[pd.DataFrame]:
+        if not self.audit_file_path.exists():
+            return None
+        stamp = self._file_stamp()
+        df = self._read()
+        self._base, self._stamp = self._rows(df), stamp
+        return df
+    
+    def save(self, df: pd.DataFrame, changed_keys: Optional[Set[str]] = None) -> AuditSaveResult:
+        result = AuditSaveResult()
+        with self._locked():
+            stamp = self._file_stamp()
+            if stamp is not None and stamp != self._stamp:
+                # Another operator saved since we loaded: merge before rewriting
+                theirs = self._rows(self._read())
+                rows = self._rows(df)
+                for key, row in rows.items():
+                    stored = theirs.get(key)
+                    if stored is None:
+                        continue
+                    base = self._base.get(key)
+                    mine_changed = self._changed(row, base) if changed_keys is None else key in changed_keys
+                    if mine_changed:
+                        rows[key], conflicts = merge_audit_row(row.get(ColumnNames.AGENCY), base, row, stored)
+                        result.conflicts.extend(conflicts)
+                    else:
+                        rows[key] = stored
+                    if self._changed(row, rows[key]):
+                        result.merged[key] = rows[key]
+                for key, stored in theirs.items():
+                    if key not in rows:
+                        rows[key] = result.merged[key] = stored
+                columns = list(dict.fromkeys([*df.columns, *(col for row in rows.values() for col in row)]))
+                df = pd.DataFrame(list(rows.values())).reindex(columns=columns)
+            self.export(df)
+            self._base, self._stamp = self._rows(df), self._file_stamp()
+        return result
+    
+    def export(self, df: pd.DataFrame) -> None:
+        # Create backup if file exists
+        if self.audit_file_path.exists():
+            self.backup()
+        self.audit_file_path.parent.mkdir(parents=True, exist_ok=True)
+        df.to_excel(self.audit_file_path, index=False)
+
+
+def is_network_path(path: Path) -> bool:
+    """
+    Whether a path lives on a network share (UNC path or mapped network drive).
+    
+    Args:
+        path: Path to check
         
-        self._df = df
-        self.logger.info(f"Marked as responded: {agency}")
+    Returns:
+        True for UNC paths and network drives; False otherwise, or if unknown
+    """
+    resolved = str(Path(path).absolute())
+    if resolved.startswith(("\\\\", "//")):
         return True
+    drive = Path(resolved).drive
+    if len(drive) == 2 and drive[1] == ":":
+        try:
+            import ctypes
+            DRIVE_REMOTE = 4
+            return ctypes.windll.kernel32.GetDriveTypeW(f"{drive}\\") == DRIVE_REMOTE
+        except (ImportError, AttributeError, OSError):
+            return False
+    return False
+
+
+class SQLiteAuditStore(AuditStore):
+    """
+    Audit log stored in SQLite, one row per agency.
     
-    def get_status(self, agency: str) -> Optional[str]:
+    A save upserts only the agencies that changed, so marking an agency
+    costs the same regardless of how many agencies the log holds. The xlsx
+    workbook is kept as an export: it is rewritten once the log has been
+    quiet for export_delay seconds, on flush() and at interpreter exit.
+    
+    Each row carries a version. A save is a compare-and-swap per row: a row
+    whose version is still the one this store last saw is overwritten,
+    otherwise it is merged field by field with the stored row (see
+    merge_audit_row()). Rows other operators saved meanwhile are returned
+    so the log can pick them up. The write lock is held only for the
+    changed rows, so operators do not wait on each other's full rewrites.
+    
+    An existing xlsx audit log is imported the first time the database is
+    opened.
+    
+    The database runs in WAL mode on local disks. WAL needs shared memory
+    between the processes using it, which does not work across hosts on a
+    network share and can corrupt the database there, so on a network path
+    (see is_network_path()) the rollback journal (DELETE mode) is used.
+    
+    Examples:
+        >>> store = SQLiteAuditStore(Path("output/Audit_CognosAccessReview.db"),
+        ...                          Path("output/Audit_CognosAccessReview.xlsx"))
+        >>> logger = AuditLogger(output_dir=Path("output"), store=store)
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS audit_log (
+            agency_key TEXT PRIMARY KEY,
+            position INTEGER NOT NULL,
+            status TEXT,
+            data TEXT NOT NULL,
+            version INTEGER NOT NULL DEFAULT 1
+        );
+        CREATE INDEX IF NOT EXISTS idx_audit_log_status ON audit_log(status);
+        CREATE TABLE IF NOT EXISTS audit_meta (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        );
+    """
+    
+    def __init__(
+        self,
+        db_path: Path,
+        xlsx_path: Path,
+        export_delay: float = 30.0,
+        backup: Optional[Callable[[], Optional[Path]]] = None,
+        normalize: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None
+    ):
         """
-        Get status for a specific agency.
+        Initialize SQLite store.
         
         Args:
-            agency: Agency name
-            
-        Returns:
-            Status string or None if not found
+            db_path: SQLite database path
+            xlsx_path: Workbook the log is exported to (and imported from once)
+            export_delay: Seconds without saves before the xlsx is rewritten
+                (0 to export on every save)
+            backup: Called before the exported workbook is overwritten
+            normalize: Applied to the log as loaded (e.g. to add missing columns)
         """
-        df = self.load()
-        
-        # Find agency (case-insensitive)
-        mask = df[ColumnNames.AGENCY].str.upper() == agency.upper()
-        
-        if not mask.any():
+        self.db_path = Path(db_path)
+        self.xlsx_path = Path(xlsx_path)
+        self.export_delay = export_delay
+        self.backup = backup
+        self.normalize = normalize
+        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self._export_lock = threading.Lock()
+        self._export_timer: Optional[threading.Timer] = None
+        self._pending_export: Optional[Callable[[], pd.DataFrame]] = None
+        self._atexit_registered = False
+        # Upper-cased agency -> (version, row) as last loaded or saved
+        self._base: Dict[str, Tuple[int, dict]] = {}
+        self.journal_mode = "WAL"
+        if is_network_path(self.db_path):
+            self.journal_mode = "DELETE"
+            self.logger.info(f"{self.db_path.parent} is a network share; not using WAL mode (unsafe across hosts)")
+    
+    def _connect(self) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute(f"PRAGMA journal_mode={self.journal_mode}")
+        # WAL makes NORMAL durable enough; the rollback journal needs FULL
+        conn.execute("PRAGMA synchronous=NORMAL" if self.journal_mode == "WAL" else "PRAGMA synchronous=FULL")
+        conn.executescript(self.SCHEMA)
+        # Databases created before rows were versioned
+        if "version" not in {info[1] for info in conn.execute("PRAGMA table_info(audit_log)")}:
+            conn.execute("ALTER TABLE audit_log ADD COLUMN version INTEGER NOT NULL DEFAULT 1")
+            conn.commit()
+        return conn
+    
+    @staticmethod
+    def _plain(value):
+        """JSON fallback for numpy scalars and timestamps."""
+        return value.item() if hasattr(value, "item") else str(value)
+    
+    def _read_frame(self, conn: sqlite3.Connection) -> Tuple[Optional[pd.DataFrame], Dict[str, Tuple[int, dict]]]:
+        """Stored log and its (version, row) per agency; (None, {}) if nothing is stored."""
+        columns = conn.execute("SELECT value FROM audit_meta WHERE key = 'columns'").fetchone()
+        if columns is None:
+            return None, {}
+        rows = conn.execute("SELECT agency_key, version, data FROM audit_log ORDER BY position").fetchall()
+        versions = {key: (version, json.loads(data)) for key, version, data in rows}
+        df = pd.DataFrame([row for _, row in versions.values()]).reindex(columns=json.loads(columns[0]))
+        return df, versions
+    
+    def load(self) -> Optional[pd.DataFrame]:
+        with closing(self._connect()) as conn:
+            df, versions = self._read_frame(conn)
+        
+        if df is None and self.xlsx_path.exists():
+            # First open: import the existing workbook
+            df = pd.read_excel(self.xlsx_path)
+            if self.normalize:
+                df = self.normalize(df)
+            self._base = {}
+            self._write(df, None)
+            self.logger.info(f"Imported {len(df)} audit rows from {self.xlsx_path.name} into {self.db_path.name}")
+            return df
+        if df is None:
+            self._base = {}
             return None
         
-        return df.loc[mask, ColumnNames.STATUS].iloc[0]
+        self._base = versions
+        return self.normalize(df) if self.normalize else df
     
-    def get_agencies_by_status(self, status: AuditStatus) -> List[str]:
+    def save(self, df: pd.DataFrame, changed_keys: Optional[Set[str]] = None) -> AuditSaveResult:
+        result = self._write(df, changed_keys)
+        self.schedule_export(self._export_frame)
+        return result
+    
+    def _export_frame(self) -> pd.DataFrame:
+        """The stored log, including rows saved by other operators."""
+        with closing(self._connect()) as conn:
+            df, _ = self._read_frame(conn)
+        return df if df is not None else pd.DataFrame()
+    
+    def _write(self, df: pd.DataFrame, changed_keys: Optional[Set[str]]) -> AuditSaveResult:
         """
-        Get list of agencies with specific status.
+        Compare-and-swap the changed rows in one transaction.
         
-        Args:
-            status: Status to filter by
-            
-        Returns:
-            List of agency names
+        With changed_keys None, every row that differs from its base is
+        written; rows missing from df are kept (another operator may have
+        added them).
         """
-        df = self.load()
+        keys = df[ColumnNames.AGENCY].astype(str).str.upper()
+        if changed_keys is None:
+            positions = list(range(len(df)))
+        else:
+            positions = keys.isin(changed_keys).to_numpy().nonzero()[0]
+        rows = self._rows(df.iloc[positions])
+        pending = [
+            (int(position), key, rows[key]) for position, key in zip(positions, keys.iloc[positions])
+            if changed_keys is not None or self._changed(rows[key], self._base.get(key, (0, None))[1])
+        ]
         
-        if df.empty:
-            return []
+        result = AuditSaveResult()
+        # Applied to _base only once the transaction commits
+        seen: Dict[str, Tuple[int, dict]] = {}
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for position, key, row in pending:
+                    base_version, base = self._base.get(key, (None, None))
+                    stored = conn.execute(
+                        "SELECT version, data FROM audit_log WHERE agency_key = ?", (key,)
+                    ).fetchone()
+                    if stored is None:
+                        version = 1
+                    elif stored[0] == base_version:
+                        version = stored[0] + 1
+                    else:
+                        # Changed by another operator since we loaded it
+                        version = stored[0] + 1
+                        theirs = json.loads(stored[1])
+                        row, conflicts = merge_audit_row(row.get(ColumnNames.AGENCY), base, row, theirs)
+                        result.conflicts.extend(conflicts)
+                        result.merged[key] = row
+                    conn.execute(
+                        "INSERT INTO audit_log (agency_key, position, status, data, version) VALUES (?, ?, ?, ?, ?) "
+                        "ON CONFLICT(agency_key) DO UPDATE SET position = excluded.position, "
+                        "status = excluded.status, data = excluded.data, version = excluded.version",
+                        (key, position, row.get(ColumnNames.STATUS),
+                         json.dumps(row, ensure_ascii=False, default=self._plain), version)
+                    )
+                    seen[key] = (version, json.loads(json.dumps(row, ensure_ascii=False, default=self._plain)))
+                
+                # Pick up rows other operators saved since we last looked
+                for key, version in conn.execute("SELECT agency_key, version FROM audit_log").fetchall():
+                    if key not in seen and self._base.get(key, (None,))[0] != version:
+                        (data,) = conn.execute("SELECT data FROM audit_log WHERE agency_key = ?", (key,)).fetchone()
+                        seen[key] = (version, json.loads(data))
+                        result.merged[key] = seen[key][1]
+                
+                stored_columns = conn.execute("SELECT value FROM audit_meta WHERE key = 'columns'").fetchone()
+                columns = json.loads(stored_columns[0]) if stored_columns else []
+                conn.execute(
+                    "INSERT OR REPLACE INTO audit_meta (key, value) VALUES ('columns', ?)",
+                    (json.dumps(list(dict.fromkeys([*(str(c) for c in df.columns), *columns]))),)
+                )
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+        self._base.update(seen)
+        self.logger.debug(f"Wrote {len(pending)} audit rows to {self.db_path.name}")
+        if result.merged:
+            self.logger.info(f"Merged {len(result.merged)} audit rows saved by other users")
+        return result
+
+    def schedule_export(self, frame: Callable[[], pd.DataFrame]) -> None:
+        """
+        Rewrite the xlsx export once saves have been quiet for export_delay seconds.
         
-        mask = df[ColumnNames.STATUS] == status.value
-        return df.loc[mask, ColumnNames.AGENCY].tolist()
+        Args:
+            frame: Returns the audit log to export when the timer fires
+        """
+        with self._export_lock:
+            self._pending_export = frame
+            if self._export_timer is not None:
+                self._export_timer.cancel()
+            if not self._atexit_registered:
+                atexit.register(self.flush)
+                self._atexit_registered = True
+            if self.export_delay <= 0:
+                self._export_timer = None
+            else:
+                self._export_timer = threading.Timer(self.export_delay, self.flush)
+                self._export_timer.daemon = True
+                self._export_timer.start()
+        if self.export_delay <= 0:
+            self.flush()
+    
+    def flush(self) -> None:
+        with self._export_lock:
+            frame, self._pending_export = self._pending_export, None
+            if self._export_timer is not None:
+                self._export_timer.cancel()
+                self._export_timer = None
+        if frame is not None:
+            try:
+                self.export(frame().copy())
+            except Exception as e:
+                self.logger.error(f"Failed to export audit log to {self.xlsx_path.name}: {e}")
     
-    def get_metrics(
-        self,
-        deadline: str,
-        total_agencies: Optional[int] = None
-    ) -> DashboardMetrics:
+    def export(self, df: pd.DataFrame) -> None:
+        if self.xlsx_path.exists() and self.backup:
+            self.backup()
+        self.xlsx_path.parent.mkdir(parents=True, exist_ok=True)
+        df.to_excel(self.xlsx_path, index=False)
+        self.logger.info(f"Exported audit log: {self.xlsx_path}")
+
+
+class AuditJournal:
+    """
+    Append-only journal of audit state transitions (JSON lines).
+    
+    Every change an AuditLogger makes is appended as an event carrying the
+    agency's row after the change, so the journal keeps the full history
+    (each send date, each response) that the current-state log overwrites.
+    Events are buffered and written with a single fsync per commit().
+    
+    The audit store is the snapshot of the journal: after the store is
+    saved, checkpoint() records the last event it includes and the byte
+    offset after it. Loading replays only events past the checkpoint (e.g.
+    after a crash between commit and save), so cold loads stay fast however
+    long the history grows.
+    
+    Several operators may share a journal (e.g. on a network drive).
+    Sequence numbers are assigned and events appended under a lock file, so
+    they stay unique across processes and hosts. Each event carries its
+    writer (host and user), and checkpoints are kept per writer: a save
+    covers only that writer's events, so it never hides another operator's
+    events that have not reached the store yet.
+    
+    Examples:
+        >>> journal = AuditJournal(Path("output/Audit_CognosAccessReview.events.jsonl"))
+        >>> journal.append("BBDO", AuditEventType.SENT, {"Status": "Sent"})
+        >>> seq = journal.commit()
+        >>> journal.history("BBDO")[-1]["event"]
+        'sent'
+    """
+    
+    # Serializes seq assignment between loggers sharing a journal in this process;
+    # the lock file does the same between processes
+    _lock = threading.Lock()
+    
+    def __init__(self, path: Path, writer: Optional[str] = None):
         """
-        Calculate dashboard metrics from audit log.
+        Initialize journal.
         
         Args:
-            deadline: Deadline string (e.g., "June 30, 2025")
-            total_agencies: Optional total agency count (uses log count if None)
-            
-        Returns:
-            DashboardMetrics instance
+            path: Journal file (the checkpoint and lock file are stored next to it)
+            writer: Writer id for events and checkpoints (defaults to host/user)
         """
-        df = self.load()
+        self.path = Path(path)
+        self.checkpoint_path = self.path.with_name(self.path.name + ".checkpoint")
+        self.lock_path = self.path.with_name(self.path.name + ".lock")
+        self.writer = writer or f"{platform.node()}/{os.environ.get('USERNAME') or os.environ.get('USER', '')}"
+        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self._buffer: List[dict] = []
+        self._offset = 0  # journal size after this writer's last commit
+    
+    def _locked(self):
+        """Hold the journal's lock file (see exclusive_file_lock())."""
+        return exclusive_file_lock(
+            self.lock_path, busy_message=f"{self.path.name} is being written by another user (lock {self.lock_path.name})"
+        )
+    
+    @property
+    def pending(self) -> int:
+        """Number of events appended but not yet committed."""
+        return len(self._buffer)
+    
+    @staticmethod
+    def _plain(value):
+        """JSON fallback for numpy scalars and timestamps."""
+        return value.item() if hasattr(value, "item") else str(value)
+    
+    def append(self, agency: str, event: AuditEventType, fields: Dict[str, object]) -> None:
+        """
+        Buffer an event.
         
-        if total_agencies is None:
-            total_agencies = len(df) if not df.empty else 0
+        Args:
+            agency: Agency the event applies to
+            event: Transition type
+            fields: Audit row values after the transition
+        """
+        self._buffer.append({
+            "ts": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "agency": agency,
+            "event": event.value,
+            "fields": fields
+        })
+    
+    def _last_seq(self) -> int:
+        """Sequence number of the last event on disk (reads only the file tail)."""
+        if not self.path.exists() or self.path.stat().st_size == 0:
+            return 0
+        with open(self.path, 'rb') as f:
+            f.seek(max(0, self.path.stat().st_size - 65536))
+            lines = f.read().splitlines()
+        for line in reversed(lines):
+            try:
+                return int(json.loads(line)["seq"])
+            except (ValueError, KeyError):
+                continue
+        return 0
+    
+    def _read_checkpoints(self) -> dict:
+        """Checkpoint file contents: {"writers": {writer: {"seq", "offset"}}}, plus a
+        shared "seq"/"offset" left by journals written before checkpoints were per writer."""
+        try:
+            with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def read_checkpoint(self) -> Dict[str, int]:
+        """This writer's last checkpoint as {"seq": ..., "offset": ...} (zeros if none).
         
-        return DashboardMetrics.calculate(df, deadline, total_agencies)
+        Until the first per-writer checkpoint, the shared one covers every writer.
+        """
+        checkpoints = self._read_checkpoints()
+        if "writers" not in checkpoints:
+            return {"seq": checkpoints.get("seq", 0), "offset": checkpoints.get("offset", 0)}
+        return checkpoints["writers"].get(self.writer, {"seq": 0, "offset": 0})
     
-    def export_to_csv(self, output_path: Path) -> bool:
+    def commit(self) -> int:
         """
-        Export audit log to CSV format.
+        Write buffered events with one fsync.
         
-        Args:
-            output_path: Path for CSV output
-            
         Returns:
-            True if successful
+            Sequence number of the last event in the journal
         """
-        df = self.load()
+        with self._lock:
+            # Take the buffer first: events appended while writing go to the next commit
+            events, self._buffer = self._buffer, []
+            if not events:
+                return self._last_seq()
+            try:
+                with self._locked():
+                    seq = self._last_seq()
+                    lines = []
+                    for event in events:
+                        seq += 1
+                        lines.append(json.dumps(
+                            {"seq": seq, "writer": self.writer, **event}, ensure_ascii=False, default=self._plain
+                        ))
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    with open(self.path, 'a', encoding='utf-8') as f:
+                        f.write("\n".join(lines) + "\n")
+                        f.flush()
+                        os.fsync(f.fileno())
+                        self._offset = f.tell()
+            except Exception:
+                self._buffer[:0] = events
+                raise
+            return seq
+    
+    def checkpoint(self, seq: int) -> None:
+        """
+        Record that the audit store now includes this writer's events up to seq.
         
-        if df.empty:
-            self.logger.warning("No audit data to export")
-            return False
+        Other writers' checkpoints are kept as they are. The shared checkpoint
+        of older journals is dropped: the events it left were replayed when
+        this log was loaded, so the store now includes them too.
         
-        try:
-            df.to_csv(output_path, index=False, encoding='utf-8-sig')
-            self.logger.info(f"Exported audit log to CSV: {output_path}")
-            return True
-        except Exception as e:
-            self.logger.error(f"Failed to export to CSV: {e}")
-            return False
-    
-    def get_summary_stats(self) -> Dict[str, int]:
+        Args:
+            seq: Last event sequence number included in the saved snapshot
+                (the value returned by commit())
         """
-        Get summary statistics from audit log.
-        
-        Returns:
-            Dictionary with count statistics
+        with self._locked():
+            writers = self._read_checkpoints().get("writers", {})
+            writers[self.writer] = {"seq": seq, "offset": self._offset}
+            temp_path = self.checkpoint_path.with_name(self.checkpoint_path.name + f".{os.getpid()}.tmp")
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({"writers": writers}, f)
+            os.replace(temp_path, self.checkpoint_path)
+    
+    def replay(self, apply: Callable[[dict], None]) -> int:
         """
-        df = self.load()
+        Apply this writer's events written after its last checkpoint.
         
-        if df.empty:
-            return {
-                "total": 0,
-                "not_sent": 0,
-                "sent": 0,
-                "responded": 0,
-                "overdue": 0
-            }
+        Events of older journals, written before events carried a writer,
+        are applied while the journal still has only the shared checkpoint.
+        Other writers' events are theirs to replay.
         
-        stats = {
-            "total": len(df),
-            "not_sent": (df[ColumnNames.STATUS] == AuditStatus.NOT_SENT.value).sum(),
-            "sent": (df[ColumnNames.STATUS] == AuditStatus.SENT.value).sum(),
-            "responded": (df[ColumnNames.STATUS] == AuditStatus.RESPONDED.value).sum(),
-            "overdue": 0
-        }
+        Args:
+            apply: Called with each event dict, in order
         
-        # Calculate overdue (sent more than 7 days ago)
-        if ColumnNames.SENT_DATE in df.columns:
-            for _, row in df.iterrows():
-                if row[ColumnNames.STATUS] == AuditStatus.SENT.value:
-                    sent_date_str = row.get(ColumnNames.SENT_DATE, "")
-                    if sent_date_str:
-                        try:
-                            sent_date = datetime.strptime(str(sent_date_str), "%Y-%m-%d %H:%M")
-                            if (datetime.now() - sent_date).days > 7:
-                                stats["overdue"] += 1
-                        except (ValueError, TypeError):
-                            pass
+        Returns:
+            Number of events applied
+        """
+        if not self.path.exists():
+            return 0
+        shared = "writers" not in self._read_checkpoints()
+        checkpoint = self.read_checkpoint()
+        applied = 0
+        with open(self.path, 'r', encoding='utf-8') as f:
+            if checkpoint["offset"] <= self.path.stat().st_size:
+                f.seek(checkpoint["offset"])
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                writer = event.get("writer")
+                if writer != self.writer and not (shared and writer is None):
+                    continue
+                if event.get("seq", 0) > checkpoint["seq"]:
+                    apply(event)
+                    applied += 1
+        if applied:
+            self.logger.info(f"Replayed {applied} journal events after checkpoint {checkpoint['seq']}")
+        return applied
+    
+    def history(self, agency: Optional[str] = None) -> List[dict]:
+        """
+        Read the full event history.
         
-        return stats
-
-
-# ============ MODULE: region_manager ============
-
-
+        Args:
+            agency: Optional agency to filter by (case-insensitive)
+        
+        Returns:
+            Events in order, each with seq, ts, agency, event and fields
+        """
+        if not self.path.exists():
+            return []
+        events = []
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                if agency is None or str(event.get("agency", "")).upper() == agency.upper():
+                    events.append(event)
+        return events
 
 
-@dataclass
-class RegionProfile:
+class AuditCounters:
     """
-    Represents a complete regional configuration.
+    Status and overdue counts of an audit log, maintained incrementally.
     
-    Attributes:
-        region_name: Unique identifier for the region (e.g., "North America", "EMEA")
-        master_file: Path to the master user access file for this region
-        mapping_file: Path to the agency mapping file for this region
-        output_dir: Output directory for generated files for this region
-        email_manifest: Path to the shared email manifest file
-        description: Optional description of the region
+    The counters are built once from the log and then updated per changed
+    agency, so reading them costs nothing however many agencies the log
+    holds. Sent agencies wait in a heap ordered by the time they become
+    overdue; advance() moves the ones whose time has passed to Overdue
+    without rescanning the log.
+    
+    Examples:
+        >>> counters = AuditCounters.from_frame(audit_df, region="APAC")
+        >>> counters.update("BBDO", "Sent", "2025-06-01 10:00")
+        True
+        >>> counters.advance()
+        ['BBDO']
+        >>> counters.metrics("June 30, 2025").overdue_count
+        1
     """
-    region_name: str
-    master_file: str
-    mapping_file: str
-    output_dir: str
-    email_manifest: str
-    description: str = ""
     
-    def validate(self) -> List[str]:
+    def __init__(self, region: str = "", overdue_after_days: int = OVERDUE_AFTER_DAYS):
         """
-        Validate that all required paths are set.
+        Initialize empty counters.
         
-        Returns:
-            List of validation error messages (empty if valid)
+        Args:
+            region: Region (output folder) the counted log belongs to
+            overdue_after_days: Days without a response before a send is overdue
         """
-        errors = []
-        
-        if not self.region_name or not self.region_name.strip():
-            errors.append("Region name is required")
-        
-        if not self.master_file or not self.master_file.strip():
-            errors.append("Master file path is required")
-        
-        if not self.mapping_file or not self.mapping_file.strip():
-            errors.append("Agency mapping file path is required")
+        self.region = region
+        self.overdue_after = timedelta(days=overdue_after_days)
+        self._lock = threading.RLock()
+        self._rows: Dict[str, Tuple[str, Optional[datetime]]] = {}  # agency -> (status, sent time)
+        self._status: Counter = Counter()
+        self._overdue: Set[str] = set()
+        self._heap: List[Tuple[datetime, str, datetime]] = []  # (overdue at, agency, sent time)
+    
+    @classmethod
+    def from_frame(
+        cls,
+        audit_df: pd.DataFrame,
+        region: str = "",
+        now: Optional[datetime] = None,
+        overdue_after_days: int = OVERDUE_AFTER_DAYS
+    ) -> 'AuditCounters':
+        """Build counters from an audit log (typed or as loaded)."""
+        counters = cls(region, overdue_after_days)
+        counters.reset(audit_df, now)
+        return counters
+    
+    @staticmethod
+    def _sent_time(value) -> Optional[datetime]:
+        if value is None or (not isinstance(value, str) and pd.isna(value)):
+            return None
+        if isinstance(value, datetime):
+            return value
+        try:
+            return datetime.strptime(str(value).strip(), "%Y-%m-%d %H:%M")
+        except ValueError:
+            parsed = pd.to_datetime(str(value), errors="coerce")
+            return None if pd.isna(parsed) else parsed.to_pydatetime()
+    
+    def reset(self, audit_df: pd.DataFrame, now: Optional[datetime] = None) -> None:
+        """Recount from a whole audit log (the last row of a duplicated agency wins)."""
+        typed = type_audit_frame(audit_df)
+        with self._lock:
+            self._rows, self._status, self._overdue, self._heap = {}, Counter(), set(), []
+            if typed.empty or ColumnNames.STATUS not in typed.columns:
+                return
+            keys = typed[ColumnNames.AGENCY].astype(str).str.upper()
+            sent_times = (typed[ColumnNames.SENT_DATE] if ColumnNames.SENT_DATE in typed.columns
+                          else pd.Series(pd.NaT, index=typed.index))
+            for key, status, sent in zip(keys, typed[ColumnNames.STATUS].astype(str), sent_times):
+                self._rows[key] = (status, None if pd.isna(sent) else sent.to_pydatetime())
+            self._status.update(status for status, _ in self._rows.values())
+            now = now or datetime.now()
+            for key, (status, sent) in self._rows.items():
+                if status == AuditStatus.SENT.value and sent is not None:
+                    if sent + self.overdue_after < now:
+                        self._overdue.add(key)
+                    else:
+                        self._heap.append((sent + self.overdue_after, key, sent))
+            heapq.heapify(self._heap)
+    
+    def update(self, agency: str, status, sent_date=None, now: Optional[datetime] = None) -> bool:
+        """
+        Record an agency's status and send date after a change.
         
-        if not self.output_dir or not self.output_dir.strip():
-            errors.append("Output directory is required")
+        Args:
+            agency: Agency whose row changed
+            status: Its status now
+            sent_date: Its sent date now (text as stored, or a datetime)
+            now: Reference time (defaults to now)
         
-        if not self.email_manifest or not self.email_manifest.strip():
-            errors.append("Email manifest path is required")
+        Returns:
+            True if the counts changed
+        """
+        key = agency.upper()
+        new = (str(status if status is not None and not pd.isna(status) else ""), self._sent_time(sent_date))
+        with self._lock:
+            old = self._rows.get(key)
+            if old == new:
+                return False
+            if old is not None:
+                self._status[old[0]] -= 1
+                self._overdue.discard(key)
+            self._rows[key] = new
+            self._status[new[0]] += 1
+            status, sent = new
+            if status == AuditStatus.SENT.value and sent is not None:
+                if sent + self.overdue_after < (now or datetime.now()):
+                    self._overdue.add(key)
+                else:
+                    heapq.heappush(self._heap, (sent + self.overdue_after, key, sent))
+            return True
+    
+    def advance(self, now: Optional[datetime] = None) -> List[str]:
+        """
+        Move sends whose response window has passed to Overdue.
         
-        return errors
+        Returns:
+            Agencies (upper-cased) that became overdue
+        """
+        now = now or datetime.now()
+        became = []
+        with self._lock:
+            while self._heap and self._heap[0][0] < now:
+                _, key, sent = heapq.heappop(self._heap)
+                # Entries of agencies changed since they were queued are stale
+                if self._rows.get(key) == (AuditStatus.SENT.value, sent) and key not in self._overdue:
+                    self._overdue.add(key)
+                    became.append(key)
+        return became
+    
+    def next_overdue_at(self) -> Optional[datetime]:
+        """When the next Sent agency becomes overdue (None if none is waiting)."""
+        with self._lock:
+            return self._heap[0][0] if self._heap else None
     
-    def to_dict(self) -> Dict:
-        """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+    @property
+    def total(self) -> int:
+        """Number of agencies counted."""
+        return len(self._rows)
     
-    @classmethod
-    def from_dict(cls, data: Dict) -> 'RegionProfile':
-        """Create RegionProfile from dictionary."""
-        return cls(**data)
+    @property
+    def counts(self) -> Counter:
+        """Agencies per status, with overdue sends counted under Overdue instead of Sent."""
+        with self._lock:
+            counts = Counter({status: n for status, n in self._status.items() if n})
+            if self._overdue:
+                counts[AuditStatus.SENT.value] -= len(self._overdue)
+                counts[AuditStatus.OVERDUE.value] += len(self._overdue)
+            return +counts
+    
+    def metrics(self, deadline: Optional[str], total_agencies: Optional[int] = None) -> DashboardMetrics:
+        """
+        Dashboard metrics from the counters.
+        
+        Args:
+            deadline: Deadline such as "June 30, 2025"
+            total_agencies: Total to report (defaults to the agencies counted)
+        
+        Returns:
+            DashboardMetrics instance
+        """
+        return metrics_from_status_counts(self.counts, deadline, self.total if total_agencies is None else total_agencies)
 
 
-class RegionManager:
+class AuditLogger:
     """
-    Manages regional profiles with persistence to JSON file.
+    Manages audit log for tracking email status and responses.
     
-    This class provides methods to create, update, delete, and switch between
-    different regional configurations. Each region has its own master file,
-    agency mapping, and output directory, but shares a common email manifest.
+    This class provides functionality for creating, updating, and querying
+    the audit log with automatic backups. The log is persisted through an
+    AuditStore: SQLite with an xlsx export (audit_backend "sqlite", the
+    default) or the xlsx workbook alone ("xlsx"). Every change is also
+    appended to an AuditJournal, which keeps the full history.
+    
+    Status and overdue counts are kept in AuditCounters, updated on each
+    change; subscribers are called with the agencies that changed.
     
     Examples:
-        >>> manager = RegionManager()
-        >>> profile = RegionProfile(
-        ...     region_name="North America",
-        ...     master_file="C:/Data/NA_Master.xlsx",
-        ...     mapping_file="C:/Data/NA_Mapping.xlsx",
-        ...     output_dir="C:/Output/NA",
-        ...     email_manifest="C:/Data/Email_Manifest.xlsx"
+        >>> audit_logger = AuditLogger(output_dir=Path("output"))
+        >>> audit_logger.initialize_log(agencies=["Agency1", "Agency2"])
+        >>> audit_logger.mark_sent(
+        ...     agency="Agency1",
+        ...     to="test@example.com",
+        ...     cc="manager@example.com"
         ... )
-        >>> manager.add_profile(profile)
-        >>> manager.switch_region("North America")
-        >>> current = manager.get_current_profile()
+        >>> metrics = audit_logger.get_metrics(deadline="June 30, 2025")
+        >>> print(f"Completion: {metrics.completion_percentage:.1f}%")
     """
     
-    def __init__(self, config_file: Optional[Path] = None):
+    def __init__(
+        self,
+        output_dir: Optional[Path] = None,
+        audit_file_name: Optional[str] = None,
+        store: Optional[AuditStore] = None
+    ):
         """
-        Initialize region manager.
+        Initialize audit logger.
         
         Args:
-            config_file: Path to region profiles JSON file (defaults to region_profiles.json)
+            output_dir: Directory for audit log file (optional, can be set later)
+            audit_file_name: Optional custom audit file name
+            store: Optional storage backend (defaults to the audit_backend setting)
         """
-        self.config_file = config_file or Path("region_profiles.json")
-        self.profiles: Dict[str, RegionProfile] = {}
-        self.current_region: Optional[str] = None
-        self.load_profiles()
+        self.output_dir = Path(output_dir) if output_dir else None
+        self.audit_file_name = audit_file_name or "Audit_CognosAccessReview.xlsx"
+        self.audit_file_path = (self.output_dir / self.audit_file_name) if self.output_dir else None
+        self.tracking_index_path = (self.output_dir / FileNames.TRACKING_INDEX) if self.output_dir else None
+        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self._store = store
+        self._frame: Optional[pd.DataFrame] = None
+        # Upper-cased agencies changed since the last save; None means the
+        # whole frame must be written
+        self._dirty: Optional[Set[str]] = set()
+        # Upper-cased agency -> row positions, rebuilt when the frame changes
+        self._index: Optional[Dict[str, List[int]]] = None
+        self._index_size = 0
+        # Typed view for metrics (see type_audit_frame), rebuilt after changes
+        self._typed: Optional[pd.DataFrame] = None
+        # Incremental counts (built on first use) and their change subscribers
+        self._counters: Optional[AuditCounters] = None
+        self._subscribers: List[Callable[[Optional[List[str]]], None]] = []
+        # Serializes saves (the GUI saves through AuditWriteBehind's thread)
+        self._save_lock = threading.Lock()
+        self.last_error: Optional[str] = None
+        # Fields other operators changed too, kept as they saved them (see take_conflicts())
+        self.conflicts: List[AuditConflict] = []
+        self.journal = AuditJournal(self.audit_file_path.with_suffix(".events.jsonl")) if self.audit_file_path else None
     
-    def load_profiles(self) -> None:
-        """Load profiles from JSON file."""
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    
-                # Load profiles
-                profiles_data = data.get("profiles", {})
-                for region_name, profile_data in profiles_data.items():
-                    try:
-                        self.profiles[region_name] = RegionProfile.from_dict(profile_data)
-                    except Exception as e:
-                        logger.error(f"Failed to load profile '{region_name}': {e}")
-                
-                # Load current region
-                self.current_region = data.get("current_region")
-                
-                logger.info(f"Loaded {len(self.profiles)} region profiles from {self.config_file}")
-                
-            except json.JSONDecodeError as e:
-                logger.error(f"Invalid JSON in region profiles file: {e}")
-                self.profiles = {}
-                self.current_region = None
-            except Exception as e:
-                logger.error(f"Failed to load region profiles: {e}")
-                self.profiles = {}
-                self.current_region = None
-        else:
-            logger.info(f"Region profiles file not found at {self.config_file}, starting fresh")
+    @property
+    def _df(self) -> Optional[pd.DataFrame]:
+        return self._frame
+    
+    @_df.setter
+    def _df(self, df: Optional[pd.DataFrame]) -> None:
+        # Callers that assign the frame directly replace the whole log
+        self._frame = df
+        self._dirty = None
+        self._index = None
+        self._typed = None
+        self._reset_counters()
     
-    def save_profiles(self) -> None:
-        """Save profiles to JSON file."""
-        try:
-            data = {
-                "profiles": {
-                    name: profile.to_dict() 
-                    for name, profile in self.profiles.items()
-                },
-                "current_region": self.current_region,
-                "version": "1.0"
-            }
-            
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            
-            logger.info(f"Saved {len(self.profiles)} region profiles to {self.config_file}")
-            
-        except Exception as e:
-            logger.error(f"Failed to save region profiles: {e}")
-            raise
+    @property
+    def store(self) -> AuditStore:
+        """Storage backend, created from the audit_backend setting on first use."""
+        if self._store is None:
+            backend = config_manager.get("audit_backend", ConfigManager.DEFAULT_CONFIG["audit_backend"])
+            if backend == "sqlite":
+                self._store = SQLiteAuditStore(
+                    self.audit_file_path.with_suffix(".db"),
+                    self.audit_file_path,
+                    export_delay=float(config_manager.get("audit_xlsx_export_seconds", 30.0)),
+                    backup=self.create_backup,
+                    normalize=self._normalize
+                )
+            else:
+                self._store = ExcelAuditStore(self.audit_file_path, self.create_backup, normalize=self._normalize)
+        return self._store
     
-    def add_profile(self, profile: RegionProfile) -> bool:
+    def _touch(self, agency: str, event: Optional[AuditEventType] = None) -> None:
         """
-        Add or update a region profile.
+        Record that an agency's row changed since the last save.
         
         Args:
-            profile: RegionProfile to add
-            
-        Returns:
-            True if successful, False otherwise
+            agency: Agency whose row changed
+            event: Transition to journal, with the row's values after it
         """
-        # Validate profile
-        errors = profile.validate()
-        if errors:
-            logger.error(f"Invalid profile: {', '.join(errors)}")
-            return False
-        
-        # Check for duplicate names
-        if profile.region_name in self.profiles:
-            logger.info(f"Updating existing profile: {profile.region_name}")
-        else:
-            logger.info(f"Adding new profile: {profile.region_name}")
-        
-        self.profiles[profile.region_name] = profile
-        self.save_profiles()
-        return True
-    
-    def delete_profile(self, region_name: str) -> bool:
+        self._typed = None
+        if self._dirty is not None:
+            self._dirty.add(agency.upper())
+        journal = event is not None and self.journal is not None
+        if journal or self._counters is not None:
+            rows = self._locate(agency)
+            if not rows.empty:
+                row = self._frame.loc[rows[0]]
+                if journal:
+                    fields = {col: (None if pd.isna(row[col]) else row[col]) for col in self._get_columns() if col in row.index}
+                    self.journal.append(agency, event, fields)
+                if self._counters is not None and self._counters.update(
+                    agency, row.get(ColumnNames.STATUS), row.get(ColumnNames.SENT_DATE)
+                ):
+                    self._publish([agency])
+    
+    def _apply_event(self, event: dict) -> None:
+        """Apply a replayed journal event (the row's values after it) to the frame."""
+        agency = str(event.get("agency", ""))
+        fields = {col: value for col, value in event.get("fields", {}).items() if col in self._frame.columns}
+        rows = self._locate(agency)
+        if rows.empty:
+            self._frame = pd.concat([self._frame, pd.DataFrame([fields])], ignore_index=True)
+            self._index = None
+            self._typed = None
+            self._counters = None
+        elif fields:
+            self._as_text(self._frame, [col for col in fields if col != ColumnNames.FOLLOWUP_COUNT])
+            self._frame.loc[rows, list(fields)] = list(fields.values())
+        self._touch(agency)
+    
+    def _agency_index(self) -> Dict[str, List[int]]:
+        """Case-insensitive agency -> row positions index of the loaded log."""
+        df = self.load()
+        # Rows appended to the frame outside this class also invalidate it
+        if self._index is None or self._index_size != len(df):
+            index: Dict[str, List[int]] = {}
+            for position, key in enumerate(df[ColumnNames.AGENCY].astype(str).str.upper()):
+                index.setdefault(key, []).append(position)
+            self._index, self._index_size = index, len(df)
+        return self._index
+    
+    def _locate(self, agency: str) -> pd.Index:
+        """Row labels of an agency (case-insensitive); empty if not in the log."""
+        return self.load().index[self._agency_index().get(agency.upper(), [])]
+    
+    def _locate_many(self, agencies: List[str]) -> Tuple[List[str], pd.Index, List[str]]:
         """
-        Delete a region profile.
+        Find the rows of several agencies at once.
         
-        Args:
-            region_name: Name of the region to delete
-            
         Returns:
-            True if deleted, False if not found
+            Tuple of (agencies found, their row labels, owning agency of each label)
         """
-        if region_name in self.profiles:
-            del self.profiles[region_name]
-            
-            # Clear current region if it was deleted
-            if self.current_region == region_name:
-                self.current_region = None
-            
-            self.save_profiles()
-            logger.info(f"Deleted region profile: {region_name}")
-            return True
-        
-        logger.warning(f"Region profile not found: {region_name}")
-        return False
+        index = self._agency_index()
+        found, positions, owners = [], [], []
+        for agency in dict.fromkeys(agencies):
+            agency_positions = index.get(agency.upper())
+            if agency_positions:
+                found.append(agency)
+                positions.extend(agency_positions)
+                owners.extend([agency] * len(agency_positions))
+        
+        missing = len(set(agencies)) - len(found)
+        if missing:
+            self.logger.warning(f"{missing} agencies not found in audit log")
+        return found, self.load().index[positions], owners
+    
+    @staticmethod
+    def _as_text(df: pd.DataFrame, columns: List[str]) -> None:
+        """Let text be assigned into columns pandas read as all-empty floats."""
+        for col in columns:
+            if df[col].dtype != object:
+                df[col] = df[col].astype(object)
     
-    def get_profile(self, region_name: str) -> Optional[RegionProfile]:
+    def _get_columns(self) -> List[str]:
+        """Get standard audit log column names."""
+        return [
+            ColumnNames.AGENCY,
+            ColumnNames.SENT_DATE,
+            ColumnNames.RESPONSE_DATE,
+            ColumnNames.TO,
+            ColumnNames.CC,
+            ColumnNames.STATUS,
+            ColumnNames.COMMENTS,
+            ColumnNames.FOLLOWUP_COUNT,
+            ColumnNames.LAST_REMINDER_DATE,
+            ColumnNames.RETURNED_FILE,
+            ColumnNames.REVIEW_COMPLETENESS
+        ]
+    
+    def _normalize(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Add missing standard columns, make follow-up counts integers and the rest text-assignable."""
+        # Ensure all required columns exist
+        for col in self._get_columns():
+            if col not in df.columns:
+                df[col] = ""
+        df[ColumnNames.FOLLOWUP_COUNT] = pd.to_numeric(
+            df[ColumnNames.FOLLOWUP_COUNT], errors='coerce'
+        ).fillna(0).astype(int)
+        # Columns read back empty come in as floats; keep them assignable to text
+        self._as_text(df, [col for col in self._get_columns() if col != ColumnNames.FOLLOWUP_COUNT])
+        return df
+    
+    def load(self) -> pd.DataFrame:
         """
-        Get a specific region profile.
+        Load audit log from file or create empty DataFrame.
         
-        Args:
-            region_name: Name of the region
-            
         Returns:
-            RegionProfile if found, None otherwise
+            Audit log DataFrame
         """
-        return self.profiles.get(region_name)
+        if self._frame is not None:
+            return self._frame
+        
+        try:
+            df = self.store.load()
+        except Exception as e:
+            self.logger.error(f"Failed to load audit log: {e}")
+            df = pd.DataFrame(columns=self._get_columns())
+        
+        if df is not None:
+            df = self._normalize(df)
+            self.logger.info(f"Loaded audit log: {self.audit_file_path}")
+        else:
+            df = pd.DataFrame(columns=self._get_columns())
+            self.logger.info("Created new audit log DataFrame")
+        
+        self._frame = df
+        self._dirty = set()
+        self._index = None
+        self._typed = None
+        self._counters = None
+        
+        # Re-apply journaled changes the saved snapshot does not include yet
+        if self.journal is not None:
+            try:
+                self.journal.replay(self._apply_event)
+            except Exception as e:
+                self.logger.error(f"Failed to replay audit journal: {e}")
+        self._publish(None)
+        return self._frame
     
-    def get_current_profile(self) -> Optional[RegionProfile]:
+    def save(self, dispatch: Optional[Callable[[Callable[[], None]], None]] = None) -> bool:
         """
-        Get the currently selected region profile.
+        Save audit log through the storage backend.
+        
+        With the SQLite backend only the agencies changed since the last save
+        are written; the xlsx export follows once saves go quiet (see flush()).
+        The log is copied before writing, so save() may run on a background
+        thread (see AuditWriteBehind) while the GUI keeps changing it; changes
+        made meanwhile are written by the next save. On failure the changed
+        agencies stay pending and the error is kept in last_error.
+        
+        Rows other operators saved meanwhile are merged into the log (see
+        AuditStore). Fields both changed keep the other operator's value and
+        are added to conflicts.
+        
+        Args:
+            dispatch: Runs the merge of other operators' rows on the thread
+                that changes the log (e.g. Tk's after()); the merge runs
+                in save() itself if None
         
         Returns:
-            Current RegionProfile if one is selected, None otherwise
+            True if successful
         """
-        if self.current_region:
-            return self.profiles.get(self.current_region)
-        return None
+        if self._frame is None:
+            self.logger.warning("No audit data to save")
+            return False
+        
+        with self._save_lock:
+            frame = self._frame.copy()
+            changed, self._dirty = self._dirty, set()
+            try:
+                # Journal first (one fsync for all buffered events), then the snapshot
+                seq = self.journal.commit() if self.journal is not None else 0
+                result = self.store.save(frame, changed)
+                if self.journal is not None:
+                    self.journal.checkpoint(seq)
+                self.last_error = None
+                if result is not None:
+                    for conflict in result.conflicts:
+                        self.logger.warning(f"Audit update conflict, kept the other user's value: {conflict}")
+                    self.conflicts.extend(result.conflicts)
+                    if result.merged:
+                        merge = lambda: self._merge_saved(result, frame)
+                        if dispatch is None:
+                            merge()
+                        else:
+                            dispatch(merge)
+                self.logger.info(f"Saved audit log: {self.audit_file_path}")
+                return True
+                
+            except Exception as e:
+                # Keep the unsaved agencies for the next attempt
+                if changed is None or self._dirty is None:
+                    self._dirty = None
+                else:
+                    self._dirty |= changed
+                self.last_error = str(e)
+                self.logger.error(f"Failed to save audit log: {e}")
+                return False
     
-    def switch_region(self, region_name: str) -> bool:
+    def _merge_saved(self, result: AuditSaveResult, snapshot: pd.DataFrame) -> None:
         """
-        Switch to a different region.
+        Apply rows merged by the store to the log.
+        
+        A field is updated only if it still holds the value that was saved
+        (snapshot); fields changed again since then are left for the next save.
+        Must run on the thread that changes the log (see save()'s dispatch).
+        New rows are added in place, so the frame stays the one load() returned.
         
         Args:
-            region_name: Name of the region to switch to
-            
-        Returns:
-            True if successful, False if region not found
+            result: Outcome of the store save
+            snapshot: Frame that was passed to the store
         """
-        if region_name in self.profiles:
-            self.current_region = region_name
-            self.save_profiles()
-            logger.info(f"Switched to region: {region_name}")
-            return True
-        
-        logger.error(f"Cannot switch to unknown region: {region_name}")
-        return False
+        changed = []
+        for key, row in result.merged.items():
+            fields = {col: value for col, value in row.items() if col in self._frame.columns}
+            positions = self._agency_index().get(key, [])
+            if not positions:
+                label = self._frame.index.max() + 1 if len(self._frame) else 0
+                self._frame.loc[label] = pd.Series(fields, dtype=object)
+                self._index = None
+                self._counters = None
+                changed.append(str(row.get(ColumnNames.AGENCY) or key))
+                continue
+            label = self._frame.index[positions[0]]
+            updates = {}
+            for col, value in fields.items():
+                if col == ColumnNames.AGENCY or col not in snapshot.columns or label not in snapshot.index:
+                    continue
+                current = self._frame.at[label, col]
+                if audit_values_equal(current, snapshot.at[label, col]) and not audit_values_equal(current, value):
+                    updates[col] = value
+            if updates:
+                self._as_text(self._frame, [col for col in updates if col != ColumnNames.FOLLOWUP_COUNT])
+                for col, value in updates.items():
+                    self._frame.loc[self._frame.index[positions], col] = value
+                changed.append(str(self._frame.at[label, ColumnNames.AGENCY]))
+        
+        if changed:
+            self._typed = None
+            if self._counters is None:
+                self._publish(None)
+            else:
+                for agency in changed:
+                    rows = self._locate(agency)
+                    row = self._frame.loc[rows[0]]
+                    self._counters.update(agency, row.get(ColumnNames.STATUS), row.get(ColumnNames.SENT_DATE))
+                self._publish(changed)
+            self.logger.info(f"Picked up changes to {len(changed)} agencies saved by other users")
+    
+    def take_conflicts(self) -> List[AuditConflict]:
+        """Return and clear the conflicts reported by saves so far."""
+        conflicts, self.conflicts = self.conflicts, []
+        return conflicts
+    
+    def flush(self) -> None:
+        """Write any pending xlsx export of the audit log now."""
+        if self._store is not None:
+            self._store.flush()
     
-    def get_all_region_names(self) -> List[str]:
+    def create_backup(self) -> Optional[Path]:
         """
-        Get list of all region names.
+        Create timestamped backup of audit log (skipped if its content is unchanged).
         
         Returns:
-            List of region names (sorted alphabetically)
+            Path to backup file or None if failed
         """
-        return sorted(self.profiles.keys())
+        if not self.audit_file_path.exists():
+            return None
+        
+        try:
+            backup_service = BackupService.from_config(self.output_dir / FileNames.BACKUP_DIR)
+            return backup_service.backup_file(self.audit_file_path)
+            
+        except Exception as e:
+            self.logger.error(f"Failed to create backup: {e}")
+            return None
     
-    def get_region_count(self) -> int:
+    def load_tracking_index(self) -> Dict[str, "str | List[str]"]:
         """
-        Get number of configured regions.
+        Load the tracking token index stored next to the audit log.
         
         Returns:
-            Count of regions
+            Dictionary mapping tracking token to source file name (or the list
+            of file names for a digest email)
         """
-        return len(self.profiles)
-    
-    def clear_current_region(self) -> None:
-        """Clear the current region selection."""
-        self.current_region = None
-        self.save_profiles()
-        logger.info("Cleared current region selection")
-    
-    def __repr__(self) -> str:
-        """String representation of region manager."""
-        return (
-            f"RegionManager(regions={len(self.profiles)}, "
-            f"current='{self.current_region or 'None'}')"
-        )
-
-
-# ============ MODULE: file_validator ============
-
-
-
-
-
-
-class FileValidator:
-    """
-    Validates all input files for the Cognos Access Review process.
-    
-    This class performs comprehensive validation of master files, agency mappings,
-    and email manifests with detailed error reporting and fix suggestions.
-    
-    Examples:
-        >>> validator = FileValidator()
-        >>> results = validator.validate_all(
-        ...     master_file=Path("master.xlsx"),
-        ...     agency_map_file=Path("mapping.xlsx"),
-        ...     email_manifest_file=Path("emails.xlsx")
-        ... )
-        >>> if results['is_valid']:
-        ...     print("All validations passed!")
-    """
-    
-    def __init__(self):
-        """Initialize the file validator."""
-        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        if not self.tracking_index_path or not self.tracking_index_path.exists():
+            return {}
+        
+        try:
+            with open(self.tracking_index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            self.logger.error(f"Failed to load tracking index: {e}")
+            return {}
     
-    def validate_file_exists(self, file_path: Path, file_type: str = "file") -> Tuple[bool, str]:
+    def register_tracking_tokens(self, tokens: Dict[str, "str | List[str]"]) -> bool:
         """
-        Check if a file or folder path is valid and exists.
+        Merge tracking tokens into the persisted index.
+        
+        A token already registered for other files is rejected, never
+        reassigned, so replies to the earlier email stay attributed to it.
         
         Args:
-            file_path: Path to the file or directory
-            file_type: User-friendly name for the path
+            tokens: Dictionary mapping tracking token to source file name (or list of names)
             
         Returns:
-            Tuple of (is_valid, error_message)
+            True if successful and no token was rejected
+        """
+        if not tokens:
+            return True
+        
+        try:
+            index = self.load_tracking_index()
+            rejected = 0
+            for token, file_name in tokens.items():
+                existing = tracking_token_conflict(index, token, file_name)
+                if existing is not None:
+                    self.logger.error(f"Tracking token {token} already belongs to {existing}; not registered for {file_name}")
+                    rejected += 1
+                    continue
+                index[token] = file_name
             
-        Examples:
-            >>> validator = FileValidator()
-            >>> valid, msg = validator.validate_file_exists(Path("test.xlsx"), "Master File")
-            >>> if not valid:
-            ...     print(msg)
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.tracking_index_path, 'w', encoding='utf-8') as f:
+                json.dump(index, f, indent=2, ensure_ascii=False)
+            self.logger.info(f"Registered {len(tokens) - rejected} tracking tokens")
+            return rejected == 0
+        except Exception as e:
+            self.logger.error(f"Failed to save tracking index: {e}")
+            return False
+    
+    def initialize_log(
+        self,
+        agencies: List[str],
+        preserve_existing: bool = True
+    ) -> None:
         """
-        if not file_path or str(file_path).strip() == "":
-            return False, f"Please select a {file_type}"
+        Initialize audit log with agency list.
         
-        if not file_path.exists():
-            return False, f"{file_type.capitalize()} not found: {file_path}"
+        Args:
+            agencies: List of agency names
+            preserve_existing: If True, preserve existing entries
+        """
+        df = self.load()
         
-        return True, ""
+        if preserve_existing and not df.empty:
+            # Get existing agencies
+            existing_agencies = set(df[ColumnNames.AGENCY].str.upper())
+            
+            # Add only new agencies
+            new_agencies = [
+                agency for agency in agencies
+                if agency.upper() not in existing_agencies
+            ]
+            
+            if new_agencies:
+                new_entries = pd.DataFrame({
+                    ColumnNames.AGENCY: new_agencies,
+                    ColumnNames.SENT_DATE: "",
+                    ColumnNames.RESPONSE_DATE: "",
+                    ColumnNames.TO: "",
+                    ColumnNames.CC: "",
+                    ColumnNames.STATUS: AuditStatus.NOT_SENT.value,
+                    ColumnNames.COMMENTS: "",
+                    ColumnNames.FOLLOWUP_COUNT: 0,
+                    ColumnNames.LAST_REMINDER_DATE: "",
+                    ColumnNames.RETURNED_FILE: "",
+                    ColumnNames.REVIEW_COMPLETENESS: ""
+                })
+                self._frame = pd.concat([df, new_entries], ignore_index=True)
+                self._index = None
+                self._typed = None
+                self._reset_counters()
+                for agency in new_agencies:
+                    self._touch(agency, AuditEventType.ADDED)
+                self.logger.info(f"Added {len(new_agencies)} new agencies to audit log")
+        else:
+            # Create fresh log
+            self._df = pd.DataFrame({
+                ColumnNames.AGENCY: agencies,
+                ColumnNames.SENT_DATE: "",
+                ColumnNames.RESPONSE_DATE: "",
+                ColumnNames.TO: "",
+                ColumnNames.CC: "",
+                ColumnNames.STATUS: AuditStatus.NOT_SENT.value,
+                ColumnNames.COMMENTS: "",
+                ColumnNames.FOLLOWUP_COUNT: 0,
+                ColumnNames.LAST_REMINDER_DATE: "",
+                ColumnNames.RETURNED_FILE: "",
+                ColumnNames.REVIEW_COMPLETENESS: ""
+            })
+            for agency in agencies:
+                self._touch(agency, AuditEventType.ADDED)
+            self.logger.info(f"Initialized audit log with {len(agencies)} agencies")
     
-    def validate_excel_file(self, file_path: Path) -> Tuple[bool, str]:
+    def mark_sent(
+        self,
+        agency: str,
+        to: str = "",
+        cc: str = "",
+        comments: str = "",
+        event: AuditEventType = AuditEventType.SENT
+    ) -> bool:
         """
-        Validate that a file is a readable Excel file.
+        Mark an agency as having email sent.
         
         Args:
-            file_path: Path to the Excel file
+            agency: Agency name
+            to: To email addresses
+            cc: CC email addresses
+            comments: Optional comments
+            event: Journal event (SENT, PREVIEWED, SCHEDULED or DRAFTED)
             
         Returns:
-            Tuple of (is_valid, error_message)
-            
-        Examples:
-            >>> validator = FileValidator()
-            >>> valid, msg = validator.validate_excel_file(Path("data.xlsx"))
+            True if updated successfully
         """
-        try:
-            # Try reading just one row for efficiency
-            pd.read_excel(file_path, nrows=1)
-            return True, ""
-        except Exception as e:
-            return False, f"Invalid Excel file: {file_path}\nError: {str(e)}"
+        df = self.load()
+        
+        # Find agency rows (case-insensitive index)
+        rows = self._locate(agency)
+        
+        if rows.empty:
+            self.logger.warning(f"Agency not found in audit log: {agency}")
+            return False
+        
+        # Update row
+        current_time = datetime.now().strftime("%Y-%m-%d %H:%M")
+        df.loc[rows, ColumnNames.SENT_DATE] = current_time
+        df.loc[rows, ColumnNames.TO] = to
+        df.loc[rows, ColumnNames.CC] = cc
+        df.loc[rows, ColumnNames.STATUS] = AuditStatus.SENT.value
+        if comments:
+            df.loc[rows, ColumnNames.COMMENTS] = comments
+        
+        self._touch(agency, event)
+        self.logger.info(f"Marked as sent: {agency}")
+        return True
     
-    def validate_master_file(self, file_path: Path) -> List[ValidationIssue]:
+    def mark_sent_many(
+        self,
+        agencies: List[str],
+        recipients: Optional[Dict[str, Tuple[str, str]]] = None,
+        comments: str = "",
+        event: AuditEventType = AuditEventType.SENT,
+        sent_dates: Optional[Dict[str, str]] = None
+    ) -> List[str]:
         """
-        Validate master user access file structure and content.
+        Mark several agencies as having email sent, in one assignment.
         
         Args:
-            file_path: Path to master file
+            agencies: Agency names
+            recipients: Optional agency -> (to, cc) addresses (case-insensitive keys)
+            comments: Optional comments for every agency
+            event: Journal event (SENT, PREVIEWED, SCHEDULED or DRAFTED)
+            sent_dates: Optional agency -> "%Y-%m-%d %H:%M" send time for sends
+                recorded after the fact (case-insensitive keys); others get the
+                current time
             
         Returns:
-            List of validation issues
+            Agencies that were updated (agencies not in the log are skipped)
         """
-        issues = []
+        df = self.load()
+        found, rows, owners = self._locate_many(agencies)
         
-        try:
-            df = pd.read_excel(file_path)
-            # Clean and normalize column names
-            df.columns = [col.strip().replace(' ', '').lower() for col in df.columns]
-            # Accept both 'username' and 'user name' but prefer 'username'
-            username_col = None
-            for col in df.columns:
-                if col == 'username':
-                    username_col = col
-                    break
-            if not username_col:
-                for col in df.columns:
-                    if col == 'username':
-                        username_col = col
-                        break
-            if not username_col:
-                issues.append({
-                    "severity": ValidationSeverity.ERROR.value,
-                    "message": "Master file must have 'Username' column (no space)",
-                    "details": f"Available columns: {', '.join(df.columns)}"
-                })
-                return issues
-            
-            # Check for empty file
-            if df.empty:
-                issues.append({
-                    "severity": ValidationSeverity.WARNING.value,
-                    "message": "Master file is empty",
-                    "details": "No user data found in master file"
-                })
-                return issues
-            # Check for null/empty usernames
-            null_count = df[username_col].isna().sum()
-            empty_count = (df[username_col] == "").sum()
-            if null_count > 0 or empty_count > 0:
-                total_unassigned = null_count + empty_count
-                issues.append({
-                    "severity": ValidationSeverity.INFO.value,
-                    "message": f"{total_unassigned} users have no username assigned",
-                    "details": "These rows will be ignored during processing"
-                })
-            # Report total records
-            self.logger.info(f"Master file contains {len(df)} user records")
-        except Exception as e:
-            issues.append({
-                "severity": ValidationSeverity.ERROR.value,
-                "message": "Failed to read master file",
-                "details": str(e)
-            })
-        return issues
+        if not found:
+            return []
+        
+        addresses = {key.upper(): value for key, value in (recipients or {}).items()}
+        dates = {key.upper(): value for key, value in (sent_dates or {}).items()}
+        current_time = datetime.now().strftime("%Y-%m-%d %H:%M")
+        self._as_text(df, [ColumnNames.SENT_DATE, ColumnNames.TO, ColumnNames.CC, ColumnNames.STATUS, ColumnNames.COMMENTS])
+        df.loc[rows, ColumnNames.SENT_DATE] = [dates.get(agency.upper(), current_time) for agency in owners]
+        df.loc[rows, ColumnNames.STATUS] = AuditStatus.SENT.value
+        df.loc[rows, ColumnNames.TO] = [addresses.get(agency.upper(), ("", ""))[0] for agency in owners]
+        df.loc[rows, ColumnNames.CC] = [addresses.get(agency.upper(), ("", ""))[1] for agency in owners]
+        if comments:
+            df.loc[rows, ColumnNames.COMMENTS] = comments
+        
+        for agency in found:
+            self._touch(agency, event)
+        self.logger.info(f"Marked as sent: {len(found)} agencies")
+        return found
     
-    def validate_agency_mapping_file(self, file_path: Path) -> Tuple[List[ValidationIssue], List[Tuple[str, str]]]:
+    def mark_responded(
+        self,
+        agency: str,
+        comments: str = ""
+    ) -> bool:
         """
-        Validate agency mapping file structure.
+        Mark an agency as having responded.
         
         Args:
-            file_path: Path to agency mapping file
+            agency: Agency name
+            comments: Optional response comments
             
         Returns:
-            Tuple of (validation issues, list of (file_name, agency_id) tuples)
+            True if updated successfully
         """
-        issues = []
-        mappings = []
+        df = self.load()
         
-        try:
-            df = pd.read_excel(file_path)
-            df.columns = df.columns.str.strip()
-            
-            # Check for required columns
-            required_cols = {
-                ColumnNames.FILE_NAME: None,
-                ColumnNames.AGENCY_ID: None
-            }
-            
-            for required_col in required_cols.keys():
-                for col in df.columns:
-                    if col.lower() == required_col.lower():
-                        required_cols[required_col] = col
-                        break
-            
-            missing_cols = [col for col, found in required_cols.items() if found is None]
-            
-            if missing_cols:
-                issues.append({
-                    "severity": ValidationSeverity.ERROR.value,
-                    "message": "Agency mapping file missing required columns",
-                    "details": f"Missing: {', '.join(missing_cols)}\nExpected: '{ColumnNames.FILE_NAME}' and '{ColumnNames.AGENCY_ID}'\nFound: {', '.join(df.columns.tolist())}"
-                })
-                return issues, mappings
-            
-            file_name_col = required_cols[ColumnNames.FILE_NAME]
-            agency_id_col = required_cols[ColumnNames.AGENCY_ID]
-            
-            # Check for empty file
-            if df.empty:
-                issues.append({
-                    "severity": ValidationSeverity.ERROR.value,
-                    "message": "Agency mapping file is empty",
-                    "details": "No mappings found"
-                })
-                return issues, mappings
-            
-            # Validate each row
-            for idx, row in df.iterrows():
-                file_name = str(row[file_name_col]).strip() if pd.notna(row[file_name_col]) else ""
-                agency_id = str(row[agency_id_col]).strip() if pd.notna(row[agency_id_col]) else ""
-                
-                if not file_name:
-                    issues.append({
-                        "severity": ValidationSeverity.WARNING.value,
-                        "message": f"Row {idx + 2}: Empty file name",
-                        "details": "This row will be skipped"
-                    })
-                    continue
-                
-                if not agency_id:
-                    issues.append({
-                        "severity": ValidationSeverity.WARNING.value,
-                        "message": f"Row {idx + 2}: Empty agency ID for file '{file_name}'",
-                        "details": "This row will be skipped"
-                    })
-                    continue
-                
-                mappings.append((file_name, agency_id))
-            
-            if not mappings:
-                issues.append({
-                    "severity": ValidationSeverity.ERROR.value,
-                    "message": "No valid mappings found",
-                    "details": "All rows were empty or invalid"
-                })
-            
-            self.logger.info(f"Agency mapping file contains {len(mappings)} mappings")
-            
-        except Exception as e:
-            issues.append({
-                "severity": ValidationSeverity.ERROR.value,
-                "message": "Failed to read agency mapping file",
-                "details": str(e)
-            })
+        # Find agency rows (case-insensitive index)
+        rows = self._locate(agency)
         
-        return issues, mappings
+        if rows.empty:
+            self.logger.warning(f"Agency not found in audit log: {agency}")
+            return False
+        
+        # Update row
+        current_time = datetime.now().strftime("%Y-%m-%d %H:%M")
+        df.loc[rows, ColumnNames.RESPONSE_DATE] = current_time
+        df.loc[rows, ColumnNames.STATUS] = AuditStatus.RESPONDED.value
+        if comments:
+            current_comments = df.loc[rows, ColumnNames.COMMENTS].iloc[0]
+            if current_comments:
+                df.loc[rows, ColumnNames.COMMENTS] = f"{current_comments}; {comments}"
+            else:
+                df.loc[rows, ColumnNames.COMMENTS] = comments
+        
+        self._touch(agency, AuditEventType.RESPONDED)
+        self.logger.info(f"Marked as responded: {agency}")
+        return True
     
-    def validate_combined_file(self, file_path: Path, file_names: Set[str]) -> List[ValidationIssue]:
+    def mark_responded_many(
+        self,
+        agencies: List[str],
+        comments: "str | Dict[str, str]" = ""
+    ) -> List[str]:
         """
-        Validate combined file structure and content.
+        Mark several agencies as having responded, in one assignment.
         
         Args:
-            file_path: Path to combined file (multi-tab Excel)
-            file_names: Set of expected file names from mapping
+            agencies: Agency names
+            comments: Comment appended for every agency, or agency -> comment
             
         Returns:
-            List of validation issues
+            Agencies that were updated (agencies not in the log are skipped)
         """
-        issues = []
+        df = self.load()
+        found, rows, owners = self._locate_many(agencies)
         
-        try:
-            # Use CombinedFileLoader to load data
-            combined_loader = CombinedFileLoader(file_path)
-            combined_data = combined_loader.load_all_data()
-            
-            if not combined_data:
-                issues.append({
-                    "severity": ValidationSeverity.ERROR.value,
-                    "message": "No data found in combined file",
-                    "details": "The combined file appears to be empty or contains no valid data"
-                })
-                return issues
-            
-            # Get email entries from all tabs
-            email_entries = set()
-            for idx, mapping in enumerate(combined_data):
-                file_name = mapping.source_file_name.strip()
-                if file_name:
-                    email_entries.add(file_name)
-                
-                # Validate email addresses
-                to_emails = mapping.recipients_to
-                cc_emails = mapping.recipients_cc
-                
-                # Check To addresses
-                if to_emails:
-                    to_list = format_email_list(to_emails)
-                    for email in to_list:
-                        if not is_valid_email(email):
-                            issues.append({
-                                "severity": ValidationSeverity.WARNING.value,
-                                "message": f"Entry {idx + 1}: Invalid To email format",
-                                "details": f"Email: {email}"
-                            })
-                else:
-                    if file_name:
-                        issues.append({
-                            "severity": ValidationSeverity.WARNING.value,
-                            "message": f"Entry {idx + 1}: No To addresses for '{file_name}'",
-                            "details": "Email cannot be sent without recipients"
-                        })
-                
-                # Check CC addresses
-                if cc_emails:
-                    cc_list = format_email_list(cc_emails)
-                    for email in cc_list:
-                        if not is_valid_email(email):
-                            issues.append({
-                                "severity": ValidationSeverity.WARNING.value,
-                                "message": f"Entry {idx + 1}: Invalid CC email format",
-                                "details": f"Email: {email}"
-                            })
-            
-            # Check for missing email entries
-            missing_emails = file_names - email_entries
-            if missing_emails:
-                issues.append({
-                    "severity": ValidationSeverity.WARNING.value,
-                    "message": f"{len(missing_emails)} file(s) missing email entries",
-                    "details": f"Files without email entries: {', '.join(sorted(missing_emails)[:5])}" + 
-                              (f" and {len(missing_emails) - 5} more..." if len(missing_emails) > 5 else "")
-                })
-            
-        except Exception as e:
-            issues.append({
-                "severity": ValidationSeverity.ERROR.value,
-                "message": "Failed to read combined file",
-                "details": str(e)
-            })
+        if not found:
+            return []
         
-        return issues
+        if isinstance(comments, dict):
+            new = pd.Series([comments.get(agency, "") for agency in owners], index=rows, dtype=object)
+        else:
+            new = pd.Series(comments, index=rows, dtype=object)
+        
+        current_time = datetime.now().strftime("%Y-%m-%d %H:%M")
+        self._as_text(df, [ColumnNames.RESPONSE_DATE, ColumnNames.STATUS, ColumnNames.COMMENTS])
+        current = df.loc[rows, ColumnNames.COMMENTS].fillna("").astype(str)
+        df.loc[rows, [ColumnNames.RESPONSE_DATE, ColumnNames.STATUS]] = [current_time, AuditStatus.RESPONDED.value]
+        df.loc[rows, ColumnNames.COMMENTS] = (current + "; " + new).where(current != "", new).where(new != "", current)
+        
+        for agency in found:
+            self._touch(agency, AuditEventType.RESPONDED)
+        self.logger.info(f"Marked as responded: {len(found)} agencies")
+        return found
     
-    def validate_agency_mapping(
-        self,
-        master_file: Path,
-        agency_map_file: Path,
-        combined_file: Optional[Path] = None
-    ) -> ValidationResults:
+    def mark_undeliverable(self, agency: str, address: Optional[str] = None) -> bool:
         """
-        Comprehensive validation of agency mapping against master file.
+        Mark an agency's email as bounced (non-delivery report received).
+        
+        Agencies that already responded keep their status.
         
         Args:
-            master_file: Path to master user access file
-            agency_map_file: Path to agency mapping file
-            combined_file: Optional path to combined file (multi-tab Excel)
+            agency: Agency name
+            address: Failing recipient address, if known
             
         Returns:
-            ValidationResults dictionary with detailed results
-            
-        Examples:
-            >>> validator = FileValidator()
-            >>> results = validator.validate_agency_mapping(
-            ...     master_file=Path("master.xlsx"),
-            ...     agency_map_file=Path("mapping.xlsx")
-            ... )
-            >>> print(f"Valid: {results['is_valid']}")
+            True if updated successfully
         """
-        # Ensure all paths are Path objects (defensive programming)
-        master_file = Path(master_file) if isinstance(master_file, str) else master_file
-        agency_map_file = Path(agency_map_file) if isinstance(agency_map_file, str) else agency_map_file
-        if combined_file and isinstance(combined_file, str):
-            combined_file = Path(combined_file)
+        df = self.load()
         
-        all_issues: List[ValidationIssue] = []
-        email_issues: List[ValidationIssue] = []
+        # Find agency rows (case-insensitive index)
+        rows = self._locate(agency)
         
-        # Validate master file exists and structure
-        master_issues = self.validate_master_file(master_file)
-        all_issues.extend(master_issues)
+        if rows.empty:
+            self.logger.warning(f"Agency not found in audit log: {agency}")
+            return False
+        if df.loc[rows, ColumnNames.STATUS].iloc[0] == AuditStatus.RESPONDED.value:
+            return False
         
-        # Validate mapping file
-        mapping_issues, mappings = self.validate_agency_mapping_file(agency_map_file)
-        all_issues.extend(mapping_issues)
+        current_time = datetime.now().strftime("%Y-%m-%d %H:%M")
+        note = f"Undeliverable {current_time}: {address or 'unknown address'}"
+        df.loc[rows, ColumnNames.STATUS] = AuditStatus.UNDELIVERABLE.value
+        current_comments = df.loc[rows, ColumnNames.COMMENTS].iloc[0]
+        if isinstance(current_comments, str) and current_comments:
+            df.loc[rows, ColumnNames.COMMENTS] = f"{current_comments}; {note}"
+        else:
+            df.loc[rows, ColumnNames.COMMENTS] = note
         
-        # If critical errors, return early
-        has_errors = any(issue["severity"] == ValidationSeverity.ERROR.value for issue in all_issues)
-        if has_errors:
-            return {
-                "is_valid": False,
-                "issues": all_issues,
-                "master_agencies": set(),
-                "mapped_agencies": set(),
-                "unmapped_agencies": set(),
-                "duplicate_agencies": {},
-                "email_issues": [],
-                "master_agency_count": 0,
-                "mapped_agency_count": 0
-            }
+        self._touch(agency, AuditEventType.BOUNCED)
+        self.logger.info(f"Marked as undeliverable: {agency} ({address})")
+        return True
+    
+    def record_send_failure(self, agency: str, error: str) -> bool:
+        """
+        Note a failed send attempt in an agency's comments (status is unchanged).
         
-        # Read master file to get agencies
-        try:
-            df_master = pd.read_excel(master_file)
-            df_master.columns = df_master.columns.str.strip()
-            
-            # Find agency column (case-insensitive)
-            agency_col = None
-            for col in df_master.columns:
-                if col.lower() == ColumnNames.AGENCY.lower():
-                    agency_col = col
-                    break
-            
-            # Get unique agencies from master (case-insensitive, excluding empty/null)
-            master_agencies = set()
-            if agency_col:
-                for agency in df_master[agency_col].dropna():
-                    agency_str = str(agency).strip()
-                    if agency_str:
-                        master_agencies.add(agency_str.upper())
+        Args:
+            agency: Agency name
+            error: Error message from the send attempt
             
-        except Exception as e:
-            all_issues.append({
-                "severity": ValidationSeverity.ERROR.value,
-                "message": "Failed to read agencies from master file",
-                "details": str(e)
-            })
-            master_agencies = set()
+        Returns:
+            True if updated successfully
+        """
+        df = self.load()
         
-        # Process mappings
-        file_names = set()
-        mapped_agencies_upper = set()
-        agency_to_files: Dict[str, List[str]] = {}
+        # Find agency rows (case-insensitive index)
+        rows = self._locate(agency)
         
-        for file_name, agency_id in mappings:
-            file_names.add(file_name)
-            
-            # Handle comma-separated agencies (e.g., "XYZ, ABC, DEF")
-            if ',' in agency_id:
-                agencies = [a.strip() for a in agency_id.split(',') if a.strip()]
-            else:
-                agencies = [agency_id]
-            
-            # Process each agency (split or single)
-            for single_agency in agencies:
-                agency_upper = single_agency.upper()
-                mapped_agencies_upper.add(agency_upper)
-                
-                # Track which files each agency is mapped to
-                if agency_upper in agency_to_files:
-                    agency_to_files[agency_upper].append(file_name)
-                else:
-                    agency_to_files[agency_upper] = [file_name]
+        if rows.empty:
+            self.logger.warning(f"Agency not found in audit log: {agency}")
+            return False
         
-        # Find duplicates (agencies mapped to multiple files)
-        duplicate_agencies = {
-            agency: files for agency, files in agency_to_files.items()
-            if len(files) > 1
-        }
+        current_time = datetime.now().strftime("%Y-%m-%d %H:%M")
+        note = f"Send failed {current_time}: {error}"
+        current_comments = df.loc[rows, ColumnNames.COMMENTS].iloc[0]
+        if isinstance(current_comments, str) and current_comments:
+            df.loc[rows, ColumnNames.COMMENTS] = f"{current_comments}; {note}"
+        else:
+            df.loc[rows, ColumnNames.COMMENTS] = note
         
-        if duplicate_agencies:
-            for agency, files in duplicate_agencies.items():
-                all_issues.append({
-                    "severity": ValidationSeverity.ERROR.value,
-                    "message": f"Agency '{agency}' mapped to multiple files",
-                    "details": f"Files: {', '.join(files)}"
-                })
+        self._touch(agency, AuditEventType.SEND_FAILED)
+        self.logger.info(f"Recorded send failure for: {agency}")
+        return True
+    
+    def record_returned_file(self, agency: str, file_path: Path) -> bool:
+        """
+        Link a harvested returned workbook to an agency's audit row.
         
-        # Find unmapped agencies
-        unmapped_agencies = master_agencies - mapped_agencies_upper
+        Args:
+            agency: Agency (source file) name
+            file_path: Path of the saved returned workbook
+            
+        Returns:
+            True if updated successfully
+        """
+        df = self.load()
         
-        if unmapped_agencies:
-            all_issues.append({
-                "severity": ValidationSeverity.WARNING.value,
-                "message": f"{len(unmapped_agencies)} agencies in master file not in mapping",
-                "details": f"Examples: {', '.join(sorted(unmapped_agencies)[:5])}" + 
-                          (f" and {len(unmapped_agencies) - 5} more..." if len(unmapped_agencies) > 5 else "")
-            })
+        # Find agency rows (case-insensitive index)
+        rows = self._locate(agency)
         
-        # Find agencies in mapping but not in master
-        extra_agencies = mapped_agencies_upper - master_agencies
-        if extra_agencies:
-            all_issues.append({
-                "severity": ValidationSeverity.INFO.value,
-                "message": f"{len(extra_agencies)} agencies in mapping not found in master file",
-                "details": f"Examples: {', '.join(sorted(extra_agencies)[:5])}" + 
-                          (f" and {len(extra_agencies) - 5} more..." if len(extra_agencies) > 5 else "")
-            })
+        if rows.empty:
+            self.logger.warning(f"Agency not found in audit log: {agency}")
+            return False
         
-        # Validate combined file if provided
-        if combined_file:
-            email_issues = self.validate_combined_file(combined_file, file_names)
+        df[ColumnNames.RETURNED_FILE] = df[ColumnNames.RETURNED_FILE].astype(object)
+        df.loc[rows, ColumnNames.RETURNED_FILE] = str(file_path)
         
-        # Determine overall validity
-        all_combined_issues = all_issues + email_issues
-        has_errors = any(issue["severity"] == ValidationSeverity.ERROR.value for issue in all_combined_issues)
+        self._touch(agency, AuditEventType.FILE_RETURNED)
+        self.logger.info(f"Linked returned file for {agency}: {file_path}")
+        return True
+    
+    def get_returned_files(self) -> Dict[str, Path]:
+        """
+        Get the latest harvested workbook for each agency that has one.
+        
+        Returns:
+            Dictionary mapping agency name to returned file path
+        """
+        df = self.load()
         
+        if df.empty:
+            return {}
+        
+        returned = df[df[ColumnNames.RETURNED_FILE].fillna("").astype(str).str.strip() != ""]
         return {
-            "is_valid": not has_errors,
-            "issues": all_issues,
-            "master_agencies": master_agencies,
-            "mapped_agencies": mapped_agencies_upper,
-            "unmapped_agencies": unmapped_agencies,
-            "duplicate_agencies": duplicate_agencies,
-            "email_issues": email_issues,
-            "master_agency_count": len(master_agencies),
-            "mapped_agency_count": len(mapped_agencies_upper)
+            str(row[ColumnNames.AGENCY]): Path(str(row[ColumnNames.RETURNED_FILE]))
+            for _, row in returned.iterrows()
         }
     
-    def validate_all_files(
-        self,
-        master_file: Path,
-        agency_map_file: Path,
-        combined_file: Path,
-        output_dir: Path
-    ) -> Tuple[bool, str]:
+    def record_review_completeness(self, agency: str, summary: str) -> bool:
         """
-        Comprehensive validation of all input files and directories.
+        Record how much of an agency's returned workbook has decisions.
         
         Args:
-            master_file: Path to master user access file
-            agency_map_file: Path to agency mapping file
-            combined_file: Path to combined file (multi-tab Excel)
-            output_dir: Path to output directory
+            agency: Agency (source file) name
+            summary: Completeness note, e.g. "48/50 decided (96%)"
             
         Returns:
-            Tuple of (is_valid, status_message)
+            True if updated successfully
         """
-        # Ensure all paths are Path objects (defensive programming)
-        master_file = Path(master_file) if isinstance(master_file, str) else master_file
-        agency_map_file = Path(agency_map_file) if isinstance(agency_map_file, str) else agency_map_file
-        combined_file = Path(combined_file) if combined_file and isinstance(combined_file, str) else combined_file
-        output_dir = Path(output_dir) if isinstance(output_dir, str) else output_dir
+        df = self.load()
         
-        validation_results = []
+        # Find agency rows (case-insensitive index)
+        rows = self._locate(agency)
         
-        # Validate file existence
-        files_to_check = [
-            (master_file, "Master User Access File"),
-            (agency_map_file, "Agency Mapping File"),
-            (combined_file, "Combined File")
-        ]
+        if rows.empty:
+            self.logger.warning(f"Agency not found in audit log: {agency}")
+            return False
         
-        for file_path, file_type in files_to_check:
-            is_valid, error_msg = self.validate_file_exists(file_path, file_type)
-            if not is_valid:
-                validation_results.append(f"❌ {error_msg}")
-            else:
-                validation_results.append(f"✅ {file_type} exists")
+        df[ColumnNames.REVIEW_COMPLETENESS] = df[ColumnNames.REVIEW_COMPLETENESS].astype(object)
+        df.loc[rows, ColumnNames.REVIEW_COMPLETENESS] = summary
         
-        # Validate output directory
-        if not output_dir or str(output_dir).strip() == "":
-            validation_results.append("❌ Please select an Output Folder")
-        elif not output_dir.exists():
-            validation_results.append(f"❌ Output folder not found: {output_dir}")
-        elif not output_dir.is_dir():
-            validation_results.append(f"❌ Output path is not a directory: {output_dir}")
-        else:
-            validation_results.append("✅ Output folder is valid")
+        self._touch(agency, AuditEventType.REVIEW_CONSOLIDATED)
+        self.logger.info(f"Recorded review completeness for {agency}: {summary}")
+        return True
+    
+    def record_followup(self, agency: str) -> bool:
+        """
+        Record that a follow-up reminder was sent to an agency.
         
-        # Validate Excel file structure
-        excel_files = [
-            (master_file, "Master User Access File"),
-            (agency_map_file, "Agency Mapping File"),
-            (combined_file, "Combined File")
-        ]
+        Increments the follow-up count and sets the last reminder date.
         
-        for file_path, file_type in excel_files:
-            if file_path and file_path.exists():
-                is_valid, error_msg = self.validate_excel_file(file_path)
-                if not is_valid:
-                    validation_results.append(f"❌ {error_msg}")
-                else:
-                    validation_results.append(f"✅ {file_type} is readable")
+        Args:
+            agency: Agency name
+            
+        Returns:
+            True if updated successfully
+        """
+        df = self.load()
         
-        # Check if any validation failed
-        has_errors = any("❌" in result for result in validation_results)
+        # Find agency rows (case-insensitive index)
+        rows = self._locate(agency)
         
-        status_message = "\n".join(validation_results)
-        if has_errors:
-            status_message += "\n\nPlease fix the errors above before proceeding."
-        else:
-            status_message += "\n\nAll files are valid and ready for processing!"
+        if rows.empty:
+            self.logger.warning(f"Agency not found in audit log: {agency}")
+            return False
         
-        return not has_errors, status_message
-
-
-# ============ MODULE: combined_file_loader ============
-
-
-class CombinedFileLoader:
-    """
-    Loads combined agency mapping and email data from multi-tab Excel file.
-    
-    This class handles reading the new consolidated file structure where
-    each tab represents a region and contains file mappings with email data.
-    """
-    
-    def __init__(self, file_path: Path):
-        """Initialize with path to combined file."""
-        self.file_path = Path(file_path)
-        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
-        self._combined_data: List[CombinedMapping] = []
-        self._loaded = False
+        current_time = datetime.now().strftime("%Y-%m-%d %H:%M")
+        counts = pd.to_numeric(df.loc[rows, ColumnNames.FOLLOWUP_COUNT], errors='coerce').fillna(0).astype(int)
+        df.loc[rows, ColumnNames.FOLLOWUP_COUNT] = counts + 1
+        df.loc[rows, ColumnNames.LAST_REMINDER_DATE] = current_time
+        
+        self._touch(agency, AuditEventType.REMINDED)
+        self.logger.info(f"Recorded follow-up for: {agency}")
+        return True
     
-    def load_all_tabs(self, selected_tabs: Optional[List[str]] = None) -> List[CombinedMapping]:
+    def get_status(self, agency: str) -> Optional[str]:
         """
-        Load data from all tabs or selected tabs in the Excel file.
+        Get status for a specific agency.
         
         Args:
-            selected_tabs: List of tab names to load. If None, loads all tabs.
+            agency: Agency name
             
         Returns:
-            List of CombinedMapping objects
+            Status string or None if not found
         """
-        if self._loaded and not selected_tabs:
-            return self._combined_data
+        df = self.load()
         
-        try:
-            # Get all sheet names
-            excel_file = pd.ExcelFile(self.file_path)
-            all_tabs = excel_file.sheet_names
-            
-            # Determine which tabs to process
-            tabs_to_process = selected_tabs if selected_tabs else all_tabs
-            
-            combined_mappings = []
-            
-            for tab_name in tabs_to_process:
-                if tab_name not in all_tabs:
-                    self.logger.warning(f"Tab '{tab_name}' not found in file")
-                    continue
-                    
-                # Read the tab
-                df = pd.read_excel(self.file_path, sheet_name=tab_name)
-                df.columns = df.columns.str.strip()
-                
-                # Map column names (case-insensitive)
-                column_mapping = {}
-                for col in df.columns:
-                    col_lower = col.lower()
-                    if "source_file_name" in col_lower or "file name" in col_lower:
-                        column_mapping[col] = ColumnNames.SOURCE_FILE_NAME
-                    elif "agency_id" in col_lower or "agency id" in col_lower:
-                        column_mapping[col] = ColumnNames.AGENCY_ID
-                    elif "recipients_to" in col_lower or col_lower in ["to", "recipients to"]:
-                        column_mapping[col] = ColumnNames.RECIPIENTS_TO
-                    elif "recipients_cc" in col_lower or col_lower in ["cc", "recipients cc"]:
-                        column_mapping[col] = ColumnNames.RECIPIENTS_CC
-                
-                # Rename columns
-                if column_mapping:
-                    df = df.rename(columns=column_mapping)
-                
-                # Ensure required columns exist
-                required_cols = [ColumnNames.SOURCE_FILE_NAME, ColumnNames.AGENCY_ID]
-                for col in required_cols:
-                    if col not in df.columns:
-                        self.logger.error(f"Required column '{col}' not found in tab '{tab_name}'")
-                        continue
-                
-                # Add optional columns if missing
-                if ColumnNames.RECIPIENTS_TO not in df.columns:
-                    df[ColumnNames.RECIPIENTS_TO] = ""
-                if ColumnNames.RECIPIENTS_CC not in df.columns:
-                    df[ColumnNames.RECIPIENTS_CC] = ""
-                
-                # Process each row
-                for _, row in df.iterrows():
-                    source_file = str(row[ColumnNames.SOURCE_FILE_NAME]).strip() if pd.notna(row[ColumnNames.SOURCE_FILE_NAME]) else ""
-                    agency_id = str(row[ColumnNames.AGENCY_ID]).strip() if pd.notna(row[ColumnNames.AGENCY_ID]) else ""
-                    
-                    if not source_file or not agency_id:
-                        continue
-                    
-                    recipients_to = str(row[ColumnNames.RECIPIENTS_TO]) if pd.notna(row[ColumnNames.RECIPIENTS_TO]) else ""
-                    recipients_cc = str(row[ColumnNames.RECIPIENTS_CC]) if pd.notna(row[ColumnNames.RECIPIENTS_CC]) else ""
-                    
-                    # Handle comma-separated agencies
-                    if ',' in agency_id:
-                        agencies = [a.strip() for a in agency_id.split(',') if a.strip()]
-                        for single_agency in agencies:
-                            combined_mappings.append(CombinedMapping(
-                                source_file_name=source_file,
-                                agency_id=single_agency,
-                                recipients_to=recipients_to,
-                                recipients_cc=recipients_cc,
-                                source_tab=tab_name
-                            ))
-                    else:
-                        combined_mappings.append(CombinedMapping(
-                            source_file_name=source_file,
-                            agency_id=agency_id,
-                            recipients_to=recipients_to,
-                            recipients_cc=recipients_cc,
-                            source_tab=tab_name
-                        ))
-                
-                self.logger.info(f"Loaded {len([m for m in combined_mappings if m.source_tab == tab_name])} mappings from tab '{tab_name}'")
-            
-            if not selected_tabs:
-                self._combined_data = combined_mappings
-                self._loaded = True
-            
-            self.logger.info(f"Total loaded mappings: {len(combined_mappings)}")
-            return combined_mappings
-            
-        except Exception as e:
-            self.logger.error(f"Failed to load combined file: {e}")
-            raise FileProcessingError(f"Failed to load combined file: {e}")
+        # Find agency rows (case-insensitive index)
+        rows = self._locate(agency)
+        
+        if rows.empty:
+            return None
+        
+        return df.loc[rows, ColumnNames.STATUS].iloc[0]
     
-    def get_agency_mappings(self, selected_tabs: Optional[List[str]] = None) -> List[AgencyMapping]:
+    def get_status_many(self, agencies: List[str]) -> Dict[str, Optional[str]]:
         """
-        Get agency mappings in the old format for backward compatibility.
+        Get the status of several agencies in one lookup.
         
+        Args:
+            agencies: Agency names
+            
         Returns:
-            List of AgencyMapping objects
+            Dictionary mapping each agency to its status (None if not found)
         """
-        combined_data = self.load_all_tabs(selected_tabs)
-        return [mapping.to_agency_mapping() for mapping in combined_data]
+        df = self.load()
+        index = self._agency_index()
+        
+        first_rows = {agency: index[agency.upper()][0] for agency in agencies if agency.upper() in index}
+        statuses = df[ColumnNames.STATUS].iloc[list(first_rows.values())].tolist()
+        
+        result: Dict[str, Optional[str]] = {agency: None for agency in agencies}
+        result.update(zip(first_rows, statuses))
+        return result
     
-    def get_email_mappings(self, selected_tabs: Optional[List[str]] = None) -> Dict[str, EmailRecipients]:
+    def get_agencies_by_status(self, status: AuditStatus) -> List[str]:
         """
-        Get email mappings by source file name.
+        Get list of agencies with specific status.
         
+        Args:
+            status: Status to filter by
+            
         Returns:
-            Dictionary mapping source_file_name to EmailRecipients
+            List of agency names
         """
-        combined_data = self.load_all_tabs(selected_tabs)
-        email_mappings = {}
+        df = self.load()
         
-        for mapping in combined_data:
-            if mapping.source_file_name not in email_mappings:
-                email_mappings[mapping.source_file_name] = mapping.get_email_recipients()
+        if df.empty:
+            return []
         
-        return email_mappings
+        mask = df[ColumnNames.STATUS] == status.value
+        return df.loc[mask, ColumnNames.AGENCY].tolist()
     
-    def get_available_tabs(self) -> List[str]:
+    def typed(self) -> pd.DataFrame:
         """
-        Get list of available tab names in the file.
+        Audit log with datetime64 date columns and a categorical Status.
+        
+        The typed view is built once per change to the log and cached, so
+        repeated metric queries do not re-parse dates.
         
         Returns:
-            List of tab names
+            Typed DataFrame (see type_audit_frame); do not modify it
         """
-        try:
-            excel_file = pd.ExcelFile(self.file_path)
-            return excel_file.sheet_names
-        except Exception as e:
-            self.logger.error(f"Failed to get tab names: {e}")
-            return []
-
-
-# ============ MODULE: file_processor ============
-
-
-
-
-
-
-class FileProcessor:
-    """
-    Processes master file and generates agency-specific Excel files.
+        df = self.load()
+        if self._typed is None or len(self._typed) != len(df):
+            self._typed = type_audit_frame(df)
+        return self._typed
     
-    This class handles the core file generation logic, creating multi-tab
-    Excel files with proper formatting, sorting, and error handling.
+    @property
+    def counters(self) -> AuditCounters:
+        """Incrementally maintained status/overdue counts of the log (region = output folder name)."""
+        if self._counters is None:
+            self._counters = AuditCounters.from_frame(
+                self.typed(), region=self.output_dir.name if self.output_dir else ""
+            )
+        return self._counters
     
-    Examples:
-        >>> processor = FileProcessor()
-        >>> processor.generate_agency_files(
-        ...     master_file=Path("master.xlsx"),
-        ...     agency_map_file=Path("mapping.xlsx"),
-        ...     output_dir=Path("output")
-        ... )
-    """
+    def _reset_counters(self) -> None:
+        """Drop the counters after the frame was replaced and tell subscribers to recount."""
+        self._counters = None
+        self._publish(None)
     
-    def __init__(self, formatting: Optional[ExcelFormatting] = None):
+    def subscribe(self, callback: Callable[[Optional[List[str]]], None]) -> None:
         """
-        Initialize file processor.
+        Call callback after each change to the counts.
+        
+        The callback receives the agencies that changed, or None when the
+        whole log was reloaded or replaced. It runs on the thread that made
+        the change.
         
         Args:
-            formatting: Excel formatting options. Uses defaults if None.
+            callback: Change handler
         """
-        self.formatting = formatting or ExcelFormatting()
-        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
     
-    def format_worksheet(
+    def unsubscribe(self, callback: Callable[[Optional[List[str]]], None]) -> None:
+        """Stop calling a subscribed callback."""
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+    
+    def _publish(self, agencies: Optional[List[str]]) -> None:
+        for callback in list(self._subscribers):
+            try:
+                callback(agencies)
+            except Exception as e:
+                self.logger.error(f"Audit change subscriber failed: {e}")
+    
+    def advance_overdue(self, now: Optional[datetime] = None) -> List[str]:
+        """
+        Count sends whose response window has passed as overdue.
+        
+        Meant to run on a timer (see AuditCounters.next_overdue_at); only
+        agencies becoming overdue are touched, the log is not rescanned.
+        
+        Returns:
+            Agencies (upper-cased) that became overdue
+        """
+        became = self.counters.advance(now)
+        if became:
+            self._publish(became)
+        return became
+    
+    def get_metrics(
         self,
-        writer: pd.ExcelWriter,
-        sheet_name: str,
-        df: pd.DataFrame
-    ) -> None:
+        deadline: str,
+        total_agencies: Optional[int] = None,
+        agencies: Optional[List[str]] = None
+    ) -> DashboardMetrics:
         """
-        Apply formatting to an Excel worksheet.
+        Calculate dashboard metrics from audit log.
         
         Args:
-            writer: Pandas ExcelWriter object
-            sheet_name: Name of the sheet to format
-            df: DataFrame that was written to the sheet
+            deadline: Deadline string (e.g., "June 30, 2025")
+            total_agencies: Optional total agency count (uses log count if None)
+            agencies: Optional agencies to count (e.g. those loaded in the GUI)
             
-        Examples:
-            >>> with pd.ExcelWriter("output.xlsx", engine="xlsxwriter") as writer:
-            ...     df.to_excel(writer, sheet_name="Sheet1", index=False)
-            ...     processor.format_worksheet(writer, "Sheet1", df)
+        Returns:
+            DashboardMetrics instance
         """
+        return compute_audit_metrics(self.typed(), deadline, agencies=agencies, total_agencies=total_agencies)
+    
+    def export_to_csv(self, output_path: Path) -> bool:
+        """
+        Export audit log to CSV format.
+        
+        Args:
+            output_path: Path for CSV output
+            
+        Returns:
+            True if successful
+        """
+        df = self.load()
+        
+        if df.empty:
+            self.logger.warning("No audit data to export")
+            return False
+        
         try:
-            workbook = writer.book
-            worksheet = writer.sheets[sheet_name]
+            df.to_csv(output_path, index=False, encoding='utf-8-sig')
+            self.logger.info(f"Exported audit log to CSV: {output_path}")
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to export to CSV: {e}")
+            return False
+    
+    def get_history(self, agency: Optional[str] = None) -> pd.DataFrame:
+        """
+        Get the journaled history of state transitions.
+        
+        Args:
+            agency: Optional agency to filter by
             
-            # Freeze top row if enabled
-            if self.formatting.freeze_header:
-                worksheet.freeze_panes(1, 0)
-            
-            # Create header format
-            if self.formatting.bold_header:
-                header_format = workbook.add_format({
-                    'bold': True,
-                    'bg_color': self.formatting.header_bg_color,
-                    'border': 1 if self.formatting.border_header else 0
-                })
-                
-                # Apply header format
-                for col_idx, col_name in enumerate(df.columns):
-                    worksheet.write(0, col_idx, col_name, header_format)
-            
-            # Auto-adjust column widths if enabled
-            if self.formatting.auto_width:
-                for col_idx, col_name in enumerate(df.columns):
-                    # Calculate max width
-                    max_len = len(str(col_name))
-                    for value in df[col_name].astype(str):
-                        max_len = max(max_len, len(value))
-                    
-                    # Set width (with max limit)
-                    width = min(max_len + 2, self.formatting.max_column_width)
-                    worksheet.set_column(col_idx, col_idx, width)
-            
-            self.logger.debug(f"Formatted worksheet: {sheet_name}")
-            
-        except Exception as e:
-            self.logger.warning(f"Failed to format worksheet {sheet_name}: {e}")
+        Returns:
+            DataFrame with one row per event: Seq, Timestamp, Agency, Event
+            and the audit columns as they were after the event
+        """
+        events = self.journal.history(agency) if self.journal is not None else []
+        rows = [
+            {"Seq": e.get("seq"), "Timestamp": e.get("ts"), ColumnNames.AGENCY: e.get("agency"),
+             "Event": e.get("event"), **{k: v for k, v in e.get("fields", {}).items() if k != ColumnNames.AGENCY}}
+            for e in events
+        ]
+        return pd.DataFrame(rows)
     
-    def load_agency_mappings(self, mapping_file: Path, selected_tabs: Optional[List[str]] = None) -> List[AgencyMapping]:
+    def export_history(self, output_path: Path) -> bool:
         """
-        Load agency mappings from combined Excel file.
+        Export the full event history to CSV (evidence of every send and response).
         
         Args:
-            mapping_file: Path to combined agency/email mapping Excel file
-            selected_tabs: Optional list of tab names to process
+            output_path: Path for CSV output
             
         Returns:
-            List of AgencyMapping objects
-            
-        Raises:
-            FileProcessingError: If file cannot be read or is invalid
+            True if successful
         """
+        history = self.get_history()
+        
+        if history.empty:
+            self.logger.warning("No audit history to export")
+            return False
+        
         try:
-            combined_loader = CombinedFileLoader(mapping_file)
-            mappings = combined_loader.get_agency_mappings(selected_tabs)
-            self.logger.info(f"Loaded {len(mappings)} agency mappings from combined file")
-            return mappings
-            
+            history.to_csv(output_path, index=False, encoding='utf-8-sig')
+            self.logger.info(f"Exported audit history to CSV: {output_path}")
+            return True
         except Exception as e:
-            raise FileProcessingError(f"Failed to load agency mappings: {e}")
+            self.logger.error(f"Failed to export audit history: {e}")
+            return False
     
-    def generate_agency_files(
+    def get_summary_stats(self) -> Dict[str, int]:
+        """
+        Get summary statistics from audit log.
+        
+        Returns:
+            Dictionary with count statistics
+        """
+        df = self.typed()
+        
+        if df.empty:
+            return {
+                "total": 0,
+                "not_sent": 0,
+                "sent": 0,
+                "responded": 0,
+                "overdue": 0
+            }
+        
+        status = df[ColumnNames.STATUS]
+        return {
+            "total": len(df),
+            "not_sent": int((status == AuditStatus.NOT_SENT.value).sum()),
+            "sent": int((status == AuditStatus.SENT.value).sum()),
+            "responded": int((status == AuditStatus.RESPONDED.value).sum()),
+            "overdue": int(audit_overdue_mask(df).sum())
+        }
+
+
+class AuditWriteBehind:
+    """
+    Background writer that coalesces audit log saves.
+    
+    GUI actions change the audit log in memory and call request_save(); a
+    daemon thread saves each requested logger at most once per interval, so
+    a burst of marks, scans or sends costs one write instead of one per
+    action. A failed save keeps the logger pending and is retried with
+    exponential backoff; the failure is reported through on_state and kept
+    in last_error until a save succeeds. Fields a save could not apply
+    because another operator changed them too are passed to on_conflicts.
+    
+    Examples:
+        >>> writer = AuditWriteBehind(interval=5.0)
+        >>> audit_logger.mark_sent("Agency1", to="test@example.com")
+        >>> writer.request_save(audit_logger)
+        >>> writer.flush(timeout=30)
+        True
+    """
+    
+    def __init__(
         self,
-        master_file: Path,
-        combined_map_file: Path,
-        output_dir: Path,
-        progress_callback: Optional[Callable[[float, str], None]] = None,
-        handle_unmapped: str = "prompt",
-        selected_tabs: Optional[List[str]] = None,
-        unmapped_callback: Optional[Callable] = None
-    ) -> bool:
+        interval: float = 5.0,
+        max_retry_delay: float = 60.0,
+        on_state: Optional[Callable[[int, Optional[str]], None]] = None,
+        on_conflicts: Optional[Callable[[List[AuditConflict]], None]] = None,
+        dispatch: Optional[Callable[[Callable[[], None]], None]] = None
+    ):
         """
-        Generate agency-specific Excel files with multi-tab structure.
+        Initialize write-behind writer.
         
-        Each file contains:
-        - Tab 1: "All Users" (all agencies for that file)
-        - Tab 2-N: Individual agency tabs (alphabetically sorted)
+        Args:
+            interval: Minimum seconds between saves
+            max_retry_delay: Longest wait between retries of a failed save
+            on_state: Called (from the writer thread) with the number of
+                loggers pending and the last error (None after a success)
+                whenever either changes
+            on_conflicts: Called (from the writer thread) with the conflicts
+                reported by a round of saves
+            dispatch: Runs other operators' rows picked up by a save on the
+                thread that changes the loggers (see AuditLogger.save())
+        """
+        self.interval = max(0.0, interval)
+        self.max_retry_delay = max_retry_delay
+        self.on_state = on_state
+        self.on_conflicts = on_conflicts
+        self.dispatch = dispatch
+        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self.last_error: Optional[str] = None
+        self._pending: Dict[int, 'AuditLogger'] = {}
+        self._saving: Set[int] = set()
+        self._failures = 0
+        self._rounds = 0  # completed save rounds, so flush() can wait for one
+        self._next_save = 0.0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="AuditWriteBehind", daemon=True)
+        self._thread.start()
+    
+    @property
+    def pending_count(self) -> int:
+        """Number of loggers with changes not yet saved."""
+        with self._condition:
+            return len(self._saving | set(self._pending))
+    
+    def request_save(self, audit_logger: 'AuditLogger') -> None:
+        """
+        Schedule a save of an audit logger.
         
         Args:
-            master_file: Path to master user access Excel file
-            combined_map_file: Path to combined agency/email mapping file
-            output_dir: Output directory for generated files
-            progress_callback: Optional callback for progress updates
-            handle_unmapped: How to handle unmapped agencies: "individual", "single", or "skip"
-            selected_tabs: Optional list of tab names to process from combined file
+            audit_logger: Logger whose in-memory changes should be persisted
+        """
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Audit writer is closed")
+            self._pending[id(audit_logger)] = audit_logger
+            self._condition.notify_all()
+        self._notify()
+    
+    def _notify(self) -> None:
+        if self.on_state is not None:
+            try:
+                self.on_state(self.pending_count, self.last_error)
+            except Exception as e:
+                self.logger.debug(f"Write-behind state callback failed: {e}")
+    
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._closed and (not self._pending or time.monotonic() < self._next_save):
+                    wait = None if not self._pending else self._next_save - time.monotonic()
+                    self._condition.wait(wait)
+                if self._closed and not self._pending:
+                    return
+                batch, self._pending = self._pending, {}
+                self._saving = set(batch)
             
+            failed = {}
+            conflicts = []
+            for key, audit_logger in batch.items():
+                try:
+                    if not audit_logger.save(dispatch=self.dispatch):
+                        raise IOError(audit_logger.last_error or "save returned False")
+                    conflicts.extend(audit_logger.take_conflicts())
+                except Exception as e:
+                    failed[key] = audit_logger
+                    self.last_error = f"{audit_logger.audit_file_path}: {e}"
+            
+            with self._condition:
+                # Changes requested while saving are newer; keep those requests
+                for key, audit_logger in failed.items():
+                    self._pending.setdefault(key, audit_logger)
+                self._saving = set()
+                self._rounds += 1
+                if failed:
+                    self._failures += 1
+                    delay = min(self.max_retry_delay, max(self.interval, 1.0) * 2 ** (self._failures - 1))
+                    self.logger.error(f"Audit save failed, retrying in {delay:.0f}s: {self.last_error}")
+                else:
+                    self._failures = 0
+                    self.last_error = None
+                    delay = self.interval
+                self._next_save = time.monotonic() + delay
+                self._condition.notify_all()
+                if self._closed and failed:
+                    # close() gave up waiting; leave failed saves to the caller
+                    return
+            self._notify()
+            if conflicts and self.on_conflicts is not None:
+                try:
+                    self.on_conflicts(conflicts)
+                except Exception as e:
+                    self.logger.debug(f"Write-behind conflict callback failed: {e}")
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Save all pending loggers now and wait for the result.
+        
+        Args:
+            timeout: Longest time to wait in seconds (None to wait indefinitely)
+        
         Returns:
-            True if successful
-            
-        Raises:
-            FileProcessingError: If file generation fails
+            True if nothing is left pending, False if a save failed or timed out
         """
-        try:
-            # Ensure all paths are Path objects (defensive programming)
-            master_file = Path(master_file) if isinstance(master_file, str) else master_file
-            combined_map_file = Path(combined_map_file) if isinstance(combined_map_file, str) else combined_map_file
-            output_dir = Path(output_dir) if isinstance(output_dir, str) else output_dir
-            
-            # Ensure output directory exists
-            output_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Update progress
-            if progress_callback:
-                progress_callback(0.1, "Loading master file...")
-            
-            # Load master file
-            df_master = pd.read_excel(master_file)
-            df_master.columns = df_master.columns.str.strip()
-            
-            # Find agency column (case-insensitive)
-            agency_col = None
-            for col in df_master.columns:
-                if col.lower() == ColumnNames.AGENCY.lower():
-                    agency_col = col
-                    break
-            
-            if not agency_col:
-                raise FileProcessingError(f"Master file must have '{ColumnNames.AGENCY}' column")
-            
-            # COUNTRY FILTERING: Filter by country if specific tabs selected
-            if selected_tabs and ColumnNames.COUNTRY in df_master.columns:
-                # Check for NULL/missing country values and warn user
-                null_countries = df_master[ColumnNames.COUNTRY].isna().sum()
-                if null_countries > 0:
-                    self.logger.warning(
-                        f"Found {null_countries} users with NULL/missing Country values - "
-                        f"these will be excluded from regional filtering"
-                    )
-                
-                # Build list of countries to include based on selected tabs
-                countries_to_include = []
-                for tab in selected_tabs:
-                    if tab in TAB_TO_COUNTRY_MAP:
-                        countries_to_include.extend(TAB_TO_COUNTRY_MAP[tab])
-                
-                if countries_to_include:
-                    # Filter master data to only include selected countries (case-insensitive)
-                    original_count = len(df_master)
-                    # Convert both to uppercase for case-insensitive comparison
-                    countries_upper = [c.upper() for c in countries_to_include]
-                    df_master = df_master[
-                        df_master[ColumnNames.COUNTRY].fillna('').astype(str).str.upper().isin(countries_upper)
-                    ]
-                    filtered_count = len(df_master)
-                    
-                    self.logger.info(
-                        f"Country filter applied: {original_count} → {filtered_count} users "
-                        f"(Tabs: {', '.join(selected_tabs)} | Countries: {', '.join(set(countries_to_include)[:5])}...)"
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            start = self._rounds
+            self._next_save = 0.0
+            self._condition.notify_all()
+            while self._pending or self._saving:
+                if self._failures and self._rounds > start:
+                    # The immediate attempt failed; the retry waits out its backoff
+                    return False
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+            return True
+    
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """
+        Flush pending saves and stop the writer thread.
+        
+        Args:
+            timeout: Longest time to wait for the final flush
+        
+        Returns:
+            True if every pending save completed
+        """
+        flushed = self.flush(timeout)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join(timeout=1.0)
+        return flushed
+
+
+@dataclass
+class RegionAuditSummary:
+    """Per-region result of an AuditAggregator load."""
+    region: str
+    folder: str
+    audit_file: Optional[str] = None
+    records: int = 0
+    counters: Optional[AuditCounters] = None
+    error: Optional[str] = None
+    from_cache: bool = False
+    
+    @property
+    def counts(self) -> Dict[str, int]:
+        """Agencies per status (overdue sends under Overdue)."""
+        return dict(self.counters.counts) if self.counters is not None else {}
+
+
+class AuditAggregator:
+    """
+    Cached, concurrent loader of the audit logs of several output folders.
+    
+    Each folder's parsed audit workbook is cached with the file's path,
+    modification time and size; a load re-reads only folders whose file
+    changed (or appeared under a preferred name), reading them in
+    parallel, and reuses the combined frame when nothing changed. Every
+    region also gets AuditCounters, built once per file version.
+    
+    Examples:
+        >>> aggregator = AuditAggregator(["Audit_CognosAccessReview.xlsx"])
+        >>> combined, summaries = aggregator.load({"C:/Review/APAC": "APAC"})
+        >>> summaries["APAC"].counts
+        {'Sent': 12, 'Responded': 30}
+    """
+    
+    # Columns added to each region's rows in the combined frame
+    SOURCE_COLUMNS = ["Region", "Folder", "Audit File"]
+    
+    def __init__(self, file_names: List[str], max_workers: int = 8):
+        """
+        Initialize aggregator.
+        
+        Args:
+            file_names: Audit workbook names to look for in each folder, in
+                order of preference
+            max_workers: Folders read in parallel
+        """
+        self.file_names = list(dict.fromkeys(file_names))
+        self.max_workers = max_workers
+        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self._lock = threading.Lock()
+        # folder -> (path, mtime, size, region, frame, counters)
+        self._cache: Dict[str, Tuple[Path, float, int, str, pd.DataFrame, AuditCounters]] = {}
+        self._combined: Optional[Tuple[tuple, pd.DataFrame]] = None
+    
+    def _find(self, folder: str) -> Optional[Tuple[Path, os.stat_result]]:
+        """First audit workbook present in a folder, with its stat."""
+        for name in self.file_names:
+            path = Path(folder) / name
+            try:
+                return path, path.stat()
+            except OSError:
+                continue
+        return None
+    
+    def _read(self, folder: str, region: str, path: Path) -> Tuple[pd.DataFrame, AuditCounters]:
+        df = pd.read_excel(path)
+        df["Region"] = region
+        df["Folder"] = folder
+        df["Audit File"] = path.name
+        return df, AuditCounters.from_frame(df, region=region)
+    
+    def folder_frame(self, folder: str, region: Optional[str] = None) -> Optional[pd.DataFrame]:
+        """
+        Cached audit log of one folder (loaded if missing or changed).
+        
+        Args:
+            folder: Output folder
+            region: Region name (defaults to the folder name)
+        
+        Returns:
+            Audit rows with the SOURCE_COLUMNS, or None if the folder has no audit workbook
+        """
+        region = region or os.path.basename(folder)
+        self.load({folder: region})
+        entry = self._cache.get(folder)
+        return entry[4] if entry is not None else None
+    
+    def load(self, folders: Dict[str, str]) -> Tuple[pd.DataFrame, Dict[str, RegionAuditSummary]]:
+        """
+        Load the audit logs of several folders.
+        
+        Args:
+            folders: Folder path -> region name
+        
+        Returns:
+            Tuple of (combined audit rows with the SOURCE_COLUMNS, summary per region)
+        """
+        summaries: Dict[str, RegionAuditSummary] = {}
+        stale: Dict[str, Tuple[str, Path, os.stat_result]] = {}
+        
+        with self._lock:
+            for folder, region in folders.items():
+                found = self._find(folder)
+                if found is None:
+                    self._cache.pop(folder, None)
+                    summaries[region] = RegionAuditSummary(region, folder, error="No audit file found")
+                    continue
+                path, stat = found
+                entry = self._cache.get(folder)
+                if entry is not None and (entry[0], entry[1], entry[2], entry[3]) == (path, stat.st_mtime, stat.st_size, region):
+                    summaries[region] = RegionAuditSummary(
+                        region, folder, path.name, len(entry[4]), entry[5], from_cache=True
                     )
-                    
-                    if progress_callback:
-                        progress_callback(0.15, f"Filtered to {', '.join(selected_tabs)} region(s)...")
-            
-            # Update progress
-            if progress_callback:
-                progress_callback(0.2, "Loading agency mappings...")
-            
-            # Load mappings using new combined file loader
-            mappings = self.load_agency_mappings(combined_map_file, selected_tabs)
-            
-            # Group mappings by file name
-            file_to_agencies: Dict[str, List[str]] = {}
-            for mapping in mappings:
-                if mapping.file_name not in file_to_agencies:
-                    file_to_agencies[mapping.file_name] = []
-                file_to_agencies[mapping.file_name].append(mapping.agency_id)
-            
-            # Track assigned indices
-            assigned_indices = set()
-            
-            # Process each file
-            total_files = len(file_to_agencies)
+                else:
+                    stale[folder] = (region, path, stat)
+        
+        if stale:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(stale))) as executor:
+                futures = {
+                    folder: executor.submit(self._read, folder, region, path)
+                    for folder, (region, path, _) in stale.items()
+                }
+            for folder, future in futures.items():
+                region, path, stat = stale[folder]
+                try:
+                    df, counters = future.result()
+                except Exception as e:
+                    self.logger.error(f"Failed to load audit from {path}: {e}")
+                    with self._lock:
+                        self._cache.pop(folder, None)
+                    summaries[region] = RegionAuditSummary(region, folder, path.name, error=str(e))
+                    continue
+                with self._lock:
+                    self._cache[folder] = (path, stat.st_mtime, stat.st_size, region, df, counters)
+                summaries[region] = RegionAuditSummary(region, folder, path.name, len(df), counters)
+                self.logger.info(f"Loaded {len(df)} audit records from {region} ({path.name})")
+        
+        with self._lock:
+            entries = [self._cache[folder] for folder in folders if folder in self._cache]
+            key = tuple((str(e[0]), e[1], e[2], e[3]) for e in entries)
+            if self._combined is not None and self._combined[0] == key:
+                return self._combined[1], summaries
+            frames = [e[4] for e in entries if not e[4].empty]
+            if frames:
+                combined = pd.concat(frames, ignore_index=True)
+            else:
+                combined = pd.DataFrame(columns=["Agency", "Sent Email Date", "Response Received Date", "To", "CC",
+                                                 "Status", "Comments"] + self.SOURCE_COLUMNS)
+            self._combined = (key, combined)
+        return combined, summaries
+    
+    def invalidate(self, folder: Optional[str] = None) -> None:
+        """Forget cached data for one folder, or for all."""
+        with self._lock:
+            if folder is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(folder, None)
+            self._combined = None
+
+
+class AuditArchive:
+    """
+    SQLite archive of the audit logs of every review period, for cross-period queries.
+    
+    Each period gets its own audit workbook (see
+    ConfigManager.get_audit_file_name). The archive ingests them keyed by
+    period and region, so questions such as "which agencies were late in
+    each of the last four quarters?" are answered from indexed tables
+    instead of opening every file. Workbooks are re-read only when their
+    modification time or size changed, and re-ingesting a period and region
+    replaces its rows.
+    
+    Each archived row carries the response latency in days and a late flag:
+    responded after the response window, or still unanswered past it.
+    Reviewers (the To addresses) are indexed in their own table.
+    
+    Examples:
+        >>> archive = AuditArchive(Path("audit_archive.db"))
+        >>> archive.ingest_folder("C:/Review/APAC", "APAC")
+        2
+        >>> archive.repeat_offenders(periods=4)[["Agency", "Late Periods"]]
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS archive_rows (
+            period TEXT NOT NULL,
+            region TEXT NOT NULL,
+            agency_key TEXT NOT NULL,
+            agency TEXT NOT NULL,
+            status TEXT,
+            sent_date TEXT,
+            response_date TEXT,
+            latency_days REAL,
+            followups INTEGER,
+            late INTEGER NOT NULL,
+            PRIMARY KEY (period, region, agency_key)
+        );
+        CREATE INDEX IF NOT EXISTS idx_archive_rows_agency ON archive_rows(agency_key, period);
+        CREATE INDEX IF NOT EXISTS idx_archive_rows_late ON archive_rows(late, period);
+        CREATE TABLE IF NOT EXISTS archive_reviewers (
+            reviewer TEXT NOT NULL,
+            period TEXT NOT NULL,
+            region TEXT NOT NULL,
+            agency_key TEXT NOT NULL,
+            PRIMARY KEY (reviewer, period, region, agency_key)
+        );
+        CREATE TABLE IF NOT EXISTS archive_periods (
+            period TEXT PRIMARY KEY,
+            sort_key INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS archive_sources (
+            period TEXT NOT NULL,
+            region TEXT NOT NULL,
+            path TEXT NOT NULL,
+            mtime REAL NOT NULL,
+            size INTEGER NOT NULL,
+            ingested TEXT NOT NULL,
+            PRIMARY KEY (period, region)
+        );
+    """
+    
+    # Per-period workbook names, e.g. Audit_CognosAccessReview_Q2_2025[_Region].xlsx
+    FILE_PATTERN = re.compile(r"^Audit_CognosAccessReview_(?P<period>.+)\.xlsx$", re.IGNORECASE)
+    
+    # Upper bounds (days) of the latency distribution buckets
+    LATENCY_BUCKETS = [1, 3, 7, 14, 30]
+    
+    def __init__(self, db_path: Path, overdue_after_days: int = OVERDUE_AFTER_DAYS):
+        """
+        Initialize archive.
+        
+        Args:
+            db_path: SQLite database path
+            overdue_after_days: Days without a response before a send counts as late
+        """
+        self.db_path = Path(db_path)
+        self.overdue_after_days = overdue_after_days
+        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+    
+    def _connect(self) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(self.SCHEMA)
+        return conn
+    
+    @staticmethod
+    def period_sort_key(period: str) -> int:
+        """
+        Chronological sort key of a period name ("Q2 2025", "Q4 FY25", ...).
+        
+        Returns:
+            year * 10 + quarter (0 if the period has no recognizable year)
+        """
+        text = str(period).upper()
+        year = re.search(r"(?<!\d)(\d{4})(?!\d)", text) or re.search(r"(?<!\d)(\d{2})(?!\d)", text)
+        if year is None:
+            return 0
+        quarter = re.search(r"Q([1-4])", text)
+        value = int(year.group(1))
+        return (value if value >= 100 else 2000 + value) * 10 + (int(quarter.group(1)) if quarter else 0)
+    
+    @classmethod
+    def period_from_file_name(cls, file_name: str, region: Optional[str] = None) -> Optional[str]:
+        """
+        Review period encoded in a per-period audit workbook name.
+        
+        Args:
+            file_name: Workbook name such as "Audit_CognosAccessReview_Q2_2025.xlsx"
+            region: Region whose suffix to strip (see get_audit_file_name)
+        
+        Returns:
+            Period with spaces restored (e.g. "Q2 2025"), or None for other names
+        """
+        match = cls.FILE_PATTERN.match(Path(file_name).name)
+        if not match:
+            return None
+        period = match.group("period")
+        if region:
+            suffix = "_" + region.replace(" ", "_")
+            if period.lower().endswith(suffix.lower()) and len(period) > len(suffix):
+                period = period[:-len(suffix)]
+        return period.replace("_", " ")
+    
+    def ingest(self, df: pd.DataFrame, period: str, region: str, source: Optional[Path] = None) -> int:
+        """
+        Archive one period's audit log for a region, replacing earlier rows for both.
+        
+        Args:
+            df: Audit log (typed or as loaded)
+            period: Review period (e.g. "Q2 2025")
+            region: Region name
+            source: Workbook the log was read from (recorded to skip unchanged files)
+        
+        Returns:
+            Number of agencies archived
+        """
+        typed = type_audit_frame(df)
+        if ColumnNames.AGENCY not in typed.columns:
+            typed = pd.DataFrame(columns=[ColumnNames.AGENCY])
+        typed = typed[typed[ColumnNames.AGENCY].notna() & typed[ColumnNames.AGENCY].astype(str).str.strip().ne("")]
+        
+        def column(name: str) -> pd.Series:
+            return typed[name] if name in typed.columns else pd.Series(None, index=typed.index, dtype=object)
+        
+        sent = column(ColumnNames.SENT_DATE)
+        response = column(ColumnNames.RESPONSE_DATE)
+        latency = (
+            (response - sent).dt.total_seconds() / 86400
+            if pd.api.types.is_datetime64_any_dtype(sent) and pd.api.types.is_datetime64_any_dtype(response)
+            else pd.Series(float("nan"), index=typed.index)
+        )
+        late = audit_overdue_mask(typed, overdue_after_days=self.overdue_after_days) | (latency > self.overdue_after_days)
+        followups = pd.to_numeric(column(ColumnNames.FOLLOWUP_COUNT), errors="coerce").fillna(0).astype(int)
+        
+        def stamp(value) -> Optional[str]:
+            return None if pd.isna(value) else pd.Timestamp(value).strftime("%Y-%m-%d %H:%M")
+        
+        rows, reviewers = [], set()
+        agencies = typed[ColumnNames.AGENCY].astype(str).str.strip()
+        statuses = column(ColumnNames.STATUS).astype(object)
+        recipients = column(ColumnNames.TO).astype(object)
+        for i, agency in enumerate(agencies):
+            key = agency.upper()
+            rows.append((
+                period, region, key, agency,
+                None if pd.isna(statuses.iloc[i]) else str(statuses.iloc[i]),
+                stamp(sent.iloc[i]), stamp(response.iloc[i]),
+                None if pd.isna(latency.iloc[i]) else round(float(latency.iloc[i]), 2),
+                int(followups.iloc[i]), int(bool(late.iloc[i]))
+            ))
+            to = recipients.iloc[i]
+            for address in re.split(r"[;,]", "" if pd.isna(to) else str(to)):
+                if address.strip():
+                    reviewers.add((address.strip().lower(), period, region, key))
+        
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM archive_rows WHERE period = ? AND region = ?", (period, region))
+            conn.execute("DELETE FROM archive_reviewers WHERE period = ? AND region = ?", (period, region))
+            conn.executemany("INSERT OR REPLACE INTO archive_rows VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            conn.executemany("INSERT OR IGNORE INTO archive_reviewers VALUES (?, ?, ?, ?)", sorted(reviewers))
+            conn.execute(
+                "INSERT OR REPLACE INTO archive_periods (period, sort_key) VALUES (?, ?)",
+                (period, self.period_sort_key(period))
+            )
+            if source is not None:
+                stat = Path(source).stat()
+                conn.execute(
+                    "INSERT OR REPLACE INTO archive_sources VALUES (?, ?, ?, ?, ?, ?)",
+                    (period, region, str(source), stat.st_mtime, stat.st_size, datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+                )
+        self.logger.info(f"Archived {len(rows)} agencies for {region} {period}")
+        return len(rows)
+    
+    def ingest_file(self, path: Path, period: str, region: str) -> bool:
+        """
+        Archive an audit workbook unless it is unchanged since it was last ingested.
+        
+        Returns:
+            True if the workbook was (re-)ingested
+        """
+        path = Path(path)
+        stat = path.stat()
+        with closing(self._connect()) as conn:
+            known = conn.execute(
+                "SELECT path, mtime, size FROM archive_sources WHERE period = ? AND region = ?", (period, region)
+            ).fetchone()
+        if known == (str(path), stat.st_mtime, stat.st_size):
+            return False
+        self.ingest(pd.read_excel(path), period, region, source=path)
+        return True
+    
+    def ingest_folder(self, folder: str, region: Optional[str] = None) -> int:
+        """
+        Archive every per-period audit workbook in an output folder.
+        
+        Args:
+            folder: Output folder
+            region: Region name (defaults to the folder name)
+        
+        Returns:
+            Number of workbooks (re-)ingested
+        """
+        region = region or os.path.basename(folder)
+        ingested = 0
+        for path in sorted(Path(folder).glob("Audit_CognosAccessReview_*.xlsx")):
+            period = self.period_from_file_name(path.name, region)
+            if period is None or path.name.startswith("~$"):
+                continue
+            try:
+                ingested += self.ingest_file(path, period, region)
+            except Exception as e:
+                self.logger.error(f"Failed to archive {path}: {e}")
+        return ingested
+    
+    def periods(self, last: Optional[int] = None) -> List[str]:
+        """
+        Archived periods, oldest first.
+        
+        Args:
+            last: Only the most recent this many periods
+        """
+        with closing(self._connect()) as conn:
+            rows = conn.execute("SELECT period FROM archive_periods ORDER BY sort_key DESC, period DESC").fetchall()
+        periods = [period for (period,) in rows]
+        if last is not None:
+            periods = periods[:last]
+        return periods[::-1]
+    
+    def repeat_offenders(
+        self,
+        periods: int = 4,
+        min_late: Optional[int] = None,
+        region: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        Agencies late in several of the most recent periods.
+        
+        Args:
+            periods: Number of most recent periods to look at
+            min_late: Late periods required (defaults to all of them)
+            region: Only this region
+        
+        Returns:
+            DataFrame with Agency, Regions, Late Periods, Periods Reviewed and
+            Late In, most often late first
+        """
+        recent = self.periods(last=periods)
+        columns = ["Agency", "Regions", "Late Periods", "Periods Reviewed", "Late In"]
+        if not recent:
+            return pd.DataFrame(columns=columns)
+        min_late = len(recent) if min_late is None else min_late
+        
+        marks = ", ".join("?" * len(recent))
+        query = (
+            "SELECT MAX(agency), GROUP_CONCAT(DISTINCT region), "
+            "COUNT(DISTINCT CASE WHEN late = 1 THEN period END) AS late_periods, "
+            "COUNT(DISTINCT period), GROUP_CONCAT(DISTINCT CASE WHEN late = 1 THEN period END) "
+            f"FROM archive_rows WHERE period IN ({marks})"
+        )
+        params: List[object] = list(recent)
+        if region:
+            query += " AND region = ?"
+            params.append(region)
+        query += " GROUP BY agency_key HAVING late_periods >= ? ORDER BY late_periods DESC, MAX(agency)"
+        params.append(min_late)
+        
+        with closing(self._connect()) as conn:
+            rows = conn.execute(query, params).fetchall()
+        df = pd.DataFrame(rows, columns=columns)
+        order = {period: i for i, period in enumerate(recent)}
+        df["Late In"] = df["Late In"].fillna("").map(
+            lambda text: ", ".join(sorted(text.split(","), key=lambda p: order.get(p, 0))) if text else ""
+        )
+        return df
+    
+    def latency_distribution(self, periods: Optional[int] = None, region: Optional[str] = None) -> pd.DataFrame:
+        """
+        Response latency per period.
+        
+        Args:
+            periods: Only the most recent this many periods (default all)
+            region: Only this region
+        
+        Returns:
+            DataFrame with Period, Sent, Responded, Median/Mean/P90 days, one
+            column per LATENCY_BUCKETS bucket and No Response, oldest period first
+        """
+        recent = self.periods(last=periods)
+        buckets = [f"<= {days}d" for days in self.LATENCY_BUCKETS] + [f"> {self.LATENCY_BUCKETS[-1]}d"]
+        columns = ["Period", "Sent", "Responded", "Median Days", "Mean Days", "P90 Days"] + buckets + ["No Response"]
+        if not recent:
+            return pd.DataFrame(columns=columns)
+        
+        marks = ", ".join("?" * len(recent))
+        query = f"SELECT period, latency_days, sent_date FROM archive_rows WHERE period IN ({marks})"
+        params: List[object] = list(recent)
+        if region:
+            query += " AND region = ?"
+            params.append(region)
+        with closing(self._connect()) as conn:
+            data = pd.DataFrame(conn.execute(query, params).fetchall(), columns=["period", "latency", "sent"])
+        
+        result = []
+        edges = [float("-inf")] + self.LATENCY_BUCKETS + [float("inf")]
+        for period in recent:
+            rows = data[data["period"] == period]
+            sent = rows[rows["sent"].notna()]
+            latency = sent["latency"].dropna()
+            counts = pd.cut(latency, edges, labels=buckets).value_counts().reindex(buckets, fill_value=0)
+            result.append({
+                "Period": period,
+                "Sent": len(sent),
+                "Responded": len(latency),
+                "Median Days": round(latency.median(), 1) if len(latency) else None,
+                "Mean Days": round(latency.mean(), 1) if len(latency) else None,
+                "P90 Days": round(latency.quantile(0.9), 1) if len(latency) else None,
+                **{bucket: int(counts[bucket]) for bucket in buckets},
+                "No Response": len(sent) - len(latency)
+            })
+        return pd.DataFrame(result, columns=columns)
+    
+    def reviewer_history(self, reviewer: str) -> pd.DataFrame:
+        """
+        Every archived review sent to a reviewer (To address, case-insensitive).
+        
+        Returns:
+            DataFrame with Period, Region, Agency, Status, sent/response dates,
+            Latency Days, Follow-ups and Late, oldest period first
+        """
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT r.period, r.region, r.agency, r.status, r.sent_date, r.response_date, "
+                "r.latency_days, r.followups, r.late "
+                "FROM archive_reviewers v "
+                "JOIN archive_rows r ON r.period = v.period AND r.region = v.region AND r.agency_key = v.agency_key "
+                "JOIN archive_periods p ON p.period = r.period "
+                "WHERE v.reviewer = ? ORDER BY p.sort_key, r.region, r.agency",
+                (reviewer.strip().lower(),)
+            ).fetchall()
+        df = pd.DataFrame(rows, columns=[
+            "Period", "Region", "Agency", "Status", ColumnNames.SENT_DATE, ColumnNames.RESPONSE_DATE,
+            "Latency Days", "Follow-ups", "Late"
+        ])
+        df["Late"] = df["Late"].astype(bool)
+        return df
+    
+    def reviewer_summary(self, periods: Optional[int] = None) -> pd.DataFrame:
+        """
+        Per-reviewer totals over the most recent periods.
+        
+        Args:
+            periods: Only the most recent this many periods (default all)
+        
+        Returns:
+            DataFrame with Reviewer, Periods, Reviews, Late, Late % and Mean
+            Days, most late first
+        """
+        recent = self.periods(last=periods)
+        columns = ["Reviewer", "Periods", "Reviews", "Late", "Late %", "Mean Days"]
+        if not recent:
+            return pd.DataFrame(columns=columns)
+        marks = ", ".join("?" * len(recent))
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT v.reviewer, COUNT(DISTINCT v.period), COUNT(*), SUM(r.late), "
+                "ROUND(100.0 * SUM(r.late) / COUNT(*), 1), ROUND(AVG(r.latency_days), 1) "
+                "FROM archive_reviewers v "
+                "JOIN archive_rows r ON r.period = v.period AND r.region = v.region AND r.agency_key = v.agency_key "
+                f"WHERE v.period IN ({marks}) GROUP BY v.reviewer ORDER BY SUM(r.late) DESC, v.reviewer",
+                recent
+            ).fetchall()
+        return pd.DataFrame(rows, columns=columns)
+
+
+# ============ MODULE: region_manager ============
+
+
+
+
+@dataclass
+class RegionProfile:
+    """
+    Represents a complete regional configuration.
+    
+    Attributes:
+        region_name: Unique identifier for the region (e.g., "North America", "EMEA")
+        master_file: Path to the master user access file for this region
+        mapping_file: Path to the agency mapping file for this region
+        output_dir: Output directory for generated files for this region
+        email_manifest: Path to the shared email manifest file
+        description: Optional description of the region
+    """
+    region_name: str
+    master_file: str
+    mapping_file: str
+    output_dir: str
+    email_manifest: str
+    description: str = ""
+    
+    def validate(self) -> List[str]:
+        """
+        Validate that all required paths are set.
+        
+        Returns:
+            List of validation error messages (empty if valid)
+        """
+        errors = []
+        
+        if not self.region_name or not self.region_name.strip():
+            errors.append("Region name is required")
+        
+        if not self.master_file or not self.master_file.strip():
+            errors.append("Master file path is required")
+        
+        if not self.mapping_file or not self.mapping_file.strip():
+            errors.append("Agency mapping file path is required")
+        
+        if not self.output_dir or not self.output_dir.strip():
+            errors.append("Output directory is required")
+        
+        if not self.email_manifest or not self.email_manifest.strip():
+            errors.append("Email manifest path is required")
+        
+        return errors
+    
+    def to_dict(self) -> Dict:
+        """Convert to dictionary for JSON serialization."""
+        return asdict(self)
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'RegionProfile':
+        """Create RegionProfile from dictionary."""
+        return cls(**data)
+
+
+class RegionManager:
+    """
+    Manages regional profiles with persistence to JSON file.
+    
+    This class provides methods to create, update, delete, and switch between
+    different regional configurations. Each region has its own master file,
+    agency mapping, and output directory, but shares a common email manifest.
+    
+    Examples:
+        >>> manager = RegionManager()
+        >>> profile = RegionProfile(
+        ...     region_name="North America",
+        ...     master_file="C:/Data/NA_Master.xlsx",
+        ...     mapping_file="C:/Data/NA_Mapping.xlsx",
+        ...     output_dir="C:/Output/NA",
+        ...     email_manifest="C:/Data/Email_Manifest.xlsx"
+        ... )
+        >>> manager.add_profile(profile)
+        >>> manager.switch_region("North America")
+        >>> current = manager.get_current_profile()
+    """
+    
+    def __init__(self, config_file: Optional[Path] = None):
+        """
+        Initialize region manager.
+        
+        Args:
+            config_file: Path to region profiles JSON file (defaults to region_profiles.json)
+        """
+        self.config_file = config_file or Path("region_profiles.json")
+        self.profiles: Dict[str, RegionProfile] = {}
+        self.current_region: Optional[str] = None
+        self.load_profiles()
+    
+    def load_profiles(self) -> None:
+        """Load profiles from JSON file."""
+        if self.config_file.exists():
+            try:
+                with open(self.config_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                    
+                # Load profiles
+                profiles_data = data.get("profiles", {})
+                for region_name, profile_data in profiles_data.items():
+                    try:
+                        self.profiles[region_name] = RegionProfile.from_dict(profile_data)
+                    except Exception as e:
+                        logger.error(f"Failed to load profile '{region_name}': {e}")
+                
+                # Load current region
+                self.current_region = data.get("current_region")
+                
+                logger.info(f"Loaded {len(self.profiles)} region profiles from {self.config_file}")
+                
+            except json.JSONDecodeError as e:
+                logger.error(f"Invalid JSON in region profiles file: {e}")
+                self.profiles = {}
+                self.current_region = None
+            except Exception as e:
+                logger.error(f"Failed to load region profiles: {e}")
+                self.profiles = {}
+                self.current_region = None
+        else:
+            logger.info(f"Region profiles file not found at {self.config_file}, starting fresh")
+    
+    def save_profiles(self) -> None:
+        """Save profiles to JSON file."""
+        try:
+            data = {
+                "profiles": {
+                    name: profile.to_dict() 
+                    for name, profile in self.profiles.items()
+                },
+                "current_region": self.current_region,
+                "version": "1.0"
+            }
+            
+            with open(self.config_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            
+            logger.info(f"Saved {len(self.profiles)} region profiles to {self.config_file}")
+            
+        except Exception as e:
+            logger.error(f"Failed to save region profiles: {e}")
+            raise
+    
+    def add_profile(self, profile: RegionProfile) -> bool:
+        """
+        Add or update a region profile.
+        
+        Args:
+            profile: RegionProfile to add
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        # Validate profile
+        errors = profile.validate()
+        if errors:
+            logger.error(f"Invalid profile: {', '.join(errors)}")
+            return False
+        
+        # Check for duplicate names
+        if profile.region_name in self.profiles:
+            logger.info(f"Updating existing profile: {profile.region_name}")
+        else:
+            logger.info(f"Adding new profile: {profile.region_name}")
+        
+        self.profiles[profile.region_name] = profile
+        self.save_profiles()
+        return True
+    
+    def delete_profile(self, region_name: str) -> bool:
+        """
+        Delete a region profile.
+        
+        Args:
+            region_name: Name of the region to delete
+            
+        Returns:
+            True if deleted, False if not found
+        """
+        if region_name in self.profiles:
+            del self.profiles[region_name]
+            
+            # Clear current region if it was deleted
+            if self.current_region == region_name:
+                self.current_region = None
+            
+            self.save_profiles()
+            logger.info(f"Deleted region profile: {region_name}")
+            return True
+        
+        logger.warning(f"Region profile not found: {region_name}")
+        return False
+    
+    def get_profile(self, region_name: str) -> Optional[RegionProfile]:
+        """
+        Get a specific region profile.
+        
+        Args:
+            region_name: Name of the region
+            
+        Returns:
+            RegionProfile if found, None otherwise
+        """
+        return self.profiles.get(region_name)
+    
+    def get_current_profile(self) -> Optional[RegionProfile]:
+        """
+        Get the currently selected region profile.
+        
+        Returns:
+            Current RegionProfile if one is selected, None otherwise
+        """
+        if self.current_region:
+            return self.profiles.get(self.current_region)
+        return None
+    
+    def switch_region(self, region_name: str) -> bool:
+        """
+        Switch to a different region.
+        
+        Args:
+            region_name: Name of the region to switch to
+            
+        Returns:
+            True if successful, False if region not found
+        """
+        if region_name in self.profiles:
+            self.current_region = region_name
+            self.save_profiles()
+            logger.info(f"Switched to region: {region_name}")
+            return True
+        
+        logger.error(f"Cannot switch to unknown region: {region_name}")
+        return False
+    
+    def get_all_region_names(self) -> List[str]:
+        """
+        Get list of all region names.
+        
+        Returns:
+            List of region names (sorted alphabetically)
+        """
+        return sorted(self.profiles.keys())
+    
+    def get_region_count(self) -> int:
+        """
+        Get number of configured regions.
+        
+        Returns:
+            Count of regions
+        """
+        return len(self.profiles)
+    
+    def clear_current_region(self) -> None:
+        """Clear the current region selection."""
+        self.current_region = None
+        self.save_profiles()
+        logger.info("Cleared current region selection")
+    
+    def __repr__(self) -> str:
+        """String representation of region manager."""
+        return (
+            f"RegionManager(regions={len(self.profiles)}, "
+            f"current='{self.current_region or 'None'}')"
+        )
+
+
+# ============ MODULE: file_validator ============
+
+
+
+
+
+
+class FileValidator:
+    """
+    Validates all input files for the Cognos Access Review process.
+    
+    This class performs comprehensive validation of master files, agency mappings,
+    and email manifests with detailed error reporting and fix suggestions.
+    
+    Examples:
+        >>> validator = FileValidator()
+        >>> results = validator.validate_all(
+        ...     master_file=Path("master.xlsx"),
+        ...     agency_map_file=Path("mapping.xlsx"),
+        ...     email_manifest_file=Path("emails.xlsx")
+        ... )
+        >>> if results['is_valid']:
+        ...     print("All validations passed!")
+    """
+    
+    def __init__(self):
+        """Initialize the file validator."""
+        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+    
+    def validate_file_exists(self, file_path: Path, file_type: str = "file") -> Tuple[bool, str]:
+        """
+        Check if a file or folder path is valid and exists.
+        
+        Args:
+            file_path: Path to the file or directory
+            file_type: User-friendly name for the path
+            
+        Returns:
+            Tuple of (is_valid, error_message)
+            
+        Examples:
+            >>> validator = FileValidator()
+            >>> valid, msg = validator.validate_file_exists(Path("test.xlsx"), "Master File")
+            >>> if not valid:
+            ...     print(msg)
+        """
+        if not file_path or str(file_path).strip() == "":
+            return False, f"Please select a {file_type}"
+        
+        if not file_path.exists():
+            return False, f"{file_type.capitalize()} not found: {file_path}"
+        
+        return True, ""
+    
+    def validate_excel_file(self, file_path: Path) -> Tuple[bool, str]:
+        """
+        Validate that a file is a readable Excel file.
+        
+        Args:
+            file_path: Path to the Excel file
+            
+        Returns:
+            Tuple of (is_valid, error_message)
+            
+        Examples:
+            >>> validator = FileValidator()
+            >>> valid, msg = validator.validate_excel_file(Path("data.xlsx"))
+        """
+        try:
+            # Try reading just one row for efficiency
+            pd.read_excel(file_path, nrows=1)
+            return True, ""
+        except Exception as e:
+            return False, f"Invalid Excel file: {file_path}\nError: {str(e)}"
+    
+    def validate_master_file(self, file_path: Path) -> List[ValidationIssue]:
+        """
+        Validate master user access file structure and content.
+        
+        Args:
+            file_path: Path to master file
+            
+        Returns:
+            List of validation issues
+        """
+        issues = []
+        
+        try:
+            df = pd.read_excel(file_path)
+            # Clean and normalize column names
+            df.columns = [col.strip().replace(' ', '').lower() for col in df.columns]
+            # Accept both 'username' and 'user name' but prefer 'username'
+            username_col = None
+            for col in df.columns:
+                if col == 'username':
+                    username_col = col
+                    break
+            if not username_col:
+                for col in df.columns:
+                    if col == 'username':
+                        username_col = col
+                        break
+            if not username_col:
+                issues.append({
+                    "severity": ValidationSeverity.ERROR.value,
+                    "message": "Master file must have 'Username' column (no space)",
+                    "details": f"Available columns: {', '.join(df.columns)}"
+                })
+                return issues
+            
+            # Check for empty file
+            if df.empty:
+                issues.append({
+                    "severity": ValidationSeverity.WARNING.value,
+                    "message": "Master file is empty",
+                    "details": "No user data found in master file"
+                })
+                return issues
+            # Check for null/empty usernames
+            null_count = df[username_col].isna().sum()
+            empty_count = (df[username_col] == "").sum()
+            if null_count > 0 or empty_count > 0:
+                total_unassigned = null_count + empty_count
+                issues.append({
+                    "severity": ValidationSeverity.INFO.value,
+                    "message": f"{total_unassigned} users have no username assigned",
+                    "details": "These rows will be ignored during processing"
+                })
+            # Report total records
+            self.logger.info(f"Master file contains {len(df)} user records")
+        except Exception as e:
+            issues.append({
+                "severity": ValidationSeverity.ERROR.value,
+                "message": "Failed to read master file",
+                "details": str(e)
+            })
+        return issues
+    
+    def validate_agency_mapping_file(self, file_path: Path) -> Tuple[List[ValidationIssue], List[Tuple[str, str]]]:
+        """
+        Validate agency mapping file structure.
+        
+        Args:
+            file_path: Path to agency mapping file
+            
+        Returns:
+            Tuple of (validation issues, list of (file_name, agency_id) tuples)
+        """
+        issues = []
+        mappings = []
+        
+        try:
+            df = pd.read_excel(file_path)
+            df.columns = df.columns.str.strip()
+            
+            # Check for required columns
+            required_cols = {
+                ColumnNames.FILE_NAME: None,
+                ColumnNames.AGENCY_ID: None
+            }
+            
+            for required_col in required_cols.keys():
+                for col in df.columns:
+                    if col.lower() == required_col.lower():
+                        required_cols[required_col] = col
+                        break
+            
+            missing_cols = [col for col, found in required_cols.items() if found is None]
+            
+            if missing_cols:
+                issues.append({
+                    "severity": ValidationSeverity.ERROR.value,
+                    "message": "Agency mapping file missing required columns",
+                    "details": f"Missing: {', '.join(missing_cols)}\nExpected: '{ColumnNames.FILE_NAME}' and '{ColumnNames.AGENCY_ID}'\nFound: {', '.join(df.columns.tolist())}"
+                })
+                return issues, mappings
+            
+            file_name_col = required_cols[ColumnNames.FILE_NAME]
+            agency_id_col = required_cols[ColumnNames.AGENCY_ID]
+            
+            # Check for empty file
+            if df.empty:
+                issues.append({
+                    "severity": ValidationSeverity.ERROR.value,
+                    "message": "Agency mapping file is empty",
+                    "details": "No mappings found"
+                })
+                return issues, mappings
+            
+            # Validate each row
+            for idx, row in df.iterrows():
+                file_name = str(row[file_name_col]).strip() if pd.notna(row[file_name_col]) else ""
+                agency_id = str(row[agency_id_col]).strip() if pd.notna(row[agency_id_col]) else ""
+                
+                if not file_name:
+                    issues.append({
+                        "severity": ValidationSeverity.WARNING.value,
+                        "message": f"Row {idx + 2}: Empty file name",
+                        "details": "This row will be skipped"
+                    })
+                    continue
+                
+                if not agency_id:
+                    issues.append({
+                        "severity": ValidationSeverity.WARNING.value,
+                        "message": f"Row {idx + 2}: Empty agency ID for file '{file_name}'",
+                        "details": "This row will be skipped"
+                    })
+                    continue
+                
+                mappings.append((file_name, agency_id))
+            
+            if not mappings:
+                issues.append({
+                    "severity": ValidationSeverity.ERROR.value,
+                    "message": "No valid mappings found",
+                    "details": "All rows were empty or invalid"
+                })
+            
+            self.logger.info(f"Agency mapping file contains {len(mappings)} mappings")
+            
+        except Exception as e:
+            issues.append({
+                "severity": ValidationSeverity.ERROR.value,
+                "message": "Failed to read agency mapping file",
+                "details": str(e)
+            })
+        
+        return issues, mappings
+    
+    def validate_combined_file(self, file_path: Path, file_names: Set[str]) -> List[ValidationIssue]:
+        """
+        Validate combined file structure and content.
+        
+        Args:
+            file_path: Path to combined file (multi-tab Excel)
+            file_names: Set of expected file names from mapping
+            
+        Returns:
+            List of validation issues
+        """
+        issues = []
+        
+        try:
+            # Use CombinedFileLoader to load data
+            combined_loader = CombinedFileLoader(file_path)
+            combined_data = combined_loader.load_all_data()
+            
+            if not combined_data:
+                issues.append({
+                    "severity": ValidationSeverity.ERROR.value,
+                    "message": "No data found in combined file",
+                    "details": "The combined file appears to be empty or contains no valid data"
+                })
+                return issues
+            
+            # Get email entries from all tabs
+            email_entries = set()
+            for idx, mapping in enumerate(combined_data):
+                file_name = mapping.source_file_name.strip()
+                if file_name:
+                    email_entries.add(file_name)
+                
+                # Validate email addresses
+                to_emails = mapping.recipients_to
+                cc_emails = mapping.recipients_cc
+                
+                # Check To addresses
+                if to_emails:
+                    to_list = format_email_list(to_emails)
+                    for email in to_list:
+                        if not is_valid_email(email):
+                            issues.append({
+                                "severity": ValidationSeverity.WARNING.value,
+                                "message": f"Entry {idx + 1}: Invalid To email format",
+                                "details": f"Email: {email}"
+                            })
+                else:
+                    if file_name:
+                        issues.append({
+                            "severity": ValidationSeverity.WARNING.value,
+                            "message": f"Entry {idx + 1}: No To addresses for '{file_name}'",
+                            "details": "Email cannot be sent without recipients"
+                        })
+                
+                # Check CC addresses
+                if cc_emails:
+                    cc_list = format_email_list(cc_emails)
+                    for email in cc_list:
+                        if not is_valid_email(email):
+                            issues.append({
+                                "severity": ValidationSeverity.WARNING.value,
+                                "message": f"Entry {idx + 1}: Invalid CC email format",
+                                "details": f"Email: {email}"
+                            })
+            
+            # Check for missing email entries
+            missing_emails = file_names - email_entries
+            if missing_emails:
+                issues.append({
+                    "severity": ValidationSeverity.WARNING.value,
+                    "message": f"{len(missing_emails)} file(s) missing email entries",
+                    "details": f"Files without email entries: {', '.join(sorted(missing_emails)[:5])}" + 
+                              (f" and {len(missing_emails) - 5} more..." if len(missing_emails) > 5 else "")
+                })
+            
+        except Exception as e:
+            issues.append({
+                "severity": ValidationSeverity.ERROR.value,
+                "message": "Failed to read combined file",
+                "details": str(e)
+            })
+        
+        return issues
+    
+    def validate_agency_mapping(
+        self,
+        master_file: Path,
+        agency_map_file: Path,
+        combined_file: Optional[Path] = None
+    ) -> ValidationResults:
+        """
+        Comprehensive validation of agency mapping against master file.
+        
+        Args:
+            master_file: Path to master user access file
+            agency_map_file: Path to agency mapping file
+            combined_file: Optional path to combined file (multi-tab Excel)
+            
+        Returns:
+            ValidationResults dictionary with detailed results
+            
+        Examples:
+            >>> validator = FileValidator()
+            >>> results = validator.validate_agency_mapping(
+            ...     master_file=Path("master.xlsx"),
+            ...     agency_map_file=Path("mapping.xlsx")
+            ... )
+            >>> print(f"Valid: {results['is_valid']}")
+        """
+        # Ensure all paths are Path objects (defensive programming)
+        master_file = Path(master_file) if isinstance(master_file, str) else master_file
+        agency_map_file = Path(agency_map_file) if isinstance(agency_map_file, str) else agency_map_file
+        if combined_file and isinstance(combined_file, str):
+            combined_file = Path(combined_file)
+        
+        all_issues: List[ValidationIssue] = []
+        email_issues: List[ValidationIssue] = []
+        
+        # Validate master file exists and structure
+        master_issues = self.validate_master_file(master_file)
+        all_issues.extend(master_issues)
+        
+        # Validate mapping file
+        mapping_issues, mappings = self.validate_agency_mapping_file(agency_map_file)
+        all_issues.extend(mapping_issues)
+        
+        # If critical errors, return early
+        has_errors = any(issue["severity"] == ValidationSeverity.ERROR.value for issue in all_issues)
+        if has_errors:
+            return {
+                "is_valid": False,
+                "issues": all_issues,
+                "master_agencies": set(),
+                "mapped_agencies": set(),
+                "unmapped_agencies": set(),
+                "duplicate_agencies": {},
+                "email_issues": [],
+                "master_agency_count": 0,
+                "mapped_agency_count": 0
+            }
+        
+        # Read master file to get agencies
+        try:
+            df_master = pd.read_excel(master_file)
+            df_master.columns = df_master.columns.str.strip()
+            
+            # Find agency column (case-insensitive)
+            agency_col = None
+            for col in df_master.columns:
+                if col.lower() == ColumnNames.AGENCY.lower():
+                    agency_col = col
+                    break
+            
+            # Get unique agencies from master (case-insensitive, excluding empty/null)
+            master_agencies = set()
+            if agency_col:
+                for agency in df_master[agency_col].dropna():
+                    agency_str = str(agency).strip()
+                    if agency_str:
+                        master_agencies.add(agency_str.upper())
+            
+        except Exception as e:
+            all_issues.append({
+                "severity": ValidationSeverity.ERROR.value,
+                "message": "Failed to read agencies from master file",
+                "details": str(e)
+            })
+            master_agencies = set()
+        
+        # Process mappings
+        file_names = set()
+        mapped_agencies_upper = set()
+        agency_to_files: Dict[str, List[str]] = {}
+        
+        for file_name, agency_id in mappings:
+            file_names.add(file_name)
+            
+            # Handle comma-separated agencies (e.g., "XYZ, ABC, DEF")
+            if ',' in agency_id:
+                agencies = [a.strip() for a in agency_id.split(',') if a.strip()]
+            else:
+                agencies = [agency_id]
+            
+            # Process each agency (split or single)
+            for single_agency in agencies:
+                agency_upper = single_agency.upper()
+                mapped_agencies_upper.add(agency_upper)
+                
+                # Track which files each agency is mapped to
+                if agency_upper in agency_to_files:
+                    agency_to_files[agency_upper].append(file_name)
+                else:
+                    agency_to_files[agency_upper] = [file_name]
+        
+        # Find duplicates (agencies mapped to multiple files)
+        duplicate_agencies = {
+            agency: files for agency, files in agency_to_files.items()
+            if len(files) > 1
+        }
+        
+        if duplicate_agencies:
+            for agency, files in duplicate_agencies.items():
+                all_issues.append({
+                    "severity": ValidationSeverity.ERROR.value,
+                    "message": f"Agency '{agency}' mapped to multiple files",
+                    "details": f"Files: {', '.join(files)}"
+                })
+        
+        # Find unmapped agencies
+        unmapped_agencies = master_agencies - mapped_agencies_upper
+        
+        if unmapped_agencies:
+            all_issues.append({
+                "severity": ValidationSeverity.WARNING.value,
+                "message": f"{len(unmapped_agencies)} agencies in master file not in mapping",
+                "details": f"Examples: {', '.join(sorted(unmapped_agencies)[:5])}" + 
+                          (f" and {len(unmapped_agencies) - 5} more..." if len(unmapped_agencies) > 5 else "")
+            })
+        
+        # Find agencies in mapping but not in master
+        extra_agencies = mapped_agencies_upper - master_agencies
+        if extra_agencies:
+            all_issues.append({
+                "severity": ValidationSeverity.INFO.value,
+                "message": f"{len(extra_agencies)} agencies in mapping not found in master file",
+                "details": f"Examples: {', '.join(sorted(extra_agencies)[:5])}" + 
+                          (f" and {len(extra_agencies) - 5} more..." if len(extra_agencies) > 5 else "")
+            })
+        
+        # Validate combined file if provided
+        if combined_file:
+            email_issues = self.validate_combined_file(combined_file, file_names)
+        
+        # Determine overall validity
+        all_combined_issues = all_issues + email_issues
+        has_errors = any(issue["severity"] == ValidationSeverity.ERROR.value for issue in all_combined_issues)
+        
+        return {
+            "is_valid": not has_errors,
+            "issues": all_issues,
+            "master_agencies": master_agencies,
+            "mapped_agencies": mapped_agencies_upper,
+            "unmapped_agencies": unmapped_agencies,
+            "duplicate_agencies": duplicate_agencies,
+            "email_issues": email_issues,
+            "master_agency_count": len(master_agencies),
+            "mapped_agency_count": len(mapped_agencies_upper)
+        }
+    
+    def validate_all_files(
+        self,
+        master_file: Path,
+        agency_map_file: Path,
+        combined_file: Path,
+        output_dir: Path
+    ) -> Tuple[bool, str]:
+        """
+        Comprehensive validation of all input files and directories.
+        
+        Args:
+            master_file: Path to master user access file
+            agency_map_file: Path to agency mapping file
+            combined_file: Path to combined file (multi-tab Excel)
+            output_dir: Path to output directory
+            
+        Returns:
+            Tuple of (is_valid, status_message)
+        """
+        # Ensure all paths are Path objects (defensive programming)
+        master_file = Path(master_file) if isinstance(master_file, str) else master_file
+        agency_map_file = Path(agency_map_file) if isinstance(agency_map_file, str) else agency_map_file
+        combined_file = Path(combined_file) if combined_file and isinstance(combined_file, str) else combined_file
+        output_dir = Path(output_dir) if isinstance(output_dir, str) else output_dir
+        
+        validation_results = []
+        
+        # Validate file existence
+        files_to_check = [
+            (master_file, "Master User Access File"),
+            (agency_map_file, "Agency Mapping File"),
+            (combined_file, "Combined File")
+        ]
+        
+        for file_path, file_type in files_to_check:
+            is_valid, error_msg = self.validate_file_exists(file_path, file_type)
+            if not is_valid:
+                validation_results.append(f"❌ {error_msg}")
+            else:
+                validation_results.append(f"✅ {file_type} exists")
+        
+        # Validate output directory
+        if not output_dir or str(output_dir).strip() == "":
+            validation_results.append("❌ Please select an Output Folder")
+        elif not output_dir.exists():
+            validation_results.append(f"❌ Output folder not found: {output_dir}")
+        elif not output_dir.is_dir():
+            validation_results.append(f"❌ Output path is not a directory: {output_dir}")
+        else:
+            validation_results.append("✅ Output folder is valid")
+        
+        # Validate Excel file structure
+        excel_files = [
+            (master_file, "Master User Access File"),
+            (agency_map_file, "Agency Mapping File"),
+            (combined_file, "Combined File")
+        ]
+        
+        for file_path, file_type in excel_files:
+            if file_path and file_path.exists():
+                is_valid, error_msg = self.validate_excel_file(file_path)
+                if not is_valid:
+                    validation_results.append(f"❌ {error_msg}")
+                else:
+                    validation_results.append(f"✅ {file_type} is readable")
+        
+        # Check if any validation failed
+        has_errors = any("❌" in result for result in validation_results)
+        
+        status_message = "\n".join(validation_results)
+        if has_errors:
+            status_message += "\n\nPlease fix the errors above before proceeding."
+        else:
+            status_message += "\n\nAll files are valid and ready for processing!"
+        
+        return not has_errors, status_message
+
+
+# ============ MODULE: combined_file_loader ============
+
+
+class CombinedFileLoader:
+    """
+    Loads combined agency mapping and email data from multi-tab Excel file.
+    
+    This class handles reading the new consolidated file structure where
+    each tab represents a region and contains file mappings with email data.
+    """
+    
+    def __init__(self, file_path: Path):
+        """Initialize with path to combined file."""
+        self.file_path = Path(file_path)
+        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self._combined_data: List[CombinedMapping] = []
+        self._loaded = False
+    
+    def load_all_tabs(self, selected_tabs: Optional[List[str]] = None) -> List[CombinedMapping]:
+        """
+        Load data from all tabs or selected tabs in the Excel file.
+        
+        Args:
+            selected_tabs: List of tab names to load. If None, loads all tabs.
+            
+        Returns:
+            List of CombinedMapping objects
+        """
+        if self._loaded and not selected_tabs:
+            return self._combined_data
+        
+        try:
+            # Get all sheet names
+            excel_file = pd.ExcelFile(self.file_path)
+            all_tabs = excel_file.sheet_names
+            
+            # Determine which tabs to process
+            tabs_to_process = selected_tabs if selected_tabs else all_tabs
+            
+            combined_mappings = []
+            
+            for tab_name in tabs_to_process:
+                if tab_name not in all_tabs:
+                    self.logger.warning(f"Tab '{tab_name}' not found in file")
+                    continue
+                    
+                # Read the tab
+                df = pd.read_excel(self.file_path, sheet_name=tab_name)
+                df.columns = df.columns.str.strip()
+                
+                # Map column names (case-insensitive)
+                column_mapping = {}
+                for col in df.columns:
+                    col_lower = col.lower()
+                    if "source_file_name" in col_lower or "file name" in col_lower:
+                        column_mapping[col] = ColumnNames.SOURCE_FILE_NAME
+                    elif "agency_id" in col_lower or "agency id" in col_lower:
+                        column_mapping[col] = ColumnNames.AGENCY_ID
+                    elif "recipients_to" in col_lower or col_lower in ["to", "recipients to"]:
+                        column_mapping[col] = ColumnNames.RECIPIENTS_TO
+                    elif "recipients_cc" in col_lower or col_lower in ["cc", "recipients cc"]:
+                        column_mapping[col] = ColumnNames.RECIPIENTS_CC
+                
+                # Rename columns
+                if column_mapping:
+                    df = df.rename(columns=column_mapping)
+                
+                # Ensure required columns exist
+                required_cols = [ColumnNames.SOURCE_FILE_NAME, ColumnNames.AGENCY_ID]
+                for col in required_cols:
+                    if col not in df.columns:
+                        self.logger.error(f"Required column '{col}' not found in tab '{tab_name}'")
+                        continue
+                
+                # Add optional columns if missing
+                if ColumnNames.RECIPIENTS_TO not in df.columns:
+                    df[ColumnNames.RECIPIENTS_TO] = ""
+                if ColumnNames.RECIPIENTS_CC not in df.columns:
+                    df[ColumnNames.RECIPIENTS_CC] = ""
+                
+                # Process each row
+                for _, row in df.iterrows():
+                    source_file = str(row[ColumnNames.SOURCE_FILE_NAME]).strip() if pd.notna(row[ColumnNames.SOURCE_FILE_NAME]) else ""
+                    agency_id = str(row[ColumnNames.AGENCY_ID]).strip() if pd.notna(row[ColumnNames.AGENCY_ID]) else ""
+                    
+                    if not source_file or not agency_id:
+                        continue
+                    
+                    recipients_to = str(row[ColumnNames.RECIPIENTS_TO]) if pd.notna(row[ColumnNames.RECIPIENTS_TO]) else ""
+                    recipients_cc = str(row[ColumnNames.RECIPIENTS_CC]) if pd.notna(row[ColumnNames.RECIPIENTS_CC]) else ""
+                    
+                    # Handle comma-separated agencies
+                    if ',' in agency_id:
+                        agencies = [a.strip() for a in agency_id.split(',') if a.strip()]
+                        for single_agency in agencies:
+                            combined_mappings.append(CombinedMapping(
+                                source_file_name=source_file,
+                                agency_id=single_agency,
+                                recipients_to=recipients_to,
+                                recipients_cc=recipients_cc,
+                                source_tab=tab_name
+                            ))
+                    else:
+                        combined_mappings.append(CombinedMapping(
+                            source_file_name=source_file,
+                            agency_id=agency_id,
+                            recipients_to=recipients_to,
+                            recipients_cc=recipients_cc,
+                            source_tab=tab_name
+                        ))
+                
+                self.logger.info(f"Loaded {len([m for m in combined_mappings if m.source_tab == tab_name])} mappings from tab '{tab_name}'")
+            
+            if not selected_tabs:
+                self._combined_data = combined_mappings
+                self._loaded = True
+            
+            self.logger.info(f"Total loaded mappings: {len(combined_mappings)}")
+            return combined_mappings
+            
+        except Exception as e:
+            self.logger.error(f"Failed to load combined file: {e}")
+            raise FileProcessingError(f"Failed to load combined file: {e}")
+    
+    def get_agency_mappings(self, selected_tabs: Optional[List[str]] = None) -> List[AgencyMapping]:
+        """
+        Get agency mappings in the old format for backward compatibility.
+        
+        Returns:
+            List of AgencyMapping objects
+        """
+        combined_data = self.load_all_tabs(selected_tabs)
+        return [mapping.to_agency_mapping() for mapping in combined_data]
+    
+    def get_email_mappings(self, selected_tabs: Optional[List[str]] = None) -> Dict[str, EmailRecipients]:
+        """
+        Get email mappings by source file name.
+        
+        Returns:
+            Dictionary mapping source_file_name to EmailRecipients
+        """
+        combined_data = self.load_all_tabs(selected_tabs)
+        email_mappings = {}
+        
+        for mapping in combined_data:
+            if mapping.source_file_name not in email_mappings:
+                email_mappings[mapping.source_file_name] = mapping.get_email_recipients()
+        
+        return email_mappings
+    
+    def get_available_tabs(self) -> List[str]:
+        """
+        Get list of available tab names in the file.
+        
+        Returns:
+            List of tab names
+        """
+        try:
+            excel_file = pd.ExcelFile(self.file_path)
+            return excel_file.sheet_names
+        except Exception as e:
+            self.logger.error(f"Failed to get tab names: {e}")
+            return []
+
+
+# ============ MODULE: file_processor ============
+
+
+
+
+
+
+class FileProcessor:
+    """
+    Processes master file and generates agency-specific Excel files.
+    
+    This class handles the core file generation logic, creating multi-tab
+    Excel files with proper formatting, sorting, and error handling.
+    
+    Examples:
+        >>> processor = FileProcessor()
+        >>> processor.generate_agency_files(
+        ...     master_file=Path("master.xlsx"),
+        ...     agency_map_file=Path("mapping.xlsx"),
+        ...     output_dir=Path("output")
+        ... )
+    """
+    
+    def __init__(self, formatting: Optional[ExcelFormatting] = None):
+        """
+        Initialize file processor.
+        
+        Args:
+            formatting: Excel formatting options. Uses defaults if None.
+        """
+        self.formatting = formatting or ExcelFormatting()
+        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+    
+    def format_worksheet(
+        self,
+        writer: pd.ExcelWriter,
+        sheet_name: str,
+        df: pd.DataFrame
+    ) -> None:
+        """
+        Apply formatting to an Excel worksheet.
+        
+        Args:
+            writer: Pandas ExcelWriter object
+            sheet_name: Name of the sheet to format
+            df: DataFrame that was written to the sheet
+            
+        Examples:
+            >>> with pd.ExcelWriter("output.xlsx", engine="xlsxwriter") as writer:
+            ...     df.to_excel(writer, sheet_name="Sheet1", index=False)
+            ...     processor.format_worksheet(writer, "Sheet1", df)
+        """
+        try:
+            workbook = writer.book
+            worksheet = writer.sheets[sheet_name]
+            
+            # Freeze top row if enabled
+            if self.formatting.freeze_header:
+                worksheet.freeze_panes(1, 0)
+            
+            # Create header format
+            if self.formatting.bold_header:
+                header_format = workbook.add_format({
+                    'bold': True,
+                    'bg_color': self.formatting.header_bg_color,
+                    'border': 1 if self.formatting.border_header else 0
+                })
+                
+                # Apply header format
+                for col_idx, col_name in enumerate(df.columns):
+                    worksheet.write(0, col_idx, col_name, header_format)
+            
+            # Auto-adjust column widths if enabled
+            if self.formatting.auto_width:
+                for col_idx, col_name in enumerate(df.columns):
+                    # Calculate max width
+                    max_len = len(str(col_name))
+                    for value in df[col_name].astype(str):
+                        max_len = max(max_len, len(value))
+                    
+                    # Set width (with max limit)
+                    width = min(max_len + 2, self.formatting.max_column_width)
+                    worksheet.set_column(col_idx, col_idx, width)
+            
+            self.logger.debug(f"Formatted worksheet: {sheet_name}")
+            
+        except Exception as e:
+            self.logger.warning(f"Failed to format worksheet {sheet_name}: {e}")
+    
+    def load_agency_mappings(self, mapping_file: Path, selected_tabs: Optional[List[str]] = None) -> List[AgencyMapping]:
+        """
+        Load agency mappings from combined Excel file.
+        
+        Args:
+            mapping_file: Path to combined agency/email mapping Excel file
+            selected_tabs: Optional list of tab names to process
+            
+        Returns:
+            List of AgencyMapping objects
+            
+        Raises:
+            FileProcessingError: If file cannot be read or is invalid
+        """
+        try:
+            combined_loader = CombinedFileLoader(mapping_file)
+            mappings = combined_loader.get_agency_mappings(selected_tabs)
+            self.logger.info(f"Loaded {len(mappings)} agency mappings from combined file")
+            return mappings
+            
+        except Exception as e:
+            raise FileProcessingError(f"Failed to load agency mappings: {e}")
+    
+    def generate_agency_files(
+        self,
+        master_file: Path,
+        combined_map_file: Path,
+        output_dir: Path,
+        progress_callback: Optional[Callable[[float, str], None]] = None,
+        handle_unmapped: str = "prompt",
+        selected_tabs: Optional[List[str]] = None,
+        unmapped_callback: Optional[Callable] = None
+    ) -> bool:
+        """
+        Generate agency-specific Excel files with multi-tab structure.
+        
+        Each file contains:
+        - Tab 1: "All Users" (all agencies for that file)
+        - Tab 2-N: Individual agency tabs (alphabetically sorted)
+        
+        Args:
+            master_file: Path to master user access Excel file
+            combined_map_file: Path to combined agency/email mapping file
+            output_dir: Output directory for generated files
+            progress_callback: Optional callback for progress updates
+            handle_unmapped: How to handle unmapped agencies: "individual", "single", or "skip"
+            selected_tabs: Optional list of tab names to process from combined file
+            
+        Returns:
+            True if successful
+            
+        Raises:
+            FileProcessingError: If file generation fails
+        """
+        try:
+            # Ensure all paths are Path objects (defensive programming)
+            master_file = Path(master_file) if isinstance(master_file, str) else master_file
+            combined_map_file = Path(combined_map_file) if isinstance(combined_map_file, str) else combined_map_file
+            output_dir = Path(output_dir) if isinstance(output_dir, str) else output_dir
+            
+            # Ensure output directory exists
+            output_dir.mkdir(parents=True, exist_ok=True)
+            
+            # Update progress
+            if progress_callback:
+                progress_callback(0.1, "Loading master file...")
+            
+            # Load master file
+            df_master = pd.read_excel(master_file)
+            df_master.columns = df_master.columns.str.strip()
+            
+            # Find agency column (case-insensitive)
+            agency_col = None
+            for col in df_master.columns:
+                if col.lower() == ColumnNames.AGENCY.lower():
+                    agency_col = col
+                    break
+            
+            if not agency_col:
+                raise FileProcessingError(f"Master file must have '{ColumnNames.AGENCY}' column")
+            
+            # COUNTRY FILTERING: Filter by country if specific tabs selected
+            if selected_tabs and ColumnNames.COUNTRY in df_master.columns:
+                # Check for NULL/missing country values and warn user
+                null_countries = df_master[ColumnNames.COUNTRY].isna().sum()
+                if null_countries > 0:
+                    self.logger.warning(
+                        f"Found {null_countries} users with NULL/missing Country values - "
+                        f"these will be excluded from regional filtering"
+                    )
+                
+                # Build list of countries to include based on selected tabs
+                countries_to_include = []
+                for tab in selected_tabs:
+                    if tab in TAB_TO_COUNTRY_MAP:
+                        countries_to_include.extend(TAB_TO_COUNTRY_MAP[tab])
+                
+                if countries_to_include:
+                    # Filter master data to only include selected countries (case-insensitive)
+                    original_count = len(df_master)
+                    # Convert both to uppercase for case-insensitive comparison
+                    countries_upper = [c.upper() for c in countries_to_include]
+                    df_master = df_master[
+                        df_master[ColumnNames.COUNTRY].fillna('').astype(str).str.upper().isin(countries_upper)
+                    ]
+                    filtered_count = len(df_master)
+                    
+                    self.logger.info(
+                        f"Country filter applied: {original_count} → {filtered_count} users "
+                        f"(Tabs: {', '.join(selected_tabs)} | Countries: {', '.join(set(countries_to_include)[:5])}...)"
+                    )
+                    
+                    if progress_callback:
+                        progress_callback(0.15, f"Filtered to {', '.join(selected_tabs)} region(s)...")
+            
+            # Update progress
+            if progress_callback:
+                progress_callback(0.2, "Loading agency mappings...")
+            
+            # Load mappings using new combined file loader
+            mappings = self.load_agency_mappings(combined_map_file, selected_tabs)
+            
+            # Group mappings by file name
+            file_to_agencies: Dict[str, List[str]] = {}
+            for mapping in mappings:
+                if mapping.file_name not in file_to_agencies:
+                    file_to_agencies[mapping.file_name] = []
+                file_to_agencies[mapping.file_name].append(mapping.agency_id)
+            
+            # Track assigned indices
+            assigned_indices = set()
+            
+            # Process each file
+            total_files = len(file_to_agencies)
             for file_idx, (file_name, agencies) in enumerate(file_to_agencies.items()):
                 if progress_callback:
                     progress = 0.3 + (file_idx / total_files) * 0.6
                     progress_callback(progress, f"Generating {file_name}...")
                 
-                self._generate_single_file(
-                    df_master=df_master,
-                    agency_col=agency_col,
-                    file_name=file_name,
-                    agencies=agencies,
-                    output_dir=output_dir,
-                    assigned_indices=assigned_indices
+                self._generate_single_file(
+                    df_master=df_master,
+                    agency_col=agency_col,
+                    file_name=file_name,
+                    agencies=agencies,
+                    output_dir=output_dir,
+                    assigned_indices=assigned_indices
+                )
+            
+            # Handle unmapped users
+            if progress_callback:
+                progress_callback(0.9, "Processing unmapped users...")
+            
+            unassigned_indices = set(df_master.index) - assigned_indices
+            if unassigned_indices:
+                df_unassigned = df_master.loc[list(unassigned_indices)].copy()
+                
+                if handle_unmapped == "prompt":
+                    # Prepare unassigned data for dialog
+                    unassigned_data = []
+                    unmapped_agencies = df_unassigned[agency_col].fillna("[No Agency]").unique()
+                    
+                    for agency in unmapped_agencies:
+                        agency_df = df_unassigned[df_unassigned[agency_col].fillna("[No Agency]") == agency]
+                        country = agency_df[ColumnNames.COUNTRY].iloc[0] if ColumnNames.COUNTRY in agency_df.columns else "Unknown"
+                        
+                        unassigned_data.append({
+                            'agency': str(agency),
+                            'country': country,
+                            'user_count': len(agency_df)
+                        })
+                    
+                    # If unmapped_callback is provided (GUI context), use it
+                    if unmapped_callback:
+                        # Callback should return dialog result or None
+                        dialog_result = unmapped_callback(unassigned_data, file_to_agencies, combined_map_file)
+                        
+                        if dialog_result and dialog_result.get('decisions'):
+                            decisions = dialog_result['decisions']
+                            update_mapping = dialog_result.get('update_mapping', False)
+                            
+                            # Process decisions
+                            updates_for_mapping = {'add_to_existing': [], 'create_new': []}
+                            
+                            for agency, decision in decisions.items():
+                                action = decision['action']
+                                target = decision['target']
+                                agency_data = decision['agency_data']
+                                
+                                # Get the subset of df_unassigned for this agency
+                                df_agency_subset = df_unassigned[
+                                    df_unassigned[agency_col].fillna("[No Agency]") == agency
+                                ]
+                                
+                                if action == "Add to Existing File":
+                                    # Generate the agency data into the existing file
+                                    if target in file_to_agencies:
+                                        # Append this agency to the existing agencies list
+                                        file_to_agencies[target].append(agency)
+                                        
+                                        # Regenerate the file with updated agency list
+                                        self._generate_single_file(
+                                            df_master=df_master,
+                                            agency_col=agency_col,
+                                            file_name=target,
+                                            agencies=file_to_agencies[target],
+                                            output_dir=output_dir,
+                                            assigned_indices=assigned_indices
+                                        )
+                                        
+                                        # Track for mapping update
+                                        updates_for_mapping['add_to_existing'].append((agency, target))
+                                
+                                elif action == "Create New File":
+                                    # Create new file for this agency
+                                    self._generate_single_file(
+                                        df_master=df_master,
+                                        agency_col=agency_col,
+                                        file_name=target,
+                                        agencies=[agency],
+                                        output_dir=output_dir,
+                                        assigned_indices=assigned_indices
+                                    )
+                                    
+                                    # Track for mapping update
+                                    recipients = decision.get('recipients', {})
+                                    to_emails = recipients.get('to', '')
+                                    cc_emails = recipients.get('cc', '')
+                                    updates_for_mapping['create_new'].append(
+                                        (agency, target, to_emails, cc_emails)
+                                    )
+                                
+                                elif action == "Keep as Unassigned":
+                                    # Create unassigned file for this country
+                                    country = agency_data.get('country', 'Unknown')
+                                    unassigned_file_name = f"Unassigned_{country}"
+                                    
+                                    self._generate_single_file(
+                                        df_master=df_master,
+                                        agency_col=agency_col,
+                                        file_name=unassigned_file_name,
+                                        agencies=[agency],
+                                        output_dir=output_dir,
+                                        assigned_indices=assigned_indices
+                                    )
+                            
+                            # Update mapping file if requested
+                            if update_mapping and (updates_for_mapping['add_to_existing'] or updates_for_mapping['create_new']):
+                                # Determine which tab to update (use first selected tab or default)
+                                tab_name = selected_tabs[0] if selected_tabs else "AMER"
+                                self.update_combined_mapping_file(
+                                    mapping_file_path=combined_map_file,
+                                    updates=updates_for_mapping,
+                                    tab_name=tab_name
+                                )
+                        else:
+                            # Dialog was cancelled, skip unmapped
+                            handle_unmapped = "skip"
+                    else:
+                        # No callback (non-GUI context), fall back to simple messagebox
+                        unmapped_count = len(df_unassigned)
+                        agency_display = ', '.join([str(a) for a in unmapped_agencies[:10]])
+                        if len(unmapped_agencies) > 10:
+                            agency_display += f" and {len(unmapped_agencies) - 10} more..."
+                        
+                        choice = messagebox.askyesnocancel(
+                            "Unmapped Users Found",
+                            f"{unmapped_count} users with {len(unmapped_agencies)} unmapped agencies:\n{agency_display}\n\n"
+                            f"YES = Individual files per agency\n"
+                            f"NO = Single 'Unassigned.xlsx' file\n"
+                            f"CANCEL = Skip unmapped users"
+                        )
+                        
+                        if choice is True:
+                            handle_unmapped = "individual"
+                        elif choice is False:
+                            handle_unmapped = "single"
+                        else:
+                            handle_unmapped = "skip"
+                
+                # Handle non-prompt modes or fallback from prompt
+                if handle_unmapped == "individual":
+                    self._create_individual_unmapped_files(
+                        df_unassigned=df_unassigned,
+                        agency_col=agency_col,
+                        output_dir=output_dir
+                    )
+                elif handle_unmapped == "single":
+                    self._create_unassigned_file(
+                        df_unassigned=df_unassigned,
+                        output_dir=output_dir
+                    )
+                
+                self.logger.info(f"Processed {len(unassigned_indices)} unmapped users with method: {handle_unmapped}")
+            
+            if progress_callback:
+                progress_callback(1.0, "Complete!")
+            
+            self.logger.info(f"Successfully generated {total_files} agency files")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"File generation failed: {e}")
+            raise FileProcessingError(f"File generation failed: {e}")
+    
+    def _generate_single_file(
+        self,
+        df_master: pd.DataFrame,
+        agency_col: str,
+        file_name: str,
+        agencies: List[str],
+        output_dir: Path,
+        assigned_indices: Set[int]
+    ) -> None:
+        """
+        Generate a single multi-tab Excel file for a group of agencies.
+        
+        Args:
+            df_master: Master DataFrame
+            agency_col: Name of agency column
+            file_name: Output file name (without .xlsx)
+            agencies: List of agency IDs to include
+            output_dir: Output directory
+            assigned_indices: Set to track assigned row indices
+        """
+        # Match agencies (case-insensitive)
+        # Create pattern with case-insensitive flag at the start - escape special regex characters
+        agency_alternatives = "|".join([f"^{re.escape(ag.strip())}$" for ag in agencies])
+        agency_pattern = f"(?i)({agency_alternatives})"
+        matched = df_master[df_master[agency_col].astype(str).str.match(agency_pattern, na=False)]
+        
+        if matched.empty:
+            # Enhanced diagnostic: show what we searched for and suggest similar matches
+            searched_agencies = ", ".join([f"'{ag.strip()}'" for ag in agencies[:3]])
+            if len(agencies) > 3:
+                searched_agencies += f" and {len(agencies)-3} more"
+            
+            # Find similar agency names in master file for troubleshooting
+            all_master_agencies = df_master[agency_col].dropna().unique()
+            similar = []
+            for search_ag in agencies:
+                search_lower = search_ag.strip().lower()
+                for master_ag in all_master_agencies:
+                    master_lower = str(master_ag).lower()
+                    # Check if any words match or if one contains the other
+                    if (search_lower in master_lower or master_lower in search_lower or 
+                        any(word in master_lower for word in search_lower.split() if len(word) > 3)):
+                        similar.append(f"'{master_ag}'")
+            
+            if similar:
+                similar_str = ", ".join(similar[:5])
+                if len(similar) > 5:
+                    similar_str += f" and {len(similar)-5} more"
+                self.logger.warning(
+                    f"No users found for {file_name} | Searched: {searched_agencies} | "
+                    f"Similar names in master file: {similar_str}"
+                )
+            else:
+                self.logger.warning(
+                    f"No users found for {file_name} | Searched: {searched_agencies} | "
+                    f"No similar agency names found in master file"
+                )
+            return
+        
+        # Track assigned indices
+        assigned_indices.update(matched.index)
+        
+        # Create output file path - sanitize filename and remove .xlsx if already present
+        safe_file_name = sanitize_filename(file_name)
+        if safe_file_name.lower().endswith('.xlsx'):
+            output_file = output_dir / safe_file_name
+        else:
+            output_file = output_dir / f"{safe_file_name}.xlsx"
+        
+        # Prepare data with review columns
+        df_output = matched.copy()
+        df_output[ColumnNames.REVIEW_ACTION] = ""
+        df_output[ColumnNames.COMMENTS] = ""
+        
+        # Create Excel writer
+        with pd.ExcelWriter(output_file, engine="xlsxwriter") as writer:
+            # Tab 1: All Users (or User Access List for Access Certification format)
+            primary_sheet = SheetNames.USER_ACCESS_LIST if hasattr(SheetNames, 'USER_ACCESS_LIST') else SheetNames.ALL_USERS
+            df_output.to_excel(writer, sheet_name=primary_sheet, index=False)
+            self.format_worksheet(writer, primary_sheet, df_output)
+            
+            # Tab 2: User Access Summary (Pivot) - NEW FEATURE
+            self._create_pivot_summary_sheet(
+                writer,
+                df_output,
+                SheetNames.USER_ACCESS_SUMMARY,
+                agencies
+            )
+            
+            # Tab 3-N: Individual agencies (alphabetically sorted)
+            for agency in sorted(agencies, key=str.upper):
+                # Match this specific agency (case-insensitive)
+                agency_match = df_output[
+                    df_output[agency_col].astype(str).str.upper() == agency.upper()
+                ]
+                
+                if not agency_match.empty:
+                    # Sanitize sheet name
+                    sheet_name = sanitize_sheet_name(agency)
+                    
+                    # Write to sheet
+                    agency_match.to_excel(writer, sheet_name=sheet_name, index=False)
+                    self.format_worksheet(writer, sheet_name, agency_match)
+        
+        self.logger.info(f"Created {output_file} with {len(agencies)} agency tabs")
+    
+    def _create_pivot_summary_sheet(
+        self,
+        writer: pd.ExcelWriter,
+        df: pd.DataFrame,
+        sheet_name: str,
+        agencies: List[str] = None
+    ) -> None:
+        """
+        Create User Access Summary pivot sheet showing UserName → Folder → SubFolder hierarchy.
+        
+        Args:
+            writer: Excel writer object
+            df: DataFrame with user access data
+            sheet_name: Name for the sheet
+            agencies: Optional list of agencies for filtering
+        """
+        try:
+            # Check if required columns exist
+            user_col = None
+            folder_col = None
+            subfolder_col = None
+            
+            # Find user name column (flexible matching)
+            for col in [ColumnNames.USERNAME, ColumnNames.USER_NAME, "UserName", "User Name"]:
+                if col in df.columns:
+                    user_col = col
+                    break
+            
+            # Find folder columns
+            if ColumnNames.FOLDER in df.columns:
+                folder_col = ColumnNames.FOLDER
+            if ColumnNames.SUBFOLDER in df.columns:
+                subfolder_col = ColumnNames.SUBFOLDER
+            
+            # If columns don't exist, log warning and skip
+            if not user_col:
+                self.logger.warning(f"Cannot create pivot summary: UserName column not found in data")
+                return
+            
+            if not folder_col or not subfolder_col:
+                self.logger.warning(f"Cannot create pivot summary: Folder/SubFolder columns not found")
+                return
+            
+            # Create a copy for processing
+            df_pivot = df.copy()
+            
+            # Remove review columns if present
+            cols_to_drop = [ColumnNames.REVIEW_ACTION, ColumnNames.REVIEW_COMMENTS, ColumnNames.COMMENTS]
+            df_pivot = df_pivot.drop(columns=[col for col in cols_to_drop if col in df_pivot.columns])
+            
+            # Create pivot table: UserName as rows, Folder+SubFolder as columns
+            # Use aggfunc='size' to count occurrences, or 'first' to show values
+            pivot_table = pd.pivot_table(
+                df_pivot,
+                index=user_col,
+                columns=[folder_col, subfolder_col],
+                aggfunc='size',
+                fill_value=0
+            )
+            
+            # Reset index FIRST to make UserName a regular column
+            pivot_display = pivot_table.reset_index()
+            
+            # NOW flatten MultiIndex columns (after reset_index)
+            if isinstance(pivot_display.columns, pd.MultiIndex):
+                # Flatten the column names
+                pivot_display.columns = [
+                    col[0] if col[1] == '' else f"{col[0]} - {col[1]}" 
+                    if isinstance(col, tuple) else str(col)
+                    for col in pivot_display.columns
+                ]
+            
+            # Replace counts with 'X' for presence indicator (use apply instead of deprecated applymap)
+            for col in pivot_display.columns:
+                if col != user_col:  # Don't modify the username column
+                    pivot_display[col] = pivot_display[col].apply(lambda x: 'X' if x > 0 else '')
+            
+            # Write to Excel, handle MultiIndex columns
+            try:
+                if isinstance(pivot_display.columns, pd.MultiIndex):
+                    pivot_display.to_excel(writer, sheet_name=sheet_name, index=True)
+                else:
+                    pivot_display.to_excel(writer, sheet_name=sheet_name, index=False)
+            except Exception as e:
+                self.logger.error(f"Failed to create pivot summary: {e}")
+            
+            # Format the worksheet
+            workbook = writer.book
+            worksheet = writer.sheets[sheet_name]
+            
+            # Format header row
+            header_format = workbook.add_format({
+                'bold': True,
+                'bg_color': '#4472C4',
+                'font_color': 'white',
+                'border': 1,
+                'align': 'center',
+                'valign': 'vcenter',
+                'text_wrap': True
+            })
+            
+            # Apply header format
+            for col_num, value in enumerate(pivot_display.columns.values):
+                worksheet.write(0, col_num, str(value), header_format)
+            
+            # Auto-fit columns
+            for i, col in enumerate(pivot_display.columns):
+                max_len = max(
+                    pivot_display[col].astype(str).apply(len).max(),
+                    len(str(col))
                 )
+                worksheet.set_column(i, i, min(max_len + 2, 50))
             
-            # Handle unmapped users
-            if progress_callback:
-                progress_callback(0.9, "Processing unmapped users...")
+            # Freeze first row and first column
+            worksheet.freeze_panes(1, 1)
             
-            unassigned_indices = set(df_master.index) - assigned_indices
-            if unassigned_indices:
-                df_unassigned = df_master.loc[list(unassigned_indices)].copy()
-                
-                if handle_unmapped == "prompt":
-                    # Prepare unassigned data for dialog
-                    unassigned_data = []
-                    unmapped_agencies = df_unassigned[agency_col].fillna("[No Agency]").unique()
-                    
-                    for agency in unmapped_agencies:
-                        agency_df = df_unassigned[df_unassigned[agency_col].fillna("[No Agency]") == agency]
-                        country = agency_df[ColumnNames.COUNTRY].iloc[0] if ColumnNames.COUNTRY in agency_df.columns else "Unknown"
-                        
-                        unassigned_data.append({
-                            'agency': str(agency),
-                            'country': country,
-                            'user_count': len(agency_df)
-                        })
-                    
-                    # If unmapped_callback is provided (GUI context), use it
-                    if unmapped_callback:
-                        # Callback should return dialog result or None
-                        dialog_result = unmapped_callback(unassigned_data, file_to_agencies, combined_map_file)
-                        
-                        if dialog_result and dialog_result.get('decisions'):
-                            decisions = dialog_result['decisions']
-                            update_mapping = dialog_result.get('update_mapping', False)
-                            
-                            # Process decisions
-                            updates_for_mapping = {'add_to_existing': [], 'create_new': []}
-                            
-                            for agency, decision in decisions.items():
-                                action = decision['action']
-                                target = decision['target']
-                                agency_data = decision['agency_data']
-                                
-                                # Get the subset of df_unassigned for this agency
-                                df_agency_subset = df_unassigned[
-                                    df_unassigned[agency_col].fillna("[No Agency]") == agency
-                                ]
-                                
-                                if action == "Add to Existing File":
-                                    # Generate the agency data into the existing file
-                                    if target in file_to_agencies:
-                                        # Append this agency to the existing agencies list
-                                        file_to_agencies[target].append(agency)
-                                        
-                                        # Regenerate the file with updated agency list
-                                        self._generate_single_file(
-                                            df_master=df_master,
-                                            agency_col=agency_col,
-                                            file_name=target,
-                                            agencies=file_to_agencies[target],
-                                            output_dir=output_dir,
-                                            assigned_indices=assigned_indices
-                                        )
-                                        
-                                        # Track for mapping update
-                                        updates_for_mapping['add_to_existing'].append((agency, target))
-                                
-                                elif action == "Create New File":
-                                    # Create new file for this agency
-                                    self._generate_single_file(
-                                        df_master=df_master,
-                                        agency_col=agency_col,
-                                        file_name=target,
-                                        agencies=[agency],
-                                        output_dir=output_dir,
-                                        assigned_indices=assigned_indices
-                                    )
-                                    
-                                    # Track for mapping update
-                                    recipients = decision.get('recipients', {})
-                                    to_emails = recipients.get('to', '')
-                                    cc_emails = recipients.get('cc', '')
-                                    updates_for_mapping['create_new'].append(
-                                        (agency, target, to_emails, cc_emails)
-                                    )
-                                
-                                elif action == "Keep as Unassigned":
-                                    # Create unassigned file for this country
-                                    country = agency_data.get('country', 'Unknown')
-                                    unassigned_file_name = f"Unassigned_{country}"
-                                    
-                                    self._generate_single_file(
-                                        df_master=df_master,
-                                        agency_col=agency_col,
-                                        file_name=unassigned_file_name,
-                                        agencies=[agency],
-                                        output_dir=output_dir,
-                                        assigned_indices=assigned_indices
-                                    )
-                            
-                            # Update mapping file if requested
-                            if update_mapping and (updates_for_mapping['add_to_existing'] or updates_for_mapping['create_new']):
-                                # Determine which tab to update (use first selected tab or default)
-                                tab_name = selected_tabs[0] if selected_tabs else "AMER"
-                                self.update_combined_mapping_file(
-                                    mapping_file_path=combined_map_file,
-                                    updates=updates_for_mapping,
-                                    tab_name=tab_name
-                                )
-                        else:
-                            # Dialog was cancelled, skip unmapped
-                            handle_unmapped = "skip"
+            # Add autofilter
+            worksheet.autofilter(0, 0, len(pivot_display), len(pivot_display.columns) - 1)
+            
+            self.logger.info(f"Created pivot summary sheet '{sheet_name}' with {len(pivot_display)} users")
+            
+        except Exception as e:
+            self.logger.error(f"Failed to create pivot summary: {e}")
+            # Don't raise - this is an enhancement feature, continue without it
+    
+    def _create_unassigned_file(
+        self,
+        df_unassigned: pd.DataFrame,
+        output_dir: Path
+    ) -> None:
+        """
+        Create single Unassigned.xlsx file for all unmapped users.
+        
+        Args:
+            df_unassigned: DataFrame with unmapped users
+            output_dir: Output directory
+        """
+        output_file = output_dir / FileNames.UNASSIGNED_FILE
+        
+        # Add review columns
+        df_output = df_unassigned.copy()
+        df_output[ColumnNames.REVIEW_ACTION] = ""
+        df_output[ColumnNames.COMMENTS] = ""
+        
+        # Write to Excel
+        with pd.ExcelWriter(output_file, engine="xlsxwriter") as writer:
+            df_output.to_excel(writer, sheet_name=SheetNames.ALL_USERS, index=False)
+            self.format_worksheet(writer, SheetNames.ALL_USERS, df_output)
+        
+        self.logger.info(f"Created {output_file} with {len(df_unassigned)} unmapped users")
+    
+    def _create_individual_unmapped_files(
+        self,
+        df_unassigned: pd.DataFrame,
+        agency_col: str,
+        output_dir: Path
+    ) -> None:
+        """
+        Create individual files for each unmapped agency.
+        
+        Args:
+            df_unassigned: DataFrame with unmapped users
+            agency_col: Name of agency column
+            output_dir: Output directory
+        """
+        # Get unique agencies from unmapped users
+        unique_agencies = df_unassigned[agency_col].fillna("Unassigned").unique()
+        
+        for agency in unique_agencies:
+            agency_str = str(agency).strip()
+            if not agency_str:
+                agency_str = "Unassigned"
+            
+            # Filter for this agency
+            df_agency = df_unassigned[
+                df_unassigned[agency_col].fillna("Unassigned") == agency
+            ].copy()
+            
+            # Add review columns
+            df_agency[ColumnNames.REVIEW_ACTION] = ""
+            df_agency[ColumnNames.COMMENTS] = ""
+            
+            # Sanitize file name
+            safe_name = sanitize_sheet_name(agency_str)
+            output_file = output_dir / f"{safe_name}.xlsx"
+            
+            # Write to Excel
+            with pd.ExcelWriter(output_file, engine="xlsxwriter") as writer:
+                df_agency.to_excel(writer, sheet_name=SheetNames.ALL_USERS, index=False)
+                self.format_worksheet(writer, SheetNames.ALL_USERS, df_agency)
+            
+            self.logger.info(f"Created individual file for unmapped agency: {safe_name}")
+    
+    def update_combined_mapping_file(
+        self,
+        mapping_file_path: Path,
+        updates: dict,
+        tab_name: str
+    ) -> bool:
+        """
+        Update the combined mapping file with new agency assignments.
+        Creates a backup before modifying.
+        
+        Args:
+            mapping_file_path: Path to the combined mapping Excel file
+            updates: Dictionary of updates to apply
+                    Format: {
+                        'add_to_existing': [(agency, source_file_name), ...],
+                        'create_new': [(agency, source_file_name, to_emails, cc_emails), ...]
+                    }
+            tab_name: Name of the regional tab to update
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            # Create backup first (skipped if unchanged since the last one)
+            BackupService.from_config(mapping_file_path.parent / FileNames.BACKUP_DIR).backup_file(mapping_file_path)
+            
+            # Load the entire workbook
+            xl_file = pd.ExcelFile(mapping_file_path)
+            all_sheets = {sheet: pd.read_excel(xl_file, sheet_name=sheet) for sheet in xl_file.sheet_names}
+            
+            # Get the target sheet
+            if tab_name not in all_sheets:
+                self.logger.error(f"Tab '{tab_name}' not found in mapping file")
+                return False
+            
+            df = all_sheets[tab_name].copy()
+            
+            # Process updates
+            # 1. Add to existing files
+            for agency, source_file_name in updates.get('add_to_existing', []):
+                # Find the row with matching source_file_name
+                mask = df[ColumnNames.SOURCE_FILE_NAME] == source_file_name
+                if mask.any():
+                    # Append agency to the agency_id column (comma-separated)
+                    idx = df[mask].index[0]
+                    current_agencies = str(df.loc[idx, ColumnNames.AGENCY_ID])
+                    if pd.isna(current_agencies) or current_agencies.strip() == '':
+                        df.loc[idx, ColumnNames.AGENCY_ID] = agency
                     else:
-                        # No callback (non-GUI context), fall back to simple messagebox
-                        unmapped_count = len(df_unassigned)
-                        agency_display = ', '.join([str(a) for a in unmapped_agencies[:10]])
-                        if len(unmapped_agencies) > 10:
-                            agency_display += f" and {len(unmapped_agencies) - 10} more..."
-                        
-                        choice = messagebox.askyesnocancel(
-                            "Unmapped Users Found",
-                            f"{unmapped_count} users with {len(unmapped_agencies)} unmapped agencies:\n{agency_display}\n\n"
-                            f"YES = Individual files per agency\n"
-                            f"NO = Single 'Unassigned.xlsx' file\n"
-                            f"CANCEL = Skip unmapped users"
-                        )
-                        
-                        if choice is True:
-                            handle_unmapped = "individual"
-                        elif choice is False:
-                            handle_unmapped = "single"
-                        else:
-                            handle_unmapped = "skip"
-                
-                # Handle non-prompt modes or fallback from prompt
-                if handle_unmapped == "individual":
-                    self._create_individual_unmapped_files(
-                        df_unassigned=df_unassigned,
-                        agency_col=agency_col,
-                        output_dir=output_dir
-                    )
-                elif handle_unmapped == "single":
-                    self._create_unassigned_file(
-                        df_unassigned=df_unassigned,
-                        output_dir=output_dir
-                    )
-                
-                self.logger.info(f"Processed {len(unassigned_indices)} unmapped users with method: {handle_unmapped}")
+                        df.loc[idx, ColumnNames.AGENCY_ID] = f"{current_agencies}, {agency}"
+                    
+                    self.logger.info(f"Added '{agency}' to existing file '{source_file_name}'")
             
-            if progress_callback:
-                progress_callback(1.0, "Complete!")
+            # 2. Create new file mappings
+            for agency, source_file_name, to_emails, cc_emails in updates.get('create_new', []):
+                new_row = pd.DataFrame([{
+                    ColumnNames.SOURCE_FILE_NAME: source_file_name,
+                    ColumnNames.AGENCY_ID: agency,
+                    ColumnNames.RECIPIENTS_TO: to_emails,
+                    ColumnNames.RECIPIENTS_CC: cc_emails
+                }])
+                df = pd.concat([df, new_row], ignore_index=True)
+                self.logger.info(f"Created new mapping: '{source_file_name}' for '{agency}'")
             
-            self.logger.info(f"Successfully generated {total_files} agency files")
+            # Update the sheet in the dictionary
+            all_sheets[tab_name] = df
+            
+            # Write back to Excel (all sheets)
+            with pd.ExcelWriter(mapping_file_path, engine='openpyxl') as writer:
+                for sheet_name, sheet_df in all_sheets.items():
+                    sheet_df.to_excel(writer, sheet_name=sheet_name, index=False)
+            
+            self.logger.info(f"Successfully updated mapping file: {mapping_file_path}")
             return True
             
         except Exception as e:
-            self.logger.error(f"File generation failed: {e}")
-            raise FileProcessingError(f"File generation failed: {e}")
+            self.logger.error(f"Failed to update mapping file: {e}")
+            return False
+
+
+# ============ MODULE: agency_matcher ============
+
+
+class AgencyMatcher:
+    """
+    Multi-pattern matcher that attributes text (e.g. an email subject) to an agency.
+    
+    An Aho-Corasick automaton is built once over the normalized agency names,
+    so a subject is attributed in a single pass regardless of how many agencies
+    there are. Names only match on word boundaries, and when several names
+    match the longest one wins, so "BBDO" does not steal "BBDO Toronto".
+    
+    Examples:
+        >>> matcher = AgencyMatcher(["BBDO", "BBDO Toronto", "DDB"])
+        >>> matcher.match("RE: Cognos Access Review Q2 2025 - BBDO_Toronto")
+        'BBDO Toronto'
+        >>> matcher.find_all("DDB and BBDO")
+        ['DDB', 'BBDO']
+        >>> matcher.match("Out of office") is None
+        True
+    """
+    
+    _NON_ALNUM = re.compile(r'[^0-9a-z]+')
+    
+    def __init__(self, agencies: List[str]):
+        """
+        Build the automaton.
+        
+        Args:
+            agencies: Agency names to match (original spelling is returned on match)
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+        self._names: List[str] = []
+        self._lengths: List[int] = []
+        
+        seen = set()
+        for agency in agencies:
+            pattern = self.normalize(agency)
+            if not pattern.strip() or pattern in seen:
+                continue
+            seen.add(pattern)
+            self._add_pattern(pattern, agency)
+        
+        self._build_failure_links()
+    
+    def __len__(self) -> int:
+        return len(self._names)
+    
+    @classmethod
+    def normalize(cls, text: str) -> str:
+        """
+        Normalize text for matching: casefold, collapse punctuation to single
+        spaces and pad with spaces so patterns match on word boundaries.
+        
+        Examples:
+            >>> AgencyMatcher.normalize("BBDO_Toronto (CA)")
+            ' bbdo toronto ca '
+        """
+        return f" {cls._NON_ALNUM.sub(' ', str(text).casefold()).strip()} "
+    
+    def _add_pattern(self, pattern: str, name: str) -> None:
+        """Insert one normalized pattern into the trie."""
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = next_state
+        self._out[state].append(len(self._names))
+        self._names.append(name)
+        self._lengths.append(len(pattern))
+    
+    def _build_failure_links(self) -> None:
+        """Compute failure links breadth-first and merge outputs along them."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._out[next_state] = self._out[next_state] + self._out[self._fail[next_state]]
+    
+    def _iter_matches(self, text: str):
+        """Yield (start, end, pattern index) for every match in normalized text."""
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for index in self._out[state]:
+                yield position + 1 - self._lengths[index], position + 1, index
+    
+    def find_all(self, text: str) -> List[str]:
+        """
+        Find all agencies mentioned in text, leftmost-longest and non-overlapping.
+        
+        Args:
+            text: Text to search
+            
+        Returns:
+            Agency names in the order they appear
+        """
+        if not self._names:
+            return []
+        
+        matches = sorted(self._iter_matches(self.normalize(text)), key=lambda m: (m[0], -(m[1] - m[0])))
+        found = []
+        last_end = 0
+        for start, end, index in matches:
+            # Patterns share their boundary spaces, so allow a one-character overlap
+            if start >= last_end - 1:
+                found.append(self._names[index])
+                last_end = end
+        return found
+    
+    def match(self, text: str) -> Optional[str]:
+        """
+        Find the single best agency for text (longest match, then leftmost).
+        
+        Args:
+            text: Text to search
+            
+        Returns:
+            Agency name or None if no agency is mentioned
+        """
+        best = None
+        for start, end, index in self._iter_matches(self.normalize(text)):
+            if best is None or (end - start, -start) > (best[1] - best[0], -best[0]):
+                best = (start, end, index)
+        return self._names[best[2]] if best else None
+
+
+# ============ MODULE: email_handler ============
+
+
+import win32com.client as win32
+
+
+class SendRateLimiter:
+    """
+    Token-bucket dispatcher that keeps Outlook submissions under Exchange throttles.
+    
+    Two buckets are maintained: one for messages and one for recipients (To + CC).
+    Each refills continuously at its per-minute rate and holds at most ``burst``
+    messages' worth of tokens, so short runs go out immediately while long runs
+    settle to the configured rate. COM errors raised while sending are retried
+    with exponential backoff before being surfaced as EmailError.
+    
+    Examples:
+        >>> limiter = SendRateLimiter(messages_per_minute=30, recipients_per_minute=300)
+        >>> limiter.dispatch(mail.Send, recipient_count=3, description="Agency1")
+        >>> limiter.projected_completion([3, 2, 5])
+        datetime.datetime(2025, 6, 1, 9, 0, 4)
+    """
+    
+    def __init__(
+        self,
+        messages_per_minute: int = 30,
+        recipients_per_minute: int = 300,
+        burst: int = 5,
+        backoff_seconds: float = 15.0,
+        max_retries: int = 3
+    ):
+        """
+        Initialize rate limiter.
+        
+        Args:
+            messages_per_minute: Sustained message submission rate
+            recipients_per_minute: Sustained recipient (To + CC) submission rate
+            burst: Number of messages that may be sent back-to-back before throttling
+            backoff_seconds: Initial delay before retrying after a COM error
+            max_retries: Number of retries after a COM error before giving up
+        """
+        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self.message_rate = messages_per_minute / 60.0
+        self.recipient_rate = recipients_per_minute / 60.0
+        self.message_capacity = float(max(burst, 1))
+        self.recipient_capacity = float(max(burst * recipients_per_minute / messages_per_minute, 1))
+        self.backoff_seconds = backoff_seconds
+        self.max_retries = max_retries
+        
+        self._message_tokens = self.message_capacity
+        self._recipient_tokens = self.recipient_capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def from_config(cls, config_manager: ConfigManager) -> 'SendRateLimiter':
+        """
+        Build a rate limiter from the send_* configuration values.
+        
+        Args:
+            config_manager: Configuration manager instance
+            
+        Returns:
+            Configured SendRateLimiter
+        """
+        defaults = ConfigManager.DEFAULT_CONFIG
+        return cls(
+            messages_per_minute=config_manager.get("send_messages_per_minute", defaults["send_messages_per_minute"]),
+            recipients_per_minute=config_manager.get("send_recipients_per_minute", defaults["send_recipients_per_minute"]),
+            burst=config_manager.get("send_burst", defaults["send_burst"]),
+            backoff_seconds=config_manager.get("send_backoff_seconds", defaults["send_backoff_seconds"]),
+            max_retries=config_manager.get("send_max_retries", defaults["send_max_retries"])
+        )
+    
+    @staticmethod
+    def count_recipients(to: str, cc: str = "") -> int:
+        """
+        Count the recipients an email will be submitted to.
+        
+        Args:
+            to: Semicolon-separated To addresses
+            cc: Semicolon-separated CC addresses
+            
+        Returns:
+            Number of addresses (at least 1)
+        """
+        return max(len(format_email_list(to)) + len(format_email_list(cc)), 1)
+    
+    def _refill(self, now: float) -> None:
+        """Top up both buckets for the time elapsed since the last update."""
+        elapsed = now - self._updated
+        self._message_tokens = min(self.message_capacity, self._message_tokens + elapsed * self.message_rate)
+        self._recipient_tokens = min(self.recipient_capacity, self._recipient_tokens + elapsed * self.recipient_rate)
+        self._updated = now
+    
+    def _wait_for(self, message_tokens: float, recipient_tokens: float, recipient_count: int) -> float:
+        """
+        Seconds until a message with recipient_count recipients may be sent.
+        
+        A message addressed to more recipients than the bucket holds is allowed
+        once the bucket is full; the deficit is then paid back by later sends.
+        """
+        recipient_need = min(float(recipient_count), self.recipient_capacity)
+        message_wait = max(0.0, (1.0 - message_tokens) / self.message_rate)
+        recipient_wait = max(0.0, (recipient_need - recipient_tokens) / self.recipient_rate)
+        return max(message_wait, recipient_wait)
+    
+    def acquire(self, recipient_count: int = 1) -> float:
+        """
+        Block until the budget allows one more message, then consume it.
+        
+        Args:
+            recipient_count: Number of recipients on the message
+            
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                wait = self._wait_for(self._message_tokens, self._recipient_tokens, recipient_count)
+                if wait <= 0:
+                    self._message_tokens -= 1.0
+                    self._recipient_tokens -= recipient_count
+                    return waited
+            time.sleep(wait)
+            waited += wait
+    
+    def estimate_duration(self, recipient_counts: List[int]) -> float:
+        """
+        Estimate how long sending the given messages will take from now.
+        
+        Args:
+            recipient_counts: Recipient count for each pending message, in send order
+            
+        Returns:
+            Estimated seconds until the last message is submitted
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            message_tokens = self._message_tokens
+            recipient_tokens = self._recipient_tokens
+        
+        elapsed = 0.0
+        for count in recipient_counts:
+            wait = self._wait_for(message_tokens, recipient_tokens, count)
+            elapsed += wait
+            message_tokens = min(self.message_capacity, message_tokens + wait * self.message_rate) - 1.0
+            recipient_tokens = min(self.recipient_capacity, recipient_tokens + wait * self.recipient_rate) - count
+        return elapsed
+    
+    def projected_completion(self, recipient_counts: List[int]) -> datetime:
+        """
+        Projected wall-clock time at which the given messages will all be submitted.
+        
+        Args:
+            recipient_counts: Recipient count for each pending message, in send order
+            
+        Returns:
+            Projected completion time
+        """
+        return datetime.now() + timedelta(seconds=self.estimate_duration(recipient_counts))
+    
+    def dispatch(self, send: Callable[[], None], recipient_count: int = 1, description: str = "") -> None:
+        """
+        Send one message within the rate budget, backing off on COM errors.
+        
+        Args:
+            send: Callable that submits the message (typically ``mail.Send``)
+            recipient_count: Number of recipients on the message
+            description: Label used in log messages
+            
+        Raises:
+            EmailError: If the message still fails after max_retries retries
+        """
+        self.acquire(recipient_count)
+        
+        attempt = 0
+        while True:
+            try:
+                send()
+                return
+            except pythoncom.com_error as e:
+                if attempt >= self.max_retries:
+                    raise EmailError(f"Send failed for {description or 'email'} after {attempt + 1} attempts: {e}")
+                delay = self.backoff_seconds * (2 ** attempt)
+                attempt += 1
+                self.logger.warning(
+                    f"COM error sending {description or 'email'} ({e}); "
+                    f"retry {attempt}/{self.max_retries} in {delay:.0f}s"
+                )
+                time.sleep(delay)
+                # The retry counts against the budget like any other submission
+                self.acquire(recipient_count)
+
+
+# Reply-to-thread reminder bodies; {agency} and {deadline} are substituted per agency
+FOLLOWUP_TEMPLATES = {
+    "gentle": """Hi Team,
+
+Just a gentle reminder about the Cognos Access Review for {agency}.
+
+Could you please review and respond at your earliest convenience?
+
+Deadline: {deadline}
+
+Thanks!
+""",
+    "urgent": """Hi Team,
+
+**URGENT REMINDER**
+
+We still need your response for the Cognos Access Review ({agency}).
+
+This is required for SOX compliance. Please prioritize and respond by {deadline}.
+
+If you're facing any issues, please contact us immediately.
+
+Thank you!
+"""
+}
+
+
+class SentMessageIndex:
+    """
+    Persisted index of sent review emails: subject / tracking token -> EntryID.
     
-    def _generate_single_file(
-        self,
-        df_master: pd.DataFrame,
-        agency_col: str,
-        file_name: str,
-        agencies: List[str],
-        output_dir: Path,
-        assigned_indices: Set[int]
-    ) -> None:
+    Entries are added when a send run is filed (EmailHandler.file_sent_emails)
+    and by incremental Sent Items refreshes, so follow-ups can open the
+    original message with a single GetItemFromID call.
+    
+    Examples:
+        >>> index = SentMessageIndex(Path("sent_index.json"))
+        >>> index.record("Review Q3 2025 - BBDO [CAR-Q3-450B5F6D]", "00000000ABC...", datetime.now())
+        >>> index.lookup(token="CAR-Q3-450B5F6D")
+        '00000000ABC...'
+    """
+    
+    def __init__(self, index_path: Path):
         """
-        Generate a single multi-tab Excel file for a group of agencies.
+        Initialize sent-message index.
         
         Args:
-            df_master: Master DataFrame
-            agency_col: Name of agency column
-            file_name: Output file name (without .xlsx)
-            agencies: List of agency IDs to include
-            output_dir: Output directory
-            assigned_indices: Set to track assigned row indices
+            index_path: JSON file the index is persisted to
         """
-        # Match agencies (case-insensitive)
-        # Create pattern with case-insensitive flag at the start - escape special regex characters
-        agency_alternatives = "|".join([f"^{re.escape(ag.strip())}$" for ag in agencies])
-        agency_pattern = f"(?i)({agency_alternatives})"
-        matched = df_master[df_master[agency_col].astype(str).str.match(agency_pattern, na=False)]
+        self.index_path = Path(index_path)
+        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self._messages: Optional[Dict[str, dict]] = None
+        self._tokens: Dict[str, str] = {}
+        self.watermark: Optional[datetime] = None
+    
+    def _ensure_loaded(self) -> None:
+        """Load the index from disk on first use."""
+        if self._messages is not None:
+            return
         
-        if matched.empty:
-            # Enhanced diagnostic: show what we searched for and suggest similar matches
-            searched_agencies = ", ".join([f"'{ag.strip()}'" for ag in agencies[:3]])
-            if len(agencies) > 3:
-                searched_agencies += f" and {len(agencies)-3} more"
-            
-            # Find similar agency names in master file for troubleshooting
-            all_master_agencies = df_master[agency_col].dropna().unique()
-            similar = []
-            for search_ag in agencies:
-                search_lower = search_ag.strip().lower()
-                for master_ag in all_master_agencies:
-                    master_lower = str(master_ag).lower()
-                    # Check if any words match or if one contains the other
-                    if (search_lower in master_lower or master_lower in search_lower or 
-                        any(word in master_lower for word in search_lower.split() if len(word) > 3)):
-                        similar.append(f"'{master_ag}'")
-            
-            if similar:
-                similar_str = ", ".join(similar[:5])
-                if len(similar) > 5:
-                    similar_str += f" and {len(similar)-5} more"
-                self.logger.warning(
-                    f"No users found for {file_name} | Searched: {searched_agencies} | "
-                    f"Similar names in master file: {similar_str}"
-                )
-            else:
-                self.logger.warning(
-                    f"No users found for {file_name} | Searched: {searched_agencies} | "
-                    f"No similar agency names found in master file"
-                )
+        self._messages = {}
+        if not self.index_path.exists():
             return
         
-        # Track assigned indices
-        assigned_indices.update(matched.index)
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self._messages = data.get("messages", {})
+            self._tokens = data.get("tokens", {})
+            if data.get("watermark"):
+                self.watermark = datetime.strptime(data["watermark"], "%Y-%m-%d %H:%M:%S")
+        except Exception as e:
+            self.logger.warning(f"Could not read sent-message index, starting fresh: {e}")
+            self._messages, self._tokens, self.watermark = {}, {}, None
+    
+    def save(self) -> None:
+        """Persist the index to disk."""
+        self._ensure_loaded()
+        try:
+            with open(self.index_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    "watermark": self.watermark.strftime("%Y-%m-%d %H:%M:%S") if self.watermark else None,
+                    "messages": self._messages,
+                    "tokens": self._tokens
+                }, f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            self.logger.warning(f"Could not save sent-message index: {e}")
+    
+    def record(self, subject: str, entry_id: str, sent_on: datetime) -> None:
+        """
+        Add or update the entry for a sent message (newest send wins).
         
-        # Create output file path - sanitize filename and remove .xlsx if already present
-        safe_file_name = sanitize_filename(file_name)
-        if safe_file_name.lower().endswith('.xlsx'):
-            output_file = output_dir / safe_file_name
-        else:
-            output_file = output_dir / f"{safe_file_name}.xlsx"
+        Args:
+            subject: Message subject
+            entry_id: Outlook EntryID of the message in Sent Items
+            sent_on: Time the message was sent
+        """
+        self._ensure_loaded()
+        existing = self._messages.get(subject)
+        sent_on_str = sent_on.strftime("%Y-%m-%d %H:%M:%S")
+        if existing and existing["sent_on"] > sent_on_str:
+            return
         
-        # Prepare data with review columns
-        df_output = matched.copy()
-        df_output[ColumnNames.REVIEW_ACTION] = ""
-        df_output[ColumnNames.COMMENTS] = ""
+        token = extract_tracking_token(subject)
+        self._messages[subject] = {"entry_id": entry_id, "sent_on": sent_on_str, "token": token}
+        if token:
+            self._tokens[token] = subject
+    
+    def alias(self, token: str, subject: str) -> None:
+        """
+        Point an extra tracking token at a message subject.
         
-        # Create Excel writer
-        with pd.ExcelWriter(output_file, engine="xlsxwriter") as writer:
-            # Tab 1: All Users (or User Access List for Access Certification format)
-            primary_sheet = SheetNames.USER_ACCESS_LIST if hasattr(SheetNames, 'USER_ACCESS_LIST') else SheetNames.ALL_USERS
-            df_output.to_excel(writer, sheet_name=primary_sheet, index=False)
-            self.format_worksheet(writer, primary_sheet, df_output)
-            
-            # Tab 2: User Access Summary (Pivot) - NEW FEATURE
-            self._create_pivot_summary_sheet(
-                writer,
-                df_output,
-                SheetNames.USER_ACCESS_SUMMARY,
-                agencies
-            )
-            
-            # Tab 3-N: Individual agencies (alphabetically sorted)
-            for agency in sorted(agencies, key=str.upper):
-                # Match this specific agency (case-insensitive)
-                agency_match = df_output[
-                    df_output[agency_col].astype(str).str.upper() == agency.upper()
-                ]
-                
-                if not agency_match.empty:
-                    # Sanitize sheet name
-                    sheet_name = sanitize_sheet_name(agency)
-                    
-                    # Write to sheet
-                    agency_match.to_excel(writer, sheet_name=sheet_name, index=False)
-                    self.format_worksheet(writer, sheet_name, agency_match)
+        Used for digest emails, so a member file's own token finds the digest.
         
-        self.logger.info(f"Created {output_file} with {len(agencies)} agency tabs")
+        Args:
+            token: Tracking token of a file included in the message
+            subject: Subject of the message that carried the file
+        """
+        self._ensure_loaded()
+        self._tokens[token.upper()] = subject
     
-    def _create_pivot_summary_sheet(
-        self,
-        writer: pd.ExcelWriter,
-        df: pd.DataFrame,
-        sheet_name: str,
-        agencies: List[str] = None
-    ) -> None:
+    def lookup(self, subject: Optional[str] = None, token: Optional[str] = None) -> Optional[str]:
         """
-        Create User Access Summary pivot sheet showing UserName → Folder → SubFolder hierarchy.
+        Find the EntryID of a sent message by tracking token or exact subject.
         
         Args:
-            writer: Excel writer object
-            df: DataFrame with user access data
-            sheet_name: Name for the sheet
-            agencies: Optional list of agencies for filtering
-        """
-        try:
-            # Check if required columns exist
-            user_col = None
-            folder_col = None
-            subfolder_col = None
-            
-            # Find user name column (flexible matching)
-            for col in [ColumnNames.USERNAME, ColumnNames.USER_NAME, "UserName", "User Name"]:
-                if col in df.columns:
-                    user_col = col
-                    break
-            
-            # Find folder columns
-            if ColumnNames.FOLDER in df.columns:
-                folder_col = ColumnNames.FOLDER
-            if ColumnNames.SUBFOLDER in df.columns:
-                subfolder_col = ColumnNames.SUBFOLDER
-            
-            # If columns don't exist, log warning and skip
-            if not user_col:
-                self.logger.warning(f"Cannot create pivot summary: UserName column not found in data")
-                return
-            
-            if not folder_col or not subfolder_col:
-                self.logger.warning(f"Cannot create pivot summary: Folder/SubFolder columns not found")
-                return
-            
-            # Create a copy for processing
-            df_pivot = df.copy()
-            
-            # Remove review columns if present
-            cols_to_drop = [ColumnNames.REVIEW_ACTION, ColumnNames.REVIEW_COMMENTS, ColumnNames.COMMENTS]
-            df_pivot = df_pivot.drop(columns=[col for col in cols_to_drop if col in df_pivot.columns])
-            
-            # Create pivot table: UserName as rows, Folder+SubFolder as columns
-            # Use aggfunc='size' to count occurrences, or 'first' to show values
-            pivot_table = pd.pivot_table(
-                df_pivot,
-                index=user_col,
-                columns=[folder_col, subfolder_col],
-                aggfunc='size',
-                fill_value=0
-            )
-            
-            # Reset index FIRST to make UserName a regular column
-            pivot_display = pivot_table.reset_index()
-            
-            # NOW flatten MultiIndex columns (after reset_index)
-            if isinstance(pivot_display.columns, pd.MultiIndex):
-                # Flatten the column names
-                pivot_display.columns = [
-                    col[0] if col[1] == '' else f"{col[0]} - {col[1]}" 
-                    if isinstance(col, tuple) else str(col)
-                    for col in pivot_display.columns
-                ]
-            
-            # Replace counts with 'X' for presence indicator (use apply instead of deprecated applymap)
-            for col in pivot_display.columns:
-                if col != user_col:  # Don't modify the username column
-                    pivot_display[col] = pivot_display[col].apply(lambda x: 'X' if x > 0 else '')
+            subject: Exact subject of the original message
+            token: Tracking token of the original message (checked first)
             
-            # Write to Excel, handle MultiIndex columns
-            try:
-                if isinstance(pivot_display.columns, pd.MultiIndex):
-                    pivot_display.to_excel(writer, sheet_name=sheet_name, index=True)
-                else:
-                    pivot_display.to_excel(writer, sheet_name=sheet_name, index=False)
-            except Exception as e:
-                self.logger.error(f"Failed to create pivot summary: {e}")
-            
-            # Format the worksheet
-            workbook = writer.book
-            worksheet = writer.sheets[sheet_name]
-            
-            # Format header row
-            header_format = workbook.add_format({
-                'bold': True,
-                'bg_color': '#4472C4',
-                'font_color': 'white',
-                'border': 1,
-                'align': 'center',
-                'valign': 'vcenter',
-                'text_wrap': True
-            })
-            
-            # Apply header format
-            for col_num, value in enumerate(pivot_display.columns.values):
-                worksheet.write(0, col_num, str(value), header_format)
-            
-            # Auto-fit columns
-            for i, col in enumerate(pivot_display.columns):
-                max_len = max(
-                    pivot_display[col].astype(str).apply(len).max(),
-                    len(str(col))
-                )
-                worksheet.set_column(i, i, min(max_len + 2, 50))
-            
-            # Freeze first row and first column
-            worksheet.freeze_panes(1, 1)
-            
-            # Add autofilter
-            worksheet.autofilter(0, 0, len(pivot_display), len(pivot_display.columns) - 1)
-            
-            self.logger.info(f"Created pivot summary sheet '{sheet_name}' with {len(pivot_display)} users")
-            
-        except Exception as e:
-            self.logger.error(f"Failed to create pivot summary: {e}")
-            # Don't raise - this is an enhancement feature, continue without it
+        Returns:
+            EntryID or None if the message is not indexed
+        """
+        self._ensure_loaded()
+        if token and token.upper() in self._tokens:
+            subject = self._tokens[token.upper()]
+        entry = self._messages.get(subject) if subject else None
+        return entry["entry_id"] if entry else None
+    
+    def forget(self, entry_id: str) -> None:
+        """Remove an entry whose EntryID no longer resolves (e.g. message moved)."""
+        self._ensure_loaded()
+        for subject, entry in list(self._messages.items()):
+            if entry["entry_id"] == entry_id:
+                del self._messages[subject]
+                if entry.get("token"):
+                    self._tokens.pop(entry["token"], None)
+
+
+class LazyEmailBatch:
+    """
+    Sequence of preview emails whose bodies are rendered on demand.
     
-    def _create_unassigned_file(
+    The batch holds cheap message specs (recipients, subject, attachment path).
+    Indexing renders the body and workbook context for that message only;
+    rendered emails are kept in a small LRU cache and the next few can be
+    prefetched on a background thread, so the first preview appears at once
+    regardless of batch size.
+    
+    Examples:
+        >>> batch = handler.prepare_email_batch(combined, output_dir, file_names)
+        >>> len(batch)
+        600
+        >>> batch[0]['body'][:20]   # rendered now, others untouched
+        'Hi Team, please rev'
+        >>> batch.prefetch(1)       # render 1..3 in the background
+    """
+    
+    def __init__(
         self,
-        df_unassigned: pd.DataFrame,
-        output_dir: Path
-    ) -> None:
+        specs: List[dict],
+        render: Callable[[dict], dict],
+        cache_size: int = 16,
+        prefetch_count: int = 3
+    ):
+        """
+        Initialize lazy batch.
+        
+        Args:
+            specs: Message specs (to, cc, subject, attachment_path, file_name)
+            render: Callable turning a spec into a full email dict (adds 'body')
+            cache_size: Number of rendered emails to keep
+            prefetch_count: Number of following emails prefetch() renders
+        """
+        self.specs = specs
+        self._render = render
+        self.cache_size = cache_size
+        self.prefetch_count = prefetch_count
+        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self._cache: "OrderedDict[int, dict]" = OrderedDict()
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+    
+    def __len__(self) -> int:
+        return len(self.specs)
+    
+    def __iter__(self):
+        for index in range(len(self.specs)):
+            yield self[index]
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self.specs)))]
+        if index < 0:
+            index += len(self.specs)
+        if not 0 <= index < len(self.specs):
+            raise IndexError("email batch index out of range")
+        
+        with self._lock:
+            if index in self._cache:
+                self._cache.move_to_end(index)
+                return self._cache[index]
+            future = self._pending.get(index)
+        
+        email = future.result() if future is not None else self._render_and_cache(index)
+        return email
+    
+    def spec(self, index: int) -> dict:
+        """Get the unrendered spec for a message (no template or workbook work)."""
+        return self.specs[index]
+    
+    def subset(self, indices: List[int]) -> 'LazyEmailBatch':
         """
-        Create single Unassigned.xlsx file for all unmapped users.
+        Create a lazy batch over some of this batch's messages.
+        
+        Already-rendered messages are carried over so they are not rendered twice.
         
         Args:
-            df_unassigned: DataFrame with unmapped users
-            output_dir: Output directory
+            indices: Indices into this batch, in the order wanted
+            
+        Returns:
+            New LazyEmailBatch sharing this batch's renderer
         """
-        output_file = output_dir / FileNames.UNASSIGNED_FILE
+        batch = LazyEmailBatch(
+            [self.specs[i] for i in indices], self._render,
+            cache_size=self.cache_size, prefetch_count=self.prefetch_count
+        )
+        with self._lock:
+            for new_index, old_index in enumerate(indices):
+                if old_index in self._cache:
+                    batch._cache[new_index] = self._cache[old_index]
+        return batch
+    
+    def _render_and_cache(self, index: int) -> dict:
+        """Render one email and store it in the LRU cache.
         
-        # Add review columns
-        df_output = df_unassigned.copy()
-        df_output[ColumnNames.REVIEW_ACTION] = ""
-        df_output[ColumnNames.COMMENTS] = ""
+        A message that fails to render is cached with 'render_error' set
+        (and the error as its preview body); send paths refuse to send it.
+        """
+        try:
+            email = self._render(self.specs[index])
+        except Exception as e:
+            self.logger.warning(f"Could not render email for {self.specs[index].get('file_name')}: {e}")
+            error = f"Email could not be rendered: {e}"
+            email = {**self.specs[index], 'body': f"[{error}]", 'render_error': error}
+        
+        with self._lock:
+            self._cache[index] = email
+            self._cache.move_to_end(index)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+            self._pending.pop(index, None)
+        return email
+    
+    def prefetch(self, start: int) -> None:
+        """
+        Render the emails following start in the background.
         
-        # Write to Excel
-        with pd.ExcelWriter(output_file, engine="xlsxwriter") as writer:
-            df_output.to_excel(writer, sheet_name=SheetNames.ALL_USERS, index=False)
-            self.format_worksheet(writer, SheetNames.ALL_USERS, df_output)
+        Args:
+            start: First index to prefetch
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="email-prefetch")
+            for index in range(start, min(start + self.prefetch_count, len(self.specs))):
+                if index not in self._cache and index not in self._pending:
+                    self._pending[index] = self._executor.submit(self._render_and_cache, index)
+    
+    def close(self) -> None:
+        """Stop the prefetch worker."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+
+class AttachmentGuard:
+    """
+    Pre-flight sizing of outgoing attachments against the mailbox limit.
+    
+    Outlook accepts an oversized attachment and the message bounces later, so
+    each message's attachments are sized before it is created. When they are
+    over the limit the workbooks are deflate-zipped; a workbook that is still
+    too large is split into parts by agency tab, and the parts are spread over
+    as many messages as needed. The universal attachment is compressed once
+    and the same file is reused for every message.
+    
+    Examples:
+        >>> guard = AttachmentGuard(limit_bytes=20 * 1024 * 1024)
+        >>> guard.fit([Path("output/BBDO.xlsx")], universal=Path("Instructions.pdf"))
+        [[WindowsPath('output/BBDO.xlsx'), WindowsPath('.../Instructions.zip')]]
+    """
+    
+    # Keep headroom for MIME encoding overhead of the attachments
+    SIZE_MARGIN = 0.9
+    
+    def __init__(self, limit_bytes: Optional[int]):
+        """
+        Initialize attachment guard.
         
-        self.logger.info(f"Created {output_file} with {len(df_unassigned)} unmapped users")
+        Args:
+            limit_bytes: Maximum attachment bytes per message (None or 0 for no limit)
+        """
+        self.limit_bytes = limit_bytes or None
+        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self._work_dir: Optional[tempfile.TemporaryDirectory] = None
+        self._universal: Dict[Tuple[str, float], Path] = {}
     
-    def _create_individual_unmapped_files(
-        self,
-        df_unassigned: pd.DataFrame,
-        agency_col: str,
-        output_dir: Path
-    ) -> None:
+    @classmethod
+    def from_config(cls, config_manager: 'ConfigManager') -> 'AttachmentGuard':
+        """Create a guard using the attachment_limit_mb setting."""
+        limit_mb = config_manager.get("attachment_limit_mb", ConfigManager.DEFAULT_CONFIG["attachment_limit_mb"])
+        return cls(int(float(limit_mb) * 1024 * 1024) if limit_mb else None)
+    
+    @property
+    def work_dir(self) -> Path:
+        """Temporary directory for compressed and split attachments."""
+        if self._work_dir is None:
+            self._work_dir = tempfile.TemporaryDirectory(prefix="car_attach_")
+        return Path(self._work_dir.name)
+    
+    def cleanup(self) -> None:
+        """Remove generated attachments (Outlook has already copied them)."""
+        if self._work_dir is not None:
+            self._work_dir.cleanup()
+            self._work_dir = None
+        self._universal.clear()
+    
+    @staticmethod
+    def _size(paths: List[Path]) -> int:
+        return sum(Path(p).stat().st_size for p in paths if p and Path(p).exists())
+    
+    def compress(self, paths: List[Path], name: str) -> Path:
         """
-        Create individual files for each unmapped agency.
+        Deflate-zip files into the work directory.
         
         Args:
-            df_unassigned: DataFrame with unmapped users
-            agency_col: Name of agency column
-            output_dir: Output directory
+            paths: Files to include
+            name: Archive file name (without .zip)
+        
+        Returns:
+            Path to the archive
         """
-        # Get unique agencies from unmapped users
-        unique_agencies = df_unassigned[agency_col].fillna("Unassigned").unique()
+        zip_path = self.work_dir / f"{sanitize_filename(name)}.zip"
+        return EmailHandler.zip_attachments(paths, zip_path)
+    
+    def universal(self, path: Path) -> Path:
+        """
+        Get the file to attach for the universal attachment.
         
-        for agency in unique_agencies:
-            agency_str = str(agency).strip()
-            if not agency_str:
-                agency_str = "Unassigned"
-            
-            # Filter for this agency
-            df_agency = df_unassigned[
-                df_unassigned[agency_col].fillna("Unassigned") == agency
-            ].copy()
-            
-            # Add review columns
-            df_agency[ColumnNames.REVIEW_ACTION] = ""
-            df_agency[ColumnNames.COMMENTS] = ""
-            
-            # Sanitize file name
-            safe_name = sanitize_sheet_name(agency_str)
-            output_file = output_dir / f"{safe_name}.xlsx"
-            
-            # Write to Excel
-            with pd.ExcelWriter(output_file, engine="xlsxwriter") as writer:
-                df_agency.to_excel(writer, sheet_name=SheetNames.ALL_USERS, index=False)
-                self.format_worksheet(writer, SheetNames.ALL_USERS, df_agency)
-            
-            self.logger.info(f"Created individual file for unmapped agency: {safe_name}")
+        The attachment is compressed on first use and the result is cached, so
+        a batch reads and deflates it once. The original is used when zipping
+        does not make it meaningfully smaller.
+        
+        Args:
+            path: Universal attachment path
+        
+        Returns:
+            Path of the file to attach
+        """
+        path = Path(path)
+        key = (str(path), path.stat().st_mtime)
+        if key not in self._universal:
+            zipped = self.compress([path], path.stem)
+            if zipped.stat().st_size < path.stat().st_size * self.SIZE_MARGIN:
+                self.logger.info(f"Compressed universal attachment {path.name}: {path.stat().st_size:,} -> {zipped.stat().st_size:,} bytes")
+                self._universal[key] = zipped
+            else:
+                self._universal[key] = path
+        return self._universal[key]
     
-    def update_combined_mapping_file(
-        self,
-        mapping_file_path: Path,
-        updates: dict,
-        tab_name: str
-    ) -> bool:
+    def split_workbook(self, path: Path, max_bytes: int) -> List[Path]:
         """
-        Update the combined mapping file with new agency assignments.
-        Creates a backup before modifying.
+        Split an agency workbook into parts by agency tab.
+        
+        Each part keeps the file's layout: a User Access List with the rows of
+        its agencies followed by one tab per agency. Part sizes are estimated
+        from the source file's bytes per row.
         
         Args:
-            mapping_file_path: Path to the combined mapping Excel file
-            updates: Dictionary of updates to apply
-                    Format: {
-                        'add_to_existing': [(agency, source_file_name), ...],
-                        'create_new': [(agency, source_file_name, to_emails, cc_emails), ...]
-                    }
-            tab_name: Name of the regional tab to update
-            
+            path: Agency workbook to split
+            max_bytes: Target maximum size of each part
+        
         Returns:
-            True if successful, False otherwise
+            Paths of the part workbooks (the original path if it cannot be split)
         """
         try:
-            # Create backup first (use pattern from AuditLogger)
-            backup_dir = mapping_file_path.parent / "backups"
-            backup_dir.mkdir(exist_ok=True)
-            
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_file = backup_dir / f"{mapping_file_path.stem}_backup_{timestamp}{mapping_file_path.suffix}"
-            
-            import shutil
-            shutil.copy2(mapping_file_path, backup_file)
-            self.logger.info(f"Created backup: {backup_file}")
-            
-            # Load the entire workbook
-            xl_file = pd.ExcelFile(mapping_file_path)
-            all_sheets = {sheet: pd.read_excel(xl_file, sheet_name=sheet) for sheet in xl_file.sheet_names}
-            
-            # Get the target sheet
-            if tab_name not in all_sheets:
-                self.logger.error(f"Tab '{tab_name}' not found in mapping file")
-                return False
-            
-            df = all_sheets[tab_name].copy()
-            
-            # Process updates
-            # 1. Add to existing files
-            for agency, source_file_name in updates.get('add_to_existing', []):
-                # Find the row with matching source_file_name
-                mask = df[ColumnNames.SOURCE_FILE_NAME] == source_file_name
-                if mask.any():
-                    # Append agency to the agency_id column (comma-separated)
-                    idx = df[mask].index[0]
-                    current_agencies = str(df.loc[idx, ColumnNames.AGENCY_ID])
-                    if pd.isna(current_agencies) or current_agencies.strip() == '':
-                        df.loc[idx, ColumnNames.AGENCY_ID] = agency
-                    else:
-                        df.loc[idx, ColumnNames.AGENCY_ID] = f"{current_agencies}, {agency}"
-                    
-                    self.logger.info(f"Added '{agency}' to existing file '{source_file_name}'")
-            
-            # 2. Create new file mappings
-            for agency, source_file_name, to_emails, cc_emails in updates.get('create_new', []):
-                new_row = pd.DataFrame([{
-                    ColumnNames.SOURCE_FILE_NAME: source_file_name,
-                    ColumnNames.AGENCY_ID: agency,
-                    ColumnNames.RECIPIENTS_TO: to_emails,
-                    ColumnNames.RECIPIENTS_CC: cc_emails
-                }])
-                df = pd.concat([df, new_row], ignore_index=True)
-                self.logger.info(f"Created new mapping: '{source_file_name}' for '{agency}'")
-            
-            # Update the sheet in the dictionary
-            all_sheets[tab_name] = df
-            
-            # Write back to Excel (all sheets)
-            with pd.ExcelWriter(mapping_file_path, engine='openpyxl') as writer:
-                for sheet_name, sheet_df in all_sheets.items():
-                    sheet_df.to_excel(writer, sheet_name=sheet_name, index=False)
-            
-            self.logger.info(f"Successfully updated mapping file: {mapping_file_path}")
-            return True
-            
+            with pd.ExcelFile(path) as xl_file:
+                tabs = [s for s in xl_file.sheet_names if s not in [SheetNames.USER_ACCESS_LIST, SheetNames.ALL_USERS, SheetNames.USER_ACCESS_SUMMARY]]
+                frames = {tab: xl_file.parse(tab) for tab in tabs}
         except Exception as e:
-            self.logger.error(f"Failed to update mapping file: {e}")
-            return False
-
-
-# ============ MODULE: email_handler ============
-
-
-import win32com.client as win32
+            self.logger.warning(f"Could not read {path.name} for splitting: {e}")
+            return [path]
+        
+        if len(tabs) < 2:
+            self.logger.warning(f"{path.name} has a single agency tab and cannot be split further")
+            return [path]
+        
+        total_rows = sum(len(frame) for frame in frames.values()) or 1
+        bytes_per_row = path.stat().st_size / total_rows
+        budget = max_bytes * self.SIZE_MARGIN
+        
+        groups, group, group_size = [], [], 0.0
+        for tab in tabs:
+            tab_size = len(frames[tab]) * bytes_per_row
+            if group and group_size + tab_size > budget:
+                groups.append(group)
+                group, group_size = [], 0.0
+            group.append(tab)
+            group_size += tab_size
+        groups.append(group)
+        
+        parts = []
+        for number, group in enumerate(groups, start=1):
+            part_path = self.work_dir / f"{path.stem} (part {number} of {len(groups)}).xlsx"
+            user_list = pd.concat([frames[tab] for tab in group], ignore_index=True)
+            with pd.ExcelWriter(part_path, engine="xlsxwriter") as writer:
+                user_list.to_excel(writer, sheet_name=SheetNames.USER_ACCESS_LIST, index=False)
+                format_worksheet(writer, SheetNames.USER_ACCESS_LIST, user_list)
+                for tab in group:
+                    frames[tab].to_excel(writer, sheet_name=tab, index=False)
+                    format_worksheet(writer, tab, frames[tab])
+            parts.append(part_path)
+        
+        self.logger.info(f"Split {path.name} ({path.stat().st_size:,} bytes) into {len(parts)} parts")
+        return parts
+    
+    def fit(self, attachments: List[Path], universal: Optional[Path] = None) -> List[List[Path]]:
+        """
+        Plan the attachments of one logical email so each message fits the limit.
+        
+        Args:
+            attachments: Workbooks (or other files) for the email
+            universal: Optional universal attachment added to every message
+        
+        Returns:
+            Attachment lists, one per message to send (a single list when the
+            attachments fit, possibly compressed)
+        """
+        attachments = [Path(p) for p in attachments if p]
+        fixed = [self.universal(universal)] if universal and Path(universal).exists() else []
+        if not self.limit_bytes:
+            return [attachments + fixed]
+        
+        limit = self.limit_bytes - self._size(fixed)
+        if self._size(attachments) <= limit:
+            return [attachments + fixed]
+        
+        # Compress the workbooks together first
+        zipped = self.compress(attachments, attachments[0].stem)
+        if zipped.stat().st_size <= limit:
+            self.logger.info(f"Compressed attachments for {attachments[0].stem} to fit the {self.limit_bytes:,} byte limit")
+            return [[zipped] + fixed]
+        
+        # Still too large: split oversized workbooks by agency tab, zipping each piece
+        pieces = []
+        for path in attachments:
+            split = self.split_workbook(path, limit) if path.suffix.lower() == ".xlsx" and path.stat().st_size > limit else [path]
+            for piece in split:
+                compressed = self.compress([piece], piece.stem)
+                pieces.append(compressed if compressed.stat().st_size < piece.stat().st_size else piece)
+        
+        messages, current, current_size = [], [], 0
+        for piece in pieces:
+            size = piece.stat().st_size
+            if size > limit:
+                self.logger.warning(f"{piece.name} is {size:,} bytes and still exceeds the attachment limit")
+            if current and current_size + size > limit:
+                messages.append(current + fixed)
+                current, current_size = [], 0
+            current.append(piece)
+            current_size += size
+        messages.append(current + fixed)
+        return messages
 
 
+@dataclass
+class SendBatchResult:
+    """
+    Outcome of EmailHandler.send_emails().
+    
+    Attributes:
+        sent: Files whose email was sent, scheduled, saved as draft or displayed
+        failed: File name -> reason its email was not
+    """
+    sent: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
 
 
 class EmailHandler:
@@ -3802,6 +7668,19 @@ class EmailHandler:
         self.config = config_manager
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         self._outlook = None
+        self.rate_limiter = SendRateLimiter.from_config(config_manager)
+        self.attachment_guard = AttachmentGuard.from_config(config_manager)
+        self.scan_state_path = Path(FileNames.SCAN_STATE)
+        self._scan_state: Optional[Dict[str, dict]] = None
+        # Watermarks of the last scan, committed once the caller has processed its results
+        self._pending_scan_state: Dict[str, dict] = {}
+        self.sent_index = SentMessageIndex(Path(FileNames.SENT_INDEX))
+        
+        # Namespace/folder handles are COM proxies bound to the thread that created them
+        self._namespace = None
+        self._folder_cache: Dict[str, object] = {}
+        self._cache_thread: Optional[int] = None
+        self._compliance_folders_ready: Set[str] = set()
         
         # Initialize COM
         try:
@@ -3856,15 +7735,114 @@ class EmailHandler:
             except Exception as e:
                 self._outlook = None
                 raise EmailError(f"Failed to connect to Outlook: {e}")
+            
+            # Handles from a previous connection are no longer valid
+            self.invalidate_folder_cache()
         
         return self._outlook
     
     def reset_outlook_connection(self):
         """Reset the Outlook connection (useful after errors)."""
         self._outlook = None
+        self.invalidate_folder_cache()
         self.logger.info("Outlook connection reset")
         return self._outlook
     
+    def invalidate_folder_cache(self) -> None:
+        """Drop cached namespace and folder handles (call after a COM failure)."""
+        self._namespace = None
+        self._folder_cache.clear()
+        self._compliance_folders_ready.clear()
+        self._cache_thread = None
+    
+    def _get_namespace(self):
+        """
+        Get the MAPI namespace, cached for the current thread.
+        
+        Returns:
+            Outlook Namespace object
+            
+        Raises:
+            EmailError: If Outlook connection fails
+        """
+        outlook = self._get_outlook()
+        
+        # COM proxies cannot be shared across threads; rebuild the cache on a new thread
+        if self._cache_thread != threading.get_ident():
+            self.invalidate_folder_cache()
+            self._cache_thread = threading.get_ident()
+        
+        if self._namespace is None:
+            self._namespace = outlook.GetNamespace("MAPI")
+        return self._namespace
+    
+    def _get_folder(self, path: str, create: bool = False):
+        """
+        Resolve an Outlook folder by path, using the folder-handle cache.
+        
+        The first path component is "Inbox", "Sent Items" or "Root" (mailbox
+        root); any other first component is treated as a subfolder of Inbox.
+        
+        Args:
+            path: Folder path, e.g. "Inbox/Compliance Q2 2025 - Sent"
+            create: If True, create missing folders along the path
+            
+        Returns:
+            Outlook Folder object
+            
+        Raises:
+            EmailError: If the folder does not exist (and create is False)
+        """
+        namespace = self._get_namespace()
+        if path in self._folder_cache:
+            return self._folder_cache[path]
+        
+        parts = [p for p in path.split("/") if p]
+        root_name = parts[0].lower() if parts else "inbox"
+        if root_name == "inbox":
+            resolved, parts = "Inbox", parts[1:]
+        elif root_name == "sent items":
+            resolved, parts = "Sent Items", parts[1:]
+        elif root_name == "root":
+            resolved, parts = "Root", parts[1:]
+        else:
+            resolved = "Inbox"
+        
+        folder = self._folder_cache.get(resolved)
+        if folder is None:
+            try:
+                if resolved == "Sent Items":
+                    folder = namespace.GetDefaultFolder(5)  # olFolderSentMail
+                elif resolved == "Root":
+                    folder = namespace.GetDefaultFolder(6).Parent  # Mailbox root
+                else:
+                    folder = namespace.GetDefaultFolder(6)  # olFolderInbox
+            except Exception as e:
+                self.invalidate_folder_cache()
+                raise EmailError(f"Failed to open folder '{resolved}': {e}")
+            self._folder_cache[resolved] = folder
+        
+        for name in parts:
+            resolved = f"{resolved}/{name}"
+            cached = self._folder_cache.get(resolved)
+            if cached is None:
+                try:
+                    cached = folder.Folders[name]
+                except Exception:
+                    if not create:
+                        raise EmailError(f"Folder '{resolved}' not found")
+                    try:
+                        cached = folder.Folders.Add(name)
+                        self.logger.info(f"Created folder: {resolved}")
+                    except Exception as e:
+                        self.invalidate_folder_cache()
+                        raise EmailError(f"Failed to create folder '{resolved}': {e}")
+                self._folder_cache[resolved] = cached
+            folder = cached
+        
+        self._folder_cache[path] = folder
+        return folder
+    
     def test_connection(self) -> Tuple[bool, str]:
         """
         Test Outlook connection and email functionality.
@@ -3946,7 +7924,8 @@ class EmailHandler:
         cc_addresses: str,
         subject: str,
         body: str,
-        attachment_path: Optional[Path] = None
+        attachment_path: Optional[Path] = None,
+        universal_attachment: Optional[Path] = None
     ) -> bool:
         """
         Send a single email immediately (used by preview navigation dialog).
@@ -3957,22 +7936,27 @@ class EmailHandler:
             subject: Email subject
             body: Email body
             attachment_path: Optional attachment file path
+            universal_attachment: Optional attachment included with every email
             
         Returns:
             True if successful, False otherwise
         """
         try:
-            attachments = [attachment_path] if attachment_path else []
-            
-            mail = self.create_email(
+            mails = self.create_guarded_emails(
                 to=to_addresses,
                 cc=cc_addresses,
                 subject=subject,
                 body=body,
-                attachments=attachments
+                attachments=[attachment_path] if attachment_path else [],
+                universal_attachment=universal_attachment
             )
             
-            mail.Send()
+            for mail in mails:
+                self.rate_limiter.dispatch(
+                    mail.Send,
+                    recipient_count=SendRateLimiter.count_recipients(to_addresses, cc_addresses),
+                    description=subject
+                )
             self.logger.info(f"Sent single email: {subject}")
             return True
             
@@ -3980,6 +7964,119 @@ class EmailHandler:
             self.logger.error(f"Failed to send single email: {e}")
             return False
     
+    def send_email_batch(
+        self,
+        emails: "List[dict] | LazyEmailBatch",
+        progress_callback: Optional[callable] = None,
+        result_callback: Optional[Callable[[dict, bool, str], None]] = None,
+        cancel_event: Optional[threading.Event] = None
+    ) -> Tuple[int, List[Tuple[dict, str]]]:
+        """
+        Send a batch of prepared emails through the rate limiter.
+        
+        A failed message is recorded and the batch carries on with the next one.
+        
+        Args:
+            emails: Email dicts as returned by prepare_email_batch()
+            progress_callback: Optional callback(progress, message) with progress 0-100
+            result_callback: Optional callback(email, ok, error) after each message
+            cancel_event: Optional event; when set, no further messages are sent
+            
+        Returns:
+            Tuple of (sent count, list of (email, error message) for failures)
+        """
+        sent_count = 0
+        failures = []
+        specs = emails.specs if isinstance(emails, LazyEmailBatch) else emails
+        pending = [SendRateLimiter.count_recipients(e.get('to', ''), e.get('cc', '')) for e in specs]
+        total = len(specs)
+        
+        for idx in range(total):
+            if cancel_event is not None and cancel_event.is_set():
+                self.logger.info(f"Batch send cancelled after {idx} of {total} emails")
+                break
+            
+            email = specs[idx]
+            if progress_callback:
+                eta = self.rate_limiter.projected_completion(pending[idx:])
+                progress_callback(
+                    (idx / total) * 100,
+                    f"Sending {idx + 1} of {total} (projected completion {eta:%H:%M:%S})..."
+                )
+            
+            try:
+                email = emails[idx]
+                if email.get('render_error'):
+                    raise EmailError(email['render_error'])
+                attachment = email.get('attachment_path')
+                mails = self.create_guarded_emails(
+                    to=email.get('to', ''),
+                    cc=email.get('cc', ''),
+                    subject=email.get('subject', ''),
+                    body=email.get('body', ''),
+                    attachments=[attachment] if attachment else [],
+                    universal_attachment=email.get('universal_attachment')
+                )
+                for mail in mails:
+                    self.rate_limiter.dispatch(mail.Send, recipient_count=pending[idx], description=email.get('subject', ''))
+                sent_count += 1
+                self.logger.info(f"Sent email: {email.get('subject', '')}")
+                if result_callback:
+                    result_callback(email, True, "")
+            except Exception as e:
+                self.logger.error(f"Failed to send email '{email.get('subject', '')}': {e}")
+                failures.append((email, str(e)))
+                if result_callback:
+                    result_callback(email, False, str(e))
+        
+        self.attachment_guard.cleanup()
+        
+        if progress_callback:
+            if cancel_event is not None and cancel_event.is_set():
+                progress_callback(100, f"Cancelled - {sent_count} sent")
+            else:
+                progress_callback(100, "Complete!")
+        
+        return sent_count, failures
+    
+    def create_guarded_emails(
+        self,
+        to: str,
+        cc: str,
+        subject: str,
+        body: str,
+        attachments: List[Path],
+        universal_attachment: Optional[Path] = None
+    ) -> List[win32.Dispatch]:
+        """
+        Create the email(s) for one send, keeping attachments under the size limit.
+        
+        Attachments are planned by the AttachmentGuard; when they have to be
+        split across several messages, each gets "(part i of n)" in its subject
+        ahead of the tracking token.
+        
+        Args:
+            to: Semicolon-separated To addresses
+            cc: Semicolon-separated CC addresses
+            subject: Email subject
+            body: Email body
+            attachments: Attachment file paths
+            universal_attachment: Optional attachment included with every message
+            
+        Returns:
+            List of Outlook mail items (usually one)
+        """
+        parts = self.attachment_guard.fit(attachments, universal_attachment)
+        mails = []
+        for number, part in enumerate(parts, start=1):
+            part_subject = subject
+            if len(parts) > 1:
+                token = extract_tracking_token(subject)
+                suffix = f" (part {number} of {len(parts)})"
+                part_subject = subject.replace(f" [{token}]", f"{suffix} [{token}]") if token else subject + suffix
+            mails.append(self.create_email(to=to, cc=cc, subject=part_subject, body=body, attachments=part))
+        return mails
+    
     def create_email(
         self,
         to: str,
@@ -4038,6 +8135,23 @@ class EmailHandler:
                 return self.create_email(to, cc, subject, body, attachments, retry_on_fail=False)
             raise EmailError(f"Failed to create email: {e}")
     
+    def build_subject(self, file_name: str, review_period: Optional[str] = None) -> str:
+        """
+        Build the outbound subject for a file, including its tracking token.
+        
+        Args:
+            file_name: Source file name the email is sent for
+            review_period: Review period (defaults to the configured one)
+            
+        Returns:
+            Subject line, e.g. "[ACTION REQUIRED] Cognos Access Review Q3 2025 - BBDO [CAR-Q3-450B5F6D]"
+        """
+        config = self.config.get_all()
+        review_period = review_period or config.get("review_period", "Q2 2025")
+        subject_prefix = config.get("email_subject_prefix", "")
+        token = make_tracking_token(review_period, file_name)
+        return f"{subject_prefix} {review_period} - {file_name} [{token}]".strip()
+    
     def send_emails(
         self,
         combined_file: Path,
@@ -4047,11 +8161,16 @@ class EmailHandler:
         universal_attachment: Optional[Path] = None,
         progress_callback: Optional[callable] = None,
         scheduled_time: Optional[datetime] = None,
-        selected_tabs: Optional[List[str]] = None
-    ) -> int:
+        selected_tabs: Optional[List[str]] = None,
+        digest: bool = False
+    ) -> SendBatchResult:
         """
         Send emails to selected agencies.
         
+        In digest mode, files whose normalized To/CC match are sent as one
+        message carrying all their workbooks (zipped if digest_zip_attachments
+        is set), split when the attachments exceed digest_max_attachment_mb.
+        
         Args:
             combined_file: Path to combined agency/email mapping Excel file
             output_dir: Directory containing agency Excel files
@@ -4061,9 +8180,10 @@ class EmailHandler:
             progress_callback: Optional callback for progress updates
             scheduled_time: Optional datetime for deferred delivery (used with Schedule mode)
             selected_tabs: Optional list of tab names to process from combined file
+            digest: Send one message per recipient group instead of one per file
             
         Returns:
-            Number of emails processed
+            SendBatchResult with the files sent and why the others were not
             
         Raises:
             EmailError: If email sending fails
@@ -4083,18 +8203,51 @@ class EmailHandler:
             folder_results = self.setup_compliance_folders(review_period)
             sent_folder = f"Compliance {review_period} - Sent"
             
-            # Process each file
-            processed_count = 0
-            total = len(file_names)
+            # Plan messages: one per file, or one per recipient group in digest mode
+            if digest:
+                max_mb = float(config.get("digest_max_attachment_mb", 20.0) or 0)
+                messages = self.plan_digest_messages(
+                    recipients, file_names, output_dir, universal_attachment,
+                    max_bytes=int(max_mb * 1024 * 1024) if max_mb else None
+                )
+                self.logger.info(f"Digest mode: {len(file_names)} files in {len(messages)} messages")
+            else:
+                messages = [[file_name] for file_name in file_names]
+            
+            # Process each message
+            result = SendBatchResult()
+            total = len(messages)
+            sent_subjects = []
+            tracking_tokens = {}
+            known_tokens = AuditLogger(output_dir=output_dir).load_tracking_index()
+            digest_aliases = {}  # member file token -> digest subject
+            batch_started = datetime.now()
+            
+            # Recipient counts of the messages still to be submitted, for ETA reporting
+            pending = []
+            if mode != EmailMode.PREVIEW:
+                pending = [
+                    SendRateLimiter.count_recipients(recipients[m[0]]["to"], recipients[m[0]]["cc"])
+                    for m in messages if m[0] in recipients and recipients[m[0]]["to"]
+                ]
+                eta = self.rate_limiter.projected_completion(pending)
+                self.logger.info(f"Submitting {len(pending)} emails, projected completion {eta:%Y-%m-%d %H:%M:%S}")
             
-            for idx, file_name in enumerate(file_names):
+            for idx, message_files in enumerate(messages):
+                file_name = message_files[0]
+                label = file_name if len(message_files) == 1 else f"{file_name} and {len(message_files) - 1} more"
                 if progress_callback:
                     progress = (idx / total) * 100
-                    progress_callback(progress, f"Processing {file_name}...")
+                    if pending:
+                        eta = self.rate_limiter.projected_completion(pending)
+                        progress_callback(progress, f"Processing {label} (projected completion {eta:%H:%M:%S})...")
+                    else:
+                        progress_callback(progress, f"Processing {label}...")
                 
                 # Check if recipients exist
                 if file_name not in recipients:
                     self.logger.warning(f"No email addresses found for: {file_name}")
+                    result.failed[file_name] = "No email addresses in the combined file"
                     continue
                 
                 recipient = recipients[file_name]
@@ -4102,126 +8255,383 @@ class EmailHandler:
                 # Check for valid To addresses
                 if not recipient["to"]:
                     self.logger.warning(f"No To addresses for: {file_name}")
+                    result.failed[file_name] = "No To addresses"
                     continue
+                recipient_count = pending.pop(0) if pending else 1
                 
-                # Build subject
-                subject_prefix = config.get("email_subject_prefix", "")
-                subject = f"{subject_prefix} {review_period} - {file_name}".strip()
-                
-                # Get file context for enhanced template placeholders
-                agency_file = output_dir / f"{file_name}.xlsx"
-                user_count = 0
-                agency_list = ""
-                
-                # Try to read the file to get context
-                if agency_file.exists():
-                    try:
-                        # Read first sheet to get user count
-                        df_check = pd.read_excel(agency_file, sheet_names=0)
-                        user_count = len(df_check)
-                        
-                        # Get agency names from sheet names (skip first 2 sheets: User Access List & Summary)
-                        xl_file = pd.ExcelFile(agency_file)
-                        sheet_names = xl_file.sheet_names
-                        agency_sheets = [s for s in sheet_names if s not in [SheetNames.USER_ACCESS_LIST, SheetNames.ALL_USERS, SheetNames.USER_ACCESS_SUMMARY]]
-                        agency_list = ", ".join(agency_sheets[:5])  # Limit to first 5
-                        if len(agency_sheets) > 5:
-                            agency_list += f" and {len(agency_sheets) - 5} more"
-                    except Exception as e:
-                        self.logger.warning(f"Could not read file context for {file_name}: {e}")
-                
-                # Extract recipient name from email (first part before @)
-                recipient_name = ""
-                if recipient["to"]:
-                    try:
-                        first_email = recipient["to"].split(';')[0].strip()
-                        recipient_name = first_email.split('@')[0].replace('.', ' ').title()
-                    except:
-                        pass
-                
-                # Build body from template with enhanced placeholders
-                template_vars = {
-                    'review_period': review_period,
-                    'deadline': config.get("deadline", "TBD"),
-                    'sender_name': config.get("sender_name", ""),
-                    'sender_title': config.get("sender_title", ""),
-                    'company_name': config.get("company_name", ""),
-                    # NEW: Access Certification specific placeholders
-                    'QUARTER': review_period,  # Alias for review_period
-                    'DEADLINE': config.get("deadline", "TBD"),  # Alias
-                    'SOURCE_FILE': file_name,
-                    'AGENCY_LIST': agency_list if agency_list else "your assigned agencies",
-                    'USER_COUNT': str(user_count),
-                    'RECIPIENT_NAME': recipient_name if recipient_name else "there"
-                }
-                
-                # Use safe substitution to avoid KeyError for missing placeholders
-                body = template
-                for key, value in template_vars.items():
-                    body = body.replace(f'{{{key}}}', str(value))
-                    body = body.replace(f'{{{key.lower()}}}', str(value))  # Support lowercase too
-                
-                # Prepare attachments
-                attachments = []
-                
-                # Add agency-specific file
-                agency_file = output_dir / f"{file_name}.xlsx"
-                if agency_file.exists():
-                    attachments.append(agency_file)
+                if len(message_files) == 1:
+                    # Build subject (includes the tracking token used to attribute replies)
+                    subject = self.build_subject(file_name, review_period)
+                    
+                    body = self.render_email_body(file_name, recipient, template, config, output_dir)
+                    
+                    # Prepare attachments
+                    attachments = []
+                    
+                    # Add agency-specific file
+                    agency_file = output_dir / f"{file_name}.xlsx"
+                    if agency_file.exists():
+                        attachments.append(agency_file)
+                    else:
+                        self.logger.warning(f"Agency file not found: {agency_file}")
+                        result.failed[file_name] = "Agency file not found"
+                        continue
+                    token_files = file_name
                 else:
-                    self.logger.warning(f"Agency file not found: {agency_file}")
-                    continue
+                    # Digest: one message carrying every workbook for this recipient group
+                    subject = self.build_digest_subject(message_files, review_period)
+                    body = self.render_digest_body(message_files, recipient, template, config, output_dir)
+                    
+                    attachments = [output_dir / f"{f}.xlsx" for f in message_files]
+                    if config.get("digest_zip_attachments", False):
+                        attachments = [self.attachment_guard.compress(attachments, label)]
+                    token_files = list(message_files)
                 
-                # Add universal attachment if provided
-                if universal_attachment:
-                    attachments.append(universal_attachment)
+                # A token held by other files would misattribute replies; never send with it
+                token = extract_tracking_token(subject)
+                existing = tracking_token_conflict({**known_tokens, **tracking_tokens}, token, token_files)
+                if existing is not None:
+                    self.logger.error(f"Tracking token {token} for {label} already belongs to {existing}; not sent")
+                    for member in message_files:
+                        result.failed[member] = f"Tracking token {token} already belongs to {existing}"
+                    continue
                 
-                # Create email
-                mail = self.create_email(
-                    to=recipient["to"],
-                    cc=recipient["cc"],
-                    subject=subject,
-                    body=body,
-                    attachments=attachments
-                )
+                # Create email(s); attachments over the mailbox limit are compressed or split
+                try:
+                    mails = self.create_guarded_emails(
+                        to=recipient["to"],
+                        cc=recipient["cc"],
+                        subject=subject,
+                        body=body,
+                        attachments=attachments,
+                        universal_attachment=universal_attachment
+                    )
+                except Exception as e:
+                    self.logger.error(f"Could not create email for {label}: {e}")
+                    for member in message_files:
+                        result.failed[member] = f"Could not create email: {e}"
+                    continue
                 
-                # Handle based on mode
-                if mode == EmailMode.PREVIEW:
-                    # For Preview mode, display email (backward compatible single email display)
-                    # Note: For batch preview with navigation, use prepare_email_batch() + EmailPreviewNavigationDialog from GUI
-                    mail.Display()
-                    self.logger.info(f"Displayed email for preview: {file_name}")
-                elif mode == EmailMode.DIRECT:
-                    mail.Send()  # Send immediately
-                    self.logger.info(f"Sent email directly: {file_name}")
-                    
-                    # Auto-organize: Copy sent email to compliance folder
-                    # Wait a moment for email to appear in Sent Items
-                    # Use default arguments to capture current values
-                    threading.Timer(2.0, lambda subj=subject, folder=sent_folder: self.copy_sent_email_to_folder(subj, folder)).start()
+                submitted = True
+                for mail in mails:
+                    # Handle based on mode
+                    if mode == EmailMode.PREVIEW:
+                        # For Preview mode, display email (backward compatible single email display)
+                        # Note: For batch preview with navigation, use prepare_email_batch() + EmailPreviewNavigationDialog from GUI
+                        mail.Display()
+                        self.logger.info(f"Displayed email for preview: {label}")
+                    elif mode == EmailMode.DIRECT:
+                        try:
+                            self.rate_limiter.dispatch(mail.Send, recipient_count, description=label)
+                        except EmailError as e:
+                            self.logger.error(str(e))
+                            submitted = str(e)
+                            break
+                        self.logger.info(f"Sent email directly: {label}")
+                        sent_subjects.append(str(mail.Subject))
                     
-                elif mode == EmailMode.SCHEDULE:
-                    # For scheduled mode, set deferred delivery time and save to Outbox
-                    if scheduled_time:
-                        # Set deferred delivery - Outlook will send at this time
-                        mail.DeferredDeliveryTime = scheduled_time
-                        mail.Send()  # This puts it in Outbox with deferred delivery
-                        self.logger.info(f"Scheduled email for {file_name} - will send at {scheduled_time}")
-                    else:
-                        # No scheduled time, just save as draft for manual review
-                        mail.Save()
-                        self.logger.info(f"Saved draft email for: {file_name}")
+                    elif mode == EmailMode.SCHEDULE:
+                        # For scheduled mode, set deferred delivery time and save to Outbox
+                        if scheduled_time:
+                            # Set deferred delivery - Outlook will send at this time
+                            mail.DeferredDeliveryTime = scheduled_time
+                            try:
+                                # This puts it in Outbox with deferred delivery
+                                self.rate_limiter.dispatch(mail.Send, recipient_count, description=label)
+                            except EmailError as e:
+                                self.logger.error(str(e))
+                                submitted = str(e)
+                                break
+                            self.logger.info(f"Scheduled email for {label} - will send at {scheduled_time}")
+                        else:
+                            # No scheduled time, just save as draft for manual review
+                            mail.Save()
+                            self.logger.info(f"Saved draft email for: {label}")
+                if submitted is not True:
+                    for member in message_files:
+                        result.failed[member] = submitted
+                    continue
                 
-                processed_count += 1
+                tracking_tokens[token] = token_files
+                if len(message_files) > 1:
+                    for member in message_files:
+                        digest_aliases[make_tracking_token(review_period, member)] = subject
+                result.sent.extend(message_files)
+            
+            # Persist token -> file index with the audit log for reply attribution
+            AuditLogger(output_dir=output_dir).register_tracking_tokens(tracking_tokens)
+            
+            # Follow-ups for a digested file reply to the digest it went out in
+            if digest_aliases:
+                for token, subject in digest_aliases.items():
+                    self.sent_index.alias(token, subject)
+                self.sent_index.save()
+            
+            # Auto-organize: file all direct sends into the compliance folder in one pass
+            if sent_subjects:
+                if progress_callback:
+                    progress_callback(99, f"Filing {len(sent_subjects)} sent emails...")
+                self.file_sent_emails(sent_subjects, sent_folder, batch_started)
             
             if progress_callback:
                 progress_callback(100, "Complete!")
             
-            self.logger.info(f"Processed {processed_count} emails in {mode.value} mode")
-            return processed_count
+            # Files the digest planner left out never got a message
+            sent = set(result.sent)
+            for file_name in file_names:
+                if file_name not in sent:
+                    result.failed.setdefault(file_name, "Not sent")
+            
+            self.logger.info(f"Processed {len(result.sent)} files in {mode.value} mode ({len(result.failed)} not sent)")
+            return result
             
         except Exception as e:
             raise EmailError(f"Email sending failed: {e}")
+        finally:
+            # Outlook copies attachments into the item, so generated files can go
+            self.attachment_guard.cleanup()
+    
+    def read_file_context(self, agency_file: Path) -> Tuple[int, List[str]]:
+        """
+        Read template context (user count and agency tabs) from an agency workbook.
+        
+        Args:
+            agency_file: Path to the agency Excel file
+        
+        Returns:
+            Tuple of (user count on the first sheet, agency tab names)
+        """
+        user_count = 0
+        agency_sheets = []
+        if agency_file.exists():
+            try:
+                with pd.ExcelFile(agency_file) as xl_file:
+                    sheet_names = xl_file.sheet_names
+                    # Read first sheet to get user count
+                    user_count = len(xl_file.parse(sheet_names[0]))
+                
+                # Get agency names from sheet names (skip User Access List & Summary sheets)
+                agency_sheets = [s for s in sheet_names if s not in [SheetNames.USER_ACCESS_LIST, SheetNames.ALL_USERS, SheetNames.USER_ACCESS_SUMMARY]]
+            except Exception as e:
+                self.logger.warning(f"Could not read file context for {agency_file.stem}: {e}")
+        return user_count, agency_sheets
+    
+    def _fill_template(
+        self,
+        template: str,
+        config: dict,
+        source_file: str,
+        agency_sheets: List[str],
+        user_count: int,
+        to_addresses: str
+    ) -> str:
+        """Substitute template placeholders for one outgoing message."""
+        review_period = config.get("review_period", "Q2 2025")
+        
+        agency_list = ", ".join(agency_sheets[:5])  # Limit to first 5
+        if len(agency_sheets) > 5:
+            agency_list += f" and {len(agency_sheets) - 5} more"
+        
+        # Extract recipient name from email (first part before @)
+        recipient_name = ""
+        if to_addresses:
+            try:
+                first_email = to_addresses.split(';')[0].strip()
+                recipient_name = first_email.split('@')[0].replace('.', ' ').title()
+            except:
+                pass
+        
+        # Build body from template with enhanced placeholders
+        template_vars = {
+            'review_period': review_period,
+            'deadline': config.get("deadline", "TBD"),
+            'sender_name': config.get("sender_name", ""),
+            'sender_title': config.get("sender_title", ""),
+            'company_name': config.get("company_name", ""),
+            # Access Certification specific placeholders
+            'QUARTER': review_period,  # Alias for review_period
+            'DEADLINE': config.get("deadline", "TBD"),  # Alias
+            'SOURCE_FILE': source_file,
+            'AGENCY_LIST': agency_list if agency_list else "your assigned agencies",
+            'USER_COUNT': str(user_count),
+            'RECIPIENT_NAME': recipient_name if recipient_name else "there"
+        }
+        
+        # Use safe substitution to avoid KeyError for missing placeholders
+        body = template
+        for key, value in template_vars.items():
+            body = body.replace(f'{{{key}}}', str(value))
+            body = body.replace(f'{{{key.lower()}}}', str(value))  # Support lowercase too
+        return body
+    
+    def render_email_body(
+        self,
+        file_name: str,
+        recipient: Dict[str, str],
+        template: str,
+        config: dict,
+        output_dir: Path
+    ) -> str:
+        """
+        Render the email body for one agency file.
+        
+        Args:
+            file_name: Agency file name (without extension)
+            recipient: Recipient dict with 'to' and 'cc'
+            template: Email template text
+            config: Configuration values (review_period, deadline, sender...)
+            output_dir: Directory containing agency Excel files
+        
+        Returns:
+            Template with all placeholders substituted
+        """
+        user_count, agency_sheets = self.read_file_context(output_dir / f"{file_name}.xlsx")
+        return self._fill_template(template, config, file_name, agency_sheets, user_count, recipient["to"])
+    
+    def render_digest_body(
+        self,
+        file_names: List[str],
+        recipient: Dict[str, str],
+        template: str,
+        config: dict,
+        output_dir: Path
+    ) -> str:
+        """
+        Render one email body covering several agency files.
+        
+        SOURCE_FILE lists all files, AGENCY_LIST combines their agency tabs
+        and USER_COUNT is the total across the workbooks.
+        
+        Args:
+            file_names: Agency file names included in the digest
+            recipient: Recipient dict with 'to' and 'cc'
+            template: Email template text
+            config: Configuration values (review_period, deadline, sender...)
+            output_dir: Directory containing agency Excel files
+        
+        Returns:
+            Template with all placeholders substituted
+        """
+        total_users = 0
+        all_sheets = []
+        for file_name in file_names:
+            user_count, agency_sheets = self.read_file_context(output_dir / f"{file_name}.xlsx")
+            total_users += user_count
+            all_sheets.extend(s for s in agency_sheets if s not in all_sheets)
+        return self._fill_template(template, config, ", ".join(file_names), all_sheets, total_users, recipient["to"])
+    
+    @staticmethod
+    def recipient_key(to: str, cc: str = "") -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """
+        Normalize a To/CC pair so files with the same reviewers group together.
+        
+        Args:
+            to: Semicolon-separated To addresses
+            cc: Semicolon-separated CC addresses
+        
+        Returns:
+            Tuple of (sorted lowercase To addresses, sorted lowercase CC addresses)
+        
+        Examples:
+            >>> EmailHandler.recipient_key("B@x.com; a@x.com", "")
+            (('a@x.com', 'b@x.com'), ())
+        """
+        return (
+            tuple(sorted({a.lower() for a in format_email_list(to)})),
+            tuple(sorted({a.lower() for a in format_email_list(cc)}))
+        )
+    
+    def plan_digest_messages(
+        self,
+        recipients: Dict[str, Dict[str, str]],
+        file_names: List[str],
+        output_dir: Path,
+        universal_attachment: Optional[Path] = None,
+        max_bytes: Optional[int] = None
+    ) -> List[List[str]]:
+        """
+        Group files into digest messages by recipient set, within a size cap.
+        
+        Files whose normalized To/CC match go into the same message. A group
+        whose workbooks (plus the universal attachment) exceed max_bytes is
+        split into several messages; a single oversized file still gets its
+        own message.
+        
+        Args:
+            recipients: Recipients by file name, from load_email_manifest()
+            file_names: Files to send, in order
+            output_dir: Directory containing agency Excel files
+            universal_attachment: Optional attachment added to every message
+            max_bytes: Attachment size cap per message (None for no cap)
+        
+        Returns:
+            List of messages, each a list of file names sharing recipients
+        """
+        groups: Dict[Tuple, List[str]] = {}
+        for file_name in file_names:
+            if file_name not in recipients:
+                self.logger.warning(f"No email addresses found for: {file_name}")
+                continue
+            recipient = recipients[file_name]
+            if not recipient["to"]:
+                self.logger.warning(f"No To addresses for: {file_name}")
+                continue
+            agency_file = output_dir / f"{file_name}.xlsx"
+            if not agency_file.exists():
+                self.logger.warning(f"Agency file not found: {agency_file}")
+                continue
+            groups.setdefault(self.recipient_key(recipient["to"], recipient["cc"]), []).append(file_name)
+        
+        fixed_size = 0
+        if universal_attachment and Path(universal_attachment).exists():
+            fixed_size = Path(universal_attachment).stat().st_size
+        
+        messages = []
+        for group_files in groups.values():
+            part, part_size = [], fixed_size
+            for file_name in group_files:
+                size = (output_dir / f"{file_name}.xlsx").stat().st_size
+                if part and max_bytes and part_size + size > max_bytes:
+                    messages.append(part)
+                    part, part_size = [], fixed_size
+                part.append(file_name)
+                part_size += size
+            messages.append(part)
+        return messages
+    
+    def build_digest_subject(self, file_names: List[str], review_period: Optional[str] = None) -> str:
+        """
+        Build the subject for a digest email, with a tracking token for the file set.
+        
+        Args:
+            file_names: Files included in the message
+            review_period: Review period (defaults to the configured one)
+        
+        Returns:
+            Subject line, e.g. "... Q3 2025 - BBDO and 3 more [CAR-Q3-1A2B3C4D]"
+        """
+        config = self.config.get_all()
+        review_period = review_period or config.get("review_period", "Q2 2025")
+        subject_prefix = config.get("email_subject_prefix", "")
+        token = make_tracking_token(review_period, "|".join(sorted(file_names)))
+        return f"{subject_prefix} {review_period} - {file_names[0]} and {len(file_names) - 1} more [{token}]".strip()
+    
+    @staticmethod
+    def zip_attachments(paths: List[Path], zip_path: Path) -> Path:
+        """
+        Deflate-compress files into a single zip archive.
+        
+        Args:
+            paths: Files to include (stored under their file names)
+            zip_path: Archive to create
+        
+        Returns:
+            Path to the created archive
+        """
+        with zipfile.ZipFile(zip_path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+            for path in paths:
+                archive.write(path, arcname=Path(path).name)
+        return zip_path
     
     def prepare_email_batch(
         self,
@@ -4230,10 +8640,13 @@ class EmailHandler:
         file_names: List[str],
         universal_attachment: Optional[Path] = None,
         selected_tabs: Optional[List[str]] = None
-    ) -> List[dict]:
+    ) -> LazyEmailBatch:
         """
         Prepare a batch of emails for preview (used with EmailPreviewNavigationDialog).
         
+        Only recipients, subjects and attachment paths are resolved here; bodies
+        and workbook context are rendered when a message is first viewed.
+        
         Args:
             combined_file: Path to combined agency/email mapping Excel file
             output_dir: Directory containing agency Excel files
@@ -4242,7 +8655,7 @@ class EmailHandler:
             selected_tabs: Optional list of tab names to process from combined file
             
         Returns:
-            List of email data dictionaries ready for preview dialog
+            LazyEmailBatch of email data dictionaries ready for preview dialog
         """
         try:
             # Load email manifest
@@ -4254,9 +8667,10 @@ class EmailHandler:
             # Get configuration values
             config = self.config.get_all()
             review_period = config.get("review_period", "Q2 2025")
-            subject_prefix = config.get("email_subject_prefix", "")
             
-            emails_to_send = []
+            specs = []
+            tracking_tokens = {}
+            known_tokens = AuditLogger(output_dir=output_dir).load_tracking_index()
             
             for file_name in file_names:
                 # Check if recipients exist
@@ -4271,89 +8685,156 @@ class EmailHandler:
                     self.logger.warning(f"No To addresses for: {file_name}")
                     continue
                 
-                # Build subject
-                subject = f"{subject_prefix} {review_period} - {file_name}".strip()
-                
-                # Get file context
+                token = make_tracking_token(review_period, file_name)
+                existing = tracking_token_conflict({**known_tokens, **tracking_tokens}, token, file_name)
+                if existing is not None:
+                    self.logger.error(f"Tracking token {token} for {file_name} already belongs to {existing}; skipped")
+                    continue
+                tracking_tokens[token] = file_name
                 agency_file = output_dir / f"{file_name}.xlsx"
-                user_count = 0
-                agency_list = ""
-                
-                if agency_file.exists():
-                    try:
-                        df_check = pd.read_excel(agency_file, sheet_names=0)
-                        user_count = len(df_check)
-                        
-                        xl_file = pd.ExcelFile(agency_file)
-                        sheet_names = xl_file.sheet_names
-                        agency_sheets = [s for s in sheet_names if s not in [SheetNames.USER_ACCESS_LIST, SheetNames.ALL_USERS, SheetNames.USER_ACCESS_SUMMARY]]
-                        agency_list = ", ".join(agency_sheets[:5])
-                        if len(agency_sheets) > 5:
-                            agency_list += f" and {len(agency_sheets) - 5} more"
-                    except Exception as e:
-                        self.logger.warning(f"Could not read file context for {file_name}: {e}")
-                
-                # Extract recipient name
-                recipient_name = ""
-                if recipient["to"]:
-                    try:
-                        first_email = recipient["to"].split(';')[0].strip()
-                        recipient_name = first_email.split('@')[0].replace('.', ' ').title()
-                    except:
-                        pass
-                
-                # Build body from template
-                template_vars = {
-                    'review_period': review_period,
-                    'deadline': config.get("deadline", "TBD"),
-                    'sender_name': config.get("sender_name", ""),
-                    'sender_title': config.get("sender_title", ""),
-                    'company_name': config.get("company_name", ""),
-                    'QUARTER': review_period,
-                    'DEADLINE': config.get("deadline", "TBD"),
-                    'SOURCE_FILE': file_name,
-                    'AGENCY_LIST': agency_list if agency_list else "your assigned agencies",
-                    'USER_COUNT': str(user_count),
-                    'RECIPIENT_NAME': recipient_name if recipient_name else "there"
-                }
-                
-                body = template
-                for key, value in template_vars.items():
-                    body = body.replace(f'{{{key}}}', str(value))
-                    body = body.replace(f'{{{key.lower()}}}', str(value))
                 
-                # Prepare attachment path
-                attachment_path = agency_file if agency_file.exists() else None
-                
-                # Add to batch
-                emails_to_send.append({
+                specs.append({
                     'to': recipient["to"],
                     'cc': recipient["cc"],
-                    'subject': subject,
-                    'body': body,
-                    'attachment_path': attachment_path,
+                    'subject': self.build_subject(file_name, review_period),
+                    'attachment_path': agency_file if agency_file.exists() else None,
+                    'universal_attachment': universal_attachment,
                     'file_name': file_name
                 })
             
-            self.logger.info(f"Prepared {len(emails_to_send)} emails for batch preview")
-            return emails_to_send
+            AuditLogger(output_dir=output_dir).register_tracking_tokens(tracking_tokens)
+            
+            def render(spec: dict) -> dict:
+                body = self.render_email_body(spec['file_name'], spec, template, config, output_dir)
+                return {**spec, 'body': body}
+            
+            self.logger.info(f"Prepared {len(specs)} emails for batch preview")
+            return LazyEmailBatch(specs, render)
             
         except Exception as e:
             raise EmailError(f"Failed to prepare email batch: {e}")
     
+    def _load_scan_state(self) -> Dict[str, dict]:
+        """Load per-folder scan watermarks from disk (cached after first load)."""
+        if self._scan_state is None:
+            self._scan_state = {}
+            if self.scan_state_path.exists():
+                try:
+                    with open(self.scan_state_path, 'r', encoding='utf-8') as f:
+                        self._scan_state = json.load(f)
+                except Exception as e:
+                    self.logger.warning(f"Could not read scan state, starting fresh: {e}")
+        return self._scan_state
+    
+    def _save_scan_state(self) -> None:
+        """Persist per-folder scan watermarks to disk."""
+        try:
+            with open(self.scan_state_path, 'w', encoding='utf-8') as f:
+                json.dump(self._scan_state or {}, f, indent=2)
+        except Exception as e:
+            self.logger.warning(f"Could not save scan state: {e}")
+    
+    def reset_scan_watermark(self, folder_name: Optional[str] = None) -> None:
+        """
+        Forget the scan watermark so the next scan starts from scratch.
+        
+        Args:
+            folder_name: Folder to reset, or None to reset all folders
+        """
+        state = self._load_scan_state()
+        if folder_name is None:
+            state.clear()
+            self._pending_scan_state.clear()
+        else:
+            state.pop(folder_name, None)
+            self._pending_scan_state.pop(folder_name, None)
+        self._save_scan_state()
+    
+    def commit_scan_watermark(self) -> None:
+        """
+        Advance the scan watermarks to the messages returned by scan_inbox().
+        
+        Call once the results have been processed and recorded; if processing
+        fails first, the next scan returns the same messages again.
+        """
+        if not self._pending_scan_state:
+            return
+        self._load_scan_state().update(self._pending_scan_state)
+        self._pending_scan_state.clear()
+        self._save_scan_state()
+    
+    # Internet headers Exchange promotes to named properties (PS_INTERNET_HEADERS)
+    HEADER_PROPERTY = "http://schemas.microsoft.com/mapi/string/{00020386-0000-0000-C000-000000000046}/"
+    CLASSIFY_HEADERS = ["auto-submitted", "x-autoreply", "x-autorespond", "precedence", "x-failed-recipients"]
+    DISPLAY_TO_PROPERTY = "http://schemas.microsoft.com/mapi/proptag/0x0E04001F"
+    
+    def _fetch_rows(self, folder, dasl_filter: str, columns: List[str], chunk_size: int = 500) -> List[dict]:
+        """
+        Fetch properties of matching items in bulk through an Outlook Table.
+        
+        Args:
+            folder: Outlook folder to query
+            dasl_filter: "@SQL=" filter restricting the rows
+            columns: Property names or schema names to fetch
+            chunk_size: Rows per GetArray call
+            
+        Returns:
+            List of {column: value} dicts, newest first
+        """
+        table = folder.GetTable(dasl_filter, 0)  # olUserItems
+        table.Columns.RemoveAll()
+        for column in columns:
+            table.Columns.Add(column)
+        table.Sort("[ReceivedTime]", True)
+        
+        rows = []
+        while not table.EndOfTable:
+            for values in table.GetArray(chunk_size) or ():
+                rows.append(dict(zip(columns, values)))
+        return rows
+    
+    @staticmethod
+    def _to_naive(value) -> datetime:
+        """Convert a COM (pywintypes) datetime to a naive local datetime."""
+        return datetime(value.year, value.month, value.day, value.hour, value.minute, value.second)
+    
     def scan_inbox(
         self,
         folder_name: str = "Compliance Q2 2025",
         subject_keywords: Optional[List[str]] = None,
-        agencies: Optional[List[str]] = None
+        agencies: Optional[List[str]] = None,
+        incremental: bool = True,
+        tracking_index: Optional[Dict[str, "str | List[str]"]] = None
     ) -> List[Dict[str, str]]:
         """
         Scan Outlook inbox folder for reply emails.
         
+        Subject and date filters are pushed down to Outlook with a DASL
+        Items.Restrict query. In incremental mode only mail received since the
+        folder's persisted watermark is fetched; EntryIDs at the watermark
+        boundary are remembered so nothing is reported twice. The watermark is
+        kept per folder actually scanned (the Inbox when folder_name does not
+        exist) and only advances when the caller calls commit_scan_watermark()
+        after processing the results. Message bodies are not read here; use
+        get_body_preview() with the returned entry_id.
+        
+        All properties are fetched in bulk through an Outlook Table and each
+        message is classified with classify_message(): auto-replies are left
+        out, bounces are returned with kind "bounce" and the failing address,
+        everything else with kind "reply".
+        
+        Subjects carrying a tracking token (see make_tracking_token) are matched
+        even if the keywords were edited out, and are attributed to their source
+        file through tracking_index ("source_file" in the result). A digest
+        token resolves to all of its files ("source_files"; "source_file" is
+        the first of them).
+        
         Args:
             folder_name: Name of folder to scan
             subject_keywords: Optional list of keywords to filter by subject
             agencies: Optional list of agencies to filter emails by
+            incremental: If True, only return mail received since the last scan
+            tracking_index: Optional token -> source file(s) index (AuditLogger.load_tracking_index())
             
         Returns:
             List of dictionaries with email information
@@ -4364,53 +8845,134 @@ class EmailHandler:
             ...     folder_name="Compliance Q2 2025",
             ...     subject_keywords=["Cognos", "Access Review"]
             ... )
-            >>> print(f"Found {len(replies)} replies")
+            >>> print(f"Found {len(replies)} new replies")
+            >>> handler.get_body_preview(replies[0]["entry_id"])
+            >>> handler.commit_scan_watermark()
         """
         try:
-            outlook = self._get_outlook()
-            namespace = outlook.GetNamespace("MAPI")
-            inbox = namespace.GetDefaultFolder(6)  # 6 = olFolderInbox
-            
-            # Try to find specific folder
-            target_folder = None
+            # Try to find specific folder; the watermark belongs to the folder scanned
             try:
-                target_folder = inbox.Folders[folder_name]
+                target_folder = self._get_folder(f"Inbox/{folder_name}")
+                scanned_folder = folder_name
                 self.logger.info(f"Scanning folder: {folder_name}")
-            except Exception:
+            except EmailError:
                 self.logger.warning(f"Folder '{folder_name}' not found, scanning inbox")
-                target_folder = inbox
+                target_folder = self._get_folder("Inbox")
+                scanned_folder = "Inbox"
+            
+            keywords = [k.lower() for k in (subject_keywords or ["cognos", "access review"])]
+            tracking_index = {k.upper(): v for k, v in (tracking_index or {}).items()}
             
-            # Get messages
-            messages = target_folder.Items
-            messages.Sort("[ReceivedTime]", True)  # Sort by newest first
+            folder_state = self._load_scan_state().get(scanned_folder, {}) if incremental else {}
+            watermark = folder_state.get("last_received")
+            seen_ids = set(folder_state.get("entry_ids", []))
             
-            # Filter and collect responses
+            # Build DASL filter: any keyword or a tracking token in subject, received since watermark
+            subject_terms = " OR ".join(
+                "\"urn:schemas:httpmail:subject\" LIKE '%{}%'".format(k.replace("'", "''"))
+                for k in keywords + ["[car-"]
+            )
+            conditions = [f"({subject_terms})"]
+            if watermark:
+                since = datetime.strptime(watermark, "%Y-%m-%d %H:%M:%S") - timedelta(minutes=1)
+                # DASL compares dates in UTC
+                since_utc = since.astimezone(pytz.utc).replace(tzinfo=None)
+                conditions.append(f"\"urn:schemas:httpmail:datereceived\" >= '{self._outlook_date(since_utc)}'")
+            
+            header_columns = [self.HEADER_PROPERTY + name for name in self.CLASSIFY_HEADERS]
+            rows = self._fetch_rows(
+                target_folder,
+                "@SQL=" + " AND ".join(conditions),
+                ["EntryID", "Subject", "MessageClass", "ReceivedTime", "SenderName", "SenderEmailAddress",
+                 self.DISPLAY_TO_PROPERTY] + header_columns
+            )
+            
+            # Collect responses
             responses = []
-            keywords = subject_keywords or ["cognos", "access review"]
+            newest = datetime.strptime(watermark, "%Y-%m-%d %H:%M:%S") if watermark else None
+            boundary_ids = []
+            auto_replies = 0
             
-            for message in messages:
+            for row in rows:
                 try:
-                    subject = str(message.Subject).lower()
+                    entry_id = row["EntryID"]
+                    if entry_id in seen_ids:
+                        continue
                     
-                    # Check if subject contains any keyword
-                    if any(keyword.lower() in subject for keyword in keywords):
-                        responses.append({
-                            "subject": message.Subject,
-                            "sender": message.SenderName,
-                            "sender_email": message.SenderEmailAddress,
-                            "received": message.ReceivedTime.strftime("%Y-%m-%d %H:%M"),
-                            "body_preview": str(message.Body)[:200]
-                        })
+                    subject = str(row["Subject"] or "")
+                    token = extract_tracking_token(subject)
+                    if not token and not any(keyword in subject.lower() for keyword in keywords):
+                        continue
+                    
+                    received = self._to_naive(row["ReceivedTime"])
+                    if newest is None or received > newest:
+                        newest = received
+                    boundary_ids.append((received, entry_id))
+                    
+                    kind, failed_address = classify_message(
+                        str(row["MessageClass"] or ""),
+                        subject,
+                        {name: row[column] for name, column in zip(self.CLASSIFY_HEADERS, header_columns)},
+                        str(row[self.DISPLAY_TO_PROPERTY] or "")
+                    )
+                    if kind == MessageKind.AUTO_REPLY:
+                        auto_replies += 1
+                        continue
+                    
+                    source = tracking_index.get(token) if token else None
+                    source_files = [source] if isinstance(source, str) else list(source or [])
+                    responses.append({
+                        "subject": subject,
+                        "sender": row["SenderName"] or "",
+                        "sender_email": row["SenderEmailAddress"] or "",
+                        "kind": kind.value,
+                        "failed_address": failed_address,
+                        "received": received.strftime("%Y-%m-%d %H:%M"),
+                        "entry_id": entry_id,
+                        "tracking_token": token,
+                        "source_file": source_files[0] if source_files else None,
+                        "source_files": source_files
+                    })
                 except Exception as e:
                     self.logger.debug(f"Error processing message: {e}")
                     continue
             
-            self.logger.info(f"Found {len(responses)} matching messages")
+            # Stage the new watermark (see commit_scan_watermark); keep IDs near it
+            # so the next overlapping query skips them
+            if newest is not None:
+                cutoff = newest - timedelta(minutes=2)
+                kept_ids = [eid for received, eid in boundary_ids if received >= cutoff]
+                if watermark and datetime.strptime(watermark, "%Y-%m-%d %H:%M:%S") >= cutoff:
+                    kept_ids.extend(seen_ids)
+                self._pending_scan_state[scanned_folder] = {
+                    "last_received": newest.strftime("%Y-%m-%d %H:%M:%S"),
+                    "entry_ids": sorted(set(kept_ids))
+                }
+            
+            self.logger.info(f"Found {len(responses)} new matching messages ({auto_replies} auto-replies skipped)")
             return responses
             
         except Exception as e:
+            self.invalidate_folder_cache()
             self.logger.error(f"Inbox scan failed: {e}")
             raise EmailError(f"Failed to scan inbox: {e}")
+    
+    def get_body_preview(self, entry_id: str, length: int = 200) -> str:
+        """
+        Fetch the start of a message body on demand.
+        
+        Args:
+            entry_id: Outlook EntryID returned by scan_inbox()
+            length: Number of characters to return
+            
+        Returns:
+            Body preview, or an empty string if the item cannot be read
+        """
+        try:
+            return str(self._get_namespace().GetItemFromID(entry_id).Body)[:length]
+        except Exception as e:
+            self.logger.debug(f"Could not read body for {entry_id}: {e}")
+            return ""
 
     def create_folder(self, folder_name: str, parent_folder: str = "Inbox") -> bool:
         """
@@ -4430,34 +8992,13 @@ class EmailHandler:
             ...     print("Folder created successfully!")
         """
         try:
-            outlook = self._get_outlook()
-            namespace = outlook.GetNamespace("MAPI")
-            
-            # Get parent folder
-            if parent_folder.lower() == "inbox":
-                parent = namespace.GetDefaultFolder(6)  # olFolderInbox
-            elif parent_folder.lower() == "sent items":
-                parent = namespace.GetDefaultFolder(5)  # olFolderSentMail
-            else:
-                # Try to find custom parent folder
-                inbox = namespace.GetDefaultFolder(6)
-                try:
-                    parent = inbox.Folders[parent_folder]
-                except:
-                    self.logger.error(f"Parent folder '{parent_folder}' not found")
-                    return False
-            
-            # Check if folder already exists
             try:
-                existing_folder = parent.Folders[folder_name]
-                self.logger.info(f"Folder '{folder_name}' already exists")
-                return True
-            except:
-                pass  # Folder doesn't exist, create it
+                self._get_folder(parent_folder)
+            except EmailError:
+                self.logger.error(f"Parent folder '{parent_folder}' not found")
+                return False
             
-            # Create the folder
-            new_folder = parent.Folders.Add(folder_name)
-            self.logger.info(f"Created folder: {folder_name}")
+            self._get_folder(f"{parent_folder}/{folder_name}", create=True)
             return True
             
         except Exception as e:
@@ -4490,10 +9031,17 @@ class EmailHandler:
             f"Compliance {review_period} - Archive": "Inbox"
         }
         
+        # Already verified with the current connection; nothing to do
+        if review_period in self._compliance_folders_ready:
+            return {folder_name: True for folder_name in folders_to_create}
+        
         results = {}
         for folder_name, parent in folders_to_create.items():
             results[folder_name] = self.create_folder(folder_name, parent)
         
+        if all(results.values()):
+            self._compliance_folders_ready.add(review_period)
+        
         self.logger.info(f"Setup compliance folders for {review_period}")
         return results
 
@@ -4510,20 +9058,7 @@ class EmailHandler:
             True if successful, False otherwise
         """
         try:
-            outlook = self._get_outlook()
-            namespace = outlook.GetNamespace("MAPI")
-            
-            # Get parent folder
-            if parent_folder.lower() == "inbox":
-                parent = namespace.GetDefaultFolder(6)  # olFolderInbox
-            elif parent_folder.lower() == "sent items":
-                parent = namespace.GetDefaultFolder(5)  # olFolderSentMail
-            else:
-                inbox = namespace.GetDefaultFolder(6)
-                parent = inbox.Folders[parent_folder]
-            
-            # Get target folder
-            target_folder = parent.Folders[folder_name]
+            target_folder = self._get_folder(f"{parent_folder}/{folder_name}")
             
             # Move the email
             mail_item.Move(target_folder)
@@ -4531,9 +9066,15 @@ class EmailHandler:
             return True
             
         except Exception as e:
+            self.invalidate_folder_cache()
             self.logger.error(f"Failed to move email to '{folder_name}': {e}")
             return False
 
+    @staticmethod
+    def _outlook_date(value: datetime) -> str:
+        """Format a datetime for use in an Outlook Items.Restrict filter."""
+        return value.strftime("%m/%d/%Y %I:%M %p")
+    
     def copy_sent_email_to_folder(self, subject: str, folder_name: str, days_back: int = 1) -> bool:
         """
         Find a recently sent email and copy it to a folder.
@@ -4546,44 +9087,97 @@ class EmailHandler:
         Returns:
             True if email was found and copied, False otherwise
         """
-        try:
-            outlook = self._get_outlook()
-            namespace = outlook.GetNamespace("MAPI")
-            sent_items = namespace.GetDefaultFolder(5)  # olFolderSentMail
+        since = datetime.now() - timedelta(days=days_back)
+        return self.file_sent_emails([subject], folder_name, since, settle_seconds=0, max_passes=1) == 1
+    
+    def file_sent_emails(
+        self,
+        subjects: List[str],
+        folder_name: str,
+        since: datetime,
+        settle_seconds: float = 2.0,
+        max_passes: int = 3
+    ) -> int:
+        """
+        Copy a batch of just-sent emails from Sent Items into a compliance folder.
+        
+        Sent Items is queried once per pass, restricted to messages sent after
+        ``since``, and each result is matched against the pending subjects with a
+        set lookup. Passes are repeated (up to max_passes) only while some
+        subjects have not yet appeared in Sent Items.
+        
+        Args:
+            subjects: Subjects of the emails that were sent
+            folder_name: Target folder name under Inbox
+            since: Time the batch started sending
+            settle_seconds: Delay before each pass to let Outlook move items to Sent Items
+            max_passes: Maximum number of Sent Items queries
             
-            # Search for the email in sent items
-            messages = sent_items.Items
-            messages.Sort("[SentOn]", True)  # Sort by newest first
+        Returns:
+            Number of emails filed
             
-            cutoff_date = datetime.now() - timedelta(days=days_back)
+        Examples:
+            >>> handler = EmailHandler(ConfigManager())
+            >>> started = datetime.now()
+            >>> # ... send emails ...
+            >>> handler.file_sent_emails(sent_subjects, "Compliance Q2 2025 - Sent", started)
+            12
+        """
+        pending = set(subjects)
+        if not pending:
+            return 0
+        
+        filed_count = 0
+        try:
+            sent_items = self._get_folder("Sent Items")
+            target_folder = self._get_folder(f"Inbox/{folder_name}")
             
-            for message in messages:
-                try:
-                    if (message.Subject == subject and 
-                        message.SentOn >= cutoff_date):
-                        
-                        # Copy the email to target folder
-                        copied_mail = message.Copy()
-                        return self.move_email_to_folder(copied_mail, folder_name)
-                        
-                except Exception as e:
-                    self.logger.debug(f"Error checking message: {e}")
-                    continue
+            # SentOn has minute resolution in Restrict filters
+            restriction = f"[SentOn] >= '{self._outlook_date(since - timedelta(minutes=1))}'"
             
-            self.logger.warning(f"Could not find recent email with subject: {subject}")
-            return False
+            for _ in range(max_passes):
+                if settle_seconds:
+                    time.sleep(settle_seconds)
+                
+                for message in sent_items.Items.Restrict(restriction):
+                    try:
+                        subject = message.Subject
+                        if subject in pending:
+                            self.sent_index.record(subject, message.EntryID, self._to_naive(message.SentOn))
+                            message.Copy().Move(target_folder)
+                            pending.discard(subject)
+                            filed_count += 1
+                    except Exception as e:
+                        self.logger.debug(f"Error filing sent message: {e}")
+                        continue
+                
+                if not pending:
+                    break
             
         except Exception as e:
-            self.logger.error(f"Failed to copy sent email: {e}")
-            return False
+            self.invalidate_folder_cache()
+            self.logger.error(f"Failed to file sent emails into '{folder_name}': {e}")
+        
+        self.sent_index.save()
+        if pending:
+            self.logger.warning(f"Could not find {len(pending)} sent emails in Sent Items to file")
+        self.logger.info(f"Filed {filed_count} sent emails into '{folder_name}'")
+        return filed_count
 
-    def organize_compliance_replies(self, folder_name: str, subject_keywords: List[str] = None) -> int:
+    def organize_compliance_replies(
+        self,
+        folder_name: str,
+        subject_keywords: List[str] = None,
+        agencies: Optional[List[str]] = None
+    ) -> int:
         """
         Find and organize compliance reply emails.
         
         Args:
             folder_name: Target folder for replies
             subject_keywords: Keywords to identify compliance emails
+            agencies: Optional agency list; if given, only replies attributable
+                to one of these agencies are moved
             
         Returns:
             Number of emails organized
@@ -4592,9 +9186,9 @@ class EmailHandler:
             if not subject_keywords:
                 subject_keywords = ["cognos", "access review", "compliance"]
             
-            outlook = self._get_outlook()
-            namespace = outlook.GetNamespace("MAPI")
-            inbox = namespace.GetDefaultFolder(6)  # olFolderInbox
+            matcher = AgencyMatcher(agencies) if agencies else None
+            
+            inbox = self._get_folder("Inbox")
             
             messages = inbox.Items
             organized_count = 0
@@ -4607,6 +9201,8 @@ class EmailHandler:
                     if any(keyword.lower() in subject for keyword in subject_keywords):
                         # Check if it's a reply (contains "re:" or "reply")
                         if "re:" in subject or "reply" in subject or "response" in subject:
+                            if matcher is not None and matcher.match(subject) is None:
+                                continue
                             if self.move_email_to_folder(message, folder_name):
                                 organized_count += 1
                                 
@@ -4618,6 +9214,7 @@ class EmailHandler:
             return organized_count
             
         except Exception as e:
+            self.invalidate_folder_cache()
             self.logger.error(f"Failed to organize replies: {e}")
             return 0
 
@@ -4643,16 +9240,14 @@ class EmailHandler:
             [{"agency": str, "to": str, "cc": str, "sent_date": datetime, "subject": str, "folder": str}]
         """
         try:
-            outlook = self._get_outlook()
-            namespace = outlook.GetNamespace("MAPI")
-            
             # Default keywords for compliance emails
             if not subject_keywords:
                 subject_keywords = ["cognos", "access review", "uar", "user access"]
             
             cutoff_date = datetime.now() - timedelta(days=days_back)
             
-            # Create uppercase agency set for matching
+            # Build the matcher once; each subject is then attributed in one pass
+            matcher = AgencyMatcher(agencies)
             agency_set = {a.upper() for a in agencies}
             
             found_emails = []
@@ -4662,7 +9257,7 @@ class EmailHandler:
             folders_to_scan = []
             
             # Check Inbox subfolders
-            inbox = namespace.GetDefaultFolder(6)  # olFolderInbox
+            inbox = self._get_folder("Inbox")
             try:
                 for folder in inbox.Folders:
                     if folder.Name.lower().startswith("compliance"):
@@ -4672,7 +9267,7 @@ class EmailHandler:
                 self.logger.debug(f"Error scanning Inbox subfolders: {e}")
             
             # Check Sent Items subfolders
-            sent_items = namespace.GetDefaultFolder(5)  # olFolderSentMail
+            sent_items = self._get_folder("Sent Items")
             try:
                 for folder in sent_items.Folders:
                     if folder.Name.lower().startswith("compliance"):
@@ -4683,7 +9278,7 @@ class EmailHandler:
             
             # Also check root-level folders
             try:
-                root_folder = namespace.GetDefaultFolder(6).Parent  # Get mailbox root
+                root_folder = self._get_folder("Root")  # Mailbox root
                 for folder in root_folder.Folders:
                     if folder.Name.lower().startswith("compliance"):
                         folders_to_scan.append((folder, folder.Name))
@@ -4725,32 +9320,27 @@ class EmailHandler:
                                 if not any(kw.lower() in subject_lower for kw in subject_keywords):
                                     continue
                             
-                            # Check if subject contains any of our agencies
-                            for agency in agencies:
+                            # Attribute the subject to the first agency not already found
+                            for agency in matcher.find_all(subject):
                                 agency_upper = agency.upper()
-                                
-                                # Skip if we already found this agency
                                 if agency_upper in processed_agencies:
                                     continue
                                 
-                                # Check if agency name is in the subject
-                                if agency.lower() in subject_lower or agency_upper in subject.upper():
-                                    # Found a match!
-                                    to_addr = str(message.To) if message.To else ""
-                                    cc_addr = str(message.CC) if message.CC else ""
-                                    
-                                    found_emails.append({
-                                        "agency": agency,
-                                        "to": to_addr,
-                                        "cc": cc_addr,
-                                        "sent_date": sent_on,
-                                        "subject": subject,
-                                        "folder": folder_path
-                                    })
-                                    
-                                    processed_agencies.add(agency_upper)
-                                    self.logger.debug(f"Found sent email for: {agency} in {folder_path}")
-                                    break
+                                to_addr = str(message.To) if message.To else ""
+                                cc_addr = str(message.CC) if message.CC else ""
+                                
+                                found_emails.append({
+                                    "agency": agency,
+                                    "to": to_addr,
+                                    "cc": cc_addr,
+                                    "sent_date": sent_on,
+                                    "subject": subject,
+                                    "folder": folder_path
+                                })
+                                
+                                processed_agencies.add(agency_upper)
+                                self.logger.debug(f"Found sent email for: {agency} in {folder_path}")
+                                break
                             
                             # Stop if we found all agencies
                             if len(processed_agencies) >= len(agency_set):
@@ -4772,74 +9362,855 @@ class EmailHandler:
             return found_emails
             
         except Exception as e:
-            self.logger.error(f"Failed to scan compliance folders: {e}")
-            return []
+            self.invalidate_folder_cache()
+            self.logger.error(f"Failed to scan compliance folders: {e}")
+            return []
+    
+    def refresh_sent_index(self, days_back: int = 90) -> int:
+        """
+        Incrementally add recently sent review emails to the sent-message index.
+        
+        Only Sent Items newer than the index watermark (or days_back on the first
+        run) are queried, via Items.Restrict. Messages are indexed if they carry
+        a tracking token or the configured subject prefix.
+        
+        Args:
+            days_back: How far back to look when the index has no watermark
+            
+        Returns:
+            Number of messages indexed
+        """
+        started = datetime.now()
+        cutoff = started - timedelta(days=days_back)
+        index = self.sent_index
+        index._ensure_loaded()
+        since = max(index.watermark - timedelta(minutes=1), cutoff) if index.watermark else cutoff
+        
+        prefix = str(self.config.get("email_subject_prefix", "") or "").lower()
+        indexed = 0
+        try:
+            sent_items = self._get_folder("Sent Items")
+            for message in sent_items.Items.Restrict(f"[SentOn] >= '{self._outlook_date(since)}'"):
+                try:
+                    subject = str(message.Subject)
+                    if extract_tracking_token(subject) or (prefix and prefix in subject.lower()):
+                        index.record(subject, message.EntryID, self._to_naive(message.SentOn))
+                        indexed += 1
+                except Exception as e:
+                    self.logger.debug(f"Error indexing sent message: {e}")
+                    continue
+            
+            index.watermark = started
+            index.save()
+        except Exception as e:
+            self.invalidate_folder_cache()
+            self.logger.error(f"Failed to refresh sent-message index: {e}")
+        
+        self.logger.info(f"Indexed {indexed} sent messages since {since:%Y-%m-%d %H:%M}")
+        return indexed
+    
+    def find_sent_message(
+        self,
+        subject: Optional[str] = None,
+        token: Optional[str] = None,
+        days_back: int = 90
+    ):
+        """
+        Open a previously sent review email through the sent-message index.
+        
+        Args:
+            subject: Exact subject of the original message
+            token: Tracking token of the original message
+            days_back: Search window for the index refresh on a miss
+            
+        Returns:
+            Outlook MailItem or None if not found
+        """
+        for attempt in range(2):
+            entry_id = self.sent_index.lookup(subject=subject, token=token)
+            if entry_id:
+                try:
+                    return self._get_namespace().GetItemFromID(entry_id)
+                except Exception as e:
+                    self.logger.debug(f"Indexed message no longer available ({e}); dropping {entry_id}")
+                    self.sent_index.forget(entry_id)
+            if attempt == 0:
+                self.refresh_sent_index(days_back)
+        return None
+    
+    def send_followup(
+        self,
+        agency: str,
+        original_subject: Optional[str],
+        followup_body: str,
+        days_back: int = 30
+    ) -> bool:
+        """
+        Send follow-up by replying to original email thread.
+        
+        The original is located through the sent-message index, by the
+        agency's tracking token first and the exact subject second.
+        
+        Args:
+            agency: Agency (source file) name
+            original_subject: Subject of original email (defaults to build_subject(agency))
+            followup_body: Body text for the follow-up
+            days_back: How many days back to search for original email
+            
+        Returns:
+            True if follow-up sent successfully
+            
+        Examples:
+            >>> handler = EmailHandler(ConfigManager())
+            >>> handler.send_followup(
+            ...     agency="BBDO Toronto",
+            ...     original_subject=None,
+            ...     followup_body="Friendly reminder: Please respond by EOD Friday."
+            ... )
+        """
+        try:
+            self._reply_to_original(agency, original_subject, followup_body, days_back)
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to send follow-up for {agency}: {e}")
+            return False
+    
+    def _reply_to_original(
+        self,
+        agency: str,
+        original_subject: Optional[str],
+        followup_body: str,
+        days_back: int
+    ) -> None:
+        """
+        Reply to the agency's original review email (see send_followup).
+        
+        Raises:
+            LookupError: If the original email is not in Sent Items
+            Exception: If Outlook fails to create or send the reply
+        """
+        try:
+            original_subject = original_subject or self.build_subject(agency)
+            token = extract_tracking_token(original_subject) or make_tracking_token(
+                self.config.get("review_period", "Q2 2025"), agency
+            )
+            
+            original_email = self.find_sent_message(subject=original_subject, token=token, days_back=days_back)
+            
+            # Emails sent before tokens were lengthened carry the shorter prefix of the same digest
+            period_code, digest = token.rsplit("-", 1)
+            if not original_email and len(digest) == TRACKING_TOKEN_DIGEST_LENGTH:
+                short_token = f"{period_code}-{digest[:LEGACY_TRACKING_TOKEN_DIGEST_LENGTH]}"
+                original_email = self.find_sent_message(
+                    subject=original_subject.replace(token, short_token), token=short_token, days_back=days_back
+                )
+            
+            # Emails sent before tracking tokens were introduced have no token in the subject
+            legacy_subject = original_subject.replace(f" [{token}]", "")
+            if not original_email and legacy_subject != original_subject:
+                original_email = self.find_sent_message(subject=legacy_subject, days_back=days_back)
+            
+            if not original_email:
+                raise LookupError(f"Original email not found for: {agency}")
+            
+            # Create reply
+            reply = original_email.Reply()
+            reply.Body = followup_body + "\n\n" + "-" * 40 + "\n\n" + reply.Body
+            self.rate_limiter.dispatch(
+                reply.Send,
+                recipient_count=SendRateLimiter.count_recipients(str(reply.To or ""), str(reply.CC or "")),
+                description=f"follow-up for {agency}"
+            )
+            
+            self.logger.info(f"Follow-up sent for: {agency}")
+            
+        except LookupError:
+            raise
+        except Exception:
+            self.invalidate_folder_cache()
+            raise
+    
+    def remind_overdue(
+        self,
+        agencies: List[str],
+        followup_template: str,
+        days_back: int = 90,
+        progress_callback: Optional[callable] = None,
+        result_callback: Optional[Callable[[str, bool, Optional[str]], None]] = None,
+        errors: Optional[Dict[str, str]] = None
+    ) -> Dict[str, bool]:
+        """
+        Send reply-to-thread reminders to a list of overdue agencies.
+        
+        The sent-message index is refreshed once up front, so each reminder
+        costs one GetItemFromID call instead of a Sent Items scan.
+        
+        Args:
+            agencies: Agency (source file) names to remind
+            followup_template: Reminder body; {agency} and {deadline} are substituted
+            days_back: Search window for original emails
+            progress_callback: Optional callback(progress, message) with progress 0-100
+            result_callback: Optional callback(agency, success, error) after each
+                reminder; error is the failure reason, None when sent
+            errors: Optional dictionary filled with agency -> failure reason
+            
+        Returns:
+            Dictionary mapping agency to whether the reminder was sent
+        """
+        self.refresh_sent_index(days_back)
+        deadline = self.config.get("deadline", "TBD")
+        
+        results = {}
+        total = len(agencies)
+        for idx, agency in enumerate(agencies):
+            if progress_callback:
+                progress_callback((idx / total) * 100, f"Reminding {agency} ({idx + 1} of {total})...")
+            body = followup_template.replace("{agency}", agency).replace("{deadline}", deadline)
+            error = None
+            try:
+                self._reply_to_original(agency, None, body, days_back)
+            except LookupError as e:
+                error = str(e)
+                self.logger.warning(error)
+            except Exception as e:
+                error = f"Send failed: {e}"
+                self.logger.error(f"Failed to send follow-up for {agency}: {e}")
+            results[agency] = error is None
+            if error is not None and errors is not None:
+                errors[agency] = error
+            if result_callback:
+                result_callback(agency, results[agency], error)
+        
+        if progress_callback:
+            progress_callback(100, "Complete!")
+        
+        self.logger.info(f"Sent {sum(results.values())} of {total} overdue reminders")
+        return results
+
+
+# ============ MODULE: mail_transport ============
+# Mail access behind a small interface, so reply processing can run against
+# Outlook or a local maildir (tests, exported mail)
+
+@dataclass
+class TransportAttachment:
+    """An attachment whose content is only read when needed."""
+    file_name: str
+    read: Callable[[], bytes] = field(repr=False)
+
+
+@dataclass
+class TransportMessage:
+    """Transport-neutral view of a received message."""
+    message_id: str
+    subject: str
+    sender: str
+    received: datetime
+    attachments: List[TransportAttachment] = field(default_factory=list)
+
+
+class MailTransport:
+    """
+    Read-only access to received mail.
+    
+    Subclasses yield TransportMessage objects for a folder, optionally only
+    those received since a given time. Attachment content is loaded lazily.
+    """
+    
+    def iter_messages(self, folder: str, since: Optional[datetime] = None) -> Iterator[TransportMessage]:
+        """
+        Yield messages in a folder.
+        
+        Args:
+            folder: Folder path (transport specific, e.g. "Inbox/Compliance Q3 2025 - Replies")
+            since: Only messages received at or after this time
+        
+        Yields:
+            TransportMessage for each message
+        """
+        raise NotImplementedError
+
+
+class OutlookTransport(MailTransport):
+    """
+    MailTransport over Outlook, using an EmailHandler's cached folder handles.
+    
+    Only messages with attachments are returned; the DASL filter is pushed down
+    to Outlook so other mail is never loaded.
+    """
+    
+    def __init__(self, email_handler: 'EmailHandler'):
+        """
+        Initialize Outlook transport.
+        
+        Args:
+            email_handler: Connected email handler
+        """
+        self.email_handler = email_handler
+        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+    
+    @staticmethod
+    def _attachment_reader(attachment) -> Callable[[], bytes]:
+        """Read an Outlook attachment by saving it to a temporary file."""
+        def read() -> bytes:
+            with tempfile.TemporaryDirectory(prefix="car_harvest_") as tmp:
+                path = Path(tmp) / "attachment"
+                attachment.SaveAsFile(str(path))
+                return path.read_bytes()
+        return read
+    
+    def iter_messages(self, folder: str, since: Optional[datetime] = None) -> Iterator[TransportMessage]:
+        target = self.email_handler._get_folder(folder)
+        conditions = ["\"urn:schemas:httpmail:hasattachment\" = 1"]
+        if since:
+            since_utc = since.astimezone(pytz.utc).replace(tzinfo=None)
+            conditions.append(f"\"urn:schemas:httpmail:datereceived\" >= '{EmailHandler._outlook_date(since_utc)}'")
+        items = target.Items.Restrict("@SQL=" + " AND ".join(conditions))
+        
+        for item in items:
+            try:
+                attachments = [
+                    TransportAttachment(str(attachment.FileName), self._attachment_reader(attachment))
+                    for attachment in item.Attachments
+                ]
+                yield TransportMessage(
+                    message_id=str(item.EntryID),
+                    subject=str(item.Subject or ""),
+                    sender=str(item.SenderEmailAddress or ""),
+                    received=EmailHandler._to_naive(item.ReceivedTime),
+                    attachments=attachments
+                )
+            except Exception as e:
+                self.logger.debug(f"Skipping unreadable item: {e}")
+                continue
+
+
+class MaildirTransport(MailTransport):
+    """
+    MailTransport over a local maildir.
+    
+    The folder "Inbox" (or "") is the maildir root; any other folder is a
+    maildir subfolder ("Compliance Q3 2025 - Replies" or ".Compliance...").
+    
+    Examples:
+        >>> transport = MaildirTransport(Path("test_mail"))
+        >>> for message in transport.iter_messages("Inbox"):
+        ...     print(message.subject, [a.file_name for a in message.attachments])
+    """
+    
+    def __init__(self, root: Path):
+        """
+        Initialize maildir transport.
+        
+        Args:
+            root: Maildir root directory (contains cur/new/tmp)
+        """
+        self.root = Path(root)
+        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+    
+    def _open_folder(self, folder: str) -> mailbox.Maildir:
+        maildir = mailbox.Maildir(self.root, create=False)
+        name = folder.split("/")[-1] if folder else ""
+        if name.lower() in ("", "inbox"):
+            return maildir
+        return maildir.get_folder(name.lstrip("."))
+    
+    def iter_messages(self, folder: str, since: Optional[datetime] = None) -> Iterator[TransportMessage]:
+        for key, message in self._open_folder(folder).iteritems():
+            try:
+                received = parsedate_to_datetime(message["Date"]) if message["Date"] else None
+                if received is None:
+                    received = datetime.fromtimestamp(message.get_date())
+                elif received.tzinfo is not None:
+                    received = received.astimezone().replace(tzinfo=None)
+                if since and received < since:
+                    continue
+                
+                attachments = []
+                for part in message.walk():
+                    file_name = part.get_filename()
+                    if file_name:
+                        attachments.append(TransportAttachment(file_name, lambda part=part: part.get_payload(decode=True) or b""))
+                if not attachments:
+                    continue
+                
+                yield TransportMessage(
+                    message_id=str(message["Message-ID"] or key),
+                    subject=str(message["Subject"] or ""),
+                    sender=parseaddr(str(message["From"] or ""))[1],
+                    received=received,
+                    attachments=attachments
+                )
+            except Exception as e:
+                self.logger.debug(f"Skipping unreadable message {key}: {e}")
+                continue
+
+
+class ReplyAttachmentHarvester:
+    """
+    Saves returned review workbooks from reply attachments.
+    
+    Walks a reply folder incrementally (per-folder received watermark), picks
+    xlsx attachments that belong to a generated file - by the tracking token
+    in the subject or by the attachment name - and saves them to the returns
+    folder. Content already harvested (same SHA-256) is skipped, so resent or
+    forwarded copies are saved once.
+    
+    Examples:
+        >>> harvester = ReplyAttachmentHarvester(
+        ...     MaildirTransport(Path("test_mail")), Path("output"), ["BBDO Toronto"]
+        ... )
+        >>> for result in harvester.harvest("Inbox"):
+        ...     print(result["file_name"], result["saved_path"])
+    """
+    
+    def __init__(
+        self,
+        transport: MailTransport,
+        output_dir: Path,
+        file_names: List[str],
+        tracking_index: Optional[Dict[str, "str | List[str]"]] = None
+    ):
+        """
+        Initialize harvester.
+        
+        Args:
+            transport: Mail transport to read replies from
+            output_dir: Output directory (returns folder and state live here)
+            file_names: Generated file names (without extension) to match against
+            tracking_index: Optional token -> source file(s) index (AuditLogger.load_tracking_index())
+        """
+        self.transport = transport
+        self.output_dir = Path(output_dir)
+        self.returns_dir = self.output_dir / FileNames.RETURNS_DIR
+        self.state_path = self.output_dir / FileNames.HARVEST_STATE
+        self.file_names = list(file_names)
+        self.tracking_index = {k.upper(): v for k, v in (tracking_index or {}).items()}
+        self.matcher = AgencyMatcher(self.file_names)
+        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+    
+    def _load_state(self) -> dict:
+        if self.state_path.exists():
+            try:
+                with open(self.state_path, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except Exception as e:
+                self.logger.warning(f"Could not read harvest state, starting fresh: {e}")
+        return {"folders": {}, "hashes": {}}
+    
+    def _save_state(self, state: dict) -> None:
+        try:
+            with open(self.state_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            self.logger.warning(f"Could not save harvest state: {e}")
+    
+    def match_file(self, subject: str, attachment_name: str) -> Optional[str]:
+        """
+        Find the generated file an attachment was returned for.
+        
+        Args:
+            subject: Subject of the reply
+            attachment_name: Attachment file name
+        
+        Returns:
+            Source file name or None if it is not one of ours
+        """
+        stem = Path(attachment_name).stem
+        token = extract_tracking_token(subject)
+        source = self.tracking_index.get(token) if token else None
+        if isinstance(source, str):
+            return source
+        if source:
+            # Digest reply: pick the member the attachment is named after
+            return AgencyMatcher(source).match(stem)
+        return self.matcher.match(stem)
+    
+    def harvest(self, folder: str) -> List[Dict[str, str]]:
+        """
+        Save new returned workbooks from a folder.
+        
+        Args:
+            folder: Folder to walk (transport specific path)
+        
+        Returns:
+            One dict per saved workbook: file_name, saved_path, sender,
+            received and content_hash
+        """
+        state = self._load_state()
+        folder_state = state["folders"].get(folder, {})
+        watermark = folder_state.get("last_received")
+        since = datetime.strptime(watermark, "%Y-%m-%d %H:%M:%S") - timedelta(minutes=1) if watermark else None
+        seen_ids = set(folder_state.get("message_ids", []))
+        
+        results = []
+        newest = datetime.strptime(watermark, "%Y-%m-%d %H:%M:%S") if watermark else None
+        boundary_ids = []
+        self.returns_dir.mkdir(parents=True, exist_ok=True)
+        
+        for message in self.transport.iter_messages(folder, since):
+            if message.message_id in seen_ids:
+                continue
+            if newest is None or message.received > newest:
+                newest = message.received
+            boundary_ids.append((message.received, message.message_id))
+            
+            for attachment in message.attachments:
+                if not attachment.file_name.lower().endswith(".xlsx"):
+                    continue
+                file_name = self.match_file(message.subject, attachment.file_name)
+                if file_name is None:
+                    continue
+                
+                content = attachment.read()
+                content_hash = hashlib.sha256(content).hexdigest()
+                if content_hash in state["hashes"]:
+                    self.logger.debug(f"Already harvested {attachment.file_name} ({content_hash[:12]})")
+                    continue
+                
+                saved_path = self.returns_dir / (
+                    sanitize_filename(f"{file_name} - returned {message.received:%Y%m%d_%H%M%S}") + ".xlsx"
+                )
+                saved_path.write_bytes(content)
+                state["hashes"][content_hash] = str(saved_path)
+                results.append({
+                    "file_name": file_name,
+                    "saved_path": str(saved_path),
+                    "sender": message.sender,
+                    "received": message.received.strftime("%Y-%m-%d %H:%M"),
+                    "content_hash": content_hash
+                })
+                self.logger.info(f"Harvested {attachment.file_name} for {file_name}")
+        
+        # Advance the watermark; keep IDs near it so the next overlapping walk skips them
+        if newest is not None:
+            cutoff = newest - timedelta(minutes=2)
+            kept_ids = [mid for received, mid in boundary_ids if received >= cutoff]
+            if watermark and datetime.strptime(watermark, "%Y-%m-%d %H:%M:%S") >= cutoff:
+                kept_ids.extend(seen_ids)
+            state["folders"][folder] = {
+                "last_received": newest.strftime("%Y-%m-%d %H:%M:%S"),
+                "message_ids": sorted(set(kept_ids))
+            }
+        self._save_state(state)
+        
+        self.logger.info(f"Harvested {len(results)} returned workbooks from {folder}")
+        return results
+
+
+# ============ MODULE: review_ingestion ============
+# Consolidates reviewer decisions from returned workbooks
+
+# Columns that identify a generated row; whichever of these the generated
+# file has are hashed to check a returned row against the original slice
+REVIEW_KEY_COLUMNS = [
+    ColumnNames.AGENCY,
+    ColumnNames.DOMAIN,
+    ColumnNames.USER_NAME,
+    ColumnNames.USERNAME,
+    ColumnNames.EMAIL,
+    ColumnNames.EMAIL_ADDRESS,
+    ColumnNames.COUNTRY,
+    ColumnNames.PROFILE_NAME,
+    ColumnNames.REGION,
+    ColumnNames.FOLDER,
+    ColumnNames.SUBFOLDER
+]
+
+# Free-text Review Action wording -> decision (earliest match in the text wins)
+REVIEW_ACTION_PATTERNS = [
+    (ReviewDecision.KEEP, re.compile(r"\b(keep|retain|approved?|no change|ok|okay|valid|yes)\b", re.IGNORECASE)),
+    (ReviewDecision.REVOKE, re.compile(r"\b(revoke|remove|delete|terminated?|disable|deactivate|no longer)\b", re.IGNORECASE)),
+    (ReviewDecision.MODIFY, re.compile(r"\b(modify|change|update|move|replace|downgrade|upgrade)\b", re.IGNORECASE))
+]
+
+
+def normalize_review_action(value) -> ReviewDecision:
+    """
+    Map a reviewer's Review Action entry to a decision.
+    
+    Args:
+        value: Cell value from the Review Action column
+    
+    Returns:
+        ReviewDecision (PENDING for blank cells, UNCLEAR when no wording matches)
+    
+    Examples:
+        >>> normalize_review_action("Remove - left company")
+        <ReviewDecision.REVOKE: 'Revoke'>
+        >>> normalize_review_action("No change")
+        <ReviewDecision.KEEP: 'Keep'>
+    """
+    if value is None or pd.isna(value) or not str(value).strip():
+        return ReviewDecision.PENDING
+    
+    text = str(value).strip()
+    best, best_pos = ReviewDecision.UNCLEAR, len(text) + 1
+    for decision, pattern in REVIEW_ACTION_PATTERNS:
+        match = pattern.search(text)
+        if match and match.start() < best_pos:
+            best, best_pos = decision, match.start()
+    return best
+
+
+def hash_review_rows(df: pd.DataFrame, columns: List[str]) -> pd.Series:
+    """
+    Hash the identifying columns of each row, ignoring case and padding.
+    
+    Args:
+        df: Rows to hash
+        columns: Columns to include (in order)
+    
+    Returns:
+        Series of uint64 row hashes aligned with df
+    """
+    normalized = df[columns].fillna("").astype(str).apply(lambda col: col.str.strip().str.upper())
+    return pd.util.hash_pandas_object(normalized, index=False)
+
+
+@dataclass
+class ReturnedFileResult:
+    """Outcome of ingesting one returned workbook."""
+    file_name: str
+    returned_path: Path
+    decisions: pd.DataFrame = field(default_factory=pd.DataFrame, repr=False)
+    total_rows: int = 0
+    decided_rows: int = 0
+    unchanged_rows: int = 0
+    altered_rows: int = 0
+    missing_rows: int = 0
+    duplicated_rows: int = 0
+    error: str = ""
+    
+    @property
+    def completeness(self) -> float:
+        """Share of the generated rows that carry a decision (0-100)."""
+        return (self.decided_rows / self.total_rows * 100) if self.total_rows else 0.0
+    
+    def summary(self) -> str:
+        """One-line completeness note for the audit log."""
+        if self.error:
+            return f"Not ingested: {self.error}"
+        text = f"{self.decided_rows}/{self.total_rows} decided ({self.completeness:.0f}%)"
+        if self.altered_rows or self.missing_rows:
+            text += f"; {self.altered_rows} rows not in generated file, {self.missing_rows} rows missing"
+        if self.duplicated_rows:
+            text += f"; {self.duplicated_rows} duplicated rows"
+        return text
+
+
+class ReviewDecisionIngestor:
+    """
+    Reads returned review workbooks and consolidates their decisions.
+    
+    Each returned file is read concurrently, and only its User Access List
+    sheet and the key, Review Action and Comments columns are parsed. Each
+    returned row is hashed on its key columns and checked against the
+    generated workbook, so rows that were edited, added or deleted by the
+    reviewer are reported. The result is one table of Keep/Revoke/Modify
+    decisions per user and folder.
+    
+    Examples:
+        >>> ingestor = ReviewDecisionIngestor(Path("output"))
+        >>> decisions, results = ingestor.ingest({"BBDO Toronto": Path("output/Returned Reviews/BBDO Toronto - returned 20250902_100000.xlsx")})
+        >>> ingestor.export(decisions, results)
+    """
+    
+    def __init__(self, output_dir: Path, max_workers: int = 8):
+        """
+        Initialize ingestor.
+        
+        Args:
+            output_dir: Directory containing the generated agency files
+            max_workers: Number of workbooks read concurrently
+        """
+        self.output_dir = Path(output_dir)
+        self.max_workers = max_workers
+        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+    
+    @staticmethod
+    def _read_user_access_list(path: Path, columns: List[str]) -> pd.DataFrame:
+        """Read only the wanted columns of the User Access List sheet, as text."""
+        wanted = set(columns)
+        return pd.read_excel(
+            path,
+            sheet_name=SheetNames.USER_ACCESS_LIST,
+            usecols=lambda c: str(c).strip() in wanted,
+            dtype=str
+        ).rename(columns=lambda c: str(c).strip())
+    
+    def ingest_file(self, file_name: str, returned_path: Path) -> ReturnedFileResult:
+        """
+        Ingest one returned workbook.
+        
+        Args:
+            file_name: Generated file name (without extension)
+            returned_path: Path of the returned workbook
+        
+        Returns:
+            ReturnedFileResult with the file's decision rows and row checks
+        """
+        result = ReturnedFileResult(file_name=file_name, returned_path=Path(returned_path))
+        generated_path = self.output_dir / f"{file_name}.xlsx"
+        try:
+            generated = self._read_user_access_list(generated_path, REVIEW_KEY_COLUMNS)
+            key_columns = [c for c in REVIEW_KEY_COLUMNS if c in generated.columns]
+            if not key_columns:
+                raise ValueError(f"no key columns in {generated_path.name}")
+            
+            returned = self._read_user_access_list(
+                returned_path, key_columns + [ColumnNames.REVIEW_ACTION, ColumnNames.REVIEW_COMMENTS]
+            )
+            missing_columns = [c for c in key_columns + [ColumnNames.REVIEW_ACTION] if c not in returned.columns]
+            if missing_columns:
+                raise ValueError(f"missing columns {missing_columns}")
+        except Exception as e:
+            result.error = str(e)
+            self.logger.warning(f"Could not ingest {file_name}: {e}")
+            return result
+        
+        if ColumnNames.REVIEW_COMMENTS not in returned.columns:
+            returned[ColumnNames.REVIEW_COMMENTS] = ""
+        
+        generated_hashes = hash_review_rows(generated, key_columns)
+        returned_hashes = hash_review_rows(returned, key_columns)
+        in_generated = returned_hashes.isin(set(generated_hashes))
+        
+        decisions = returned[key_columns].copy()
+        decisions.insert(0, ColumnNames.SOURCE_FILE_NAME, file_name)
+        decisions["Decision"] = returned[ColumnNames.REVIEW_ACTION].map(lambda v: normalize_review_action(v).value)
+        decisions[ColumnNames.REVIEW_ACTION] = returned[ColumnNames.REVIEW_ACTION].fillna("")
+        decisions[ColumnNames.REVIEW_COMMENTS] = returned[ColumnNames.REVIEW_COMMENTS].fillna("")
+        decisions["Row Check"] = in_generated.map({True: "Matched", False: "Not in generated file"})
+        
+        result.decisions = decisions
+        result.total_rows = len(generated)
+        result.unchanged_rows = int(in_generated.sum())
+        result.altered_rows = int((~in_generated).sum())
+        result.missing_rows = int((~generated_hashes.isin(set(returned_hashes))).sum())
+        result.duplicated_rows = int(returned_hashes[in_generated].duplicated().sum())
+        # Count distinct generated rows so a copied row can't push completeness past 100%
+        decided = decisions["Decision"] != ReviewDecision.PENDING.value
+        result.decided_rows = int(returned_hashes[in_generated & decided].nunique())
+        return result
     
-    def send_followup(
+    def ingest(self, returned_files: Dict[str, Path]) -> Tuple[pd.DataFrame, List[ReturnedFileResult]]:
+        """
+        Ingest returned workbooks concurrently and consolidate their decisions.
+        
+        Args:
+            returned_files: Generated file name -> returned workbook path
+        
+        Returns:
+            Tuple of (consolidated decisions, per-file results). The decisions
+            have one row per user and folder; a user/folder with different
+            decisions in different files is flagged in the Conflict column.
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="review-ingest") as executor:
+            results = list(executor.map(lambda item: self.ingest_file(*item), returned_files.items()))
+        
+        frames = [r.decisions for r in results if not r.decisions.empty]
+        if not frames:
+            return pd.DataFrame(), results
+        decisions = pd.concat(frames, ignore_index=True)
+        
+        user_column = next((c for c in [ColumnNames.USER_NAME, ColumnNames.USERNAME, ColumnNames.EMAIL, ColumnNames.EMAIL_ADDRESS] if c in decisions.columns), None)
+        group_columns = [c for c in [user_column, ColumnNames.FOLDER, ColumnNames.SUBFOLDER] if c and c in decisions.columns]
+        if group_columns:
+            decisions = decisions.drop_duplicates(subset=group_columns + ["Decision"])
+            keys = decisions[group_columns].fillna("").apply(lambda col: col.str.strip().str.upper())
+            distinct = decisions.groupby([keys[c] for c in group_columns])["Decision"].transform("nunique")
+            decisions["Conflict"] = distinct > 1
+            decisions = decisions.sort_values(group_columns, kind="stable", ignore_index=True)
+        
+        self.logger.info(
+            f"Ingested {sum(1 for r in results if not r.error)}/{len(results)} returned files, "
+            f"{len(decisions)} decision rows"
+        )
+        return decisions, results
+    
+    @staticmethod
+    def completeness_by_agency(decisions: pd.DataFrame) -> pd.DataFrame:
+        """
+        Summarize decided rows per agency.
+        
+        Args:
+            decisions: Consolidated decisions from ingest()
+        
+        Returns:
+            DataFrame with Agency, Rows, one column per decision and Completeness %
+        """
+        if decisions.empty or ColumnNames.AGENCY not in decisions.columns:
+            return pd.DataFrame()
+        
+        matched = decisions[decisions["Row Check"] == "Matched"]
+        summary = pd.crosstab(matched[ColumnNames.AGENCY], matched["Decision"])
+        for decision in ReviewDecision:
+            if decision.value not in summary.columns:
+                summary[decision.value] = 0
+        summary = summary[[d.value for d in ReviewDecision]]
+        summary.insert(0, "Rows", summary.sum(axis=1))
+        summary["Completeness %"] = ((summary["Rows"] - summary[ReviewDecision.PENDING.value]) / summary["Rows"] * 100).round(1)
+        return summary.reset_index()
+    
+    def export(
         self,
-        agency: str,
-        original_subject: str,
-        followup_body: str,
-        days_back: int = 30
-    ) -> bool:
+        decisions: pd.DataFrame,
+        results: List[ReturnedFileResult],
+        stem: str = FileNames.CONSOLIDATED_DECISIONS
+    ) -> List[Path]:
         """
-        Send follow-up by replying to original email thread.
+        Write the consolidated decisions as xlsx, CSV and Parquet.
         
-        This finds the original sent email and creates a reply to maintain thread continuity.
+        The xlsx also has Completeness (per agency) and Files (per returned
+        workbook) sheets. Parquet is skipped when no Parquet engine is installed.
         
         Args:
-            agency: Agency name to find
-            original_subject: Subject of original email
-            followup_body: Body text for the follow-up
-            days_back: How many days back to search for original email
-            
+            decisions: Consolidated decisions from ingest()
+            results: Per-file results from ingest()
+            stem: Output file name without extension
+        
         Returns:
-            True if follow-up sent successfully
-            
-        Examples:
-            >>> handler = EmailHandler(ConfigManager())
-            >>> handler.send_followup(
-            ...     agency="BBDO Toronto",
-            ...     original_subject="[ACTION REQUIRED] Cognos Access Review - Q4 FY25",
-            ...     followup_body="Friendly reminder: Please respond by EOD Friday."
-            ... )
+            Paths of the files written
         """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        files = pd.DataFrame([{
+            ColumnNames.SOURCE_FILE_NAME: r.file_name,
+            "Returned File": str(r.returned_path),
+            "Rows": r.total_rows,
+            "Decided": r.decided_rows,
+            "Completeness %": round(r.completeness, 1),
+            "Not In Generated File": r.altered_rows,
+            "Missing Rows": r.missing_rows,
+            "Duplicated Rows": r.duplicated_rows,
+            "Error": r.error
+        } for r in results])
+        
+        written = []
+        xlsx_path = self.output_dir / f"{stem}.xlsx"
+        with pd.ExcelWriter(xlsx_path, engine="xlsxwriter") as writer:
+            for sheet_name, frame in [
+                ("Decisions", decisions),
+                ("Completeness", self.completeness_by_agency(decisions)),
+                ("Files", files)
+            ]:
+                frame.to_excel(writer, sheet_name=sheet_name, index=False)
+                format_worksheet(writer, sheet_name, frame)
+        written.append(xlsx_path)
+        
+        csv_path = self.output_dir / f"{stem}.csv"
+        decisions.to_csv(csv_path, index=False, encoding='utf-8-sig')
+        written.append(csv_path)
+        
+        parquet_path = self.output_dir / f"{stem}.parquet"
         try:
-            outlook = self._get_outlook()
-            namespace = outlook.GetNamespace("MAPI")
-            sent_items = namespace.GetDefaultFolder(5)  # olFolderSentMail
-            
-            # Search for original email
-            cutoff_date = datetime.now() - timedelta(days=days_back)
-            messages = sent_items.Items
-            messages.Sort("[SentOn]", True)
-            
-            original_email = None
-            for message in messages:
-                try:
-                    if (message.Subject == original_subject and 
-                        message.SentOn >= cutoff_date):
-                        original_email = message
-                        break
-                except Exception as e:
-                    self.logger.debug(f"Error checking message: {e}")
-                    continue
-            
-            if not original_email:
-                self.logger.warning(f"Original email not found for: {agency}")
-                return False
-            
-            # Create reply
-            reply = original_email.Reply()
-            reply.Body = followup_body + "\n\n" + "-" * 40 + "\n\n" + reply.Body
-            reply.Send()
-            
-            self.logger.info(f"Follow-up sent for: {agency}")
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Failed to send follow-up for {agency}: {e}")
-            return False
+            decisions.to_parquet(parquet_path, index=False)
+            written.append(parquet_path)
+        except ImportError as e:
+            self.logger.warning(f"Parquet export skipped (no engine installed): {e}")
+        
+        self.logger.info(f"Exported consolidated decisions: {', '.join(p.name for p in written)}")
+        return written
 
 
 # ============ MODULE: report_generator ============
@@ -4852,9 +10223,11 @@ class ReportGenerator:
     Generates SOX compliance reports in multiple formats.
     
     Supports summary, detailed, and exception reports in Excel and PDF formats.
+    With an AuditArchive, reports also include cross-period history: repeat
+    offenders, response latency per period and per-reviewer totals.
     
     Examples:
-        >>> generator = ReportGenerator(output_dir=Path("reports"))
+        >>> generator = ReportGenerator(output_dir=Path("reports"), archive=AuditArchive(Path("audit_archive.db")))
         >>> report_path = generator.generate_compliance_report(
         ...     audit_df=audit_data,
         ...     metrics=dashboard_metrics,
@@ -4863,34 +10236,62 @@ class ReportGenerator:
         ... )
     """
     
-    def __init__(self, output_dir: Optional[Path] = None):
+    def __init__(self, output_dir: Optional[Path] = None, archive: Optional[AuditArchive] = None):
         """
         Initialize report generator.
         
         Args:
             output_dir: Directory for report output
+            archive: Optional audit archive for the cross-period history sections
         """
         self.output_dir = Path(output_dir) if output_dir else Path("reports")
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.archive = archive
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
     
+    def history(self, region: Optional[str] = None) -> Dict[str, pd.DataFrame]:
+        """
+        Cross-period history tables from the archive.
+        
+        Args:
+            region: Only this region (repeat offenders and latency)
+        
+        Returns:
+            Section title -> table (empty if there is no archive or it is unavailable)
+        """
+        if self.archive is None:
+            return {}
+        periods = int(config_manager.get("repeat_offender_periods", ConfigManager.DEFAULT_CONFIG["repeat_offender_periods"]))
+        try:
+            return {
+                "Repeat Offenders": self.archive.repeat_offenders(periods, region=region),
+                "Response Latency": self.archive.latency_distribution(periods, region=region),
+                "Reviewer Summary": self.archive.reviewer_summary(periods)
+            }
+        except Exception as e:
+            self.logger.error(f"Failed to read audit archive: {e}")
+            return {}
+    
     def generate_compliance_report(
         self,
         audit_df: pd.DataFrame,
-        metrics: DashboardMetrics,
+        metrics: Optional[DashboardMetrics] = None,
         report_type: str = "summary",
         output_format: str = "xlsx",
-        review_period: str = "Q4 FY25"
+        review_period: str = "Q4 FY25",
+        region: Optional[str] = None
     ) -> str:
         """
         Generate SOX compliance report.
         
         Args:
             audit_df: Audit log DataFrame
-            metrics: Dashboard metrics
+            metrics: Dashboard metrics (computed from audit_df against the
+                configured deadline if omitted)
             report_type: "summary", "detailed", or "exceptions"
             output_format: "xlsx" or "pdf"
             review_period: Review period string
+            region: Region the report covers (filters the archive history)
             
         Returns:
             Path to generated report file
@@ -4904,15 +10305,19 @@ class ReportGenerator:
         if output_format not in ["xlsx", "pdf"]:
             raise ValueError(f"Invalid output_format: {output_format}")
         
+        if metrics is None:
+            metrics = compute_audit_metrics(audit_df, config_manager.get("deadline"))
+        
         # Generate filename
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"SOX_Compliance_Report_{report_type.title()}_{review_period.replace(' ', '_')}_{timestamp}.{output_format}"
         output_path = self.output_dir / filename
         
+        history = self.history(region)
         if output_format == "xlsx":
-            return self._generate_excel_report(audit_df, metrics, report_type, output_path, review_period)
+            return self._generate_excel_report(audit_df, metrics, report_type, output_path, review_period, history)
         else:  # pdf
-            return self._generate_pdf_report(audit_df, metrics, report_type, output_path, review_period)
+            return self._generate_pdf_report(audit_df, metrics, report_type, output_path, review_period, history)
     
     def _generate_excel_report(
         self,
@@ -4920,7 +10325,8 @@ class ReportGenerator:
         metrics: DashboardMetrics,
         report_type: str,
         output_path: Path,
-        review_period: str
+        review_period: str,
+        history: Optional[Dict[str, pd.DataFrame]] = None
     ) -> str:
         """Generate Excel format report."""
         try:
@@ -5033,8 +10439,7 @@ class ReportGenerator:
                 elif report_type == "exceptions":
                     # Only show items requiring action
                     exceptions = audit_df[
-                        (audit_df['Status'] == 'Not Sent') | 
-                        (audit_df['Status'] == 'Overdue')
+                        effective_audit_status(audit_df).isin([AuditStatus.NOT_SENT.value, AuditStatus.OVERDUE.value])
                     ]
                     
                     exceptions.to_excel(writer, sheet_name="Action Required", index=False)
@@ -5050,6 +10455,19 @@ class ReportGenerator:
                             len(str(col))
                         )
                         exc_sheet.set_column(i, i, min(max_len + 2, 50))
+                
+                # Cross-period history from the audit archive
+                for title, history_df in (history or {}).items():
+                    history_df.to_excel(writer, sheet_name=title, index=False)
+                    history_sheet = writer.sheets[title]
+                    for col_num, value in enumerate(history_df.columns.values):
+                        history_sheet.write(0, col_num, value, header_format)
+                    for i, col in enumerate(history_df.columns):
+                        max_len = max(
+                            history_df[col].map(lambda value: len(str(value))).max() if not history_df.empty else 10,
+                            len(str(col))
+                        )
+                        history_sheet.set_column(i, i, min(max_len + 2, 50))
             
             self.logger.info(f"Excel report generated: {output_path}")
             return str(output_path)
@@ -5064,7 +10482,8 @@ class ReportGenerator:
         metrics: DashboardMetrics,
         report_type: str,
         output_path: Path,
-        review_period: str
+        review_period: str,
+        history: Optional[Dict[str, pd.DataFrame]] = None
     ) -> str:
         """
         Generate PDF format report.
@@ -5077,7 +10496,7 @@ class ReportGenerator:
             # Alternatively, generate Excel and provide instructions for PDF export
             
             # Simple approach: Generate HTML report
-            html_content = self._generate_html_report(audit_df, metrics, report_type, review_period)
+            html_content = self._generate_html_report(audit_df, metrics, report_type, review_period, history)
             
             # Save as HTML (can be opened in browser and printed to PDF)
             html_path = output_path.with_suffix('.html')
@@ -5096,7 +10515,8 @@ class ReportGenerator:
         audit_df: pd.DataFrame,
         metrics: DashboardMetrics,
         report_type: str,
-        review_period: str
+        review_period: str,
+        history: Optional[Dict[str, pd.DataFrame]] = None
     ) -> str:
         """Generate HTML content for report."""
         
@@ -5143,14 +10563,19 @@ class ReportGenerator:
             """
         elif report_type == "exceptions":
             exceptions = audit_df[
-                (audit_df['Status'] == 'Not Sent') | 
-                (audit_df['Status'] == 'Overdue')
+                effective_audit_status(audit_df).isin([AuditStatus.NOT_SENT.value, AuditStatus.OVERDUE.value])
             ]
             html += f"""
             <h2>Items Requiring Action</h2>
             {exceptions.to_html(index=False, classes='audit-table')}
             """
         
+        for title, history_df in (history or {}).items():
+            html += f"""
+            <h2>{title}</h2>
+            {history_df.to_html(index=False, classes='audit-table', na_rep='')}
+            """
+        
         html += """
         </body>
         </html>
@@ -5441,7 +10866,7 @@ class EmailManifestManager:
     
     def create_backup(self, backup_dir: str = "backups") -> Optional[str]:
         """
-        Create timestamped backup of current manifest.
+        Create timestamped backup of current manifest (skipped if its data is unchanged).
         
         Args:
             backup_dir: Directory to store backups
@@ -5450,14 +10875,8 @@ class EmailManifestManager:
             Path to backup file, or None if failed
         """
         try:
-            backup_path = Path(backup_dir)
-            backup_path.mkdir(parents=True, exist_ok=True)
-            
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_file = backup_path / f"{timestamp}_{self.manifest_file.name}"
-            
-            self.df.to_excel(backup_file, index=False)
-            logger.info(f"Created email manifest backup: {backup_file}")
+            backup_file = BackupService.from_config(Path(backup_dir)).backup_frame(self.df, self.manifest_file.name)
+            logger.info(f"Email manifest backup: {backup_file}")
             return str(backup_file)
             
         except Exception as e:
@@ -5504,6 +10923,15 @@ REVIEW_PERIOD = config.get("review_period", "Q2 2025")
 REVIEW_DEADLINE = config.get("deadline", "June 30, 2025")
 AUDIT_FILE_NAME = config_manager.get_audit_file_name()
 
+
+def audit_file_patterns() -> List[str]:
+    """Audit workbook names looked for in each loaded folder, in order of preference."""
+    return [
+        AUDIT_FILE_NAME,  # e.g., Audit_CognosAccessReview_Q3_2025.xlsx
+        "Audit_CognosAccessReview.xlsx",  # Legacy name without period
+        "Cognos_Review_Audit_Log.xlsx"  # Alternative name
+    ]
+
 # =============== Utility Functions ===============
 
 def smart_agency_match(agency1: str, agency2: str) -> bool:
@@ -5912,7 +11340,9 @@ def create_backup(file_path: str, backup_dir: str = "backups") -> str:
     Creates a timestamped backup of a given file.
 
     This helps prevent data loss by saving a version of a file before it's
-    overwritten. Backups are stored in a specified directory.
+    overwritten. Backups are stored in a specified directory; a file whose
+    content matches its latest backup is not copied again, and old versions
+    are pruned by the backup retention settings.
 
     Args:
         file_path (str): The full path of the file to back up.
@@ -5925,19 +11355,8 @@ def create_backup(file_path: str, backup_dir: str = "backups") -> str:
         if not os.path.exists(file_path):
             return "" # Nothing to backup
         
-        # Ensure the backup directory exists
-        backup_path = Path(backup_dir)
-        backup_path.mkdir(exist_ok=True)
-        
-        # Create a unique filename with a timestamp (e.g., "20231027_153000_filename.xlsx")
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = Path(file_path).name
-        backup_filename = f"{timestamp}_{filename}"
-        backup_file_path = backup_path / backup_filename
-        
-        # Copy the original file to the new backup location
-        shutil.copy2(file_path, backup_file_path)
-        logger.info(f"Backup created: {backup_file_path}")
+        # Stored as e.g. "20231027_153000_filename.xlsx", once per distinct content
+        backup_file_path = BackupService.from_config(Path(backup_dir)).backup_file(Path(file_path))
         return str(backup_file_path)
     except Exception as e:
         logger.error(f"Failed to create backup of {file_path}: {str(e)}")
@@ -6633,8 +12052,28 @@ class CognosAccessReviewApp(ctk.CTk):
         self.file_validator = FileValidator()
         self.file_processor = FileProcessor()
         self.email_handler = EmailHandler(config_manager)
-        # AuditLogger will be initialized with output_dir when needed
-        self.audit_logger = None
+        # AuditLogger will be initialized with output_dir when needed; the
+        # live status panel follows its counters (see the audit_logger property)
+        self._audit_logger = None
+        # Loggers opened per (folder, audit file), so every action on a folder
+        # shares the logger holding its unsaved changes
+        self._folder_audit_loggers: Dict[Tuple[Path, str], AuditLogger] = {}
+        self._audit_update_pending = False
+        self._overdue_after_id = None
+        # GUI actions queue audit saves; they are written in the background
+        self.audit_writer = AuditWriteBehind(
+            interval=float(config.get("audit_write_interval_seconds", 5.0)),
+            on_state=lambda pending, error: self.after(0, self._update_pending_writes, pending, error),
+            on_conflicts=lambda conflicts: self.after(0, self._show_audit_conflicts, conflicts),
+            # Other operators' rows are merged on the Tk thread, which owns the audit frames
+            dispatch=lambda merge: self.after(0, merge)
+        )
+        self._audit_save_error_shown = False
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+        # Parsed audit logs of every loaded folder, reused while unchanged
+        self._audit_aggregator = None
+        # Cross-period archive for the dashboard history and reports
+        self._audit_archive = None
 
         # --- Application State Variables ---
         # These variables hold the application's data in memory.
@@ -6709,6 +12148,13 @@ class CognosAccessReviewApp(ctk.CTk):
         footer_frame = ctk.CTkFrame(self.sidebar_frame, fg_color="transparent")
         footer_frame.grid(row=8, column=0, sticky="ew", padx=10, pady=10)
 
+        # Audit write-behind state
+        self.pending_writes_label = ctk.CTkLabel(
+            footer_frame, text="✓ All changes saved", font=ctk.CTkFont(size=11),
+            text_color=get_color("text_secondary"), wraplength=DIMENSIONS["sidebar_width"] - 30, justify="left"
+        )
+        self.pending_writes_label.pack(anchor="w", pady=(0, 10))
+
         # Theme switcher in sidebar
         ctk.CTkLabel(footer_frame, text="Theme:", font=ctk.CTkFont(size=11), text_color=get_color("text")).pack(anchor="w", pady=(0, 5))
         self.theme_var = ctk.StringVar(value="System")
@@ -6783,6 +12229,7 @@ class CognosAccessReviewApp(ctk.CTk):
         keys = ["master", "combined", "attach", "output"]
         self.vars = {k: ctk.StringVar() for k in keys}
         self.email_mode = tk.StringVar(value="Preview")
+        self.digest_mode = tk.BooleanVar(value=False)
 
         # File Configuration in SETUP section
         ctk.CTkLabel(setup_scroll, text="📁 File Paths", font=ctk.CTkFont(size=16, weight="bold"), text_color=get_color("primary")).pack(anchor="w", pady=(15, 15), padx=5)
@@ -6832,6 +12279,12 @@ class CognosAccessReviewApp(ctk.CTk):
                 text_color=get_color("text"), border_color=get_color("primary"),
                 fg_color=get_color("primary")
             ).grid(row=1, column=col, padx=10, pady=(0, 10), sticky="w")
+        
+        ctk.CTkCheckBox(
+            email_mode_frame, text="Digest: one email per recipient group (Direct/Schedule)",
+            variable=self.digest_mode, text_color=get_color("text"),
+            border_color=get_color("primary"), fg_color=get_color("primary")
+        ).grid(row=2, column=0, columnspan=3, padx=10, pady=(0, 10), sticky="w")
 
         # Agency Management Section
         ctk.CTkLabel(setup_scroll, text="🏢 Agency Management", font=ctk.CTkFont(size=16, weight="bold"), text_color=get_color("primary")).pack(anchor="w", pady=(25, 15), padx=5)
@@ -7031,7 +12484,11 @@ class CognosAccessReviewApp(ctk.CTk):
             ("Smart Email Verifier", self.open_email_verifier),
             ("Test Email Connection", self.test_email),
             ("Scan Inbox", self.scan),
+            ("Full Inbox Rescan", self.full_rescan),
             ("Organize Replies", self.organize_compliance_replies),
+            ("Remind All Overdue", self.remind_overdue),
+            ("Harvest Returned Files", self.harvest_returned_files),
+            ("Consolidate Decisions", self.consolidate_review_decisions),
         ]
         
         for btn_text, cmd in email_buttons:
@@ -7417,18 +12874,9 @@ class CognosAccessReviewApp(ctk.CTk):
         # Create a dictionary for quick status lookups
         status_map = {}
         if not self.audit_df.empty and "Agency" in self.audit_df.columns:
-            audit_copy = self.audit_df.copy()
-            audit_copy['AgencyUpper'] = audit_copy['Agency'].str.upper()
-            
-            # Dynamically determine "Overdue" status
-            if 'Sent Email Date' in audit_copy.columns:
-                sent_mask = audit_copy['Status'] == 'Sent'
-                sent_dates = pd.to_datetime(audit_copy.loc[sent_mask, 'Sent Email Date'], errors='coerce')
-                # An item is overdue if it was sent and the send date is in the past
-                overdue_mask = sent_dates < pd.Timestamp.now()
-                audit_copy.loc[sent_mask & overdue_mask, 'Status'] = 'Overdue'
-
-            status_map = audit_copy.set_index('AgencyUpper')['Status'].to_dict()
+            # Sent agencies without a response after OVERDUE_AFTER_DAYS show as Overdue
+            typed = self._typed_audit()
+            status_map = dict(zip(typed['Agency'].astype(str).str.upper(), effective_audit_status(typed)))
 
         # Re-create checkboxes for the filtered list
         for agency in filtered_agencies:
@@ -7451,6 +12899,80 @@ class CognosAccessReviewApp(ctk.CTk):
         # Re-filter (which rebuilds) the list to apply the correct text colors for the new theme
         self.filter_agencies()
 
+    def _audit_logger_for(self, output_dir, audit_file_name: Optional[str] = None) -> AuditLogger:
+        """
+        Audit logger for a folder: the one already open for that folder's log.
+        
+        Reusing an open logger keeps changes not yet written by the
+        write-behind saver; before a log is first loaded from disk, pending
+        saves are flushed so it sees them.
+        
+        Args:
+            output_dir: Folder holding the audit log
+            audit_file_name: Optional custom audit file name
+        
+        Returns:
+            AuditLogger for the folder
+        """
+        current = self.audit_logger
+        if (current is not None and current.output_dir == Path(output_dir)
+                and audit_file_name in (None, current.audit_file_name)):
+            return current
+        key = (Path(output_dir), audit_file_name or "Audit_CognosAccessReview.xlsx")
+        if key in self._folder_audit_loggers:
+            return self._folder_audit_loggers[key]
+        if not self.audit_writer.flush(timeout=30):
+            logger.warning(f"Pending audit saves not flushed before loading {output_dir}: {self.audit_writer.last_error}")
+        audit_logger = AuditLogger(output_dir=Path(output_dir), audit_file_name=audit_file_name)
+        self._folder_audit_loggers[key] = audit_logger
+        return audit_logger
+    
+    def _update_pending_writes(self, pending: int, error: Optional[str]):
+        """Show the write-behind state in the sidebar (main thread)."""
+        if error:
+            self.pending_writes_label.configure(
+                text=f"⚠️ Save failed, retrying ({pending} pending)", text_color=get_color("danger"))
+            if not self._audit_save_error_shown:
+                self._audit_save_error_shown = True
+                messagebox.showwarning(
+                    "Audit Log Not Saved",
+                    f"The audit log could not be saved and will be retried:\n\n{error}\n\n"
+                    "Close the workbook if it is open in Excel."
+                )
+            return
+        self._audit_save_error_shown = False
+        if pending:
+            self.pending_writes_label.configure(
+                text=f"💾 {pending} pending write{'s' if pending != 1 else ''}", text_color=get_color("warning"))
+        else:
+            self.pending_writes_label.configure(text="✓ All changes saved", text_color=get_color("text_secondary"))
+    
+    def _show_audit_conflicts(self, conflicts: List[AuditConflict]):
+        """Tell the user which of their changes lost to another user's save (main thread)."""
+        lines = [str(conflict) for conflict in conflicts[:10]]
+        if len(conflicts) > 10:
+            lines.append(f"... and {len(conflicts) - 10} more (see the log)")
+        messagebox.showwarning(
+            "Audit Changes Conflict",
+            "Another user changed these fields of the audit log at the same time. "
+            "Their values were kept:\n\n" + "\n".join(lines) +
+            "\n\nReview the agencies and update them again if needed."
+        )
+    
+    def on_close(self):
+        """Write pending audit changes before the window closes."""
+        if not self.audit_writer.flush(timeout=30):
+            if not messagebox.askyesno(
+                "Unsaved Audit Changes",
+                f"Audit log changes could not be saved:\n\n{self.audit_writer.last_error or 'Timed out'}\n\n"
+                "Close anyway and lose them?"
+            ):
+                return
+        self.audit_writer.close(timeout=5)
+        if self.audit_logger is not None:
+            self.audit_logger.flush()
+        self.destroy()
+
     def refresh(self):
         """
         Callback for the 'Refresh List' button.
@@ -7478,12 +13000,9 @@ class CognosAccessReviewApp(ctk.CTk):
             
             # Reload the audit log using AuditLogger
             audit_file_path = os.path.join(out, AUDIT_FILE_NAME)
-            if self.audit_logger is not None:
-                self.audit_df = self.audit_logger.load()
-            else:
-                # Initialize audit_logger if not already done
-                self.audit_logger = AuditLogger(output_dir=Path(out))
-                self.audit_df = self.audit_logger.load()
+            # Reuses the open logger unless the output folder changed
+            self.audit_logger = self._audit_logger_for(out)
+            self.audit_df = self.audit_logger.load()
         else:
              self.agencies = []
              self.audit_df = pd.DataFrame(
@@ -7494,63 +13013,121 @@ class CognosAccessReviewApp(ctk.CTk):
         self.filter_agencies()
         self.update_dashboard_metrics()
 
+    @property
+    def audit_logger(self) -> Optional[AuditLogger]:
+        """Audit log of the output folder; the live counters follow it."""
+        return self._audit_logger
+    
+    @audit_logger.setter
+    def audit_logger(self, audit_logger: Optional[AuditLogger]):
+        if audit_logger is self._audit_logger:
+            return
+        if self._audit_logger is not None:
+            self._audit_logger.unsubscribe(self._on_audit_changed)
+        self._audit_logger = audit_logger
+        if audit_logger is not None:
+            audit_logger.subscribe(self._on_audit_changed)
+        self._on_audit_changed(None)
+    
+    def _on_audit_changed(self, agencies: Optional[List[str]]):
+        """Audit counts changed (any thread): update the live status panel once per burst."""
+        if not self._audit_update_pending:
+            self._audit_update_pending = True
+            self.after(0, self._apply_audit_change)
+    
+    def _apply_audit_change(self):
+        self._audit_update_pending = False
+        if hasattr(self, 'days_left_label'):
+            self.update_dashboard_metrics()
+        self._schedule_overdue_tick()
+    
+    def _schedule_overdue_tick(self):
+        """Wake up when the next Sent agency becomes overdue (checked at least hourly)."""
+        if self._overdue_after_id is not None:
+            self.after_cancel(self._overdue_after_id)
+            self._overdue_after_id = None
+        if self.audit_logger is None or self.audit_logger.output_dir is None:
+            return
+        delay_ms = 3600 * 1000
+        due = self.audit_logger.counters.next_overdue_at()
+        if due is not None:
+            delay_ms = int(min(max((due - datetime.now()).total_seconds() + 1, 1), 3600) * 1000)
+        self._overdue_after_id = self.after(delay_ms, self._overdue_tick)
+    
+    def _overdue_tick(self):
+        self._overdue_after_id = None
+        if self.audit_logger is not None:
+            # Publishes a change (and reschedules) only if agencies became overdue
+            if not self.audit_logger.advance_overdue():
+                self._schedule_overdue_tick()
+
+    def _get_audit_aggregator(self) -> AuditAggregator:
+        """Cached multi-folder audit loader (recreated if the audit file name setting changed)."""
+        patterns = audit_file_patterns()
+        if self._audit_aggregator is None or self._audit_aggregator.file_names != patterns:
+            self._audit_aggregator = AuditAggregator(patterns)
+        return self._audit_aggregator
+
+    def _get_audit_archive(self) -> AuditArchive:
+        """Cross-period audit archive (recreated if the archive path setting changed)."""
+        path = Path(config_manager.get("audit_archive_path", ConfigManager.DEFAULT_CONFIG["audit_archive_path"]))
+        if self._audit_archive is None or self._audit_archive.db_path != path:
+            self._audit_archive = AuditArchive(path)
+        return self._audit_archive
+    
+    def _archive_folders(self, folders: Dict[str, str]) -> AuditArchive:
+        """
+        Ingest the new or changed per-period audit workbooks of some folders.
+        
+        Args:
+            folders: Folder path -> region name
+        
+        Returns:
+            The audit archive
+        """
+        archive = self._get_audit_archive()
+        for folder, region in folders.items():
+            archive.ingest_folder(folder, region)
+        return archive
+    
+    def _typed_audit(self) -> pd.DataFrame:
+        """Typed view of the in-memory audit log (cached by the audit logger that holds it)."""
+        if self.audit_logger is not None and self.audit_logger.load() is self.audit_df:
+            return self.audit_logger.typed()
+        return type_audit_frame(self.audit_df)
+
     def update_dashboard_metrics(self):
         """
         Calculates and updates all the labels in the 'Live Status' panel.
         
         This function uses the in-memory audit DataFrame to calculate completion
         percentage, responded counts, overdue counts, and days left until the deadline.
+        Counts come from the audit logger's incrementally maintained counters
+        when it holds the loaded log, so nothing is recounted per refresh.
         """
-        if self.audit_df.empty or not self.agencies:
-            # Set default values if no data is loaded
-            self.completion_label.configure(text="0.0%")
-            self.responded_label.configure(text=f"0 / {len(self.agencies)}")
-            self.overdue_label.configure(text="0")
-            # Update reporting dashboard metrics
-            if hasattr(self, 'report_total_label'):
-                self.report_total_label.configure(text=str(len(self.agencies)))
-                self.report_responded_label.configure(text="0")
-                self.report_pending_label.configure(text=str(len(self.agencies)))
-                self.report_overdue_label.configure(text="0")
+        if self.agencies and self.audit_logger is not None and self.audit_logger.load() is self.audit_df:
+            metrics = self.audit_logger.counters.metrics(REVIEW_DEADLINE, total_agencies=len(self.agencies))
         else:
-            total = len(self.agencies)
-            
-            # Count how many unique agencies have the "Responded" status
-            responded_agencies = self.audit_df[self.audit_df["Status"] == "Responded"]["Agency"].str.upper().tolist()
-            responded_count = len(set(responded_agencies) & set([a.upper() for a in self.agencies]))
-            
-            # Calculate overdue items - agencies sent more than 7 days ago without response
-            overdue_count = 0
-            if "Sent Email Date" in self.audit_df.columns:
-                sent_df = self.audit_df[self.audit_df["Status"] == "Sent"].copy()
-                sent_df["Sent Email Date"] = pd.to_datetime(sent_df["Sent Email Date"], errors='coerce')
-                # Overdue if sent more than 7 days ago and still no response
-                seven_days_ago = pd.Timestamp.now() - pd.Timedelta(days=7)
-                overdue_df = sent_df[sent_df["Sent Email Date"] < seven_days_ago]
-                overdue_count = len(overdue_df)
-
-            completion_val = (responded_count / total * 100) if total > 0 else 0
-            pending_count = total - responded_count
-            
-            # Update UI labels with the new values
-            self.completion_label.configure(text=f"{completion_val:.1f}%")
-            self.responded_label.configure(text=f"{responded_count} / {len(self.agencies)}")
-            self.overdue_label.configure(text=f"{overdue_count}")
-            
-            # Update reporting dashboard metrics
-            if hasattr(self, 'report_total_label'):
-                self.report_total_label.configure(text=str(total))
-                self.report_responded_label.configure(text=str(responded_count))
-                self.report_pending_label.configure(text=str(pending_count))
-                self.report_overdue_label.configure(text=str(overdue_count))
-
-        # Calculate and display days left until the deadline
-        try:
-            deadline = pd.to_datetime(REVIEW_DEADLINE)
-            days_left = (deadline - pd.Timestamp.now()).days
-            self.days_left_label.configure(text=str(days_left))
-        except (ValueError, TypeError):
-            self.days_left_label.configure(text="-") # Show a dash if deadline is invalid
+            metrics = compute_audit_metrics(self._typed_audit(), REVIEW_DEADLINE, agencies=self.agencies)
+        pending_count = metrics.total_agencies - metrics.responded_count
+        
+        # Update UI labels with the new values
+        self.completion_label.configure(text=f"{metrics.completion_percentage:.1f}%")
+        self.responded_label.configure(text=f"{metrics.responded_count} / {metrics.total_agencies}")
+        self.overdue_label.configure(text=f"{metrics.overdue_count}")
+        
+        # Update reporting dashboard metrics
+        if hasattr(self, 'report_total_label'):
+            self.report_total_label.configure(text=str(metrics.total_agencies))
+            self.report_responded_label.configure(text=str(metrics.responded_count))
+            self.report_pending_label.configure(text=str(pending_count))
+            self.report_overdue_label.configure(text=str(metrics.overdue_count))
+
+        # Days left until the deadline (a dash if the deadline is invalid)
+        if pd.isna(pd.to_datetime(REVIEW_DEADLINE, errors="coerce")):
+            self.days_left_label.configure(text="-")
+        else:
+            self.days_left_label.configure(text=str(metrics.days_left))
 
     def get_selected_agencies(self):
         """
@@ -7618,24 +13195,17 @@ class CognosAccessReviewApp(ctk.CTk):
             # Sort the combined list
             self.agencies = sorted(self.agencies)
             
-            # Load audit log from this folder and merge it - try multiple file name patterns
-            audit_file_patterns = [
-                AUDIT_FILE_NAME,  # e.g., Audit_CognosAccessReview_Q3_2025.xlsx
-                "Audit_CognosAccessReview.xlsx",  # Legacy name
-                "Cognos_Review_Audit_Log.xlsx"  # Alternative name
-            ]
-            
-            audit_file_found = None
-            for pattern in audit_file_patterns:
-                test_path = os.path.join(path, pattern)
-                if os.path.exists(test_path):
-                    audit_file_found = test_path
-                    break
+            # Load audit log from this folder and merge it (cached for the dashboard)
+            try:
+                folder_df = self._get_audit_aggregator().folder_frame(path)
+            except Exception as e:
+                logger.error(f"Failed to load audit log from {path}: {e}")
+                folder_df = None
             
-            if audit_file_found:
+            if folder_df is not None:
                 try:
-                    new_audit_df = pd.read_excel(audit_file_found)
-                    logger.info(f"Loaded audit log from {path}: {len(new_audit_df)} records ({os.path.basename(audit_file_found)})")
+                    new_audit_df = folder_df.drop(columns=AuditAggregator.SOURCE_COLUMNS)
+                    logger.info(f"Loaded audit log from {path}: {len(new_audit_df)} records")
                     
                     # Merge with existing audit data
                     if self.audit_df.empty:
@@ -7648,7 +13218,7 @@ class CognosAccessReviewApp(ctk.CTk):
                         self.audit_df = combined
                         logger.info(f"Merged audit data: Total {len(self.audit_df)} records")
                 except Exception as e:
-                    logger.error(f"Failed to load audit log from {audit_file_found}: {e}")
+                    logger.error(f"Failed to merge audit log from {path}: {e}")
             else:
                 logger.info(f"No audit log found in {path} (this is normal if no emails have been sent yet)")
             
@@ -7873,16 +13443,7 @@ Best regards,
             self.schedule_email_dialog(selected) # Let's keep the single schedule dialog
         elif mode == "Direct":
             # SAFETY: Confirm before actually sending emails
-            confirm = messagebox.askyesno(
-                "Confirm Direct Send",
-                f"⚠️ WARNING: Direct Send Mode ⚠️\n\n"
-                f"You are about to AUTOMATICALLY SEND {len(selected)} emails.\n\n"
-                f"Recipients will receive emails immediately without your review.\n\n"
-                f"Selected agencies: {', '.join(selected[:5])}"
-                f"{' ...' if len(selected) > 5 else ''}\n\n"
-                f"Are you absolutely sure you want to continue?",
-                icon="warning"
-            )
+            confirm = confirm_direct_send(selected)
             if confirm:
                 self.run_task_in_thread(
                     target=self._send_emails_with_progress,
@@ -7891,11 +13452,51 @@ Best regards,
             else:
                 logger.info("Direct send cancelled by user confirmation")
         else:
-            # Preview mode - no confirmation needed
-            self.run_task_in_thread(
-                target=self._send_emails_with_progress,
-                args=(selected, mode)
+            # Preview mode - the dialog confirms before it sends anything
+            self.open_email_preview(selected)
+    
+    def open_email_preview(self, selected_agencies):
+        """
+        Open the navigable preview dialog for the selected agencies.
+        
+        Bodies are rendered lazily by the batch, so the dialog opens at once
+        even for several hundred agencies.
+        
+        Args:
+            selected_agencies (list[str]): The agencies to preview.
+        """
+        output_dir = self.vars["output"].get()
+        if not output_dir or not Path(output_dir).is_dir():
+            messagebox.showerror("Validation Error", "Please select a valid output folder.")
+            return
+        
+        universal_attachment = self.vars["attach"].get()
+        try:
+            emails = self.email_handler.prepare_email_batch(
+                combined_file=Path(self.vars["combined"].get()),
+                output_dir=Path(output_dir),
+                file_names=selected_agencies,
+                universal_attachment=Path(universal_attachment) if universal_attachment else None
             )
+        except EmailError as e:
+            logger.error(f"Error preparing email preview: {e}")
+            messagebox.showerror("Error", f"Failed to prepare emails: {e}")
+            return
+        
+        if not len(emails):
+            messagebox.showwarning("Warning", "None of the selected agencies have email addresses.")
+            return
+        
+        # Record sends from the preview in the audit log (preserves existing entries)
+        self.audit_logger = self._audit_logger_for(output_dir)
+        self.audit_logger.initialize_log(self.agencies, preserve_existing=True)
+        
+        EmailPreviewNavigationDialog(
+            self, emails, self.email_handler,
+            audit_logger=self.audit_logger,
+            on_audit_saved=self.refresh,
+            audit_writer=self.audit_writer
+        )
     
     def run_task_in_thread(self, target, args=()):
         """
@@ -7911,6 +13512,16 @@ Best regards,
         thread.daemon = True # Allows app to exit even if thread is running
         thread.start()
 
+    @staticmethod
+    def _describe_send_failures(failed: Dict[str, str], limit: int = 15) -> str:
+        """Dialog text listing files send_emails() did not send, or "" if none."""
+        if not failed:
+            return ""
+        lines = [f"• {name}: {reason}" for name, reason in list(failed.items())[:limit]]
+        if len(failed) > limit:
+            lines.append(f"... and {len(failed) - limit} more")
+        return f"\n\nNot sent ({len(failed)}):\n" + "\n".join(lines)
+    
     def _send_emails_with_progress(self, selected_agencies, mode):
         """
         Internal function to handle the email sending process with a progress bar.
@@ -7936,18 +13547,20 @@ Best regards,
             
             # Use EmailHandler to send emails with combined file
             universal_attach_path = Path(universal_attachment) if universal_attachment else None
-            sent_count = self.email_handler.send_emails(
+            send_result = self.email_handler.send_emails(
                 combined_file=Path(combined_file),
                 output_dir=Path(output_dir),
                 file_names=selected_agencies,
                 mode=email_mode,
-                universal_attachment=universal_attach_path
+                universal_attachment=universal_attach_path,
+                progress_callback=lambda pct, msg: self.after(0, self.update_progress, 0.3 + 0.4 * pct / 100, msg),
+                digest=self.digest_mode.get()
             )
             
             self.after(0, self.update_progress, 0.7, "Updating audit log...")
             
             # Initialize AuditLogger with output directory
-            self.audit_logger = AuditLogger(output_dir=Path(output_dir))
+            self.audit_logger = self._audit_logger_for(output_dir)
             
             # Initialize log with all agencies (preserves existing entries)
             self.audit_logger.initialize_log(self.agencies, preserve_existing=True)
@@ -7967,14 +13580,16 @@ Best regards,
                 logger.warning(f"Could not load combined file for audit log: {str(e)}")
                 addr_dict = {}
             
-            # Mark each successfully processed agency as Sent
-            for agency in selected_agencies:
-                to, cc = addr_dict.get(agency.upper(), ("", ""))
-                status = "Sent" if mode == "Direct" else "Preview"
-                self.audit_logger.mark_sent(agency, to=to, cc=cc, comments=f"Mode: {mode}")
+            # Mark only the agencies whose email actually went out as Sent
+            self.audit_logger.mark_sent_many(
+                send_result.sent,
+                recipients=addr_dict,
+                comments=f"Mode: {mode}",
+                event=AuditEventType.SENT if mode == "Direct" else AuditEventType.PREVIEWED
+            )
             
-            # Save the audit log to file
-            self.audit_logger.save()
+            # Queue the audit log save (written in the background)
+            self.audit_writer.request_save(self.audit_logger)
             
             # Reload audit log into memory
             self.audit_df = self.audit_logger.load()
@@ -7983,7 +13598,12 @@ Best regards,
             self.after(0, self.refresh)
             
             self.after(0, self.update_progress, 1.0, "Complete!")
-            self.after(0, messagebox.showinfo, "Done", f"Emails processed successfully! ({sent_count}/{len(selected_agencies)})")
+            summary = f"Emails processed: {len(send_result.sent)} of {len(selected_agencies)}"
+            summary += self._describe_send_failures(send_result.failed)
+            if send_result.failed:
+                self.after(0, messagebox.showwarning, "Done with failures", summary)
+            else:
+                self.after(0, messagebox.showinfo, "Done", summary)
             
         except Exception as e:
             logger.error(f"Error sending emails: {str(e)}")
@@ -8023,42 +13643,29 @@ Best regards,
             
             # Create drafts using the email handler
             try:
-                success_count = self.email_handler.send_emails(
+                send_result = self.email_handler.send_emails(
                     combined_file=Path(self.vars["combined"].get()),
                     output_dir=Path(self.vars["output"].get()),
                     file_names=selected_agencies,
                     mode=EmailMode.SCHEDULE,  # This creates drafts
-                    universal_attachment=Path(self.vars["attach"].get()) if self.vars["attach"].get() else None
+                    universal_attachment=Path(self.vars["attach"].get()) if self.vars["attach"].get() else None,
+                    digest=self.digest_mode.get()
                 )
+                success_count = len(send_result.sent)
                 
                 if success_count > 0:
                     logger.info(f"SCHEDULED EMAILS: Created {success_count} draft emails")
                     
-                    # Update audit log
+                    # Update audit log (agencies missing from it are added first)
                     now = datetime.now().strftime("%Y-%m-%d %H:%M")
-                    for agency in selected_agencies:
-                        mask = self.audit_df[ColumnNames.AGENCY].str.upper() == agency.upper()
-                        if mask.any():
-                            self.audit_df.loc[mask, [ColumnNames.SENT_DATE, ColumnNames.STATUS, ColumnNames.COMMENTS]] = [
-                                now, "Draft Created", f"Scheduled draft created at {now}"
-                            ]
-                        else:
-                            # Add new row for this agency with all required columns
-                            new_row = {
-                                ColumnNames.AGENCY: agency,
-                                ColumnNames.SENT_DATE: now,
-                                ColumnNames.RESPONSE_DATE: "",
-                                ColumnNames.TO: "",
-                                ColumnNames.CC: "",
-                                ColumnNames.STATUS: "Draft Created",
-                                ColumnNames.COMMENTS: f"Scheduled draft created at {now}"
-                            }
-                            self.audit_df = pd.concat([self.audit_df, pd.DataFrame([new_row])], ignore_index=True)
-                    
-                    # Save audit log
-                    if hasattr(self, 'audit_logger') and self.audit_logger:
-                        self.audit_logger._df = self.audit_df
-                        self.audit_logger.save()
+                    audit_logger = self._audit_logger_for(self.vars["output"].get())
+                    audit_logger.initialize_log(send_result.sent, preserve_existing=True)
+                    audit_logger.mark_sent_many(
+                        send_result.sent,
+                        comments=f"Scheduled draft created at {now}",
+                        event=AuditEventType.DRAFTED
+                    )
+                    self.audit_writer.request_save(audit_logger)
                     
                     # Show success notification
                     show_notification(
@@ -8067,14 +13674,19 @@ Best regards,
                         f"📧 Check your Outlook drafts folder\n"
                         f"📝 Review and send when ready\n"
                         f"📊 Audit log updated"
+                        + self._describe_send_failures(send_result.failed)
                     )
                     
                     # Update UI in main thread - reset status and refresh dashboard
                     self.after(0, lambda: self.status_label.configure(text=f"✅ {success_count} drafts created"))
-                    self.after(0, self.update_dashboard_metrics)
+                    self.after(0, self.refresh)
                     
                 else:
-                    show_error("Scheduling Failed", "No draft emails were created. Check the logs for details.")
+                    show_error(
+                        "Scheduling Failed",
+                        "No draft emails were created." + (self._describe_send_failures(send_result.failed)
+                                                            or " Check the logs for details.")
+                    )
                     self.after(0, lambda: self.status_label.configure(text="❌ Scheduling failed"))
                     
             except Exception as email_error:
@@ -8107,27 +13719,14 @@ Best regards,
         comment = simpledialog.askstring(
             "Add Comment","Enter response comments (optional):"
         )
-        now = datetime.now().strftime("%Y-%m-%d %H:%M")
-        
-        for agency in selected:
-            mask = self.audit_df["Agency"].str.upper() == agency.upper()
-            if mask.any():
-                self.audit_df.loc[
-                    mask, ["Response Received Date","Status","Comments"]
-                ] = [now, "Responded", comment or ""] # Use comment or empty string
-            else:
-                # Add a new record if one doesn't exist for some reason
-                self.audit_df.loc[len(self.audit_df)] = [
-                    agency, "", now, "", "", "Responded", comment or ""
-                ]
         
-        # Save using AuditLogger
+        # Save using AuditLogger (agencies missing from the log are added first)
         output_dir = self.vars["output"].get()
-        from pathlib import Path
-        self.audit_logger = AuditLogger(output_dir=Path(output_dir))
-        # Update internal dataframe and save
-        self.audit_logger._df = self.audit_df
-        self.audit_logger.save()
+        self.audit_logger = self._audit_logger_for(output_dir)
+        self.audit_logger.initialize_log(selected, preserve_existing=True)
+        self.audit_logger.mark_responded_many(selected, comments=comment or "")
+        self.audit_writer.request_save(self.audit_logger)
+        self.audit_df = self.audit_logger.load()
         
         messagebox.showinfo(
             "Updated", "Marked selected agencies as responded."
@@ -8144,17 +13743,8 @@ Best regards,
         try:
             folder_name = f"Compliance {REVIEW_PERIOD}"
             
-            # Use EmailHandler to scan inbox
-            responses = self.email_handler.scan_inbox(
-                folder_name=folder_name,
-                agencies=self.agencies
-            )
-            
-            if responses is None:
-                messagebox.showerror("Folder Error", f"Could not find '{folder_name}' folder")
-                return
-            
             found_count = 0
+            bounced_count = 0
             output_dir = self.vars["output"].get()
             
             if not output_dir:
@@ -8162,43 +13752,83 @@ Best regards,
                 return
             
             # Update audit log using AuditLogger
-            self.audit_logger = AuditLogger(output_dir=Path(output_dir))
+            self.audit_logger = self._audit_logger_for(output_dir)
             self.audit_logger.initialize_log(self.agencies, preserve_existing=True)
             
+            # Use EmailHandler to scan inbox
+            responses = self.email_handler.scan_inbox(
+                folder_name=folder_name,
+                agencies=self.agencies,
+                tracking_index=self.audit_logger.load_tracking_index()
+            )
+            
+            if responses is None:
+                messagebox.showerror("Folder Error", f"Could not find '{folder_name}' folder")
+                return
+            
             # responses is a list of dictionaries with email info
-            # We need to match agency names in subjects
+            # Attribute each subject to an agency in a single pass
+            matcher = AgencyMatcher(self.agencies)
+            replies = {}  # agency -> comment from its first reply
             for response in responses:
                 subject = response.get("subject", "")
                 received_date = response.get("received", "")
                 
-                # Try to match agency from subject
-                for agency in self.agencies:
-                    if agency.lower() in subject.lower():
-                        # Check if it's not already marked as responded
-                        current_status = self.audit_logger.get_status(agency)
-                        if current_status != AuditStatus.RESPONDED.value:
-                            self.audit_logger.mark_responded(
-                                agency=agency,
-                                comments=f"Response received on {received_date}"
-                            )
-                            found_count += 1
-                            logger.info(f"Found response for {agency} from email.")
-                        break  # Found the agency, move to next response
-            
-            # Save and reload audit log
-            self.audit_logger.save()
+                # Tracking token gives an exact attribution (all files of a digest);
+                # fall back to the agency name
+                attributed = response.get("source_files") or [matcher.match(subject)]
+                for agency in attributed:
+                    if agency is None:
+                        continue
+                    
+                    # Bounces flag the agency's address instead of counting as a response
+                    if response.get("kind") == MessageKind.BOUNCE.value:
+                        if self.audit_logger.mark_undeliverable(agency, response.get("failed_address")):
+                            bounced_count += 1
+                        continue
+                    
+                    replies.setdefault(agency, f"Response received on {received_date}")
+            
+            # Mark agencies not already responded, as one batch
+            statuses = self.audit_logger.get_status_many(list(replies))
+            pending = [agency for agency, status in statuses.items() if status != AuditStatus.RESPONDED.value]
+            marked = self.audit_logger.mark_responded_many(pending, comments=replies)
+            found_count = len(marked)
+            for agency in marked:
+                logger.info(f"Found response for {agency} from email.")
+            
+            # Queue the save and reload audit log; only then move the scan watermark
+            self.audit_writer.request_save(self.audit_logger)
             self.audit_df = self.audit_logger.load()
+            self.email_handler.commit_scan_watermark()
             
             messagebox.showinfo(
                 "Inbox Scan", f"Inbox scan complete.\n\n"
-                f"📧 Emails found: {len(responses)}\n"
-                f"✅ New responses logged: {found_count}"
+                f"📧 New emails since last scan: {len(responses)}\n"
+                f"✅ New responses logged: {found_count}\n"
+                f"⚠️ Undeliverable: {bounced_count}"
             )
             self.refresh() # Refresh UI
         except Exception as e:
             logger.error(f"Inbox scan failed: {e}")
             messagebox.showerror("Scan Error", f"Failed to scan inbox: {e}")
 
+    def full_rescan(self):
+        """
+        Callback for the 'Full Inbox Rescan' button.
+        
+        Forgets the incremental scan watermarks and scans every matching
+        message again, e.g. after replies were missed or moved between folders.
+        """
+        if not messagebox.askyesno(
+            "Full Inbox Rescan",
+            "Scan all matching emails again, ignoring what previous scans have already seen?\n\n"
+            "This can take longer on large mailboxes."
+        ):
+            return
+        self.email_handler.reset_scan_watermark()
+        self.scan()
+
     def sync_sent_emails(self):
         """
         Scan Outlook Sent Items to find and record previously sent emails.
@@ -8259,43 +13889,36 @@ Best regards,
             self.update_progress(0.6, f"Found {len(found_emails)} emails. Updating audit log...")
             
             # Initialize audit logger
-            self.audit_logger = AuditLogger(output_dir=Path(output_dir))
+            self.audit_logger = self._audit_logger_for(output_dir)
             self.audit_logger.initialize_log(self.agencies, preserve_existing=True)
             
-            # Update audit log with found emails
-            synced_count = 0
+            # Agencies not yet sent or responded, grouped by the folder they were found in
+            statuses = self.audit_logger.get_status_many([e["agency"] for e in found_emails])
+            by_folder: Dict[str, Dict[str, dict]] = {}
             for email_info in found_emails:
                 agency = email_info["agency"]
-                
-                # Check if already marked as sent
-                current_status = self.audit_logger.get_status(agency)
-                if current_status in [AuditStatus.SENT.value, AuditStatus.RESPONDED.value]:
+                if statuses.get(agency) in [AuditStatus.SENT.value, AuditStatus.RESPONDED.value]:
                     continue  # Skip if already sent or responded
-                
-                # Mark as sent with the original sent date
-                df = self.audit_logger.load()
-                mask = df[ColumnNames.AGENCY].str.upper() == agency.upper()
-                
-                if mask.any():
-                    sent_date = email_info["sent_date"]
-                    if isinstance(sent_date, datetime):
-                        sent_date_str = sent_date.strftime("%Y-%m-%d %H:%M")
-                    else:
-                        sent_date_str = str(sent_date)
-                    
-                    folder_info = email_info.get("folder", "Compliance folder")
-                    df.loc[mask, ColumnNames.SENT_DATE] = sent_date_str
-                    df.loc[mask, ColumnNames.TO] = email_info.get("to", "")
-                    df.loc[mask, ColumnNames.CC] = email_info.get("cc", "")
-                    df.loc[mask, ColumnNames.STATUS] = AuditStatus.SENT.value
-                    df.loc[mask, ColumnNames.COMMENTS] = f"Synced from {folder_info}"
-                    
-                    self.audit_logger._df = df
-                    synced_count += 1
+                statuses[agency] = AuditStatus.SENT.value
+                by_folder.setdefault(email_info.get("folder", "Compliance folder"), {})[agency] = email_info
+            
+            # Mark as sent with the original sent dates, one batch per folder
+            synced_count = 0
+            for folder_info, emails in by_folder.items():
+                synced_count += len(self.audit_logger.mark_sent_many(
+                    list(emails),
+                    recipients={agency: (info.get("to", ""), info.get("cc", "")) for agency, info in emails.items()},
+                    comments=f"Synced from {folder_info}",
+                    sent_dates={
+                        agency: (info["sent_date"].strftime("%Y-%m-%d %H:%M")
+                                 if isinstance(info["sent_date"], datetime) else str(info["sent_date"]))
+                        for agency, info in emails.items()
+                    }
+                ))
             
             # Save audit log
             self.update_progress(0.9, "Saving audit log...")
-            self.audit_logger.save()
+            self.audit_writer.request_save(self.audit_logger)
             self.audit_df = self.audit_logger.load()
             
             # Refresh UI
@@ -8333,13 +13956,19 @@ Best regards,
             messagebox.showwarning("No Output Folder", "Please select an output folder first.")
             return
         
-        from pathlib import Path
-        self.audit_logger = AuditLogger(output_dir=Path(output_dir))
-        # Update internal dataframe and save
-        self.audit_logger._df = self.audit_df
+        self.audit_logger = self._audit_logger_for(output_dir)
+        # Write the logger's pending changes now (not behind)
         audit_file_path = os.path.join(output_dir, AUDIT_FILE_NAME)
-        self.audit_logger.save()
-        messagebox.showinfo("Export", f"Audit log saved successfully to:\n{audit_file_path}")
+        self.audit_writer.request_save(self.audit_logger)
+        if not self.audit_writer.flush(timeout=60):
+            messagebox.showerror("Export", f"Failed to save the audit log:\n{self.audit_writer.last_error or 'Timed out'}")
+            return
+        self.audit_logger.flush()
+        history_path = Path(output_dir) / f"{Path(self.audit_logger.audit_file_name).stem} History.csv"
+        message = f"Audit log saved successfully to:\n{audit_file_path}"
+        if self.audit_logger.export_history(history_path):
+            message += f"\n\nFull event history:\n{history_path}"
+        messagebox.showinfo("Export", message)
 
     def show_progress(self, show=True):
         """
@@ -8372,13 +14001,16 @@ Best regards,
         Callback for the 'Dashboard' button. Opens a unified multi-region dashboard
         that combines audit logs from all loaded folders (APAC, OASYS, etc.)
         """
+        # The dashboard reads the xlsx exports; write any pending one first
+        if self.audit_logger is not None:
+            self.audit_logger.flush()
+        
         dashboard = ctk.CTkToplevel(self)
         dashboard.title("Unified Reporting Dashboard - All Regions")
         dashboard.geometry("1200x700")
         dashboard.transient(self)
         
-        # Collect all audit data from all folders
-        all_audit_data = []
+        # Collect all folders with audit data
         folder_sources = {}
         
         # Main output folder
@@ -8412,44 +14044,22 @@ Best regards,
             dashboard.destroy()
             return
         
-        # Load audit logs from each folder
-        for folder_path, folder_name in folder_sources.items():
-            # Try multiple audit file name patterns
-            audit_file_patterns = [
-                AUDIT_FILE_NAME,  # e.g., Audit_CognosAccessReview_Q3_2025.xlsx
-                "Audit_CognosAccessReview.xlsx",  # Legacy name without period
-                "Cognos_Review_Audit_Log.xlsx"  # Alternative name
-            ]
-            
-            audit_file_found = None
-            for pattern in audit_file_patterns:
-                test_path = os.path.join(folder_path, pattern)
-                if os.path.exists(test_path):
-                    audit_file_found = test_path
-                    break
-            
-            if audit_file_found:
-                try:
-                    df = pd.read_excel(audit_file_found)
-                    if not df.empty:
-                        df['Region'] = folder_name  # Add region column
-                        df['Folder'] = folder_path  # Track source folder
-                        all_audit_data.append(df)
-                        logger.info(f"Dashboard: Loaded {len(df)} records from {folder_name} ({os.path.basename(audit_file_found)})")
-                    else:
-                        logger.warning(f"Dashboard: Audit file is empty: {audit_file_found}")
-                except Exception as e:
-                    logger.error(f"Failed to load audit from {audit_file_found}: {e}")
+        # Load audit logs from each folder (cached; only changed files are re-read, in parallel)
+        combined_df, summaries = self._get_audit_aggregator().load(folder_sources)
+        for summary in summaries.values():
+            if summary.error:
+                logger.warning(f"Dashboard: {summary.region}: {summary.error}")
             else:
-                logger.warning(f"Dashboard: No audit file found in {folder_path}")
+                logger.info(f"Dashboard: {summary.records} records from {summary.region} ({summary.audit_file})"
+                            f"{' [cached]' if summary.from_cache else ''}")
+        loaded = [summary for summary in summaries.values() if summary.records]
         
         # Show debug info about what was loaded
-        if all_audit_data:
-            total_records = sum(len(df) for df in all_audit_data)
+        if loaded:
             messagebox.showinfo(
                 "Dashboard Data Loaded",
-                f"Found {len(all_audit_data)} audit file(s)\n"
-                f"Total records: {total_records}\n\n"
+                f"Found {len(loaded)} audit file(s)\n"
+                f"Total records: {len(combined_df)}\n\n"
                 f"Folders checked: {len(folder_sources)}"
             )
         else:
@@ -8457,21 +14067,9 @@ Best regards,
                 "No Data Found",
                 f"Checked {len(folder_sources)} folder(s) but found no audit data.\n\n"
                 f"Folders checked:\n" + "\n".join(f"• {name}" for name in folder_sources.values()) +
-                f"\n\nLooking for files named:\n"
-                f"• Audit_CognosAccessReview_Q3_2025.xlsx\n"
-                f"• Audit_CognosAccessReview.xlsx\n"
-                f"• Cognos_Review_Audit_Log.xlsx"
+                f"\n\nLooking for files named:\n" + "\n".join(f"• {name}" for name in audit_file_patterns())
             )
         
-        # Combine all data
-        if all_audit_data:
-            combined_df = pd.concat(all_audit_data, ignore_index=True)
-            logger.info(f"Dashboard: Combined {len(combined_df)} total records from {len(all_audit_data)} folder(s)")
-        else:
-            # No audit data found - create empty dataframe and show info
-            combined_df = pd.DataFrame(columns=["Agency", "Region", "Sent Email Date", "Response Received Date", "To", "CC", "Status", "Comments"])
-            logger.warning(f"Dashboard: No audit log files found in {len(folder_sources)} folders")
-        
         # Get unique regions for filter
         regions = ["All Regions"] + sorted(combined_df['Region'].unique().tolist()) if not combined_df.empty else ["All Regions"]
         
@@ -8642,31 +14240,11 @@ Thank you for your cooperation!
             
             def use_gentle_reminder():
                 message_text.delete("1.0", "end")
-                message_text.insert("1.0", f"""Hi Team,
-
-Just a gentle reminder about the Cognos Access Review for {agency}.
-
-Could you please review and respond at your earliest convenience?
-
-Deadline: {deadline}
-
-Thanks!
-""")
+                message_text.insert("1.0", FOLLOWUP_TEMPLATES["gentle"].format(agency=agency, deadline=deadline))
             
             def use_urgent_reminder():
                 message_text.delete("1.0", "end")
-                message_text.insert("1.0", f"""Hi Team,
-
-**URGENT REMINDER**
-
-We still need your response for the Cognos Access Review ({agency}).
-
-This is required for SOX compliance. Please prioritize and respond by {deadline}.
-
-If you're facing any issues, please contact us immediately.
-
-Thank you!
-""")
+                message_text.insert("1.0", FOLLOWUP_TEMPLATES["urgent"].format(agency=agency, deadline=deadline))
             
             ctk.CTkButton(template_frame, text="Gentle", command=use_gentle_reminder, width=80).pack(side="left", padx=2)
             ctk.CTkButton(template_frame, text="Urgent", command=use_urgent_reminder, width=80).pack(side="left", padx=2)
@@ -8679,21 +14257,12 @@ Thank you!
                         messagebox.showerror("Error", "Please enter a follow-up message", parent=followup_dialog)
                         return
                     
-                    # Get config for subject
-                    config = get_config_manager().load()
-                    subject_prefix = config.get("email_subject_prefix", "[ACTION REQUIRED] Cognos Access Review")
-                    review_period = config.get("review_period", "Q4 FY25")
-                    original_subject = f"{subject_prefix} - {review_period} - {agency}"
-                    
-                    # Create email handler
-                    email_handler = EmailHandler()
-                    
-                    # Send follow-up
-                    success = email_handler.send_followup(
+                    # Send follow-up (original is located via the sent-message index)
+                    success = self.email_handler.send_followup(
                         agency=agency,
-                        original_subject=original_subject,
+                        original_subject=None,
                         followup_body=followup_body,
-                        search_days=60  # Search back 60 days for original email
+                        days_back=60  # Search back 60 days for original email
                     )
                     
                     if success:
@@ -8735,6 +14304,63 @@ Thank you!
                 return 'overdue'
             return 'not_sent'
         
+        live_logger = self.audit_logger
+        live_region = [None]  # region whose counters are the open audit log's
+        labels_pending = [False]
+        
+        def build_region_counters():
+            """Counters per region: the open audit log's live counters, the others counted once."""
+            counters = {}
+            live_region[0] = None
+            for region, region_df in combined_df.groupby('Region'):
+                if (live_logger is not None and live_logger.output_dir == Path(region_df['Folder'].iloc[0])
+                        and live_logger.audit_file_name == region_df['Audit File'].iloc[0]):
+                    counters[region] = live_logger.counters
+                    live_region[0] = region
+                elif region in summaries and summaries[region].counters is not None:
+                    counters[region] = summaries[region].counters
+                else:
+                    counters[region] = AuditCounters.from_frame(region_df, region=region)
+            return counters
+        
+        region_counters = build_region_counters()
+        
+        def update_metric_labels(selected_region):
+            """Update the metric labels from the region counters (no rescan of the data)"""
+            labels_pending[0] = False
+            if not dashboard.winfo_exists():
+                return
+            if live_region[0] is not None:
+                # Rebuilt by the logger after a reload
+                region_counters[live_region[0]] = live_logger.counters
+            if selected_region == "All Regions":
+                selected = list(region_counters.values())
+            else:
+                selected = [region_counters[selected_region]] if selected_region in region_counters else []
+            for counters in selected:
+                counters.advance()
+            metrics = metrics_from_status_counts(
+                sum((c.counts for c in selected), Counter()), REVIEW_DEADLINE, sum(c.total for c in selected)
+            )
+            completion = f"{metrics.completion_percentage:.1f}%" if metrics.total_agencies > 0 else "0%"
+            
+            metric_labels["total"].configure(text=str(metrics.total_agencies))
+            metric_labels["sent"].configure(text=str(metrics.sent_count))
+            metric_labels["responded"].configure(text=str(metrics.responded_count))
+            metric_labels["not_sent"].configure(text=str(metrics.not_sent_count))
+            metric_labels["overdue"].configure(text=str(metrics.overdue_count))
+            metric_labels["completion"].configure(text=completion)
+        
+        def on_live_change(agencies):
+            """The open audit log changed (any thread): refresh the labels once per burst"""
+            if not labels_pending[0]:
+                labels_pending[0] = True
+                dashboard.after(0, lambda: update_metric_labels(region_var.get()))
+        
+        if live_logger is not None:
+            live_logger.subscribe(on_live_change)
+            dashboard.bind("<Destroy>", lambda e: live_logger.unsubscribe(on_live_change) if e.widget is dashboard else None)
+        
         def update_dashboard(selected_region):
             """Update the dashboard based on selected region filter"""
             # Filter data
@@ -8743,29 +14369,9 @@ Thank you!
             else:
                 filtered_df = combined_df[combined_df['Region'] == selected_region].copy()
             
-            # Calculate metrics
-            total = len(filtered_df)
-            responded = (filtered_df["Status"] == "Responded").sum() if not filtered_df.empty else 0
-            sent = (filtered_df["Status"] == "Sent").sum() if not filtered_df.empty else 0
-            not_sent_count = total - sent - responded
-            
-            # Calculate overdue
-            overdue = 0
-            if not filtered_df.empty and "Sent Email Date" in filtered_df.columns:
-                sent_df = filtered_df[filtered_df["Status"] == "Sent"].copy()
-                sent_df["Sent Email Date"] = pd.to_datetime(sent_df["Sent Email Date"], errors='coerce')
-                seven_days_ago = pd.Timestamp.now() - pd.Timedelta(days=7)
-                overdue = len(sent_df[sent_df["Sent Email Date"] < seven_days_ago])
-            
-            completion = f"{responded/total*100:.1f}%" if total > 0 else "0%"
-            
-            # Update metric labels
-            metric_labels["total"].configure(text=str(total))
-            metric_labels["sent"].configure(text=str(sent))
-            metric_labels["responded"].configure(text=str(responded))
-            metric_labels["not_sent"].configure(text=str(not_sent_count))
-            metric_labels["overdue"].configure(text=str(overdue))
-            metric_labels["completion"].configure(text=completion)
+            # Metrics come from the region counters; dates are parsed once for the row colors
+            update_metric_labels(selected_region)
+            typed_df = type_audit_frame(filtered_df)
             
             # Update region summary
             if not combined_df.empty:
@@ -8778,7 +14384,8 @@ Thank you!
             
             if not filtered_df.empty:
                 # Reorder columns to show Region first
-                display_cols = ['Region', 'Agency', 'Status', 'Sent Email Date', 'Response Received Date', 'To', 'CC', 'Comments']
+                display_cols = ['Region', 'Agency', 'Status', 'Sent Email Date', 'Response Received Date', 'To', 'CC', 'Comments',
+                                'Follow-up Count', 'Last Reminder Date']
                 display_cols = [c for c in display_cols if c in filtered_df.columns]
                 df_display = filtered_df[display_cols].fillna("")
                 
@@ -8787,15 +14394,15 @@ Thank you!
                 
                 # Configure columns
                 col_widths = {'Region': 150, 'Agency': 180, 'Status': 100, 'Sent Email Date': 120, 
-                              'Response Received Date': 140, 'To': 200, 'CC': 150, 'Comments': 150}
+                              'Response Received Date': 140, 'To': 200, 'CC': 150, 'Comments': 150,
+                              'Follow-up Count': 110, 'Last Reminder Date': 130}
                 for col in df_display.columns:
                     tree.heading(col, text=col)
                     tree.column(col, width=col_widths.get(col, 120), anchor='w')
                 
-                for _, row in df_display.iterrows():
-                    status = row.get('Status', '')
-                    tag = get_row_tag(status)
-                    tree.insert("", "end", values=list(row), tags=(tag,))
+                # Overdue sends are tagged from their send date, not only a stored Overdue status
+                for values, status in zip(df_display.itertuples(index=False, name=None), effective_audit_status(typed_df)):
+                    tree.insert("", "end", values=list(values), tags=(get_row_tag(status),))
         
         # Bind region filter change
         def on_region_change(choice):
@@ -8828,26 +14435,13 @@ Thank you!
         
         def refresh_data():
             """Reload data from all folders"""
-            nonlocal combined_df, regions
-            all_audit_data.clear()
-            
-            for folder_path, folder_name in folder_sources.items():
-                audit_file = os.path.join(folder_path, AUDIT_FILE_NAME)
-                if os.path.exists(audit_file):
-                    try:
-                        df = pd.read_excel(audit_file)
-                        df['Region'] = folder_name
-                        df['Folder'] = folder_path
-                        all_audit_data.append(df)
-                    except Exception as e:
-                        logger.error(f"Failed to reload audit from {folder_path}: {e}")
-            
-            if all_audit_data:
-                combined_df = pd.concat(all_audit_data, ignore_index=True)
-            else:
-                combined_df = pd.DataFrame(columns=["Agency", "Region", "Sent Email Date", "Response Received Date", "To", "CC", "Status", "Comments"])
+            nonlocal combined_df, regions, region_counters, summaries
+            if self.audit_logger is not None:
+                self.audit_logger.flush()
+            combined_df, summaries = self._get_audit_aggregator().load(folder_sources)
             
             regions = ["All Regions"] + sorted(combined_df['Region'].unique().tolist()) if not combined_df.empty else ["All Regions"]
+            region_counters = build_region_counters()
             region_dropdown.configure(values=regions)
             update_dashboard(region_var.get())
             messagebox.showinfo("Refreshed", "Dashboard data has been refreshed.")
@@ -8908,43 +14502,18 @@ Thank you!
                     else:
                         report_df = combined_df[combined_df['Region'] == selected_region].copy()
                     
-                    # Calculate metrics
-                    total = len(report_df)
-                    sent = len(report_df[report_df["Status"] == "Sent"])
-                    responded = len(report_df[report_df["Status"] == "Responded"])
-                    not_sent_count = len(report_df[report_df["Status"] == "Not Sent"])
-                    
-                    # Calculate overdue
-                    seven_days_ago = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
-                    sent_df = report_df[report_df["Status"] == "Sent"]
-                    overdue = 0
-                    if not sent_df.empty:
-                        overdue = len(sent_df[sent_df["Sent Email Date"] < seven_days_ago])
-                    
-                    completion = (responded / total * 100) if total > 0 else 0
-                    
-                    # Get deadline from config
+                    # Calculate metrics against the deadline from config
                     config = get_config_manager().load()
                     deadline_str = config.get("deadline", "TBD")
-                    try:
-                        deadline = datetime.strptime(deadline_str, "%B %d, %Y")
-                        days_left = (deadline - datetime.now()).days
-                    except:
-                        days_left = -1
-                    
-                    # Create metrics object
-                    report_metrics = DashboardMetrics(
-                        total_agencies=total,
-                        sent_count=sent,
-                        responded_count=responded,
-                        not_sent_count=not_sent_count,
-                        overdue_count=overdue,
-                        completion_percentage=completion,
-                        days_left=days_left
-                    )
+                    report_metrics = compute_audit_metrics(report_df, deadline_str)
                     
-                    # Generate report
-                    generator = ReportGenerator(output_dir=Path("reports"))
+                    # Generate report, with cross-period history from the archive
+                    try:
+                        archive = self._archive_folders(folder_sources)
+                    except Exception as e:
+                        logger.error(f"Audit archive unavailable, report has no history: {e}")
+                        archive = None
+                    generator = ReportGenerator(output_dir=Path("reports"), archive=archive)
                     review_period = config.get("review_period", "Q4 FY25")
                     
                     report_path = generator.generate_compliance_report(
@@ -8952,7 +14521,8 @@ Thank you!
                         metrics=report_metrics,
                         report_type=report_type_var.get(),
                         output_format=format_var.get(),
-                        review_period=review_period
+                        review_period=review_period,
+                        region=None if selected_region == "All Regions" else selected_region
                     )
                     
                     report_dialog.destroy()
@@ -8976,10 +14546,189 @@ Thank you!
             ctk.CTkButton(button_frame, text="Cancel", command=report_dialog.destroy).pack(side="right", padx=5)
             ctk.CTkButton(button_frame, text="Generate Report", command=do_generate).pack(side="right")
         
+        def followup_campaign():
+            """Send reminders to every Sent/Overdue agency in the current region filter"""
+            selected_region = region_var.get()
+            if selected_region == "All Regions":
+                campaign_df = combined_df
+            else:
+                campaign_df = combined_df[combined_df['Region'] == selected_region]
+            campaign_df = campaign_df[campaign_df['Status'].isin([AuditStatus.SENT.value, AuditStatus.OVERDUE.value])]
+            
+            if campaign_df.empty:
+                messagebox.showinfo("No Pending Agencies", "There are no Sent or Overdue agencies to remind.", parent=dashboard)
+                return
+            
+            targets = campaign_df[['Agency', 'Folder', 'Audit File']].dropna(subset=['Agency']).to_dict('records')
+            
+            campaign_dialog = ctk.CTkToplevel(dashboard)
+            campaign_dialog.title("Follow-up Campaign")
+            campaign_dialog.geometry("650x550")
+            campaign_dialog.transient(dashboard)
+            campaign_dialog.grab_set()
+            
+            main_frame = ctk.CTkFrame(campaign_dialog)
+            main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+            
+            ctk.CTkLabel(main_frame, text=f"Follow-up Campaign - {len(targets)} agencies",
+                        font=ctk.CTkFont(size=18, weight="bold")).pack(pady=(0, 10))
+            
+            # Template choice
+            template_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
+            template_frame.pack(fill="x", pady=(0, 10))
+            ctk.CTkLabel(template_frame, text="Template:").pack(side="left", padx=5)
+            template_var = ctk.StringVar(value="gentle")
+            for key in FOLLOWUP_TEMPLATES:
+                ctk.CTkRadioButton(template_frame, text=key.title(), variable=template_var, value=key).pack(side="left", padx=10)
+            
+            # Per-agency status
+            status_tree = ttk.Treeview(main_frame, columns=("Agency", "Region", "Result"), show="headings", height=12)
+            for col, width in (("Agency", 250), ("Region", 150), ("Result", 150)):
+                status_tree.heading(col, text=col)
+                status_tree.column(col, width=width, anchor='w')
+            status_tree.pack(fill="both", expand=True, pady=(0, 10))
+            
+            rows = {}
+            for target in targets:
+                region_name = os.path.basename(str(target['Folder']))
+                rows[target['Agency']] = status_tree.insert("", "end", values=(target['Agency'], region_name, "Pending"))
+            
+            progress_label = ctk.CTkLabel(main_frame, text="")
+            progress_label.pack(fill="x")
+            
+            def set_result(agency, success, error=None):
+                if agency in rows:
+                    status_tree.set(rows[agency], "Result", "✅ Sent" if success else f"❌ {error or 'Failed'}")
+            
+            def run_campaign(template_key):
+                agencies = list(dict.fromkeys(t['Agency'] for t in targets))
+                try:
+                    results = self.email_handler.remind_overdue(
+                        agencies,
+                        FOLLOWUP_TEMPLATES[template_key],
+                        progress_callback=lambda pct, msg: dashboard.after(0, lambda: progress_label.configure(text=msg)),
+                        result_callback=lambda agency, ok, error: dashboard.after(0, set_result, agency, ok, error)
+                    )
+                    
+                    # Record follow-up count and last reminder date in each source audit log
+                    for (folder, audit_file), group in pd.DataFrame(targets).groupby(['Folder', 'Audit File']):
+                        audit_logger = self._audit_logger_for(folder, audit_file)
+                        for agency in group['Agency']:
+                            if results.get(agency):
+                                audit_logger.record_followup(agency)
+                        self.audit_writer.request_save(audit_logger)
+                    
+                    sent = sum(results.values())
+                    dashboard.after(0, lambda: progress_label.configure(
+                        text=f"Campaign complete: {sent} of {len(results)} reminders sent"))
+                    dashboard.after(0, refresh_data)
+                except Exception as e:
+                    logger.error(f"Follow-up campaign failed: {e}")
+                    dashboard.after(0, lambda error=str(e): messagebox.showerror(
+                        "Campaign Error", f"Follow-up campaign failed:\n{error}", parent=campaign_dialog))
+            
+            def start():
+                start_btn.configure(state="disabled")
+                progress_label.configure(text="Starting campaign...")
+                self.run_task_in_thread(run_campaign, (template_var.get(),))
+            
+            button_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
+            button_frame.pack(side="bottom", fill="x", pady=(10, 0))
+            
+            ctk.CTkButton(button_frame, text="Close", command=campaign_dialog.destroy).pack(side="right", padx=5)
+            start_btn = ctk.CTkButton(button_frame, text="Send Reminders", command=start, fg_color="#2196F3")
+            start_btn.pack(side="right")
+        
+        def show_history():
+            """Cross-period history from the audit archive: repeat offenders, latency and reviewers"""
+            selected_region = region_var.get()
+            region_filter = None if selected_region == "All Regions" else selected_region
+            periods = int(config_manager.get("repeat_offender_periods", ConfigManager.DEFAULT_CONFIG["repeat_offender_periods"]))
+            
+            history_dialog = ctk.CTkToplevel(dashboard)
+            history_dialog.title(f"Review History - {selected_region}")
+            history_dialog.geometry("950x600")
+            history_dialog.transient(dashboard)
+            
+            status_label = ctk.CTkLabel(history_dialog, text="Updating audit archive...", anchor="w")
+            status_label.pack(fill="x", padx=15, pady=(10, 0))
+            
+            tabview = ctk.CTkTabview(history_dialog)
+            tabview.pack(fill="both", expand=True, padx=15, pady=10)
+            tables = {}
+            for title in ("Repeat Offenders", "Response Latency", "Reviewer History"):
+                tab = tabview.add(title)
+                if title == "Reviewer History":
+                    search_frame = ctk.CTkFrame(tab, fg_color="transparent")
+                    search_frame.pack(fill="x", pady=(0, 5))
+                    ctk.CTkLabel(search_frame, text="Reviewer email:").pack(side="left", padx=5)
+                    reviewer_entry = ctk.CTkEntry(search_frame, width=300, placeholder_text="All reviewers")
+                    reviewer_entry.pack(side="left", padx=5)
+                history_tree = ttk.Treeview(tab, show="headings")
+                history_vsb = ttk.Scrollbar(tab, orient="vertical", command=history_tree.yview)
+                history_vsb.pack(side="right", fill="y")
+                history_tree.configure(yscrollcommand=history_vsb.set)
+                history_tree.pack(fill="both", expand=True)
+                tables[title] = history_tree
+            
+            def fill_table(title, df):
+                history_tree = tables[title]
+                history_tree.delete(*history_tree.get_children())
+                history_tree["columns"] = list(df.columns)
+                for col in df.columns:
+                    history_tree.heading(col, text=col)
+                    history_tree.column(col, width=max(80, min(250, len(str(col)) * 9)), anchor="w")
+                for row in df.astype(object).where(df.notna(), "").itertuples(index=False):
+                    history_tree.insert("", "end", values=list(row))
+            
+            def show_results(archive, archived_periods, offenders, latency, reviewers):
+                if not history_dialog.winfo_exists():
+                    return
+                recent = archived_periods[-periods:]
+                status_label.configure(
+                    text=f"{len(archived_periods)} period(s) archived - repeat offenders were late in "
+                         f"all of: {', '.join(recent) or 'none'}"
+                )
+                fill_table("Repeat Offenders", offenders)
+                fill_table("Response Latency", latency)
+                fill_table("Reviewer History", reviewers)
+                
+                def search_reviewer(event=None):
+                    reviewer = reviewer_entry.get().strip()
+                    try:
+                        fill_table("Reviewer History", archive.reviewer_history(reviewer) if reviewer else reviewers)
+                    except Exception as e:
+                        messagebox.showerror("History Error", f"Could not read reviewer history:\n{e}", parent=history_dialog)
+                
+                reviewer_entry.bind("<Return>", search_reviewer)
+                ctk.CTkButton(search_frame, text="Search", command=search_reviewer, width=80).pack(side="left", padx=5)
+            
+            def load_history():
+                try:
+                    archive = self._archive_folders(folder_sources)
+                    results = (
+                        archive,
+                        archive.periods(),
+                        archive.repeat_offenders(periods, region=region_filter),
+                        archive.latency_distribution(periods, region=region_filter),
+                        archive.reviewer_summary(periods)
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to load review history: {e}")
+                    dashboard.after(0, lambda error=str(e): history_dialog.winfo_exists() and status_label.configure(
+                        text=f"⚠️ Audit archive unavailable: {error}"))
+                    return
+                dashboard.after(0, show_results, *results)
+            
+            self.run_task_in_thread(load_history)
+
         ctk.CTkButton(button_frame, text="🔄 Refresh Data", command=refresh_data, width=140).pack(side="left", padx=5)
         ctk.CTkButton(button_frame, text="📥 Export as CSV", command=export_csv, width=140).pack(side="left", padx=5)
         ctk.CTkButton(button_frame, text="📊 Generate Report", command=generate_report, width=150, 
                      fg_color="#2196F3").pack(side="left", padx=5)
+        ctk.CTkButton(button_frame, text="📣 Follow-up Campaign", command=followup_campaign, width=170,
+                     fg_color="#D42B2B").pack(side="left", padx=5)
+        ctk.CTkButton(button_frame, text="📈 History", command=show_history, width=110).pack(side="left", padx=5)
         
         # Status filter buttons
         ctk.CTkLabel(button_frame, text="Quick Filters:").pack(side="left", padx=(20, 5))
@@ -8998,7 +14747,8 @@ Thank you!
                 filtered_df = filtered_df[filtered_df['Status'] == status]
             
             if not filtered_df.empty:
-                display_cols = ['Region', 'Agency', 'Status', 'Sent Email Date', 'Response Received Date', 'To', 'CC', 'Comments']
+                display_cols = ['Region', 'Agency', 'Status', 'Sent Email Date', 'Response Received Date', 'To', 'CC', 'Comments',
+                                'Follow-up Count', 'Last Reminder Date']
                 display_cols = [c for c in display_cols if c in filtered_df.columns]
                 df_display = filtered_df[display_cols].fillna("")
                 
@@ -9015,6 +14765,14 @@ Thank you!
         # Initial update
         update_dashboard("All Regions")
         
+        def overdue_tick():
+            """Advance overdue counts as response windows pass (counters only, no reload)"""
+            if dashboard.winfo_exists():
+                update_metric_labels(region_var.get())
+                dashboard.after(60 * 1000, overdue_tick)
+        
+        dashboard.after(60 * 1000, overdue_tick)
+        
         dashboard.grab_set()
 
     def schedule_email_dialog(self, agencies):
@@ -9092,35 +14850,35 @@ Thank you!
                     addr_dict[key] = (mapping.recipients_to, mapping.recipients_cc)
                 
                 try:
-                    success_count = self.email_handler.send_emails(
+                    send_result = self.email_handler.send_emails(
                         combined_file=Path(self.vars["combined"].get()),
                         output_dir=Path(self.vars["output"].get()),
                         file_names=agencies,
                         mode=EmailMode.SCHEDULE,
                         universal_attachment=Path(self.vars["attach"].get()) if self.vars["attach"].get() else None,
-                        scheduled_time=naive_dt  # Outlook uses local time
+                        scheduled_time=naive_dt,  # Outlook uses local time
+                        digest=self.digest_mode.get()
                     )
+                    success_count = len(send_result.sent)
                     
                     if success_count > 0:
                         logger.info(f"SIMPLE SCHEDULE: Created {success_count} scheduled emails")
                         
                         # Update audit log with scheduled emails
                         output_dir = Path(self.vars["output"].get())
-                        self.audit_logger = AuditLogger(output_dir=output_dir)
+                        self.audit_logger = self._audit_logger_for(output_dir)
                         self.audit_logger.initialize_log(self.agencies, preserve_existing=True)
                         
                         scheduled_str = naive_dt.strftime("%Y-%m-%d %H:%M")
-                        for agency in agencies:
-                            to, cc = addr_dict.get(agency.upper(), ("", ""))
-                            self.audit_logger.mark_sent(
-                                agency, 
-                                to=to, 
-                                cc=cc, 
-                                comments=f"Scheduled for {scheduled_str}"
-                            )
+                        self.audit_logger.mark_sent_many(
+                            send_result.sent,
+                            recipients=addr_dict,
+                            comments=f"Scheduled for {scheduled_str}",
+                            event=AuditEventType.SCHEDULED
+                        )
                         
-                        # Save audit log
-                        self.audit_logger.save()
+                        # Queue the audit log save
+                        self.audit_writer.request_save(self.audit_logger)
                         self.audit_df = self.audit_logger.load()
                         
                         # Update status bar
@@ -9144,12 +14902,17 @@ Thank you!
                             f"   You can review/edit them before send time\n\n"
                             f"✅ You can close this app!\n"
                             f"   Outlook will send them automatically."
+                            + self._describe_send_failures(send_result.failed)
                         )
                         
                         # Refresh UI
                         self.refresh()
                     else:
-                        messagebox.showerror("Scheduling Failed", "No emails were created.", parent=win)
+                        messagebox.showerror(
+                            "Scheduling Failed",
+                            "No emails were created." + self._describe_send_failures(send_result.failed),
+                            parent=win
+                        )
                         
                 except Exception as email_error:
                     logger.error(f"SIMPLE SCHEDULE ERROR: {email_error}")
@@ -9281,35 +15044,35 @@ Thank you!
                 logger.info(f"CREATING SCHEDULED EMAILS: {len(agencies)} agencies, delivery at {local_dt}")
                 
                 try:
-                    success_count = self.email_handler.send_emails(
+                    send_result = self.email_handler.send_emails(
                         combined_file=Path(self.vars["combined"].get()),
                         output_dir=Path(self.vars["output"].get()),
                         file_names=agencies,
                         mode=EmailMode.SCHEDULE,
                         universal_attachment=Path(self.vars["attach"].get()) if self.vars["attach"].get() else None,
-                        scheduled_time=local_system_dt.replace(tzinfo=None)  # Outlook needs naive datetime in local time
+                        scheduled_time=local_system_dt.replace(tzinfo=None),  # Outlook needs naive datetime in local time
+                        digest=self.digest_mode.get()
                     )
+                    success_count = len(send_result.sent)
                     
                     if success_count > 0:
                         logger.info(f"SCHEDULED EMAILS CREATED: {success_count} emails in Outbox")
                         
                         # Update audit log using AuditLogger
                         output_dir = Path(self.vars["output"].get())
-                        self.audit_logger = AuditLogger(output_dir=output_dir)
+                        self.audit_logger = self._audit_logger_for(output_dir)
                         self.audit_logger.initialize_log(self.agencies, preserve_existing=True)
                         
                         scheduled_str = local_dt.strftime("%Y-%m-%d %H:%M")
-                        for agency in agencies:
-                            to, cc = addr_dict.get(agency.upper(), ("", ""))
-                            self.audit_logger.mark_sent(
-                                agency, 
-                                to=to, 
-                                cc=cc, 
-                                comments=f"Scheduled for {scheduled_str} ({tz_name})"
-                            )
+                        self.audit_logger.mark_sent_many(
+                            send_result.sent,
+                            recipients=addr_dict,
+                            comments=f"Scheduled for {scheduled_str} ({tz_name})",
+                            event=AuditEventType.SCHEDULED
+                        )
                         
-                        # Save audit log
-                        self.audit_logger.save()
+                        # Queue the audit log save
+                        self.audit_writer.request_save(self.audit_logger)
                         self.audit_df = self.audit_logger.load()
                         
                         # Update status
@@ -9336,13 +15099,19 @@ Thank you!
                             f"   • You can review/edit them before send time\n\n"
                             f"✅ You can close this app!\n"
                             f"   Outlook will send them automatically at the scheduled time."
+                            + self._describe_send_failures(send_result.failed)
                         )
                         
                         # Refresh UI
                         self.refresh()
                         
                     else:
-                        messagebox.showerror("Scheduling Failed", "No emails were created. Check the logs for details.", parent=win)
+                        messagebox.showerror(
+                            "Scheduling Failed",
+                            "No emails were created." + (self._describe_send_failures(send_result.failed)
+                                                         or " Check the logs for details."),
+                            parent=win
+                        )
                         
                 except Exception as email_error:
                     logger.error(f"SCHEDULED EMAIL CREATION ERROR: {email_error}")
@@ -9942,7 +15711,9 @@ Thank you!
             
             # Organize replies
             replies_folder = f"Compliance {review_period} - Replies"
-            organized_count = self.email_handler.organize_compliance_replies(replies_folder)
+            organized_count = self.email_handler.organize_compliance_replies(
+                replies_folder, agencies=self.agencies or None
+            )
             
             # Show results
             result_message = (
@@ -9971,6 +15742,173 @@ Thank you!
             messagebox.showerror("Email Organization Failed", 
                                f"Could not organize compliance emails:\n\n{str(e)}")
 
+    def remind_overdue(self):
+        """
+        Callback for the 'Remind All Overdue' button.
+        
+        Sends a gentle reply-to-thread reminder to every agency that was sent
+        the review more than 7 days ago and has not responded.
+        """
+        if self.audit_df is None or self.audit_df.empty:
+            messagebox.showwarning("No Audit Data", "No audit data loaded. Please refresh first.")
+            return
+        
+        df = self._typed_audit()
+        overdue = df.loc[audit_overdue_mask(df), ColumnNames.AGENCY].dropna().astype(str).tolist()
+        
+        if not overdue:
+            messagebox.showinfo("No Overdue Agencies", "There are no overdue agencies to remind.")
+            return
+        
+        if not messagebox.askyesno(
+            "Confirm Reminders",
+            f"Send a reminder to {len(overdue)} overdue agencies?\n\n"
+            + "\n".join(f"• {a}" for a in overdue[:15])
+            + (f"\n... and {len(overdue) - 15} more" if len(overdue) > 15 else "")
+        ):
+            return
+        
+        def worker():
+            try:
+                self.after(0, self.show_progress, True)
+                errors = {}
+                results = self.email_handler.remind_overdue(
+                    overdue,
+                    FOLLOWUP_TEMPLATES["gentle"],
+                    progress_callback=lambda pct, msg: self.after(0, self.update_progress, pct / 100, msg),
+                    errors=errors
+                )
+                failed = [agency for agency, ok in results.items() if not ok]
+                
+                # Record follow-ups in the audit log
+                output_dir = self.vars["output"].get()
+                if output_dir:
+                    audit_logger = self._audit_logger_for(output_dir)
+                    for agency, ok in results.items():
+                        if ok:
+                            audit_logger.record_followup(agency)
+                    self.audit_writer.request_save(audit_logger)
+                    self.audit_logger = audit_logger
+                    self.after(0, self.refresh)
+                summary = f"Reminders sent: {len(results) - len(failed)} of {len(results)}"
+                if failed:
+                    summary += "\n\nNot sent:\n" + "\n".join(
+                        f"• {a}: {errors.get(a, 'Failed')}" for a in failed[:15])
+                self.after(0, messagebox.showinfo, "Reminders Complete", summary)
+            except Exception as e:
+                logger.error(f"Failed to send overdue reminders: {e}")
+                self.after(0, messagebox.showerror, "Reminder Error", f"Failed to send reminders:\n{e}")
+            finally:
+                self.after(0, self.show_progress, False)
+        
+        self.run_task_in_thread(worker, ())
+    
+    def harvest_returned_files(self):
+        """
+        Callback for the 'Harvest Returned Files' button.
+        
+        Saves xlsx attachments from new replies in the compliance Replies folder
+        to the returns folder and links each one to its audit row.
+        """
+        output_dir = self.vars["output"].get()
+        if not output_dir:
+            messagebox.showwarning("No Output Folder", "Please select an output folder first.")
+            return
+        if not self.agencies:
+            messagebox.showwarning("No Agencies", "Please load agencies first by selecting an output folder with agency files.")
+            return
+        
+        review_period = config_manager.get("review_period", "Q2 2025")
+        folder = f"Inbox/Compliance {review_period} - Replies"
+        
+        def worker():
+            try:
+                self.after(0, self.show_progress, True)
+                self.after(0, self.update_progress, 0.2, "Harvesting returned workbooks...")
+                audit_logger = self._audit_logger_for(output_dir)
+                harvester = ReplyAttachmentHarvester(
+                    OutlookTransport(self.email_handler),
+                    Path(output_dir),
+                    self.agencies,
+                    tracking_index=audit_logger.load_tracking_index()
+                )
+                results = harvester.harvest(folder)
+                
+                for result in results:
+                    audit_logger.record_returned_file(result["file_name"], Path(result["saved_path"]))
+                if results:
+                    self.audit_writer.request_save(audit_logger)
+                    self.audit_logger = audit_logger
+                    self.after(0, self.refresh)
+                
+                summary = f"Saved {len(results)} returned workbooks to:\n{harvester.returns_dir}"
+                if results:
+                    summary += "\n\n" + "\n".join(f"• {r['file_name']}" for r in results[:15])
+                self.after(0, messagebox.showinfo, "Harvest Complete", summary)
+            except Exception as e:
+                logger.error(f"Failed to harvest returned files: {e}")
+                self.after(0, messagebox.showerror, "Harvest Error", f"Failed to harvest returned files:\n{e}")
+            finally:
+                self.after(0, self.show_progress, False)
+        
+        self.run_task_in_thread(worker, ())
+
+    def consolidate_review_decisions(self):
+        """
+        Callback for the 'Consolidate Decisions' button.
+        
+        Ingests every harvested returned workbook, exports the consolidated
+        Keep/Revoke/Modify decisions and records each agency's completeness
+        in the audit log.
+        """
+        output_dir = self.vars["output"].get()
+        if not output_dir:
+            messagebox.showwarning("No Output Folder", "Please select an output folder first.")
+            return
+        
+        def worker():
+            try:
+                self.after(0, self.show_progress, True)
+                self.after(0, self.update_progress, 0.2, "Reading returned workbooks...")
+                audit_logger = self._audit_logger_for(output_dir)
+                returned_files = audit_logger.get_returned_files()
+                if not returned_files:
+                    self.after(0, messagebox.showinfo, "Nothing to Consolidate",
+                               "No returned workbooks found. Use 'Harvest Returned Files' first.")
+                    return
+                
+                ingestor = ReviewDecisionIngestor(Path(output_dir))
+                decisions, results = ingestor.ingest(returned_files)
+                self.after(0, self.update_progress, 0.7, "Exporting consolidated decisions...")
+                written = ingestor.export(decisions, results)
+                
+                for result in results:
+                    audit_logger.record_review_completeness(result.file_name, result.summary())
+                self.audit_writer.request_save(audit_logger)
+                self.audit_logger = audit_logger
+                self.after(0, self.refresh)
+                
+                counts = decisions["Decision"].value_counts() if not decisions.empty else pd.Series(dtype=int)
+                summary = (
+                    f"Consolidated {len(decisions)} decisions from {len(results)} returned workbooks.\n\n"
+                    + "\n".join(f"• {d.value}: {int(counts.get(d.value, 0))}" for d in ReviewDecision)
+                )
+                failed = [r for r in results if r.error]
+                flagged = [r for r in results if r.altered_rows or r.missing_rows or r.duplicated_rows]
+                if failed:
+                    summary += f"\n\n⚠️ {len(failed)} files could not be read"
+                if flagged:
+                    summary += f"\n⚠️ {len(flagged)} files have rows that differ from the generated file"
+                summary += "\n\nSaved:\n" + "\n".join(str(p) for p in written)
+                self.after(0, messagebox.showinfo, "Consolidation Complete", summary)
+            except Exception as e:
+                logger.error(f"Failed to consolidate review decisions: {e}")
+                self.after(0, messagebox.showerror, "Consolidation Error", f"Failed to consolidate review decisions:\n{e}")
+            finally:
+                self.after(0, self.show_progress, False)
+        
+        self.run_task_in_thread(worker, ())
+
     def open_email_verifier(self):
         """
         Open the Smart Email Verifier dialog.
@@ -12394,20 +18332,59 @@ class RegionEditorDialog(ctk.CTkToplevel):
         self.geometry(f"+{x}+{y}")
 
 
+def confirm_direct_send(names: List[str], parent=None, note: str = "") -> bool:
+    """
+    Ask before emails are sent without further review (Direct mode and preview sends).
+    
+    Args:
+        names: Agencies (file names) about to be emailed
+        parent: Window the message box belongs to
+        note: Optional extra line, e.g. the projected completion time
+    
+    Returns:
+        True if the user confirmed
+    """
+    return messagebox.askyesno(
+        "Confirm Direct Send",
+        f"⚠️ WARNING: Direct Send Mode ⚠️\n\n"
+        f"You are about to AUTOMATICALLY SEND {len(names)} emails.\n\n"
+        f"Recipients will receive emails immediately without your review.\n\n"
+        f"Selected agencies: {', '.join(names[:5])}"
+        f"{' ...' if len(names) > 5 else ''}\n\n"
+        + (f"{note}\n\n" if note else "")
+        + "Are you absolutely sure you want to continue?",
+        icon="warning",
+        parent=parent
+    )
+
+
 class EmailPreviewNavigationDialog(ctk.CTkToplevel):
     """
     Dialog for previewing and navigating through multiple emails before sending.
-    Allows reviewing all emails with Previous/Next navigation.
+    Allows reviewing all emails with Previous/Next navigation. Sending from
+    the dialog asks the same confirmation as Direct mode.
     """
     
-    def __init__(self, parent, emails: List[dict], email_handler):
+    def __init__(
+        self,
+        parent,
+        emails: "List[dict] | LazyEmailBatch",
+        email_handler,
+        audit_logger: Optional[AuditLogger] = None,
+        on_audit_saved: Optional[Callable[[], None]] = None,
+        audit_writer: Optional[AuditWriteBehind] = None
+    ):
         super().__init__(parent)
         
-        self.emails = emails  # List of email data dicts
+        self.emails = emails  # Email data dicts (LazyEmailBatch renders on demand)
         self.email_handler = email_handler
+        self.audit_logger = audit_logger  # Send outcomes are recorded here when given
+        self.on_audit_saved = on_audit_saved
+        self.audit_writer = audit_writer  # Saves go through it (write-behind) when given
         self.current_index = 0
         self.sent_count = 0
         self.skipped_emails = set()
+        self._send_confirmed = False  # Send This Email asks once per dialog
         
         self.title("Email Preview")
         self.geometry("900x700")
@@ -12590,6 +18567,16 @@ class EmailPreviewNavigationDialog(ctk.CTkToplevel):
         body = email.get('body', '')
         preview = body[:2000] + ("..." if len(body) > 2000 else "")
         self.body_text.insert("1.0", preview)
+        
+        # Render the next few in the background so Next is instant
+        if isinstance(self.emails, LazyEmailBatch):
+            self.emails.prefetch(self.current_index + 1)
+    
+    def _spec(self, index: int) -> dict:
+        """Get recipients/subject for an email without rendering its body."""
+        if isinstance(self.emails, LazyEmailBatch):
+            return self.emails.spec(index)
+        return self.emails[index]
     
     def previous_email(self):
         """Navigate to previous email."""
@@ -12615,9 +18602,19 @@ class EmailPreviewNavigationDialog(ctk.CTkToplevel):
             self.destroy()
     
     def send_current(self):
-        """Send the current email."""
+        """Send the current email (after the Direct mode confirmation, asked once)."""
         try:
             email = self.emails[self.current_index]
+            if email.get('render_error'):
+                self._record_outcome(email, False, email['render_error'])
+                self._save_audit()
+                messagebox.showerror("Send Failed", f"{email['render_error']}\n\nThe email was not sent.", parent=self)
+                return
+            
+            if not self._send_confirmed:
+                if not confirm_direct_send([email.get('file_name') or email.get('subject', '')], parent=self):
+                    return
+                self._send_confirmed = True
             
             # Send via email handler
             success = self.email_handler.send_single_email(
@@ -12625,9 +18622,13 @@ class EmailPreviewNavigationDialog(ctk.CTkToplevel):
                 cc_addresses=email.get('cc', ''),
                 subject=email.get('subject', ''),
                 body=email.get('body', ''),
-                attachment_path=email.get('attachment_path')
+                attachment_path=email.get('attachment_path'),
+                universal_attachment=email.get('universal_attachment')
             )
             
+            self._record_outcome(email, success, "" if success else "See log for details")
+            self._save_audit()
+            
             if success:
                 self.sent_count += 1
                 messagebox.showinfo("Success", f"Email sent successfully!\n\nSent: {self.sent_count} of {len(self.emails)}")
@@ -12645,38 +18646,68 @@ class EmailPreviewNavigationDialog(ctk.CTkToplevel):
             messagebox.showerror("Error", f"Failed to send email: {str(e)}")
     
     def send_all_remaining(self):
-        """Send all remaining emails without further preview."""
-        confirm = messagebox.askyesno(
-            "Confirm Send All",
-            f"Send all {len(self.emails) - self.current_index} remaining emails?\n\nThis cannot be undone."
-        )
+        """Send all remaining emails without further preview, within the send rate budget."""
+        remaining_indices = [
+            i for i in range(self.current_index, len(self.emails))
+            if i not in self.skipped_emails
+        ]
         
-        if not confirm:
-            return
+        recipient_counts = [
+            SendRateLimiter.count_recipients(self._spec(i).get('to', ''), self._spec(i).get('cc', ''))
+            for i in remaining_indices
+        ]
+        eta = self.email_handler.rate_limiter.projected_completion(recipient_counts)
         
-        # Send all from current index onwards
-        for i in range(self.current_index, len(self.emails)):
-            if i in self.skipped_emails:
-                continue
-            
-            try:
-                email = self.emails[i]
-                success = self.email_handler.send_single_email(
-                    to_addresses=email.get('to', ''),
-                    cc_addresses=email.get('cc', ''),
-                    subject=email.get('subject', ''),
-                    body=email.get('body', ''),
-                    attachment_path=email.get('attachment_path')
-                )
-                
-                if success:
-                    self.sent_count += 1
-            
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to send email {i+1}: {str(e)}")
-                break
+        names = [self._spec(i).get('file_name') or self._spec(i).get('subject', '') for i in remaining_indices]
+        if not confirm_direct_send(names, parent=self, note=f"Projected completion: {eta:%H:%M:%S}"):
+            return
         
-        messagebox.showinfo("Complete", f"Batch send complete!\n\nSent: {self.sent_count}\nSkipped: {len(self.skipped_emails)}")
+        if isinstance(self.emails, LazyEmailBatch):
+            remaining = self.emails.subset(remaining_indices)
+        else:
+            remaining = [self.emails[i] for i in remaining_indices]
+        
+        BatchSendDialog(
+            self,
+            remaining,
+            self.email_handler,
+            on_result=self._record_outcome,
+            on_close=self._on_batch_closed
+        )
+    
+    def _record_outcome(self, email: dict, ok: bool, error: str):
+        """Record one send outcome in the audit log (main thread)."""
+        if self.audit_logger is None or not email.get('file_name'):
+            return
+        if ok:
+            self.audit_logger.mark_sent(
+                email['file_name'],
+                to=email.get('to', ''),
+                cc=email.get('cc', ''),
+                comments="Mode: Direct (preview)"
+            )
+        else:
+            self.audit_logger.record_send_failure(email['file_name'], error)
+    
+    def _save_audit(self):
+        """Persist recorded outcomes and let the owner refresh its view."""
+        if self.audit_logger is None:
+            return
+        if self.audit_writer is not None:
+            self.audit_writer.request_save(self.audit_logger)
+        else:
+            self.audit_logger.save()
+        if self.on_audit_saved:
+            self.on_audit_saved()
+    
+    def _on_batch_closed(self, sent: int, failed: int):
+        """Summarize once the background batch window is closed."""
+        self.sent_count += sent
+        self._save_audit()
+        messagebox.showinfo(
+            "Complete",
+            f"Batch send complete!\n\nSent: {self.sent_count}\nFailed: {failed}\nSkipped: {len(self.skipped_emails)}"
+        )
         self.destroy()
     
     def on_cancel(self):
@@ -12689,6 +18720,12 @@ class EmailPreviewNavigationDialog(ctk.CTkToplevel):
         if confirm:
             self.destroy()
     
+    def destroy(self):
+        """Stop background prefetching before closing."""
+        if isinstance(self.emails, LazyEmailBatch):
+            self.emails.close()
+        super().destroy()
+    
     def center_window(self):
         """Center the dialog on screen."""
         self.update_idletasks()
@@ -12697,6 +18734,172 @@ class EmailPreviewNavigationDialog(ctk.CTkToplevel):
         self.geometry(f"+{x}+{y}")
 
 
+class BatchSendDialog(ctk.CTkToplevel):
+    """
+    Sends a batch of emails on a background thread with live per-message results.
+    
+    Shows a progress bar and a result row per email. The batch can be cancelled
+    between messages, and failed messages can be retried once it has stopped.
+    """
+    
+    def __init__(
+        self,
+        parent,
+        emails: "List[dict] | LazyEmailBatch",
+        email_handler,
+        on_result: Optional[Callable[[dict, bool, str], None]] = None,
+        on_close: Optional[Callable[[int, int], None]] = None
+    ):
+        super().__init__(parent)
+        
+        self.emails = emails
+        self.email_handler = email_handler
+        self.on_result = on_result  # Called on the main thread for every message
+        self.on_close = on_close  # Called with (sent, still failed) when closed
+        self.cancel_event = threading.Event()
+        self.running = False
+        self.sent_count = 0
+        self.failed: Dict[str, dict] = {}  # subject -> email
+        self.rows: Dict[str, str] = {}  # subject -> tree item id
+        
+        self.title("Sending Emails")
+        self.geometry("760x520")
+        self.transient(parent)
+        self.grab_set()
+        self.protocol("WM_DELETE_WINDOW", self.close)
+        
+        self.create_widgets()
+        self.start(self.emails)
+    
+    def create_widgets(self):
+        """Create the dialog UI."""
+        self.status_label = ctk.CTkLabel(self, text="Starting...", font=ctk.CTkFont(size=14, weight="bold"))
+        self.status_label.pack(fill="x", padx=20, pady=(20, 5))
+        
+        self.progress_bar = ctk.CTkProgressBar(self)
+        self.progress_bar.pack(fill="x", padx=20, pady=5)
+        self.progress_bar.set(0)
+        
+        tree_frame = ctk.CTkFrame(self)
+        tree_frame.pack(fill="both", expand=True, padx=20, pady=10)
+        
+        self.tree = ttk.Treeview(tree_frame, columns=("file", "status", "detail"), show="headings")
+        self.tree.heading("file", text="File")
+        self.tree.heading("status", text="Status")
+        self.tree.heading("detail", text="Detail")
+        self.tree.column("file", width=220)
+        self.tree.column("status", width=90)
+        self.tree.column("detail", width=380)
+        scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        
+        button_frame = ctk.CTkFrame(self, fg_color="transparent")
+        button_frame.pack(fill="x", padx=20, pady=(0, 20))
+        
+        self.close_btn = ctk.CTkButton(button_frame, text="Close", command=self.close, width=100, state="disabled")
+        self.close_btn.pack(side="right")
+        
+        self.retry_btn = ctk.CTkButton(
+            button_frame, text="Retry Failed", command=self.retry_failed, width=120, state="disabled",
+            fg_color=("#FF9800", "#F57C00")
+        )
+        self.retry_btn.pack(side="right", padx=(0, 10))
+        
+        self.cancel_btn = ctk.CTkButton(
+            button_frame, text="Cancel", command=self.cancel, width=100,
+            fg_color=("#F44336", "#D32F2F")
+        )
+        self.cancel_btn.pack(side="right", padx=(0, 10))
+    
+    def start(self, emails):
+        """Start sending the given emails on a background thread."""
+        specs = emails.specs if isinstance(emails, LazyEmailBatch) else emails
+        for spec in specs:
+            subject = spec.get('subject', '')
+            values = (spec.get('file_name', subject), "Queued", "")
+            if subject in self.rows:
+                self.tree.item(self.rows[subject], values=values)
+            else:
+                self.rows[subject] = self.tree.insert("", "end", values=values)
+        
+        self.cancel_event.clear()
+        self.running = True
+        self.cancel_btn.configure(state="normal")
+        self.retry_btn.configure(state="disabled")
+        self.close_btn.configure(state="disabled")
+        
+        thread = threading.Thread(target=self._worker, args=(emails,), daemon=True)
+        thread.start()
+    
+    def _worker(self, emails):
+        """Background thread: send the batch and marshal results to the UI."""
+        try:
+            self.email_handler.send_email_batch(
+                emails,
+                progress_callback=lambda pct, msg: self.after(0, self._on_progress, pct, msg),
+                result_callback=lambda email, ok, error: self.after(0, self._on_result, email, ok, error),
+                cancel_event=self.cancel_event
+            )
+        except Exception as e:
+            logger.error(f"Batch send failed: {e}")
+            self.after(0, self._on_progress, 100, f"Stopped: {e}")
+        finally:
+            self.after(0, self._on_finished)
+    
+    def _on_progress(self, pct: float, message: str):
+        self.progress_bar.set(pct / 100)
+        self.status_label.configure(text=message)
+    
+    def _on_result(self, email: dict, ok: bool, error: str):
+        subject = email.get('subject', '')
+        item = self.rows.get(subject)
+        if item:
+            self.tree.item(item, values=(email.get('file_name', subject), "Sent" if ok else "Failed", error))
+            self.tree.see(item)
+        if ok:
+            self.sent_count += 1
+            self.failed.pop(subject, None)
+        else:
+            self.failed[subject] = email
+        if self.on_result:
+            self.on_result(email, ok, error)
+    
+    def _on_finished(self):
+        self.running = False
+        if self.cancel_event.is_set():
+            for item in self.tree.get_children():
+                if self.tree.item(item, "values")[1] == "Queued":
+                    self.tree.item(item, values=(self.tree.item(item, "values")[0], "Cancelled", ""))
+        self.status_label.configure(text=f"Sent: {self.sent_count}   Failed: {len(self.failed)}")
+        self.cancel_btn.configure(state="disabled")
+        self.retry_btn.configure(state="normal" if self.failed else "disabled")
+        self.close_btn.configure(state="normal")
+    
+    def cancel(self):
+        """Stop after the message currently being sent."""
+        self.cancel_event.set()
+        self.cancel_btn.configure(state="disabled")
+        self.status_label.configure(text="Cancelling after the current message...")
+    
+    def retry_failed(self):
+        """Send the failed messages again."""
+        if self.failed and not self.running:
+            self.start(list(self.failed.values()))
+    
+    def close(self):
+        """Close once the worker has stopped."""
+        if self.running:
+            if not messagebox.askyesno("Cancel Sending", "Sending is still in progress. Cancel the remaining emails?", parent=self):
+                return
+            self.cancel()
+            return
+        if self.on_close:
+            self.on_close(self.sent_count, len(self.failed))
+        self.destroy()
+
+
 class UnassignedAgenciesDialog(ctk.CTkToplevel):
     """
     Interactive dialog for handling agencies found in master data but not in mapping file.
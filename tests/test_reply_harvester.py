@@ -0,0 +1,128 @@
+"""
+Tests for ReplyAttachmentHarvester over a MaildirTransport.
+
+The application module pulls in its GUI and Outlook dependencies at import
+time, so these tests are skipped where those are not installed.
+"""
+
+import mailbox
+from email.message import EmailMessage
+from email.utils import format_datetime, make_msgid
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+app = pytest.importorskip("cognos_review_STANDALONE")
+
+REVIEW_PERIOD = "Q3 2025"
+FOLDER = "Inbox/Compliance Q3 2025 - Replies"
+FILE_NAMES = ["BBDO Toronto", "DDB London", "Ogilvy Paris"]
+
+
+def make_reply(subject: str, received: datetime, attachments: dict) -> EmailMessage:
+    """Build a reply with the given attachments (file name -> content)."""
+    message = EmailMessage()
+    message["Subject"] = subject
+    message["From"] = "Reviewer <reviewer@example.com>"
+    message["To"] = "compliance@example.com"
+    message["Date"] = format_datetime(received)
+    message["Message-ID"] = make_msgid()
+    message.set_content("Please find the completed review attached.")
+    for file_name, content in attachments.items():
+        message.add_attachment(
+            content,
+            maintype="application",
+            subtype="vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            filename=file_name
+        )
+    return message
+
+
+@pytest.fixture
+def replies(tmp_path: Path) -> Path:
+    """Maildir with a reply subfolder holding token, name and duplicate replies."""
+    root = tmp_path / "mail"
+    maildir = mailbox.Maildir(root, create=True)
+    folder = maildir.add_folder("Compliance Q3 2025 - Replies")
+    token = app.make_tracking_token(REVIEW_PERIOD, "BBDO Toronto")
+
+    # Matched by tracking token; the attachment name says nothing
+    folder.add(make_reply(
+        f"RE: Cognos Access Review {REVIEW_PERIOD} [{token}]",
+        datetime(2025, 9, 1, 9, 0),
+        {"review.xlsx": b"bbdo toronto decisions"}
+    ))
+    # Matched by attachment name
+    folder.add(make_reply(
+        "RE: Cognos Access Review",
+        datetime(2025, 9, 1, 10, 0),
+        {"DDB_London.xlsx": b"ddb london decisions", "notes.txt": b"not a workbook"}
+    ))
+    # Forwarded copy of the same workbook - same content, saved once
+    folder.add(make_reply(
+        "FW: RE: Cognos Access Review",
+        datetime(2025, 9, 1, 11, 0),
+        {"DDB_London.xlsx": b"ddb london decisions"}
+    ))
+    # Not one of ours
+    folder.add(make_reply(
+        "RE: Lunch",
+        datetime(2025, 9, 1, 12, 0),
+        {"menu.xlsx": b"sandwiches"}
+    ))
+    return root
+
+
+def make_harvester(root: Path, output_dir: Path) -> "app.ReplyAttachmentHarvester":
+    token = app.make_tracking_token(REVIEW_PERIOD, "BBDO Toronto")
+    return app.ReplyAttachmentHarvester(
+        app.MaildirTransport(root),
+        output_dir,
+        FILE_NAMES,
+        tracking_index={token.lower(): "BBDO Toronto"}
+    )
+
+
+def test_harvest_matches_by_token_and_name(replies: Path, tmp_path: Path):
+    output_dir = tmp_path / "output"
+    results = make_harvester(replies, output_dir).harvest(FOLDER)
+
+    by_file = {r["file_name"]: r for r in results}
+    assert sorted(by_file) == ["BBDO Toronto", "DDB London"]
+    assert Path(by_file["BBDO Toronto"]["saved_path"]).read_bytes() == b"bbdo toronto decisions"
+    assert Path(by_file["DDB London"]["saved_path"]).read_bytes() == b"ddb london decisions"
+    assert by_file["DDB London"]["sender"] == "reviewer@example.com"
+    assert all(Path(r["saved_path"]).parent == output_dir / app.FileNames.RETURNS_DIR for r in results)
+
+
+def test_harvest_skips_duplicate_content(replies: Path, tmp_path: Path):
+    output_dir = tmp_path / "output"
+    results = make_harvester(replies, output_dir).harvest(FOLDER)
+
+    assert [r["file_name"] for r in results].count("DDB London") == 1
+    assert len({r["content_hash"] for r in results}) == len(results)
+    assert len(list((output_dir / app.FileNames.RETURNS_DIR).iterdir())) == len(results)
+
+
+def test_second_pass_harvests_nothing(replies: Path, tmp_path: Path):
+    output_dir = tmp_path / "output"
+    assert make_harvester(replies, output_dir).harvest(FOLDER)
+
+    # A fresh harvester reads the watermark and hashes from the state file
+    assert make_harvester(replies, output_dir).harvest(FOLDER) == []
+    assert (output_dir / app.FileNames.HARVEST_STATE).exists()
+
+
+def test_new_reply_after_watermark_is_harvested(replies: Path, tmp_path: Path):
+    output_dir = tmp_path / "output"
+    make_harvester(replies, output_dir).harvest(FOLDER)
+
+    mailbox.Maildir(replies, create=False).get_folder("Compliance Q3 2025 - Replies").add(make_reply(
+        "RE: Cognos Access Review - Ogilvy Paris",
+        datetime(2025, 9, 2, 9, 0),
+        {"Ogilvy Paris.xlsx": b"ogilvy paris decisions"}
+    ))
+    results = make_harvester(replies, output_dir).harvest(FOLDER)
+
+    assert [r["file_name"] for r in results] == ["Ogilvy Paris"]